@@ -2,6 +2,15 @@ from typing import Protocol
 
 
 class IDatabaseConfig(Protocol):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    prepared_statement_cache_size: int
+    statement_timeout: int
+    server_settings: str
+
     @property
     def uri(self) -> str:
         raise NotImplementedError
@@ -12,3 +21,9 @@ class INeo4jConfig(Protocol):
     user: str
     password: str
     database: str
+    orphan_keyword_sweep_enabled: bool
+    orphan_keyword_sweep_batch_size: int
+    max_connection_pool_size: int
+    connection_acquisition_timeout: float
+    max_connection_lifetime: int
+    fetch_size: int
@@ -4,7 +4,8 @@ from typing import Protocol
 from uuid import UUID
 
 from brain.domain.entities.draft import Draft
-from brain.application.abstractions.repositories.models import DraftCreationStat
+from brain.application.abstractions.repositories.models import DraftCreationStat, DraftCursor, HashtagCount
+from brain.application.types import Unset, UnsetType
 
 
 class IDraftsRepository(Protocol):
@@ -16,6 +17,13 @@ class IDraftsRepository(Protocol):
     async def get_by_id(self, draft_id: UUID) -> Draft | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_plain_by_id(self, draft_id: UUID, for_update: bool = False) -> Draft | None:
+        """
+        Draft columns only: no file and no hashtags are loaded.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_user(
         self,
@@ -26,6 +34,23 @@ class IDraftsRepository(Protocol):
     ) -> list[Draft]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_page_by_user(
+        self,
+        user_id: UUID,
+        limit: int | None,
+        after: DraftCursor | None = None,
+        summary: bool = False,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        hashtags: list[str] | None = None,
+    ) -> list[Draft]:
+        """
+        Newest drafts first, keyset-paginated on (created_at, id); no limit returns every draft.
+        Summary drafts carry only a text preview: no file and no hashtags are loaded.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_by_text(
         self,
@@ -38,11 +63,34 @@ class IDraftsRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, entity: Draft) -> None:
+    async def count_hashtags_by_user(
+        self,
+        user_id: UUID,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> list[HashtagCount]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_for_user(
+        self,
+        draft_id: UUID,
+        user_id: UUID,
+        updated_at: datetime,
+        text: str | None | UnsetType = Unset,
+        file_id: UUID | None | UnsetType = Unset,
+    ) -> Draft | None:
+        """
+        Updates the draft only if it belongs to the user; None when no such draft exists.
+        The returned draft carries the hashtags stored before the update.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_id(self, draft_id: UUID) -> None:
+    async def delete_by_id(self, draft_id: UUID) -> Draft | None:
+        """
+        Returns the deleted draft with its hashtags; None when no row was deleted.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from typing import Protocol
 from uuid import UUID
 
+from brain.application.abstractions.repositories.models import HashtagCount
 from brain.domain.entities.hashtag import Hashtag
 
 
@@ -11,7 +12,10 @@ class IHashtagsRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def replace_draft_hashtags(self, draft_id: UUID, texts: list[str]) -> None:
+    async def replace_draft_hashtags(self, draft_id: UUID, texts: list[str]) -> list[str]:
+        """
+        Returns the hashtags the draft carried before the replacement.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -21,3 +25,14 @@ class IHashtagsRepository(Protocol):
     @abstractmethod
     async def get_by_text(self, text: str) -> Hashtag | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def change_user_hashtag_counts(self, user_id: UUID, texts: list[str], delta: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_hashtag_counts(self, user_id: UUID) -> list[HashtagCount]:
+        """
+        Most used hashtags first, ties broken by text.
+        """
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -21,3 +22,11 @@ class IJwtRefreshTokensRepository(Protocol):
     @abstractmethod
     async def delete_by_id(self, token_id: UUID) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired(self, expired_before: datetime, limit: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self) -> int:
+        raise NotImplementedError
@@ -31,6 +31,13 @@ class IKeywordsRepository(Protocol):
     async def get_note_keyword_names(self, note_id: UUID) -> list[str]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_notes_keyword_names(self, note_ids: list[UUID]) -> list[str]:
+        """
+        Distinct keyword names linked from any of the notes.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_note_keywords(self, note_id: UUID) -> None:
         raise NotImplementedError
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
+from uuid import UUID
 
 
 @dataclass
@@ -18,3 +19,19 @@ class NoteCreationStat:
 class DraftCreationStat:
     date: date
     count: int
+
+
+@dataclass
+class HashtagCount:
+    hashtag: str
+    count: int
+
+
+@dataclass(frozen=True)
+class DraftCursor:
+    """
+    Position in a user's drafts ordered by (created_at, id) descending.
+    """
+
+    created_at: datetime
+    id: UUID
@@ -31,7 +31,25 @@ class INotesRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_id(self, entity_id: UUID) -> Note:
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        pinned_first: bool = True,
+        include_archived: bool = False,
+    ) -> list[Note]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, entity_id: UUID, user_id: UUID | None = None) -> Note:
+        """
+        With user_id, notes of other users are not returned.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_ids(self, entity_ids: list[UUID]) -> list[Note]:
         raise NotImplementedError
 
     @abstractmethod
@@ -51,6 +69,9 @@ class INotesRepository(Protocol):
 
     @abstractmethod
     async def update(self, entity: Note):
+        """
+        Writes the note without reading it back; rows of other users are left untouched.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -58,7 +79,17 @@ class INotesRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_id(self, entity_id: UUID):
+    async def delete_by_id(self, entity_id: UUID, user_id: UUID | None = None) -> Note | None:
+        """
+        Returns the deleted note, or None when no note matched.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_by_ids(self, entity_ids: list[UUID], user_id: UUID | None = None) -> list[Note]:
+        """
+        Deletes the notes in one statement and returns those that matched.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -97,9 +128,9 @@ class INotesRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_note_creation_stats_by_user_telegram_id(
+    async def get_note_creation_stats_by_user_id(
         self,
-        telegram_id: int,
+        user_id: UUID,
         timezone_name: str = "UTC",
     ) -> list[NoteCreationStat]:
         raise NotImplementedError
@@ -25,6 +25,14 @@ class INotesGraphRepository(Protocol):
     async def delete_note(self, note_id: UUID):
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_notes(self, note_ids: list[UUID]):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_orphan_keywords(self, limit: int) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     async def count_notes_by_user_and_title(self, user_id: UUID, title: str) -> int:
         raise NotImplementedError
@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.repositories.drafts import IDraftsRepository
+from brain.application.abstractions.repositories.notes import INotesRepository
+
+
+class IReadRepositoryRouter(Protocol):
+    """
+    Hands out repositories for read-only queries. They may be served by a lagging
+    read replica, so never use them for data the caller is about to write.
+    """
+
+    @abstractmethod
+    async def get_notes_repo(self, user_id: UUID) -> INotesRepository:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_drafts_repo(self, user_id: UUID) -> IDraftsRepository:
+        raise NotImplementedError
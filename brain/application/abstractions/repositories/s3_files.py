@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -22,6 +23,30 @@ class IS3FilesRepository(Protocol):
     async def update(self, entity: S3File) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_sha256(self, sha256: str) -> S3File | None:
+        """
+        Ready file with the given content hash. The row is share-locked until the transaction
+        ends, so the object cannot be released while a new reference to it is being written.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_path(self, path: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_orphaned_object(self, path: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_orphaned_objects(self, created_before: datetime, limit: int) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_orphaned_object(self, path: str) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_all(self) -> None:
         raise NotImplementedError
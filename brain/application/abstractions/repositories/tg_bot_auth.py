@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from datetime import datetime
 from typing import Protocol
 
 from uuid import UUID
@@ -23,3 +24,11 @@ class ITelegramBotAuthSessionsRepository(Protocol):
         jwt_token_id: UUID,
     ) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_created_before(self, created_before: datetime, limit: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self) -> int:
+        raise NotImplementedError
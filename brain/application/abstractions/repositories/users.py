@@ -33,3 +33,10 @@ class IUsersRepository(Protocol):
     @abstractmethod
     async def get_all(self) -> list[User]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self, after_id: UUID | None, limit: int) -> list[User]:
+        """
+        Users ordered by id, starting after `after_id` (keyset pagination).
+        """
+        raise NotImplementedError
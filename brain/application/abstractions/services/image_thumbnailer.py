@@ -0,0 +1,19 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    size: int
+    content: bytes
+    content_type: str
+
+
+class IImageThumbnailer(Protocol):
+    async def make_thumbnails(self, content: bytes, sizes: Sequence[int]) -> list[Thumbnail]:
+        """
+        Downscale an image so its longest edge fits each of `sizes`.
+        Sizes the original is already smaller than are skipped; returns [] for undecodable content.
+        """
+        raise NotImplementedError
@@ -6,6 +6,14 @@ from typing import Protocol
 class ProfilePictureData:
     content: bytes
     content_type: str
+    file_unique_id: str | None = None
+
+
+@dataclass
+class ProfilePictureRef:
+    file_id: str
+    # Stable across bots and re-uploads of the same photo, unlike file_id
+    file_unique_id: str
 
 
 class IProfilePictureProvider(Protocol):
@@ -16,3 +24,12 @@ class IProfilePictureProvider(Protocol):
             ProfilePictureData | None: Object containing content and content_type or None if no photo found
         """
         raise NotImplementedError
+
+    async def get_profile_picture_ref(self, telegram_id: int) -> ProfilePictureRef | None:
+        """
+        Get a reference to the current profile picture without downloading it.
+        """
+        raise NotImplementedError
+
+    async def download_profile_picture(self, ref: ProfilePictureRef) -> ProfilePictureData | None:
+        raise NotImplementedError
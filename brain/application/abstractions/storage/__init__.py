@@ -1,2 +1,10 @@
-from .files import IFileStorage
+from .files import IFileStorage, PresignedUpload, StoredFile, StoredObjectInfo
 from .user_profile_pictures import IProfilePictureStorage
+
+__all__ = [
+    "IFileStorage",
+    "IProfilePictureStorage",
+    "PresignedUpload",
+    "StoredFile",
+    "StoredObjectInfo",
+]
@@ -1,13 +1,71 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
 from typing import Protocol
 
 
+@dataclass(frozen=True)
+class StoredFile:
+    size: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class StoredObjectInfo:
+    size: int
+    content_type: str | None
+    sha256: str | None
+
+
+@dataclass(frozen=True)
+class PresignedUpload:
+    url: str
+    method: str
+    headers: dict[str, str]
+
+
 class IFileStorage(Protocol):
     @abstractmethod
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
         content_type: str | None = None,
     ) -> str:
         raise NotImplementedError
+
+    @abstractmethod
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        object_name: str,
+        content_type: str | None = None,
+    ) -> StoredFile:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def download(self, object_name: str) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, object_name: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_upload_url(
+        self,
+        object_name: str,
+        content_type: str,
+        size: int,
+        sha256: str | None,
+        expires_in: int,
+    ) -> PresignedUpload:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_download_url(self, object_name: str, expires_in: int) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_object_info(self, object_name: str) -> StoredObjectInfo | None:
+        raise NotImplementedError
@@ -4,7 +4,7 @@ from typing import Protocol
 
 class IProfilePictureStorage(Protocol):
     @abstractmethod
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
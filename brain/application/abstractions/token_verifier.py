@@ -15,3 +15,5 @@ class TokenVerifier(Protocol):
     def create_token(self, payload: dict) -> JwtAccessToken: ...
 
     def decode_token(self, token: str) -> dict: ...
+
+    def get_public_jwks(self) -> list[dict]: ...
@@ -6,6 +6,7 @@ from .drafts.delete_draft import DeleteDraftInteractor
 from .drafts.get_draft import GetDraftInteractor
 from .drafts.get_drafts import GetDraftsInteractor
 from .drafts.get_draft_creation_stats import GetDraftCreationStatsInteractor
+from .drafts.get_draft_hashtag_counts import GetDraftHashtagCountsInteractor as GetDraftHashtagCountsInteractor
 from .drafts.search_drafts_by_text import SearchDraftsByTextInteractor
 from .drafts.update_draft import UpdateDraftInteractor
 from .notes.get_note import GetNoteInteractor
@@ -18,6 +19,7 @@ from .notes.update_note import UpdateNoteInteractor
 from .notes.merge_notes import MergeNotesInteractor
 from .notes.append_note_from_draft import AppendNoteFromDraftInteractor
 from .graph.get_graph import GetGraphInteractor
+from .graph.sweep_orphan_keywords import SweepOrphanKeywordsInteractor as SweepOrphanKeywordsInteractor
 from .users.get_user import GetUserInteractor
 from .users.interactor import UserInteractor
 from .users.upload_profile_picture import UploadUserProfilePictureInteractor
@@ -26,3 +28,8 @@ from .notes.export_notes import ExportNotesInteractor
 from .notes.import_notes import ImportNotesInteractor
 from .upload_file import UploadFileInteractor
 from .get_file import GetFileInteractor
+from .request_file_upload import RequestFileUploadInteractor as RequestFileUploadInteractor
+from .complete_file_upload import CompleteFileUploadInteractor as CompleteFileUploadInteractor
+from .get_file_download_url import GetFileDownloadUrlInteractor as GetFileDownloadUrlInteractor
+from .cleanup_orphaned_files import CleanupOrphanedFilesInteractor as CleanupOrphanedFilesInteractor
+from .generate_file_thumbnails import GenerateFileThumbnailsInteractor as GenerateFileThumbnailsInteractor
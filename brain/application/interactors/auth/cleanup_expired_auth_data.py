@@ -0,0 +1,55 @@
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from brain.application.abstractions.repositories.jwt import IJwtRefreshTokensRepository
+from brain.application.abstractions.repositories.tg_bot_auth import ITelegramBotAuthSessionsRepository
+from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.application.interactors.auth.dto import AuthDataCleanupResult
+from brain.config.models import AuthenticationConfig
+from brain.domain.time import utc_now
+
+
+class CleanupExpiredAuthDataInteractor:
+    def __init__(
+        self,
+        jwt_repo: IJwtRefreshTokensRepository,
+        sessions_repo: ITelegramBotAuthSessionsRepository,
+        auth_config: AuthenticationConfig,
+        uow_factory: UnitOfWorkFactory,
+    ):
+        self._jwt_repo = jwt_repo
+        self._sessions_repo = sessions_repo
+        self._auth_config = auth_config
+        self._uow_factory = uow_factory
+
+    async def _delete_in_batches(self, delete_batch: Callable[[int], Awaitable[int]]) -> int:
+        batch_size = max(1, self._auth_config.cleanup_batch_size)
+        total_deleted = 0
+        while True:
+            async with self._uow_factory() as uow:
+                deleted = await delete_batch(batch_size)
+                await uow.commit()
+            total_deleted += deleted
+            if deleted < batch_size:
+                return total_deleted
+
+    async def execute(self) -> AuthDataCleanupResult:
+        now = utc_now()
+        sessions_created_before = now - timedelta(seconds=self._auth_config.bot_auth_session_lifetime)
+
+        deleted_sessions = await self._delete_in_batches(
+            lambda limit: self._sessions_repo.delete_created_before(
+                created_before=sessions_created_before,
+                limit=limit,
+            )
+        )
+        deleted_tokens = await self._delete_in_batches(
+            lambda limit: self._jwt_repo.delete_expired(expired_before=now, limit=limit)
+        )
+
+        return AuthDataCleanupResult(
+            deleted_refresh_tokens=deleted_tokens,
+            deleted_bot_auth_sessions=deleted_sessions,
+            refresh_tokens_total=await self._jwt_repo.count(),
+            bot_auth_sessions_total=await self._sessions_repo.count(),
+        )
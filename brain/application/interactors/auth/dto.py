@@ -29,3 +29,11 @@ class CreatedApiKey:
     name: str
     key: str
     created_at: datetime
+
+
+@dataclass
+class AuthDataCleanupResult:
+    deleted_refresh_tokens: int
+    deleted_bot_auth_sessions: int
+    refresh_tokens_total: int
+    bot_auth_sessions_total: int
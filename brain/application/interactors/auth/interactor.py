@@ -42,3 +42,6 @@ class AuthInteractor:
 
     async def authorize_by_token(self, token: str) -> User:
         return await self._auth_tokens_service.authorize_by_token(token)
+
+    def get_public_jwks(self) -> list[dict]:
+        return self._auth_tokens_service.get_public_jwks()
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.config.models import S3Config
+from brain.domain.time import utc_now
+
+
+class CleanupOrphanedFilesInteractor:
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        s3_files_repo: IS3FilesRepository,
+        s3_config: S3Config,
+        uow_factory: UnitOfWorkFactory,
+    ):
+        self._file_storage = file_storage
+        self._s3_files_repo = s3_files_repo
+        self._s3_config = s3_config
+        self._uow_factory = uow_factory
+
+    async def execute(self) -> int:
+        created_before = utc_now() - timedelta(seconds=self._s3_config.orphan_cleanup_grace_period)
+        batch_size = max(1, self._s3_config.orphan_cleanup_batch_size)
+        deleted_objects = 0
+        while True:
+            async with self._uow_factory() as uow:
+                paths = await self._s3_files_repo.get_orphaned_objects(
+                    created_before=created_before,
+                    limit=batch_size,
+                )
+                for path in paths:
+                    # The path may have been referenced again since it was released.
+                    if await self._s3_files_repo.count_by_path(path) == 0:
+                        await self._file_storage.delete(path)
+                        deleted_objects += 1
+                    await self._s3_files_repo.delete_orphaned_object(path)
+                await uow.commit()
+            if len(paths) < batch_size:
+                return deleted_objects
@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.application.interactors.file_dto import ReadFileOutput
+from brain.application.interactors.get_file import FileNotFoundException
+from brain.application.services.file_deduplication import FileDeduplicationService
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3FileStatus
+from brain.domain.services.media import build_public_file_url
+
+
+class FileUploadNotCompletedException(Exception):
+    pass
+
+
+class CompleteFileUploadInteractor:
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        s3_files_repo: IS3FilesRepository,
+        s3_config: S3Config,
+        uow_factory: UnitOfWorkFactory,
+        file_deduplication_service: FileDeduplicationService,
+    ):
+        self._file_storage = file_storage
+        self._s3_files_repo = s3_files_repo
+        self._s3_config = s3_config
+        self._uow_factory = uow_factory
+        self._file_deduplication_service = file_deduplication_service
+
+    async def complete_upload(self, file_id: UUID, user_id: UUID) -> ReadFileOutput:
+        async with self._uow_factory() as uow:
+            file = await self._s3_files_repo.get_by_id(file_id=file_id)
+            # Other users' files are reported as missing so their ids cannot be probed
+            if not file or file.owner_id != user_id:
+                raise FileNotFoundException()
+
+            if file.status == S3FileStatus.PENDING:
+                info = await self._file_storage.get_object_info(file.path)
+                if info is None or info.size != file.size:
+                    raise FileUploadNotCompletedException()
+                if file.sha256 and info.sha256 and info.sha256 != file.sha256:
+                    raise FileUploadNotCompletedException()
+
+                file.status = S3FileStatus.READY
+                file.sha256 = file.sha256 or info.sha256
+                if file.sha256:
+                    file.path = await self._file_deduplication_service.resolve_uploaded(file.path, file.sha256)
+                await self._s3_files_repo.update(file)
+                await uow.commit()
+
+        return ReadFileOutput(
+            id=file.id,
+            name=file.name,
+            path=file.path,
+            content_type=file.content_type,
+            created_at=file.created_at,
+            url=build_public_file_url(
+                external_host=self._s3_config.external_host,
+                file_path=file.path,
+            ),
+        )
@@ -29,6 +29,7 @@ class CreateDraftInteractor:
             await self._drafts_repo.create(draft)
             draft.hashtags = await self._hashtag_sync_service.sync(
                 draft_id=draft.id,
+                user_id=draft.user_id,
                 text=draft.text,
             )
             await uow.commit()
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from brain.application.abstractions.repositories.models import DraftCursor
 from brain.application.types import Unset, UnsetType
+from brain.domain.entities.draft import Draft
 
 
 @dataclass
@@ -14,6 +16,13 @@ class CreateDraft:
 @dataclass
 class UpdateDraft:
     draft_id: UUID
+    user_id: UUID
     text: str | None | UnsetType = Unset
     file_id: UUID | None | UnsetType = Unset
     patch: str | None | UnsetType = Unset
+
+
+@dataclass
+class DraftsPage:
+    drafts: list[Draft]
+    next_cursor: DraftCursor | None
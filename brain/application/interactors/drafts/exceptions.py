@@ -4,3 +4,7 @@ class DraftNotFoundException(Exception):
 
 class DraftPatchApplyException(Exception):
     pass
+
+
+class UpdateDraftForbiddenException(Exception):
+    pass
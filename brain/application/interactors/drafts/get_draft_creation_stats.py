@@ -1,19 +1,20 @@
 from uuid import UUID
 
-from brain.application.abstractions.repositories.drafts import IDraftsRepository
 from brain.application.abstractions.repositories.models import DraftCreationStat
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 
 
 class GetDraftCreationStatsInteractor:
-    def __init__(self, drafts_repo: IDraftsRepository):
-        self._drafts_repo = drafts_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def get_stats(
         self,
         user_id: UUID,
         timezone_name: str = "UTC",
     ) -> list[DraftCreationStat]:
-        return await self._drafts_repo.get_draft_creation_stats_by_user_id(
+        drafts_repo = await self._read_repositories.get_drafts_repo(user_id)
+        return await drafts_repo.get_draft_creation_stats_by_user_id(
             user_id=user_id,
             timezone_name=timezone_name,
         )
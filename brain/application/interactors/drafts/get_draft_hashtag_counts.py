@@ -0,0 +1,31 @@
+from datetime import datetime
+from uuid import UUID
+
+from brain.application.abstractions.repositories.drafts import IDraftsRepository
+from brain.application.abstractions.repositories.hashtags import IHashtagsRepository
+from brain.application.abstractions.repositories.models import HashtagCount
+
+
+class GetDraftHashtagCountsInteractor:
+    def __init__(
+        self,
+        hashtags_repo: IHashtagsRepository,
+        drafts_repo: IDraftsRepository,
+    ):
+        self._hashtags_repo = hashtags_repo
+        self._drafts_repo = drafts_repo
+
+    async def get_counts(
+        self,
+        user_id: UUID,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> list[HashtagCount]:
+        if from_date is None and to_date is None:
+            return await self._hashtags_repo.get_user_hashtag_counts(user_id)
+        # Totals cannot be split by creation time, so a date range counts the matching drafts instead.
+        return await self._drafts_repo.count_hashtags_by_user(
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+        )
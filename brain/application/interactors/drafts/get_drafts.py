@@ -1,14 +1,16 @@
 from datetime import datetime
 from uuid import UUID
 
-from brain.application.abstractions.repositories.drafts import IDraftsRepository
+from brain.application.abstractions.repositories.models import DraftCursor
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
+from brain.application.interactors.drafts.dto import DraftsPage
 from brain.domain.entities.draft import Draft
 from brain.domain.services.hashtags import normalize_hashtag_texts
 
 
 class GetDraftsInteractor:
-    def __init__(self, drafts_repo: IDraftsRepository):
-        self._drafts_repo = drafts_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def get_drafts(
         self,
@@ -18,9 +20,38 @@ class GetDraftsInteractor:
         hashtags: list[str] | None = None,
     ) -> list[Draft]:
         normalized_hashtags = normalize_hashtag_texts(hashtags or [])
-        return await self._drafts_repo.get_by_user(
+        drafts_repo = await self._read_repositories.get_drafts_repo(user_id)
+        return await drafts_repo.get_by_user(
             user_id=user_id,
             from_date=from_date,
             to_date=to_date,
             hashtags=normalized_hashtags or None,
         )
+
+    async def get_drafts_page(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: DraftCursor | None = None,
+        summary: bool = False,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        hashtags: list[str] | None = None,
+    ) -> DraftsPage:
+        normalized_hashtags = normalize_hashtag_texts(hashtags or [])
+        drafts_repo = await self._read_repositories.get_drafts_repo(user_id)
+        # One extra row tells whether another page exists without a count query.
+        drafts = await drafts_repo.get_page_by_user(
+            user_id=user_id,
+            limit=limit + 1 if limit is not None else None,
+            after=cursor,
+            summary=summary,
+            from_date=from_date,
+            to_date=to_date,
+            hashtags=normalized_hashtags or None,
+        )
+        next_cursor = None
+        if limit is not None and len(drafts) > limit:
+            drafts = drafts[:limit]
+            next_cursor = DraftCursor(created_at=drafts[-1].created_at, id=drafts[-1].id)
+        return DraftsPage(drafts=drafts, next_cursor=next_cursor)
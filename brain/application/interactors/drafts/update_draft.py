@@ -4,10 +4,12 @@ from brain.application.interactors.drafts.dto import UpdateDraft
 from brain.application.interactors.drafts.exceptions import (
     DraftNotFoundException,
     DraftPatchApplyException,
+    UpdateDraftForbiddenException,
 )
 from brain.application.services.draft_hashtag_sync import DraftHashtagSyncService
 from brain.application.types import Unset
 from brain.domain.entities.draft import Draft
+from brain.domain.services.hashtags import extract_hashtags
 from brain.domain.time import utc_now
 from brain.domain.services.diffs import apply_patch
 
@@ -23,31 +25,44 @@ class UpdateDraftInteractor:
         self._hashtag_sync_service = hashtag_sync_service
         self._uow_factory = uow_factory
 
+    async def _raise_access_error(self, draft_data: UpdateDraft, draft: Draft | None = None) -> None:
+        if draft is None:
+            draft = await self._drafts_repo.get_plain_by_id(draft_data.draft_id)
+        if draft is None:
+            raise DraftNotFoundException()
+        raise UpdateDraftForbiddenException()
+
     async def update_draft(self, draft_data: UpdateDraft) -> Draft:
         async with self._uow_factory() as uow:
-            draft = await self._drafts_repo.get_by_id(draft_data.draft_id)
-            if draft is None:
-                raise DraftNotFoundException()
-
+            text = draft_data.text
             if draft_data.patch is not Unset and draft_data.patch is not None:
+                # Patches apply to the stored text; the row lock keeps concurrent autosaves from losing edits.
+                current = await self._drafts_repo.get_plain_by_id(draft_data.draft_id, for_update=True)
+                if current is None or current.user_id != draft_data.user_id:
+                    await self._raise_access_error(draft_data, current)
                 try:
-                    draft.text = apply_patch(draft.text or "", draft_data.patch)
+                    text = apply_patch(current.text or "", draft_data.patch)
                 except Exception as exc:
                     raise DraftPatchApplyException() from exc
-            elif draft_data.text is not Unset:
-                draft.text = draft_data.text
-            if draft_data.file_id is not Unset:
-                draft.file_id = draft_data.file_id
 
-            draft.updated_at = utc_now()
-            await self._drafts_repo.update(draft)
-            hashtags = await self._hashtag_sync_service.sync(
-                draft_id=draft.id,
-                text=draft.text,
+            draft = await self._drafts_repo.update_for_user(
+                draft_id=draft_data.draft_id,
+                user_id=draft_data.user_id,
+                updated_at=utc_now(),
+                text=text,
+                file_id=draft_data.file_id,
             )
-            updated_draft = await self._drafts_repo.get_by_id(draft.id)
-            if updated_draft is None:
-                raise DraftNotFoundException()
-            updated_draft.hashtags = hashtags
+            if draft is None:
+                await self._raise_access_error(draft_data)
+
+            if text is not Unset:
+                hashtags = extract_hashtags(draft.text)
+                if set(hashtags) != set(draft.hashtags):
+                    await self._hashtag_sync_service.sync(
+                        draft_id=draft.id,
+                        user_id=draft.user_id,
+                        text=draft.text,
+                    )
+                draft.hashtags = hashtags
             await uow.commit()
-            return updated_draft
+            return draft
@@ -2,15 +2,20 @@ from dishka import Provider, Scope, provide
 
 from brain.application.interactors import (
     AppendNoteFromDraftInteractor,
+    CleanupOrphanedFilesInteractor,
+    CompleteFileUploadInteractor,
     CreateDraftInteractor,
     CreateNoteFromDraftInteractor,
     CreateNoteInteractor,
     DeleteDraftInteractor,
     DeleteNoteInteractor,
     ExportNotesInteractor,
+    GenerateFileThumbnailsInteractor,
     GetDraftCreationStatsInteractor,
+    GetDraftHashtagCountsInteractor,
     GetDraftInteractor,
     GetDraftsInteractor,
+    GetFileDownloadUrlInteractor,
     GetFileInteractor,
     GetGraphInteractor,
     GetNewNoteTitleInteractor,
@@ -20,9 +25,11 @@ from brain.application.interactors import (
     GetUserInteractor,
     ImportNotesInteractor,
     MergeNotesInteractor,
+    RequestFileUploadInteractor,
     SearchDraftsByTextInteractor,
     SearchNotesByTitleInteractor,
     SearchWikilinkSuggestionsInteractor,
+    SweepOrphanKeywordsInteractor,
     UpdateDraftInteractor,
     UpdateNoteInteractor,
     UploadFileInteractor,
@@ -30,6 +37,7 @@ from brain.application.interactors import (
     UserInteractor,
 )
 from brain.application.interactors.auth.authorize_api_key import AuthorizeApiKeyInteractor
+from brain.application.interactors.auth.cleanup_expired_auth_data import CleanupExpiredAuthDataInteractor
 from brain.application.interactors.auth.create_api_key import CreateApiKeyInteractor
 from brain.application.interactors.auth.delete_api_key import DeleteApiKeyInteractor
 from brain.application.interactors.auth.get_api_keys import GetApiKeysInteractor
@@ -43,6 +51,7 @@ from brain.application.services.api_key_authorization import ApiKeyAuthorization
 from brain.application.services.auth_tokens import AuthTokensService
 from brain.application.services.draft_access import DraftDeletionService, DraftLookupService
 from brain.application.services.draft_hashtag_sync import DraftHashtagSyncService
+from brain.application.services.file_deduplication import FileDeduplicationService
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_crud import NoteCreationService, NoteDeletionService, NoteUpdateService
 from brain.application.services.note_keyword_sync import NoteKeywordSyncService
@@ -57,6 +66,7 @@ from brain.domain.services.note_text import NoteTextService
 class InteractorProvider(Provider):
     get_user_lookup_service = provide(UserLookupService, scope=Scope.REQUEST)
     get_user_profile_picture_service = provide(UserProfilePictureService, scope=Scope.REQUEST)
+    get_file_deduplication_service = provide(FileDeduplicationService, scope=Scope.REQUEST)
     get_auth_tokens_service = provide(AuthTokensService, scope=Scope.REQUEST)
     get_pin_verification_service = provide(PinVerificationService, scope=Scope.REQUEST)
     get_api_key_authorization_service = provide(ApiKeyAuthorizationService, scope=Scope.REQUEST)
@@ -72,6 +82,11 @@ class InteractorProvider(Provider):
     get_upload_user_profile_picture_interactor = provide(UploadUserProfilePictureInteractor, scope=Scope.REQUEST)
     get_upload_file_interactor = provide(UploadFileInteractor, scope=Scope.REQUEST)
     get_get_file_interactor = provide(GetFileInteractor, scope=Scope.REQUEST)
+    get_request_file_upload_interactor = provide(RequestFileUploadInteractor, scope=Scope.REQUEST)
+    get_complete_file_upload_interactor = provide(CompleteFileUploadInteractor, scope=Scope.REQUEST)
+    get_get_file_download_url_interactor = provide(GetFileDownloadUrlInteractor, scope=Scope.REQUEST)
+    get_cleanup_orphaned_files_interactor = provide(CleanupOrphanedFilesInteractor, scope=Scope.REQUEST)
+    get_generate_file_thumbnails_interactor = provide(GenerateFileThumbnailsInteractor, scope=Scope.REQUEST)
     get_update_all_users_profile_pictures_interactor = provide(
         UpdateAllUsersProfilePicturesInteractor,
         scope=Scope.REQUEST,
@@ -95,6 +110,7 @@ class InteractorProvider(Provider):
     get_get_notes_interactor = provide(GetNotesInteractor, scope=Scope.REQUEST)
     get_get_drafts_interactor = provide(GetDraftsInteractor, scope=Scope.REQUEST)
     get_get_draft_creation_stats_interactor = provide(GetDraftCreationStatsInteractor, scope=Scope.REQUEST)
+    get_get_draft_hashtag_counts_interactor = provide(GetDraftHashtagCountsInteractor, scope=Scope.REQUEST)
     get_get_note_creation_stats_interactor = provide(GetNoteCreationStatsInteractor, scope=Scope.REQUEST)
     get_get_note_interactor = provide(GetNoteInteractor, scope=Scope.REQUEST)
     get_get_draft_interactor = provide(GetDraftInteractor, scope=Scope.REQUEST)
@@ -103,6 +119,7 @@ class InteractorProvider(Provider):
     get_search_drafts_by_text_interactor = provide(SearchDraftsByTextInteractor, scope=Scope.REQUEST)
     get_search_wikilink_suggestions_interactor = provide(SearchWikilinkSuggestionsInteractor, scope=Scope.REQUEST)
     get_get_graph_interactor = provide(GetGraphInteractor, scope=Scope.REQUEST)
+    get_sweep_orphan_keywords_interactor = provide(SweepOrphanKeywordsInteractor, scope=Scope.REQUEST)
 
     get_auth_interactor = provide(AuthInteractor, scope=Scope.REQUEST)
     get_request_authorization_interactor = provide(RequestAuthorizationInteractor, scope=Scope.REQUEST)
@@ -113,6 +130,7 @@ class InteractorProvider(Provider):
     get_telegram_bot_auth_session_interactor = provide(TelegramBotAuthSessionInteractor, scope=Scope.REQUEST)
     get_set_user_pin_interactor = provide(SetUserPinInteractor, scope=Scope.REQUEST)
     get_verify_user_pin_interactor = provide(VerifyUserPinInteractor, scope=Scope.REQUEST)
+    get_cleanup_expired_auth_data_interactor = provide(CleanupExpiredAuthDataInteractor, scope=Scope.REQUEST)
 
     get_export_notes_interactor = provide(ExportNotesInteractor, scope=Scope.REQUEST)
     get_import_notes_interactor = provide(ImportNotesInteractor, scope=Scope.REQUEST)
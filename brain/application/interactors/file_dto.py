@@ -1,8 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
 
+@dataclass(frozen=True)
+class ReadFileThumbnailOutput:
+    size: int
+    content_type: str
+    url: str
+
+
 @dataclass(frozen=True)
 class ReadFileOutput:
     id: UUID
@@ -11,3 +18,19 @@ class ReadFileOutput:
     content_type: str
     created_at: datetime | None
     url: str
+    thumbnails: list[ReadFileThumbnailOutput] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FileUploadTicketOutput:
+    file_id: UUID
+    upload_url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+@dataclass(frozen=True)
+class FileDownloadUrlOutput:
+    url: str
+    expires_at: datetime
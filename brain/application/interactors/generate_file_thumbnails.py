@@ -0,0 +1,89 @@
+import hashlib
+import logging
+from uuid import UUID, uuid4
+
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+from brain.application.abstractions.services.image_thumbnailer import IImageThumbnailer
+from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3File, S3FileStatus
+from brain.domain.services.media import is_thumbnail_source
+from brain.domain.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class GenerateFileThumbnailsInteractor:
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        s3_files_repo: IS3FilesRepository,
+        image_thumbnailer: IImageThumbnailer,
+        s3_config: S3Config,
+        uow_factory: UnitOfWorkFactory,
+    ):
+        self._file_storage = file_storage
+        self._s3_files_repo = s3_files_repo
+        self._image_thumbnailer = image_thumbnailer
+        self._s3_config = s3_config
+        self._uow_factory = uow_factory
+
+    async def generate_thumbnails(self, file_id: UUID) -> list[S3File]:
+        async with self._uow_factory():
+            file = await self._s3_files_repo.get_by_id(file_id=file_id)
+        if not self._needs_thumbnails(file):
+            return []
+
+        # Download, resize and upload run outside the unit of work so no connection is held meanwhile.
+        content = await self._file_storage.download(file.path)
+        thumbnails = await self._image_thumbnailer.make_thumbnails(content, self._get_sizes())
+        if not thumbnails:
+            return []
+
+        # Keyed by content hash so deduplicated copies of an image share the same thumbnail objects.
+        prefix = f"thumbnails/{file.sha256 or file.id}"
+        files = []
+        for thumbnail in thumbnails:
+            object_name = f"{prefix}/{thumbnail.size}.webp"
+            await self._file_storage.upload(
+                content=thumbnail.content,
+                object_name=object_name,
+                content_type=thumbnail.content_type,
+            )
+            files.append(
+                S3File(
+                    id=uuid4(),
+                    name=object_name,
+                    path=object_name,
+                    content_type=thumbnail.content_type,
+                    size=len(thumbnail.content),
+                    sha256=hashlib.sha256(thumbnail.content).hexdigest(),
+                    parent_id=file.id,
+                    thumbnail_size=thumbnail.size,
+                    created_at=utc_now(),
+                )
+            )
+
+        async with self._uow_factory() as uow:
+            # The task may have been delivered twice; the first run wins.
+            current = await self._s3_files_repo.get_by_id(file_id=file.id)
+            if current is None or current.thumbnails:
+                return []
+            for thumbnail_file in files:
+                await self._s3_files_repo.create(entity=thumbnail_file)
+            await uow.commit()
+        logger.debug("Generated %d thumbnails for file %s", len(files), file.id)
+        return files
+
+    def _needs_thumbnails(self, file: S3File | None) -> bool:
+        if file is None or file.status != S3FileStatus.READY:
+            return False
+        if file.parent_id is not None or file.thumbnails:
+            return False
+        if not is_thumbnail_source(file.content_type):
+            return False
+        return file.size is None or file.size <= self._s3_config.thumbnail_max_source_size
+
+    def _get_sizes(self) -> list[int]:
+        return [int(size) for size in self._s3_config.thumbnail_sizes.split(",") if size.strip()]
@@ -1,8 +1,9 @@
 from uuid import UUID
 
 from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
-from brain.application.interactors.file_dto import ReadFileOutput
+from brain.application.interactors.file_dto import ReadFileOutput, ReadFileThumbnailOutput
 from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3FileStatus
 from brain.domain.services.media import build_public_file_url
 
 
@@ -21,7 +22,7 @@ class GetFileInteractor:
 
     async def get_file_by_id(self, file_id: UUID) -> ReadFileOutput:
         file = await self._s3_files_repo.get_by_id(file_id=file_id)
-        if not file:
+        if not file or file.status != S3FileStatus.READY:
             raise FileNotFoundException()
         return ReadFileOutput(
             id=file.id,
@@ -33,4 +34,15 @@ class GetFileInteractor:
                 external_host=self._s3_config.external_host,
                 file_path=file.path,
             ),
+            thumbnails=[
+                ReadFileThumbnailOutput(
+                    size=thumbnail.thumbnail_size,
+                    content_type=thumbnail.content_type,
+                    url=build_public_file_url(
+                        external_host=self._s3_config.external_host,
+                        file_path=thumbnail.path,
+                    ),
+                )
+                for thumbnail in file.thumbnails
+            ],
         )
@@ -0,0 +1,31 @@
+from datetime import timedelta
+from uuid import UUID
+
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.interactors.file_dto import FileDownloadUrlOutput
+from brain.application.interactors.get_file import FileNotFoundException
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3FileStatus
+from brain.domain.time import utc_now
+
+
+class GetFileDownloadUrlInteractor:
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        s3_files_repo: IS3FilesRepository,
+        s3_config: S3Config,
+    ):
+        self._file_storage = file_storage
+        self._s3_files_repo = s3_files_repo
+        self._s3_config = s3_config
+
+    async def get_download_url(self, file_id: UUID, user_id: UUID) -> FileDownloadUrlOutput:
+        file = await self._s3_files_repo.get_by_id(file_id=file_id)
+        if not file or file.owner_id != user_id or file.status != S3FileStatus.READY:
+            raise FileNotFoundException()
+
+        expires_in = self._s3_config.presigned_url_ttl
+        url = await self._file_storage.create_download_url(object_name=file.path, expires_in=expires_in)
+        return FileDownloadUrlOutput(url=url, expires_at=utc_now() + timedelta(seconds=expires_in))
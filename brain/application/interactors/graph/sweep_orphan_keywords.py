@@ -0,0 +1,28 @@
+from brain.application.abstractions.config.models import INeo4jConfig
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.application.abstractions.uow import UnitOfWorkFactory
+
+
+class SweepOrphanKeywordsInteractor:
+    def __init__(
+        self,
+        notes_graph_repo: INotesGraphRepository,
+        neo4j_config: INeo4jConfig,
+        uow_factory: UnitOfWorkFactory,
+    ):
+        self._notes_graph_repo = notes_graph_repo
+        self._neo4j_config = neo4j_config
+        self._uow_factory = uow_factory
+
+    async def execute(self) -> int:
+        if not self._neo4j_config.orphan_keyword_sweep_enabled:
+            return 0
+        batch_size = max(1, self._neo4j_config.orphan_keyword_sweep_batch_size)
+        deleted_keywords = 0
+        while True:
+            async with self._uow_factory() as uow:
+                deleted = await self._notes_graph_repo.delete_orphan_keywords(limit=batch_size)
+                await uow.commit()
+            deleted_keywords += deleted
+            if deleted < batch_size:
+                return deleted_keywords
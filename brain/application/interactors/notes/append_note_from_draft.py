@@ -52,6 +52,7 @@ class AppendNoteFromDraftInteractor:
             if text != note.text:
                 updated_note = await self._note_update_service.update_note(
                     UpdateNote(note_id=note.id, text=text),
+                    note=note,
                 )
             await self._draft_deletion_service.delete_draft(draft.id)
             await uow.commit()
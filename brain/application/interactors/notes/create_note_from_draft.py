@@ -1,12 +1,12 @@
-from uuid import UUID
-
 from brain.application.abstractions.repositories.drafts import IDraftsRepository
 from brain.application.abstractions.uow import UnitOfWorkFactory
 from brain.application.interactors.drafts.exceptions import DraftNotFoundException
 from brain.application.interactors.notes.dto import CreateNote, CreateNoteFromDraft
+from brain.application.services.draft_hashtag_sync import DraftHashtagSyncService
 from brain.application.services.note_crud import NoteCreationService
 from brain.application.services.user_lookup import UserLookupService
 from brain.config.models import S3Config
+from brain.domain.entities.note import Note
 from brain.domain.services.media import build_public_file_url
 
 
@@ -20,12 +20,14 @@ class CreateNoteFromDraftInteractor:
         user_lookup_service: UserLookupService,
         drafts_repo: IDraftsRepository,
         note_creation_service: NoteCreationService,
+        hashtag_sync_service: DraftHashtagSyncService,
         s3_config: S3Config,
         uow_factory: UnitOfWorkFactory,
     ):
         self._user_lookup_service = user_lookup_service
         self._drafts_repo = drafts_repo
         self._note_creation_service = note_creation_service
+        self._hashtag_sync_service = hashtag_sync_service
         self._s3_config = s3_config
         self._uow_factory = uow_factory
 
@@ -39,7 +41,7 @@ class CreateNoteFromDraftInteractor:
             return markdown_image
         return f"{draft_text}\n\n{markdown_image}"
 
-    async def create_note_from_draft(self, note_data: CreateNoteFromDraft) -> UUID:
+    async def create_note_from_draft(self, note_data: CreateNoteFromDraft) -> Note:
         async with self._uow_factory() as uow:
             user = await self._user_lookup_service.get_user_by_telegram_id(note_data.by_user_telegram_id)
             draft = await self._drafts_repo.get_by_id(note_data.draft_id)
@@ -56,8 +58,11 @@ class CreateNoteFromDraftInteractor:
                     file_path=draft.file.path,
                 )
 
-            await self._drafts_repo.delete_by_id(draft.id)
-            note_id = await self._note_creation_service.create_note(
+            deleted = await self._drafts_repo.delete_by_id(draft.id)
+            if deleted is None:
+                raise DraftNotFoundException()
+            await self._hashtag_sync_service.release(user_id=deleted.user_id, hashtags=deleted.hashtags)
+            note = await self._note_creation_service.create_note(
                 CreateNote(
                     by_user_telegram_id=note_data.by_user_telegram_id,
                     title=note_data.title,
@@ -65,4 +70,4 @@ class CreateNoteFromDraftInteractor:
                 )
             )
             await uow.commit()
-            return note_id
+            return note
@@ -13,7 +13,7 @@ class DeleteNoteInteractor:
         self._note_deletion_service = note_deletion_service
         self._uow_factory = uow_factory
 
-    async def delete_note(self, note_id: UUID) -> None:
+    async def delete_note(self, note_id: UUID, user_id: UUID | None = None) -> None:
         async with self._uow_factory() as uow:
-            await self._note_deletion_service.delete_note(note_id)
+            await self._note_deletion_service.delete_note(note_id, user_id=user_id)
             await uow.commit()
@@ -20,6 +20,8 @@ class CreateNoteFromDraft:
 @dataclass
 class UpdateNote:
     note_id: UUID
+    # When set, only a note owned by this user is updated
+    user_id: UUID | None = None
     title: str | None | UnsetType = Unset
     text: str | None | UnsetType = Unset
     patch: str | None | UnsetType = Unset
@@ -12,3 +12,7 @@ class NoteTitleRequiredException(Exception):
 
 class NoteTitleAlreadyExistsException(Exception):
     pass
+
+
+class NoteForbiddenException(Exception):
+    pass
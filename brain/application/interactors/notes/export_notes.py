@@ -3,7 +3,7 @@ import json
 import zipfile
 from dataclasses import asdict
 
-from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 from brain.application.services.user_lookup import UserLookupService
 from brain.domain.services import sanitize_filename
 
@@ -12,14 +12,15 @@ class ExportNotesInteractor:
     def __init__(
         self,
         user_lookup_service: UserLookupService,
-        notes_repo: INotesRepository,
+        read_repositories: IReadRepositoryRouter,
     ):
         self._user_lookup_service = user_lookup_service
-        self._notes_repo = notes_repo
+        self._read_repositories = read_repositories
 
     async def export_notes(self, user_telegram_id: int) -> bytes:
-        await self._user_lookup_service.get_user_by_telegram_id(user_telegram_id)
-        notes = await self._notes_repo.get_by_user_telegram_id(
+        user = await self._user_lookup_service.get_user_by_telegram_id(user_telegram_id)
+        notes_repo = await self._read_repositories.get_notes_repo(user.id)
+        notes = await notes_repo.get_by_user_telegram_id(
             user_telegram_id,
             include_archived=True,
         )
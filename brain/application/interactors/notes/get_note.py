@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from brain.application.interactors.notes.exceptions import NoteForbiddenException, NoteNotFoundException
 from brain.application.services.note_lookup import NoteLookupService
 from brain.domain.entities.note import Note
 
@@ -11,5 +12,13 @@ class GetNoteInteractor:
     async def get_note_by_id(self, note_id: UUID) -> Note | None:
         return await self._note_lookup_service.get_note_by_id(note_id)
 
+    async def get_user_note(self, note_id: UUID, user_id: UUID) -> Note:
+        note = await self._note_lookup_service.get_note_by_id(note_id)
+        if note is None:
+            raise NoteNotFoundException()
+        if note.user_id != user_id:
+            raise NoteForbiddenException()
+        return note
+
     async def get_note_by_title(self, user_id: UUID, title: str, exact_match: bool = False) -> Note | None:
         return await self._note_lookup_service.get_note_by_title(user_id, title, exact_match)
@@ -1,17 +1,20 @@
-from brain.application.abstractions.repositories.notes import INotesRepository
+from uuid import UUID
+
 from brain.application.abstractions.repositories.models import NoteCreationStat
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 
 
 class GetNoteCreationStatsInteractor:
-    def __init__(self, notes_repo: INotesRepository):
-        self._notes_repo = notes_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def get_stats(
         self,
-        user_telegram_id: int,
+        user_id: UUID,
         timezone_name: str = "UTC",
     ) -> list[NoteCreationStat]:
-        return await self._notes_repo.get_note_creation_stats_by_user_telegram_id(
-            telegram_id=user_telegram_id,
+        notes_repo = await self._read_repositories.get_notes_repo(user_id)
+        return await notes_repo.get_note_creation_stats_by_user_id(
+            user_id=user_id,
             timezone_name=timezone_name,
         )
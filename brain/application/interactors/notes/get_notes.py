@@ -1,23 +1,25 @@
 from datetime import datetime
+from uuid import UUID
 
-from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 from brain.domain.entities.note import Note
 
 
 class GetNotesInteractor:
-    def __init__(self, notes_repo: INotesRepository):
-        self._notes_repo = notes_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def get_notes(
         self,
-        user_telegram_id: int,
+        user_id: UUID,
         from_date: datetime | None = None,
         to_date: datetime | None = None,
         pinned_first: bool = True,
         include_archived: bool = False,
     ) -> list[Note]:
-        return await self._notes_repo.get_by_user_telegram_id(
-            user_telegram_id,
+        notes_repo = await self._read_repositories.get_notes_repo(user_id)
+        return await notes_repo.get_by_user_id(
+            user_id,
             from_date=from_date,
             to_date=to_date,
             pinned_first=pinned_first,
@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from brain.application.abstractions.uow import UnitOfWorkFactory
 from brain.application.interactors.notes.dto import MergeNotes, UpdateNote
 from brain.application.interactors.notes.exceptions import NoteNotFoundException
@@ -35,24 +33,21 @@ class MergeNotesInteractor:
         self._note_text_service = note_text_service
         self._uow_factory = uow_factory
 
-    async def _get_note_or_raise(self, note_id: UUID) -> Note:
-        note = await self._note_lookup_service.get_note_by_id(note_id)
-        if note is None:
-            raise NoteNotFoundException()
-        return note
-
     async def merge_notes(self, data: MergeNotes) -> Note:
         async with self._uow_factory() as uow:
             if not data.source_note_ids:
                 raise MergeNotesValidationException("source_note_ids cannot be empty")
-            if len(set(data.source_note_ids)) != len(data.source_note_ids):
-                raise MergeNotesValidationException("Note ids must be unique")
-            if data.target_note_id in set(data.source_note_ids):
+            source_note_ids = list(dict.fromkeys(data.source_note_ids))
+            if data.target_note_id in source_note_ids:
                 raise MergeNotesValidationException("Source notes cannot include target note")
 
             user = await self._user_lookup_service.get_user_by_telegram_id(data.by_user_telegram_id)
-            source_notes = [await self._get_note_or_raise(note_id) for note_id in data.source_note_ids]
-            target_note = await self._get_note_or_raise(data.target_note_id)
+            notes = await self._note_lookup_service.get_notes_by_ids([*source_note_ids, data.target_note_id])
+            notes_by_id = {note.id: note for note in notes}
+            if len(notes_by_id) != len(source_note_ids) + 1:
+                raise NoteNotFoundException()
+            source_notes = [notes_by_id[note_id] for note_id in source_note_ids]
+            target_note = notes_by_id[data.target_note_id]
 
             notes_to_validate = source_notes + [target_note]
             if any(note.user_id != user.id for note in notes_to_validate):
@@ -65,9 +60,12 @@ class MergeNotesInteractor:
                 text = self._note_text_service.append_with_newline(target_note.text, source_text)
                 updated_target = await self._note_update_service.update_note(
                     UpdateNote(note_id=target_note.id, text=text),
+                    note=target_note,
                 )
 
-            for source_note in source_notes:
-                await self._note_deletion_service.delete_note(source_note.id)
+            await self._note_deletion_service.delete_notes(
+                [source_note.id for source_note in source_notes],
+                user_id=user.id,
+            )
             await uow.commit()
             return updated_target
@@ -1,12 +1,12 @@
 from uuid import UUID
 
-from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 from brain.domain.entities.note import Note
 
 
 class SearchNotesByTitleInteractor:
-    def __init__(self, notes_repo: INotesRepository):
-        self._notes_repo = notes_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def search(
         self,
@@ -21,7 +21,8 @@ class SearchNotesByTitleInteractor:
         if not normalized_query:
             return []
 
-        return await self._notes_repo.search_by_title(
+        notes_repo = await self._read_repositories.get_notes_repo(user_id)
+        return await notes_repo.search_by_title(
             user_id=user_id,
             query=normalized_query,
             exact_match=exact_match,
@@ -1,19 +1,20 @@
 from uuid import UUID
 
 from brain.application.abstractions.repositories.models import WikilinkSuggestion
-from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 
 
 class SearchWikilinkSuggestionsInteractor:
-    def __init__(self, notes_repo: INotesRepository):
-        self._notes_repo = notes_repo
+    def __init__(self, read_repositories: IReadRepositoryRouter):
+        self._read_repositories = read_repositories
 
     async def search_wikilink_suggestions(
         self,
         user_id: UUID,
         query: str,
     ) -> list[WikilinkSuggestion]:
-        return await self._notes_repo.search_wikilink_suggestions(
+        notes_repo = await self._read_repositories.get_notes_repo(user_id)
+        return await notes_repo.search_wikilink_suggestions(
             user_id=user_id,
             query=query,
         )
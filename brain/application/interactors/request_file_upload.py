@@ -0,0 +1,72 @@
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.application.interactors.file_dto import FileUploadTicketOutput
+from brain.application.interactors.upload_file import FileTooLargeException
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3File, S3FileStatus
+from brain.domain.services.media import get_file_extension
+from brain.domain.time import utc_now
+
+
+class RequestFileUploadInteractor:
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        s3_files_repo: IS3FilesRepository,
+        s3_config: S3Config,
+        uow_factory: UnitOfWorkFactory,
+    ):
+        self._file_storage = file_storage
+        self._s3_files_repo = s3_files_repo
+        self._s3_config = s3_config
+        self._uow_factory = uow_factory
+
+    async def request_upload(
+        self,
+        owner_id: UUID,
+        filename: str | None,
+        size: int,
+        content_type: str | None = None,
+        sha256: str | None = None,
+    ) -> FileUploadTicketOutput:
+        if size > self._s3_config.max_upload_size:
+            raise FileTooLargeException(self._s3_config.max_upload_size)
+
+        object_name = f"{uuid4()}.{get_file_extension(filename)}"
+        normalized_content_type = content_type or "application/octet-stream"
+        expires_in = self._s3_config.presigned_url_ttl
+        presigned = await self._file_storage.create_upload_url(
+            object_name=object_name,
+            content_type=normalized_content_type,
+            size=size,
+            sha256=sha256,
+            expires_in=expires_in,
+        )
+
+        now = utc_now()
+        file = S3File(
+            id=uuid4(),
+            name=object_name,
+            path=object_name,
+            content_type=normalized_content_type,
+            size=size,
+            sha256=sha256,
+            status=S3FileStatus.PENDING,
+            owner_id=owner_id,
+            created_at=now,
+        )
+        async with self._uow_factory() as uow:
+            await self._s3_files_repo.create(entity=file)
+            await uow.commit()
+
+        return FileUploadTicketOutput(
+            file_id=file.id,
+            upload_url=presigned.url,
+            method=presigned.method,
+            headers=presigned.headers,
+            expires_at=now + timedelta(seconds=expires_in),
+        )
@@ -1,15 +1,24 @@
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator
 from uuid import uuid4
 
 from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
 from brain.application.abstractions.storage.files import IFileStorage
 from brain.application.abstractions.uow import UnitOfWorkFactory
 from brain.application.interactors.file_dto import ReadFileOutput
+from brain.application.services.file_deduplication import FileDeduplicationService
 from brain.config.models import S3Config
 from brain.domain.entities.s3_file import S3File
 from brain.domain.time import utc_now
 from brain.domain.services.media import build_public_file_url, get_file_extension
 
 
+class FileTooLargeException(Exception):
+    def __init__(self, max_size: int):
+        super().__init__(f"File exceeds {max_size} bytes")
+        self.max_size = max_size
+
+
 class UploadFileInteractor:
     def __init__(
         self,
@@ -17,11 +26,13 @@ class UploadFileInteractor:
         s3_files_repo: IS3FilesRepository,
         s3_config: S3Config,
         uow_factory: UnitOfWorkFactory,
+        file_deduplication_service: FileDeduplicationService,
     ):
         self._file_storage = file_storage
         self._s3_files_repo = s3_files_repo
         self._s3_config = s3_config
         self._uow_factory = uow_factory
+        self._file_deduplication_service = file_deduplication_service
 
     async def upload_file(
         self,
@@ -29,33 +40,86 @@ class UploadFileInteractor:
         content: bytes,
         content_type: str | None = None,
     ) -> ReadFileOutput:
+        sha256 = hashlib.sha256(content).hexdigest()
+        normalized_content_type = content_type or "application/octet-stream"
         async with self._uow_factory() as uow:
-            extension = get_file_extension(filename)
-            name = f"{uuid4()}.{extension}"
-            object_name = name
-            normalized_content_type = content_type or "application/octet-stream"
-            self._file_storage.upload(
-                content=content,
-                object_name=object_name,
+            object_name = await self._file_deduplication_service.find_existing_path(sha256)
+            if object_name is None:
+                object_name = self._build_object_name(filename)
+                await self._file_storage.upload(
+                    content=content,
+                    object_name=object_name,
+                    content_type=normalized_content_type,
+                )
+            file = S3File(
+                id=uuid4(),
+                name=object_name,
+                path=object_name,
                 content_type=normalized_content_type,
+                size=len(content),
+                sha256=sha256,
+                created_at=utc_now(),
             )
+            await self._s3_files_repo.create(entity=file)
+            await uow.commit()
+            return self._to_output(file)
+
+    async def upload_file_stream(
+        self,
+        filename: str | None,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None = None,
+    ) -> ReadFileOutput | None:
+        object_name = self._build_object_name(filename)
+        normalized_content_type = content_type or "application/octet-stream"
+        # The transfer runs before the unit of work so no DB connection is held while bytes are in flight.
+        stored = await self._file_storage.upload_stream(
+            chunks=self._limit_size(chunks, self._s3_config.max_upload_size),
+            object_name=object_name,
+            content_type=normalized_content_type,
+        )
+        if not stored.size:
+            return None
+
+        async with self._uow_factory() as uow:
+            object_name = await self._file_deduplication_service.resolve_uploaded(object_name, stored.sha256)
             file = S3File(
                 id=uuid4(),
-                name=name,
+                name=object_name,
                 path=object_name,
                 content_type=normalized_content_type,
+                size=stored.size,
+                sha256=stored.sha256,
                 created_at=utc_now(),
             )
             await self._s3_files_repo.create(entity=file)
             await uow.commit()
-            return ReadFileOutput(
-                id=file.id,
-                name=file.name,
-                path=file.path,
-                content_type=file.content_type,
-                created_at=file.created_at,
-                url=build_public_file_url(
-                    external_host=self._s3_config.external_host,
-                    file_path=file.path,
-                ),
-            )
+            return self._to_output(file)
+
+    @staticmethod
+    async def _limit_size(chunks: AsyncIterable[bytes], max_size: int) -> AsyncIterator[bytes]:
+        # Raising inside the stream makes the storage abort the transfer before the limit is passed.
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_size:
+                raise FileTooLargeException(max_size)
+            yield chunk
+
+    @staticmethod
+    def _build_object_name(filename: str | None) -> str:
+        extension = get_file_extension(filename)
+        return f"{uuid4()}.{extension}"
+
+    def _to_output(self, file: S3File) -> ReadFileOutput:
+        return ReadFileOutput(
+            id=file.id,
+            name=file.name,
+            path=file.path,
+            content_type=file.content_type,
+            created_at=file.created_at,
+            url=build_public_file_url(
+                external_host=self._s3_config.external_host,
+                file_path=file.path,
+            ),
+        )
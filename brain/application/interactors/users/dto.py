@@ -7,3 +7,11 @@ class CreateOrUpdateUser:
     username: str | None
     first_name: str
     last_name: str | None
+
+
+@dataclass
+class ProfilePictureRefreshResult:
+    checked: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
@@ -15,20 +15,33 @@ class UserInteractor:
         self._users_repo = users_repo
         self._uow_factory = uow_factory
 
+    async def _save_user(self, user_data: CreateOrUpdateUser) -> None:
+        user_entity = User(
+            id=uuid4(),
+            telegram_id=user_data.telegram_id,
+            username=user_data.username,
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+        )
+        user = await self._users_repo.get_by_telegram_id(user_data.telegram_id)
+        if user:
+            user_entity.id = user.id
+            user_entity.profile_picture_file_id = user.profile_picture_file_id
+            user_entity.pin_hash = user.pin_hash
+            user_entity.profile_picture_file_unique_id = user.profile_picture_file_unique_id
+            await self._users_repo.update(user_entity)
+        else:
+            await self._users_repo.create(user_entity)
+
     async def create_or_update_user(self, user_data: CreateOrUpdateUser):
         async with self._uow_factory() as uow:
-            user_entity = User(
-                id=uuid4(),
-                telegram_id=user_data.telegram_id,
-                username=user_data.username,
-                first_name=user_data.first_name,
-                last_name=user_data.last_name,
-            )
-            user = await self._users_repo.get_by_telegram_id(user_data.telegram_id)
-            if user:
-                user_entity.id = user.id
-                user_entity.profile_picture_file_id = user.profile_picture_file_id
-                await self._users_repo.update(user_entity)
-            else:
-                await self._users_repo.create(user_entity)
+            await self._save_user(user_data)
+            await uow.commit()
+
+    async def create_or_update_users(self, users_data: list[CreateOrUpdateUser]) -> None:
+        if not users_data:
+            return
+        async with self._uow_factory() as uow:
+            for user_data in users_data:
+                await self._save_user(user_data)
             await uow.commit()
@@ -1,7 +1,19 @@
+import asyncio
+import logging
+
 from brain.application.abstractions.repositories.users import IUsersRepository
-from brain.application.abstractions.services.profile_picture_provider import IProfilePictureProvider
+from brain.application.abstractions.services.profile_picture_provider import (
+    IProfilePictureProvider,
+    ProfilePictureData,
+)
 from brain.application.abstractions.uow import UnitOfWorkFactory
+from brain.application.interactors.users.dto import ProfilePictureRefreshResult
 from brain.application.services.user_profile_picture import UserProfilePictureService
+from brain.config.models import BotConfig
+from brain.domain.entities.s3_file import S3File
+from brain.domain.entities.user import User
+
+logger = logging.getLogger(__name__)
 
 
 class UpdateAllUsersProfilePicturesInteractor:
@@ -10,27 +22,97 @@ class UpdateAllUsersProfilePicturesInteractor:
         users_repo: IUsersRepository,
         profile_picture_provider: IProfilePictureProvider,
         user_profile_picture_service: UserProfilePictureService,
+        bot_config: BotConfig,
         uow_factory: UnitOfWorkFactory,
     ):
         self._users_repo = users_repo
         self._profile_picture_provider = profile_picture_provider
         self._user_profile_picture_service = user_profile_picture_service
+        self._bot_config = bot_config
         self._uow_factory = uow_factory
 
-    async def execute(self) -> None:
-        async with self._uow_factory() as uow:
-            users = await self._users_repo.get_all()
-            for user in users:
-                try:
-                    result = await self._profile_picture_provider.get_profile_picture_content(user.telegram_id)
-                    if not result:
-                        continue
-
-                    await self._user_profile_picture_service.upload_profile_picture(
-                        telegram_id=user.telegram_id,
-                        image_content=result.content,
-                        content_type=result.content_type,
-                    )
-                except Exception:
-                    continue
-            await uow.commit()
+    async def execute(self) -> ProfilePictureRefreshResult:
+        result = ProfilePictureRefreshResult()
+        batch_size = max(1, self._bot_config.profile_picture_refresh_batch_size)
+        semaphore = asyncio.Semaphore(max(1, self._bot_config.profile_picture_refresh_concurrency))
+        after_id = None
+        while True:
+            async with self._uow_factory():
+                users = await self._users_repo.get_page(after_id=after_id, limit=batch_size)
+            if not users:
+                return result
+            after_id = users[-1].id
+            result.checked += len(users)
+
+            # Telegram is queried outside of any transaction so slow downloads do not hold a connection.
+            pictures = await asyncio.gather(*(self._fetch_changed_picture(user, semaphore) for user in users))
+            changed: list[tuple[User, ProfilePictureData]] = []
+            for user, picture in zip(users, pictures, strict=True):
+                if isinstance(picture, ProfilePictureData):
+                    changed.append((user, picture))
+                elif picture is False:
+                    result.failed += 1
+                else:
+                    result.unchanged += 1
+
+            for user, picture in changed:
+                if await self._store_picture(user, picture):
+                    result.updated += 1
+                else:
+                    result.failed += 1
+
+            if len(users) < batch_size:
+                return result
+
+    async def _store_picture(self, user: User, picture: ProfilePictureData) -> bool:
+        # The PUT happens before the transaction, and every user gets their own transaction,
+        # so one failing row neither holds a connection during uploads nor rolls back the batch.
+        try:
+            stored = await self._user_profile_picture_service.store_profile_picture(
+                user_id=user.id,
+                image_content=picture.content,
+                content_type=picture.content_type,
+            )
+        except Exception:
+            logger.exception("Failed to upload profile picture for user %s", user.id)
+            return False
+
+        try:
+            async with self._uow_factory() as uow:
+                await self._user_profile_picture_service.attach_profile_picture(
+                    telegram_id=user.telegram_id,
+                    profile_picture=stored,
+                    file_unique_id=picture.file_unique_id,
+                )
+                await uow.commit()
+        except Exception:
+            logger.exception("Failed to store profile picture for user %s", user.id)
+            await self._release_unattached(stored)
+            return False
+        return True
+
+    async def _release_unattached(self, stored: S3File) -> None:
+        try:
+            async with self._uow_factory() as uow:
+                await self._user_profile_picture_service.release_profile_picture(stored)
+                await uow.commit()
+        except Exception:
+            logger.exception("Failed to queue unattached profile picture %s for cleanup", stored.path)
+
+    async def _fetch_changed_picture(
+        self,
+        user: User,
+        semaphore: asyncio.Semaphore,
+    ) -> ProfilePictureData | bool | None:
+        """
+        Returns the new picture, None when there is nothing to update or False on failure.
+        """
+        async with semaphore:
+            try:
+                ref = await self._profile_picture_provider.get_profile_picture_ref(user.telegram_id)
+                if ref is None or ref.file_unique_id == user.profile_picture_file_unique_id:
+                    return None
+                return await self._profile_picture_provider.download_profile_picture(ref)
+            except Exception:
+                logger.exception("Failed to fetch profile picture for user %s", user.id)
+                return False
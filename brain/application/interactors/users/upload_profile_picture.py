@@ -17,12 +17,14 @@ class UploadUserProfilePictureInteractor:
         telegram_id: int,
         image_content: bytes,
         content_type: str | None = None,
+        file_unique_id: str | None = None,
     ) -> S3File:
         async with self._uow_factory() as uow:
             file = await self._user_profile_picture_service.upload_profile_picture(
                 telegram_id=telegram_id,
                 image_content=image_content,
                 content_type=content_type,
+                file_unique_id=file_unique_id,
             )
             await uow.commit()
             return file
@@ -122,6 +122,9 @@ class AuthTokensService:
             refresh_expires_at=refresh_token.expires_at,
         )
 
+    def get_public_jwks(self) -> list[dict]:
+        return self._jwt_service.get_public_jwks()
+
     async def authorize_by_token(self, token: str) -> User:
         payload = self._decode_jwt_token(token)
         return await self._user_lookup_service.get_user_by_id(payload.user_id)
@@ -2,6 +2,7 @@ from uuid import UUID
 
 from brain.application.abstractions.repositories.drafts import IDraftsRepository
 from brain.application.interactors.drafts.exceptions import DraftNotFoundException
+from brain.application.services.draft_hashtag_sync import DraftHashtagSyncService
 from brain.domain.entities.draft import Draft
 
 
@@ -14,11 +15,16 @@ class DraftLookupService:
 
 
 class DraftDeletionService:
-    def __init__(self, drafts_repo: IDraftsRepository):
+    def __init__(
+        self,
+        drafts_repo: IDraftsRepository,
+        hashtag_sync_service: DraftHashtagSyncService,
+    ):
         self._drafts_repo = drafts_repo
+        self._hashtag_sync_service = hashtag_sync_service
 
     async def delete_draft(self, draft_id: UUID) -> None:
-        draft = await self._drafts_repo.get_by_id(draft_id)
+        draft = await self._drafts_repo.delete_by_id(draft_id)
         if draft is None:
             raise DraftNotFoundException()
-        await self._drafts_repo.delete_by_id(draft_id)
+        await self._hashtag_sync_service.release(user_id=draft.user_id, hashtags=draft.hashtags)
@@ -11,11 +11,32 @@ class DraftHashtagSyncService:
     async def sync(
         self,
         draft_id: UUID,
+        user_id: UUID,
         text: str | None,
     ) -> list[str]:
         hashtags = extract_hashtags(text)
-        await self._hashtags_repo.replace_draft_hashtags(
+        previous = await self._hashtags_repo.replace_draft_hashtags(
             draft_id=draft_id,
             texts=hashtags,
         )
+        await self._hashtags_repo.change_user_hashtag_counts(
+            user_id=user_id,
+            texts=[hashtag for hashtag in hashtags if hashtag not in previous],
+            delta=1,
+        )
+        await self._hashtags_repo.change_user_hashtag_counts(
+            user_id=user_id,
+            texts=[hashtag for hashtag in previous if hashtag not in hashtags],
+            delta=-1,
+        )
         return hashtags
+
+    async def release(self, user_id: UUID, hashtags: list[str]) -> None:
+        """
+        Drops a deleted draft's hashtags from the user's counters.
+        """
+        await self._hashtags_repo.change_user_hashtag_counts(
+            user_id=user_id,
+            texts=hashtags,
+            delta=-1,
+        )
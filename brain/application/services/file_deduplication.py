@@ -0,0 +1,29 @@
+from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
+
+
+class FileDeduplicationService:
+    """
+    Content-addressed reuse of stored objects. An object is referenced by every s3_files row
+    with its path; released paths go to an orphan queue and are only deleted by the sweeper
+    once no row references them anymore.
+    """
+
+    def __init__(self, s3_files_repo: IS3FilesRepository):
+        self._s3_files_repo = s3_files_repo
+
+    async def find_existing_path(self, sha256: str) -> str | None:
+        existing = await self._s3_files_repo.get_by_sha256(sha256)
+        if existing is None:
+            return None
+        return existing.path
+
+    async def resolve_uploaded(self, object_name: str, sha256: str) -> str:
+        # For objects already written (streamed or presigned): keep the older copy, drop the new one.
+        existing_path = await self.find_existing_path(sha256)
+        if existing_path is None or existing_path == object_name:
+            return object_name
+        await self._s3_files_repo.add_orphaned_object(object_name)
+        return existing_path
+
+    async def release(self, path: str) -> None:
+        await self._s3_files_repo.add_orphaned_object(path)
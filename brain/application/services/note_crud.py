@@ -4,7 +4,7 @@ from brain.application.abstractions.repositories.keywords import IKeywordsReposi
 from brain.application.abstractions.repositories.notes import INotesRepository
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
 from brain.application.interactors.notes.dto import CreateNote, UpdateNote
-from brain.application.interactors.notes.exceptions import NoteNotFoundException
+from brain.application.interactors.notes.exceptions import NoteForbiddenException, NoteNotFoundException
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_keyword_sync import NoteKeywordSyncService
 from brain.application.services.note_titles import NoteTitleService
@@ -17,6 +17,15 @@ from brain.domain.services.wikilinks import extract_link_intervals, extract_link
 from brain.domain.time import utc_now
 
 
+async def raise_note_access_error(notes_repo: INotesRepository, note_id: UUID, user_id: UUID | None) -> None:
+    """
+    Called after an owner-scoped query matched nothing; only this failure path pays for telling 404 from 403.
+    """
+    if user_id is not None and await notes_repo.get_by_id(note_id) is not None:
+        raise NoteForbiddenException()
+    raise NoteNotFoundException()
+
+
 class NoteCreationService:
     def __init__(
         self,
@@ -34,22 +43,25 @@ class NoteCreationService:
         self._note_title_service = note_title_service
         self._keyword_sync_service = keyword_sync_service
 
-    async def create_note(self, note_data: CreateNote) -> UUID:
+    async def create_note(self, note_data: CreateNote) -> Note:
         user = await self._user_lookup_service.get_user_by_telegram_id(note_data.by_user_telegram_id)
         title = await self._note_title_service.resolve_create_title(user_id=user.id, title=note_data.title)
         represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(user_id=user.id, title=title)
 
+        now = utc_now()
         note = Note(
             id=uuid4(),
             user_id=user.id,
             title=title,
             text=note_data.text,
             represents_keyword_id=represents_keyword_id,
+            created_at=now,
+            updated_at=now,
         )
         await self._notes_repo.create(note)
         await self._notes_graph_repo.upsert_note(note)
         await self._keyword_sync_service.sync(note)
-        return note.id
+        return note
 
 
 class NoteUpdateService:
@@ -69,10 +81,14 @@ class NoteUpdateService:
         self._note_title_service = note_title_service
         self._keyword_sync_service = keyword_sync_service
 
-    async def update_note(self, note_data: UpdateNote) -> Note:
-        note = await self._notes_repo.get_by_id(note_data.note_id)
+    async def update_note(self, note_data: UpdateNote, note: Note | None = None) -> Note:
+        """
+        Callers that already hold the note pass it in to skip the read.
+        """
+        if note is None:
+            note = await self._notes_repo.get_by_id(note_data.note_id, user_id=note_data.user_id)
         if note is None:
-            raise NoteNotFoundException()
+            await raise_note_access_error(self._notes_repo, note_data.note_id, note_data.user_id)
 
         previous_state = Note(
             id=note.id,
@@ -163,18 +179,41 @@ class NoteDeletionService:
         self._keywords_repo = keywords_repo
         self._notes_graph_repo = notes_graph_repo
 
-    async def delete_note(self, note_id: UUID) -> None:
-        note = await self._notes_repo.get_by_id(note_id)
+    async def delete_note(self, note_id: UUID, user_id: UUID | None = None) -> None:
+        # Links go away with the note, so they are read first; the delete itself returns the note.
+        link_targets = await self._keywords_repo.get_note_keyword_names(note_id)
+        note = await self._notes_repo.delete_by_id(note_id, user_id=user_id)
         if note is None:
-            raise NoteNotFoundException()
+            await raise_note_access_error(self._notes_repo, note_id, user_id)
 
-        link_targets = await self._keywords_repo.get_note_keyword_names(note_id)
         cleanup_names = collect_cleanup_keyword_names(
             link_targets=link_targets,
             represents_keyword_id=note.represents_keyword_id,
             title=note.title,
         )
-        await self._notes_repo.delete_by_id(note_id)
         await self._keywords_repo.delete_note_keywords(note_id)
         await self._keywords_repo.delete_unused_keywords(user_id=note.user_id, names=cleanup_names)
         await self._notes_graph_repo.delete_note(note_id)
+
+    async def delete_notes(self, note_ids: list[UUID], user_id: UUID) -> list[Note]:
+        """
+        Deletes the user's notes with a fixed number of statements, whatever their count.
+        Note links are removed by the notes foreign key cascade.
+        """
+        link_targets = await self._keywords_repo.get_notes_keyword_names(note_ids)
+        notes = await self._notes_repo.delete_by_ids(note_ids, user_id=user_id)
+        if not notes:
+            return []
+
+        cleanup_names = list(link_targets)
+        for note in notes:
+            cleanup_names.extend(
+                collect_cleanup_keyword_names(
+                    link_targets=[],
+                    represents_keyword_id=note.represents_keyword_id,
+                    title=note.title,
+                )
+            )
+        await self._keywords_repo.delete_unused_keywords(user_id=user_id, names=cleanup_names)
+        await self._notes_graph_repo.delete_notes([note.id for note in notes])
+        return notes
@@ -11,5 +11,8 @@ class NoteLookupService:
     async def get_note_by_id(self, note_id: UUID) -> Note | None:
         return await self._notes_repo.get_by_id(note_id)
 
+    async def get_notes_by_ids(self, note_ids: list[UUID]) -> list[Note]:
+        return await self._notes_repo.get_by_ids(note_ids)
+
     async def get_note_by_title(self, user_id: UUID, title: str, exact_match: bool = False) -> Note | None:
         return await self._notes_repo.get_by_title(user_id, title, exact_match)
@@ -1,10 +1,13 @@
-from uuid import uuid4
+import hashlib
+from uuid import UUID, uuid4
 
 from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.application.abstractions.storage.user_profile_pictures import IProfilePictureStorage
 from brain.application.interactors.users.exceptions import UserNotFoundException
+from brain.application.services.file_deduplication import FileDeduplicationService
 from brain.domain.entities.s3_file import S3File
+from brain.domain.entities.user import User
 
 
 class UserProfilePictureService:
@@ -13,44 +16,123 @@ class UserProfilePictureService:
         users_repo: IUsersRepository,
         s3_files_repo: IS3FilesRepository,
         profile_picture_storage: IProfilePictureStorage,
+        file_deduplication_service: FileDeduplicationService,
     ):
         self._users_repo = users_repo
         self._s3_files_repo = s3_files_repo
         self._profile_picture_storage = profile_picture_storage
+        self._file_deduplication_service = file_deduplication_service
 
     async def upload_profile_picture(
         self,
         telegram_id: int,
         image_content: bytes,
         content_type: str | None = None,
+        file_unique_id: str | None = None,
     ) -> S3File:
         user = await self._users_repo.get_by_telegram_id(telegram_id)
         if not user:
             raise UserNotFoundException
 
+        sha256 = hashlib.sha256(image_content).hexdigest()
+        existing = await self._s3_files_repo.get_by_user_id(user.id)
+        if existing and existing.sha256 == sha256:
+            if file_unique_id and user.profile_picture_file_unique_id != file_unique_id:
+                user.profile_picture_file_unique_id = file_unique_id
+                await self._users_repo.update(user)
+            return existing
+
+        extension = self._get_extension(content_type)
+        normalized_content_type = content_type or self._default_content_type(extension)
+        object_name = await self._file_deduplication_service.find_existing_path(sha256)
+        if object_name is None:
+            object_name = f"avatars/{user.id}/{uuid4()}.{extension}"
+            await self._profile_picture_storage.upload(
+                content=image_content,
+                object_name=object_name,
+                content_type=normalized_content_type,
+            )
+        profile_picture = S3File(
+            id=uuid4(),
+            name=object_name.rsplit("/", 1)[-1],
+            path=object_name,
+            content_type=normalized_content_type,
+            size=len(image_content),
+            sha256=sha256,
+        )
+        return await self._save(user, existing, profile_picture, file_unique_id)
+
+    async def store_profile_picture(
+        self,
+        user_id: UUID,
+        image_content: bytes,
+        content_type: str | None = None,
+    ) -> S3File:
+        """
+        Writes the picture to storage without touching the database, so the PUT can run outside
+        of a transaction. The returned file is not persisted until attach_profile_picture.
+        """
         extension = self._get_extension(content_type)
-        name = f"{uuid4()}.{extension}"
-        object_name = f"avatars/{user.id}/{name}"
         normalized_content_type = content_type or self._default_content_type(extension)
-        self._profile_picture_storage.upload(
+        object_name = f"avatars/{user_id}/{uuid4()}.{extension}"
+        await self._profile_picture_storage.upload(
             content=image_content,
             object_name=object_name,
             content_type=normalized_content_type,
         )
-        profile_picture = S3File(
+        return S3File(
             id=uuid4(),
-            name=name,
+            name=object_name.rsplit("/", 1)[-1],
             path=object_name,
             content_type=normalized_content_type,
+            size=len(image_content),
+            sha256=hashlib.sha256(image_content).hexdigest(),
         )
+
+    async def attach_profile_picture(
+        self,
+        telegram_id: int,
+        profile_picture: S3File,
+        file_unique_id: str | None = None,
+    ) -> S3File:
+        user = await self._users_repo.get_by_telegram_id(telegram_id)
+        if not user:
+            raise UserNotFoundException
+
         existing = await self._s3_files_repo.get_by_user_id(user.id)
+        profile_picture.path = await self._file_deduplication_service.resolve_uploaded(
+            profile_picture.path,
+            profile_picture.sha256,
+        )
+        profile_picture.name = profile_picture.path.rsplit("/", 1)[-1]
+        if existing and existing.sha256 == profile_picture.sha256:
+            if file_unique_id and user.profile_picture_file_unique_id != file_unique_id:
+                user.profile_picture_file_unique_id = file_unique_id
+                await self._users_repo.update(user)
+            return existing
+        return await self._save(user, existing, profile_picture, file_unique_id)
+
+    async def release_profile_picture(self, profile_picture: S3File) -> None:
+        """Queues a stored but never attached picture for cleanup."""
+        await self._file_deduplication_service.release(profile_picture.path)
+
+    async def _save(
+        self,
+        user: User,
+        existing: S3File | None,
+        profile_picture: S3File,
+        file_unique_id: str | None,
+    ) -> S3File:
         if existing:
             profile_picture.id = existing.id
             await self._s3_files_repo.update(profile_picture)
+            if existing.path != profile_picture.path:
+                await self._file_deduplication_service.release(existing.path)
         else:
             await self._s3_files_repo.create(profile_picture)
 
         user.profile_picture_file_id = profile_picture.id
+        user.profile_picture_file_unique_id = file_unique_id
         await self._users_repo.update(user)
 
         return profile_picture
@@ -22,12 +22,40 @@ class DatabaseConfig(IDatabaseConfig):
     user: str
     password: str
     engine: str = "postgresql+asyncpg"
+    # Requests wait up to pool_timeout seconds once pool_size + max_overflow connections are out
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # Set to 0 behind PgBouncer in transaction pooling mode
+    prepared_statement_cache_size: int = 100
+    # Milliseconds, 0 keeps the server default
+    statement_timeout: int = 0
+    # Comma-separated key=value pairs sent as Postgres run-time parameters on connect
+    server_settings: str = ""
 
     @property
     def uri(self) -> str:
         return f"{self.engine}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
+@dataclass
+class DatabaseReplicaConfig(DatabaseConfig):
+    # An empty host disables the replica and all reads go to the primary
+    host: str = ""
+    port: int = 5432
+    database: str = ""
+    user: str = ""
+    password: str = ""
+    # Seconds after a user's write during which their reads stay on the primary
+    sticky_period: int = 5
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.host)
+
+
 @dataclass
 class RedisConfig:
     host: str
@@ -48,15 +76,41 @@ class Neo4jConfig(INeo4jConfig):
     password: str
     database: str = "neo4j"
     scheme: str = "neo4j"
+    # Note deletes only clean up keywords they touched; the sweeper collects any other orphans
+    orphan_keyword_sweep_enabled: bool = False
+    orphan_keyword_sweep_batch_size: int = 1000
+    # Connections per server; sessions wait up to connection_acquisition_timeout seconds for one
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
+    max_connection_lifetime: int = 3600
+    # Records pulled per batch while a result is consumed
+    fetch_size: int = 1000
 
     @property
     def uri(self) -> str:
         return f"{self.scheme}://{self.host}:{self.port}"
 
 
+class WebhookProcessingMode(Enum):
+    INLINE = "inline"
+    QUEUE = "queue"
+
+
 @dataclass
 class BotConfig:
     token: str
+    user_info_cache_ttl: int = 86400
+    # "queue" acknowledges webhooks immediately and processes updates in bot workers
+    webhook_mode: WebhookProcessingMode = WebhookProcessingMode.INLINE
+    update_dedupe_ttl: int = 86400
+    # Per-chat lock TTL, restarted for every update; must exceed the slowest update handler
+    update_lock_timeout: int = 300
+    # A queued update failing this many times is moved to a dead-letter list
+    update_max_attempts: int = 3
+    # Bot API calls per second made by background jobs (profile picture refresh)
+    api_rate_limit: float = 20
+    profile_picture_refresh_batch_size: int = 200
+    profile_picture_refresh_concurrency: int = 8
 
 
 class EnvironmentType(Enum):
@@ -73,6 +127,19 @@ class AuthenticationConfig:
     access_token_lifetime: int = 3600
     refresh_token_lifetime: int = 86400
     algorithm: str = "HS256"
+    # Optional JSON keyring with kid-tagged keys; secret_key stays valid for tokens without kid
+    keyring_path: str = ""
+    keyring_reload_interval: int = 30
+    # Expired auth data cleanup settings
+    bot_auth_session_lifetime: int = 86400
+    cleanup_batch_size: int = 500
+
+
+class S3StorageBackend(Enum):
+    # boto3 calls run on the event loop thread (legacy behaviour)
+    BLOCKING = "blocking"
+    # boto3 calls run on a dedicated bounded thread pool
+    EXECUTOR = "executor"
 
 
 @dataclass
@@ -83,6 +150,65 @@ class S3Config:
     secret_access_key: str
     bucket_name: str
     region_name: str = "us-east-1"
+    # S3 requires at least 5 MiB for every part but the last one.
+    multipart_part_size: int = 8 * 1024 * 1024
+    max_upload_size: int = 50 * 1024 * 1024
+    presigned_url_ttl: int = 900
+    # Host clients use to reach S3 directly; presigned URLs are signed for it. Defaults to endpoint_url.
+    presign_endpoint_url: str = ""
+    # Released objects are kept for this long before the sweeper may delete them
+    orphan_cleanup_grace_period: int = 3600
+    orphan_cleanup_batch_size: int = 100
+    backend: S3StorageBackend = S3StorageBackend.EXECUTOR
+    executor_max_workers: int = 16
+    # Keep at least executor_max_workers so worker threads never wait on the urllib3 pool
+    max_pool_connections: int = 16
+    connect_timeout: int = 5
+    read_timeout: int = 60
+    # Comma-separated longest-edge sizes in pixels of the WebP thumbnails generated for images
+    thumbnail_sizes: str = "160,480"
+    thumbnail_quality: int = 80
+    # Larger originals are not decoded for thumbnails
+    thumbnail_max_source_size: int = 25 * 1024 * 1024
+
+
+class TracingExporter(Enum):
+    # Spans are not recorded at all
+    NONE = "none"
+    CONSOLE = "console"
+    # OTLP over HTTP, needs the `otlp` extra
+    OTLP = "otlp"
+    # Finished spans are kept in process, for tests
+    MEMORY = "memory"
+
+
+@dataclass
+class TracingConfig:
+    exporter: TracingExporter = TracingExporter.NONE
+    service_name: str = "brain-backend"
+    # Empty falls back to the standard OTEL_EXPORTER_OTLP_* environment variables
+    otlp_endpoint: str = ""
+    # Share of new traces that are recorded; traces started upstream follow the caller's decision
+    sample_ratio: float = 1.0
+
+
+@dataclass
+class SlowQueryConfig:
+    # SQL statements and Cypher queries slower than this are logged, 0 disables the hook
+    threshold_ms: int = 0
+    # Share of slow statements re-run under EXPLAIN ANALYZE / PROFILE; writes only get a plain EXPLAIN
+    plan_sample_rate: float = 0.0
+    plan_log_path: str = "logs/query_plans.jsonl"
+    plan_log_max_bytes: int = 10 * 1024 * 1024
+    plan_log_backup_count: int = 5
+
+
+@dataclass
+class MetricsConfig:
+    # Port a taskiq worker serves its Prometheus metrics on, 0 disables it
+    worker_port: int = 0
+    # Bearer token scrapers send to the API's /metrics; empty keeps the endpoint disabled
+    token: str = ""
 
 
 @dataclass
@@ -95,4 +221,8 @@ class Config:
     s3: S3Config
     bot: BotConfig
     environment: EnvironmentType
+    db_replica: DatabaseReplicaConfig = field(default_factory=DatabaseReplicaConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
+    slow_queries: SlowQueryConfig = field(default_factory=SlowQueryConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
     logging_level: str = "INFO"
@@ -1,7 +1,17 @@
 from dishka import Provider, Scope, provide, from_context
 
 from brain.application.abstractions.config.models import IDatabaseConfig, INeo4jConfig
-from brain.config.models import APIConfig, Config, BotConfig, AuthenticationConfig, RedisConfig, S3Config
+from brain.config.models import (
+    APIConfig,
+    AuthenticationConfig,
+    BotConfig,
+    Config,
+    DatabaseReplicaConfig,
+    MetricsConfig,
+    RedisConfig,
+    S3Config,
+    SlowQueryConfig,
+)
 
 
 class ConfigProvider(Provider):
@@ -24,6 +34,14 @@ class ConfigProvider(Provider):
     def get_auth_config(self, config: Config) -> AuthenticationConfig:
         return config.auth
 
+    @provide
+    def get_slow_query_config(self, config: Config) -> SlowQueryConfig:
+        return config.slow_queries
+
+    @provide
+    def get_metrics_config(self, config: Config) -> MetricsConfig:
+        return config.metrics
+
 
 class DatabaseConfigProvider(Provider):
     scope = Scope.APP
@@ -32,6 +50,10 @@ class DatabaseConfigProvider(Provider):
     def get_db_config(self, config: Config) -> IDatabaseConfig:
         return config.db
 
+    @provide
+    def get_db_replica_config(self, config: Config) -> DatabaseReplicaConfig:
+        return config.db_replica
+
     @provide
     def get_neo4j_config(self, config: Config) -> INeo4jConfig:
         return config.neo4j
@@ -1,10 +1,17 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from brain.domain.entities.common import Entity
 
 
+class S3FileStatus(Enum):
+    # Presigned upload was issued, the object may not exist yet
+    PENDING = "pending"
+    READY = "ready"
+
+
 @dataclass
 class S3File(Entity):
     """
@@ -15,4 +22,13 @@ class S3File(Entity):
     name: str
     path: str
     content_type: str
+    size: int | None = field(default=None, kw_only=True)
+    sha256: str | None = field(default=None, kw_only=True)
+    status: S3FileStatus = field(default=S3FileStatus.READY, kw_only=True)
+    # User that requested a presigned upload; only they may complete it or fetch a download URL
+    owner_id: UUID | None = field(default=None, kw_only=True)
+    # Set on derived thumbnails: the original file and the longest edge in pixels
+    parent_id: UUID | None = field(default=None, kw_only=True)
+    thumbnail_size: int | None = field(default=None, kw_only=True)
+    thumbnails: list["S3File"] = field(default_factory=list, kw_only=True)
     created_at: datetime | None = field(default=None, kw_only=True)
@@ -18,6 +18,13 @@ def guess_image_content_type(file_path: str | None) -> str | None:
     return None
 
 
+THUMBNAIL_SOURCE_CONTENT_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/gif"})
+
+
+def is_thumbnail_source(content_type: str | None) -> bool:
+    return content_type in THUMBNAIL_SOURCE_CONTENT_TYPES
+
+
 def build_public_file_url(*, external_host: str, file_path: str) -> str:
     base = (external_host or "").rstrip("/")
     path = (file_path or "").lstrip("/")
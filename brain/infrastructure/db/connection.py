@@ -1,15 +1,58 @@
+from typing import Any
+
 from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine, AsyncEngine
 
 from brain.application.abstractions.config.models import IDatabaseConfig
+from brain.infrastructure.db.pool_stats import TimedAsyncAdaptedQueuePool
+from brain.infrastructure.db.tracing import instrument_engine_tracing
+
+
+def parse_server_settings(value: str) -> dict[str, str]:
+    settings: dict[str, str] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        key, separator, setting = item.partition("=")
+        if not separator or not key.strip():
+            raise ValueError(f"Invalid server setting {item!r}, expected key=value")
+        settings[key.strip()] = setting.strip()
+    return settings
+
+
+def build_connect_args(config: IDatabaseConfig) -> dict[str, Any]:
+    server_settings = parse_server_settings(config.server_settings)
+    if config.statement_timeout > 0:
+        server_settings["statement_timeout"] = str(config.statement_timeout)
+    connect_args: dict[str, Any] = {
+        # asyncpg's own statement cache; 0 is required behind PgBouncer in transaction mode
+        "statement_cache_size": config.prepared_statement_cache_size,
+    }
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    return connect_args
 
 
 def create_engine(config: IDatabaseConfig) -> AsyncEngine:
-    return create_async_engine(
-        url=make_url(config.uri),
-        pool_pre_ping=True,
-        pool_recycle=1800,
+    url = make_url(config.uri)
+    options: dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg":
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(config.prepared_statement_cache_size)},
+        )
+        options["connect_args"] = build_connect_args(config)
+    engine = create_async_engine(
+        url=url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        **options,
     )
+    instrument_engine_tracing(engine.sync_engine)
+    return engine
 
 
 def create_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -1,8 +1,14 @@
+import hashlib
+
 from brain.domain.entities.jwt import JwtRefreshToken
 from brain.infrastructure.db.mappers import normalize_datetime
 from brain.infrastructure.db.models.jwt import JwtRefreshTokenDB
 
 
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def map_jwt_refresh_token_to_dm(token: JwtRefreshTokenDB) -> JwtRefreshToken:
     return JwtRefreshToken(
         id=token.id,
@@ -18,7 +24,7 @@ def map_jwt_refresh_token_to_db(token: JwtRefreshToken) -> JwtRefreshTokenDB:
         id=token.id,
         user_id=token.user_id,
         token=token.token,
+        token_hash=hash_refresh_token(token.token),
         expires_at=normalize_datetime(token.expires_at),
         created_at=normalize_datetime(token.created_at),
     )
-
@@ -1,4 +1,6 @@
-from brain.domain.entities.s3_file import S3File
+from sqlalchemy import inspect
+
+from brain.domain.entities.s3_file import S3File, S3FileStatus
 from brain.domain.time import utc_now
 from brain.infrastructure.db.mappers import normalize_datetime
 from brain.infrastructure.db.models.s3 import S3FileDB
@@ -10,16 +12,36 @@ def map_s3_file_to_dm(file_db: S3FileDB) -> S3File:
         name=file_db.name,
         path=file_db.path,
         content_type=file_db.content_type,
+        size=file_db.size,
+        sha256=file_db.sha256,
+        status=S3FileStatus(file_db.status),
+        owner_id=file_db.owner_id,
+        parent_id=file_db.parent_id,
+        thumbnail_size=file_db.thumbnail_size,
+        thumbnails=_map_loaded_thumbnails(file_db),
         created_at=normalize_datetime(file_db.created_at),
     )
 
 
+def _map_loaded_thumbnails(file_db: S3FileDB) -> list[S3File]:
+    # Touching an unloaded relationship would emit lazy IO, which async sessions forbid.
+    if "thumbnails" in inspect(file_db).unloaded:
+        return []
+    return [map_s3_file_to_dm(thumbnail) for thumbnail in file_db.thumbnails]
+
+
 def map_s3_file_to_db(file_dm: S3File) -> S3FileDB:
     return S3FileDB(
         id=file_dm.id,
         name=file_dm.name,
         path=file_dm.path,
         content_type=file_dm.content_type,
+        size=file_dm.size,
+        sha256=file_dm.sha256,
+        status=file_dm.status.value,
+        owner_id=file_dm.owner_id,
+        parent_id=file_dm.parent_id,
+        thumbnail_size=file_dm.thumbnail_size,
         created_at=normalize_datetime(file_dm.created_at) or utc_now(),
     )
 
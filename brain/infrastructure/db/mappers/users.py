@@ -13,6 +13,7 @@ def map_user_to_dm(user: UserDB) -> User:
         last_name=user.last_name,
         pin_hash=user.pin_hash,
         profile_picture_file_id=user.profile_picture_file_id,
+        profile_picture_file_unique_id=user.profile_picture_file_unique_id,
         profile_picture=map_s3_file_to_dm(user.profile_picture_file) if user.profile_picture_file else None,
         created_at=normalize_datetime(user.created_at),
         updated_at=normalize_datetime(user.updated_at),
@@ -28,6 +29,7 @@ def map_user_to_db(user: User) -> UserDB:
         last_name=user.last_name,
         pin_hash=user.pin_hash,
         profile_picture_file_id=user.profile_picture_file_id,
+        profile_picture_file_unique_id=user.profile_picture_file_unique_id,
         created_at=normalize_datetime(user.created_at),
         updated_at=normalize_datetime(user.updated_at),
     )
@@ -1,10 +1,11 @@
 from .base import Base
+from .creation_count import CreationCountKind as CreationCountKind, UserCreationCountDB as UserCreationCountDB
 from .draft import DraftDB
-from .hashtag import HashtagDB, DraftHashtagDB
+from .hashtag import HashtagDB, DraftHashtagDB, UserHashtagCountDB as UserHashtagCountDB
 from .jwt import JwtRefreshTokenDB
 from .keyword import KeywordDB, NoteKeywordDB
 from .note import NoteDB
 from .tg_bot_auth import TelegramBotAuthSessionDB
 from .user import UserDB
-from .s3 import S3FileDB
+from .s3 import S3FileDB, S3OrphanedObjectDB as S3OrphanedObjectDB
 from .api_key import ApiKeyDB
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from brain.infrastructure.db.models.base import Base
+
+
+class CreationCountKind(Enum):
+    NOTE = "note"
+    DRAFT = "draft"
+
+
+class UserCreationCountDB(Base):
+    """
+    Number of notes or drafts a user created per quarter-hour UTC bucket, kept in step
+    with the rows so creation stats never aggregate over the notes and drafts themselves.
+    Every IANA zone offset is a multiple of 15 minutes, so a bucket always falls into a
+    single local day.
+    """
+
+    __tablename__ = "user_creation_counts"
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    kind: Mapped[str] = mapped_column(String(length=16), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
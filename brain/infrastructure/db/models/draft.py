@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Text, Uuid
+from sqlalchemy import ForeignKey, Index, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from brain.infrastructure.db.models.base import Base
@@ -11,6 +11,8 @@ from brain.infrastructure.db.models.mixins import CreatedUpdatedMixin
 
 class DraftDB(Base, CreatedUpdatedMixin):
     __tablename__ = "drafts"
+    # Serves the per-user listing and its (created_at, id) keyset in either direction
+    __table_args__ = (Index("ix_drafts_user_id_created_at", "user_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     user_id: Mapped[UUID] = mapped_column(
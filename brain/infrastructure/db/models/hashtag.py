@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Uuid, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from brain.infrastructure.db.models.base import Base
@@ -37,6 +37,8 @@ class HashtagDB(Base):
 
 class DraftHashtagDB(Base):
     __tablename__ = "draft_hashtags"
+    # The primary key starts with draft_id; this one finds the drafts carrying a hashtag.
+    __table_args__ = (Index("ix_draft_hashtags_hashtag_text_draft_id", "hashtag_text", "draft_id"),)
     __mapper_args__ = {"confirm_deleted_rows": False}
 
     draft_id: Mapped[UUID] = mapped_column(
@@ -62,3 +64,24 @@ class DraftHashtagDB(Base):
         lazy="selectin",
         overlaps="drafts",
     )
+
+
+class UserHashtagCountDB(Base):
+    """
+    Number of a user's drafts carrying a hashtag, kept in step with draft_hashtags
+    so hashtag facets never aggregate over the drafts themselves.
+    """
+
+    __tablename__ = "user_hashtag_counts"
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    hashtag_text: Mapped[str] = mapped_column(
+        String(length=255),
+        ForeignKey("hashtags.text", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
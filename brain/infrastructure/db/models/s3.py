@@ -2,8 +2,8 @@ from uuid import UUID
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Uuid, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, UniqueConstraint, Uuid, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from brain.domain.time import utc_now
 from brain.infrastructure.db.models.base import Base
@@ -11,14 +11,57 @@ from brain.infrastructure.db.models.base import Base
 
 class S3FileDB(Base):
     __tablename__ = "s3_files"
+    __table_args__ = (UniqueConstraint("parent_id", "thumbnail_size", name="uq_s3_files_parent_id_thumbnail_size"),)
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     name: Mapped[str] = mapped_column(String(length=256), nullable=False)
-    path: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    path: Mapped[str] = mapped_column(String(length=256), nullable=False, index=True)
     content_type: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    sha256: Mapped[str | None] = mapped_column(String(length=64), nullable=True, index=True)
+    status: Mapped[str] = mapped_column(String(length=16), nullable=False, default="ready", server_default="ready")
+    owner_id: Mapped[UUID | None] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="SET NULL", onupdate="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    parent_id: Mapped[UUID | None] = mapped_column(
+        Uuid,
+        ForeignKey("s3_files.id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    thumbnail_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+        server_default=func.now(),
+    )
+
+    # One level only: thumbnails never have thumbnails of their own.
+    thumbnails = relationship(
+        "S3FileDB",
+        lazy="selectin",
+        join_depth=1,
+        order_by="S3FileDB.thumbnail_size",
+    )
+
+
+class S3OrphanedObjectDB(Base):
+    """
+    Objects that lost a reference. Written in the same transaction as the change that
+    released them and deleted later, once no s3_files row points at the path anymore.
+    """
+
+    __tablename__ = "s3_orphaned_objects"
+
+    path: Mapped[str] = mapped_column(String(length=256), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         default=utc_now,
         server_default=func.now(),
+        index=True,
     )
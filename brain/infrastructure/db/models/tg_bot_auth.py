@@ -22,4 +22,5 @@ class TelegramBotAuthSessionDB(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
+        index=True,
     )
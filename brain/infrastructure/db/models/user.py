@@ -22,6 +22,7 @@ class UserDB(Base, CreatedUpdatedMixin):
         ForeignKey("s3_files.id", ondelete="SET NULL", onupdate="CASCADE"),
         nullable=True,
     )
+    profile_picture_file_unique_id: Mapped[str | None] = mapped_column(String(length=128), nullable=True)
 
     notes = relationship("NoteDB", back_populates="user", lazy="selectin")
     drafts = relationship("DraftDB", back_populates="user", lazy="selectin")
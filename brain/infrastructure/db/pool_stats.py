@@ -0,0 +1,75 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class CheckoutLatencyTracker:
+    """Cumulative checkout counters, exported as Prometheus counters."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.seconds += duration
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout took, including waiting for a free
+    slot, opening overflow connections and the pre-ping.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_latency = CheckoutLatencyTracker()
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_latency.record_timeout()
+            raise
+        self.checkout_latency.record(time.perf_counter() - started_at)
+        return connection
+
+
+@dataclass(frozen=True, kw_only=True)
+class DatabasePoolStats:
+    size: int
+    checked_out: int
+    overflow: int
+    max_size: int
+    saturation: float
+    checkouts_total: int
+    checkout_seconds_total: float
+    checkout_timeouts_total: int
+
+
+def collect_database_pool_stats(engine: AsyncEngine) -> DatabasePoolStats:
+    pool = engine.pool
+    if not isinstance(pool, TimedAsyncAdaptedQueuePool):
+        raise TypeError(f"Pool stats are not available for {type(pool).__name__}")
+    max_size = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    latency = pool.checkout_latency
+    return DatabasePoolStats(
+        size=pool.size(),
+        checked_out=checked_out,
+        overflow=max(pool.overflow(), 0),
+        max_size=max_size,
+        saturation=round(checked_out / max_size, 3) if max_size > 0 else 0.0,
+        checkouts_total=latency.count,
+        checkout_seconds_total=latency.seconds,
+        checkout_timeouts_total=latency.timeouts,
+    )
@@ -1,11 +1,11 @@
-from typing import AsyncIterable
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable, Iterable
 
 from dishka import Provider, provide, Scope
 from neo4j import AsyncDriver
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
 
 from brain.application.abstractions.config.models import INeo4jConfig
+from brain.config.models import DatabaseReplicaConfig, SlowQueryConfig
 from brain.application.abstractions.repositories.drafts import IDraftsRepository
 from brain.application.abstractions.repositories.hashtags import IHashtagsRepository
 from brain.application.abstractions.repositories.notes import INotesRepository
@@ -24,8 +24,12 @@ from brain.application.abstractions.repositories.tg_bot_auth import (
     ITelegramBotAuthSessionsRepository,
 )
 from brain.application.abstractions.config.models import IDatabaseConfig
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
 from brain.application.abstractions.uow import IUnitOfWork, UnitOfWorkFactory
 from brain.infrastructure.db.connection import create_engine, create_session_maker
+from brain.infrastructure.db.pool_stats import collect_database_pool_stats
+from brain.infrastructure.db.replica import ReadRepositoryRouter, ReplicaSessionMaker
+from brain.infrastructure.db.slow_queries import instrument_slow_queries
 from brain.infrastructure.db.repositories.hub import RepositoryHub
 from brain.infrastructure.db.repositories.drafts import DraftsRepository
 from brain.infrastructure.db.repositories.hashtags import HashtagsRepository
@@ -42,6 +46,9 @@ from brain.infrastructure.db.repositories.api_keys import (
 from brain.infrastructure.db.repositories.tg_bot_auth import (
     TelegramBotAuthSessionsRepository,
 )
+from brain.infrastructure.db.write_tracking import IRecentUserWrites
+from brain.infrastructure.monitoring.metrics import DATABASE_POOLS
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
 from brain.infrastructure.uow.composite import CompositeUnitOfWork
 from brain.infrastructure.uow.context import UnitOfWorkContext
 from brain.infrastructure.uow.backends import (
@@ -54,9 +61,18 @@ class DatabaseProvider(Provider):
     scope = Scope.APP
 
     @provide
-    async def get_engine(self, config: IDatabaseConfig) -> AsyncIterable[AsyncEngine]:
+    def get_slow_query_log(self, config: SlowQueryConfig) -> Iterable[SlowQueryLog]:
+        slow_query_log = SlowQueryLog(config)
+        yield slow_query_log
+        slow_query_log.close()
+
+    @provide
+    async def get_engine(self, config: IDatabaseConfig, slow_query_log: SlowQueryLog) -> AsyncIterable[AsyncEngine]:
         engine = create_engine(config)
+        instrument_slow_queries(engine.sync_engine, slow_query_log)
+        DATABASE_POOLS.add_pool("primary", lambda: collect_database_pool_stats(engine))
         yield engine
+        DATABASE_POOLS.remove_pool("primary")
         # await engine.dispose(True)
 
     @provide
@@ -76,8 +92,9 @@ class DatabaseProvider(Provider):
     def get_sql_transaction_controller(
         self,
         session: AsyncSession,
+        recent_writes: IRecentUserWrites,
     ) -> SqlAlchemyTransactionController:
-        return SqlAlchemyTransactionController(session=session)
+        return SqlAlchemyTransactionController(session=session, recent_writes=recent_writes)
 
     @provide(scope=Scope.REQUEST)
     def get_neo4j_transaction_controller(
@@ -128,3 +145,40 @@ class DatabaseProvider(Provider):
         provides=IApiKeysRepository,
     )
     hub_repository = provide(RepositoryHub, scope=Scope.REQUEST)
+
+
+class ReadReplicaProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_replica_session_maker(
+        self,
+        config: DatabaseReplicaConfig,
+        slow_query_log: SlowQueryLog,
+    ) -> AsyncIterable[ReplicaSessionMaker]:
+        if not config.enabled:
+            yield ReplicaSessionMaker(session_maker=None)
+            return
+        engine = create_engine(config)
+        instrument_slow_queries(engine.sync_engine, slow_query_log)
+        DATABASE_POOLS.add_pool("replica", lambda: collect_database_pool_stats(engine))
+        yield ReplicaSessionMaker(session_maker=create_session_maker(engine))
+        DATABASE_POOLS.remove_pool("replica")
+        await engine.dispose()
+
+    @provide(scope=Scope.REQUEST, provides=IReadRepositoryRouter)
+    async def get_read_repository_router(
+        self,
+        notes_repo: INotesRepository,
+        drafts_repo: IDraftsRepository,
+        replica: ReplicaSessionMaker,
+        recent_writes: IRecentUserWrites,
+    ) -> AsyncIterable[ReadRepositoryRouter]:
+        router = ReadRepositoryRouter(
+            notes_repo=notes_repo,
+            drafts_repo=drafts_repo,
+            replica_session_maker=replica.session_maker,
+            recent_writes=recent_writes,
+        )
+        yield router
+        await router.close()
@@ -0,0 +1,64 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from brain.application.abstractions.repositories.drafts import IDraftsRepository
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.read_routing import IReadRepositoryRouter
+from brain.infrastructure.db.repositories.drafts import DraftsRepository
+from brain.infrastructure.db.repositories.notes import NotesRepository
+from brain.infrastructure.db.write_tracking import IRecentUserWrites
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSessionMaker:
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession] | None):
+        self.session_maker = session_maker
+
+
+class ReadRepositoryRouter(IReadRepositoryRouter):
+    """
+    Serves reads from the replica unless it is disabled or the user wrote recently,
+    in which case the primary repositories of the request are returned.
+    """
+
+    def __init__(
+        self,
+        notes_repo: INotesRepository,
+        drafts_repo: IDraftsRepository,
+        replica_session_maker: async_sessionmaker[AsyncSession] | None,
+        recent_writes: IRecentUserWrites,
+    ):
+        self._notes_repo = notes_repo
+        self._drafts_repo = drafts_repo
+        self._replica_session_maker = replica_session_maker
+        self._recent_writes = recent_writes
+        self._replica_session: AsyncSession | None = None
+
+    async def _get_replica_session(self, user_id: UUID) -> AsyncSession | None:
+        if self._replica_session_maker is None:
+            return None
+        try:
+            if await self._recent_writes.is_recent(user_id):
+                return None
+        except Exception:
+            logger.exception("Failed to check recent writes of user %s, reading from primary", user_id)
+            return None
+        if self._replica_session is None:
+            self._replica_session = self._replica_session_maker()
+        return self._replica_session
+
+    async def get_notes_repo(self, user_id: UUID) -> INotesRepository:
+        session = await self._get_replica_session(user_id)
+        return NotesRepository(session=session) if session is not None else self._notes_repo
+
+    async def get_drafts_repo(self, user_id: UUID) -> IDraftsRepository:
+        session = await self._get_replica_session(user_id)
+        return DraftsRepository(session=session) if session is not None else self._drafts_repo
+
+    async def close(self) -> None:
+        if self._replica_session is not None:
+            await self._replica_session.close()
+            self._replica_session = None
@@ -10,8 +10,10 @@ from brain.infrastructure.db.mappers.api_keys import (
     map_api_key_to_dm,
 )
 from brain.infrastructure.db.models.api_key import ApiKeyDB
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class ApiKeysRepository(IApiKeysRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
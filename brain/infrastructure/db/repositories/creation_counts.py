@@ -0,0 +1,79 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.domain.time import ensure_utc_datetime
+from brain.infrastructure.db.models.creation_count import CreationCountKind, UserCreationCountDB
+
+BUCKET_SIZE = timedelta(minutes=15)
+_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def creation_bucket_start(created_at: datetime) -> datetime:
+    created_at = ensure_utc_datetime(created_at)
+    return created_at - (created_at - _EPOCH) % BUCKET_SIZE
+
+
+async def change_creation_counts(
+    session: AsyncSession,
+    kind: CreationCountKind,
+    created: Iterable[tuple[UUID, datetime]],
+    delta: int,
+) -> None:
+    """Add delta for every (user_id, created_at) pair to the bucket it falls into."""
+    buckets = Counter((user_id, creation_bucket_start(created_at)) for user_id, created_at in created)
+    if not buckets or delta == 0:
+        return
+    stmt = insert(UserCreationCountDB).values(
+        [
+            {
+                "user_id": user_id,
+                "kind": kind.value,
+                "bucket_start": bucket_start,
+                "count": delta * count,
+            }
+            for (user_id, bucket_start), count in buckets.items()
+        ],
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "kind", "bucket_start"],
+        set_={"count": UserCreationCountDB.count + stmt.excluded.count},
+    )
+    await session.execute(stmt)
+    if delta < 0:
+        await session.execute(
+            delete(UserCreationCountDB).where(
+                UserCreationCountDB.kind == kind.value,
+                tuple_(UserCreationCountDB.user_id, UserCreationCountDB.bucket_start).in_(list(buckets)),
+                UserCreationCountDB.count <= 0,
+            ),
+        )
+
+
+async def clear_creation_counts(session: AsyncSession, kind: CreationCountKind) -> None:
+    await session.execute(delete(UserCreationCountDB).where(UserCreationCountDB.kind == kind.value))
+
+
+def select_daily_creation_counts(kind: CreationCountKind, timezone_name: str):
+    created_date = func.date(func.timezone(timezone_name, UserCreationCountDB.bucket_start)).label(
+        "created_date",
+    )
+    return (
+        select(created_date, func.sum(UserCreationCountDB.count))
+        .where(UserCreationCountDB.kind == kind.value)
+        .group_by(created_date)
+        .order_by(created_date.asc())
+    )
+
+
+def normalize_created_date(created_at: date | datetime | str) -> date:
+    if isinstance(created_at, str):
+        return date.fromisoformat(created_at)
+    if isinstance(created_at, datetime):
+        return created_at.date()
+    return created_at
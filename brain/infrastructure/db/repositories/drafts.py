@@ -1,19 +1,38 @@
-from datetime import date, datetime
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import delete, exists, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from brain.application.abstractions.repositories.drafts import IDraftsRepository
-from brain.application.abstractions.repositories.models import DraftCreationStat
+from brain.application.abstractions.repositories.models import DraftCreationStat, DraftCursor, HashtagCount
+from brain.application.types import Unset, UnsetType
 from brain.domain.entities.draft import Draft
+from brain.infrastructure.db.mappers import normalize_datetime
 from brain.infrastructure.db.mappers.drafts import map_draft_to_db, map_draft_to_dm
+from brain.infrastructure.db.mappers.s3_files import map_s3_file_to_dm
+from brain.infrastructure.db.models.creation_count import CreationCountKind, UserCreationCountDB
 from brain.infrastructure.db.models.draft import DraftDB
-from brain.infrastructure.db.models.hashtag import DraftHashtagDB
+from brain.infrastructure.db.models.hashtag import DraftHashtagDB, UserHashtagCountDB
+from brain.infrastructure.db.models.s3 import S3FileDB
+from brain.infrastructure.db.repositories.creation_counts import (
+    change_creation_counts,
+    clear_creation_counts,
+    normalize_created_date,
+    select_daily_creation_counts,
+)
+from brain.infrastructure.db.write_tracking import record_user_write
 from brain.domain.time import ensure_utc_datetime, utc_now
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+# Characters of text returned by summary queries
+SUMMARY_TEXT_LENGTH = 280
+
+
+@instrumented_repository
 class DraftsRepository(IDraftsRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -33,24 +52,58 @@ class DraftsRepository(IDraftsRepository):
             stmt = stmt.where(DraftDB.created_at >= from_date)
         if to_date:
             stmt = stmt.where(DraftDB.created_at <= to_date)
-        if hashtags:
-            stmt = (
-                stmt.join(DraftHashtagDB, DraftHashtagDB.draft_id == DraftDB.id)
-                .where(DraftHashtagDB.hashtag_text.in_(hashtags))
-                .group_by(DraftDB.id)
-                .having(func.count(func.distinct(DraftHashtagDB.hashtag_text)) == len(hashtags))
+        # One semi-join per hashtag instead of GROUP BY/HAVING: rows stream in index order, so a
+        # LIMIT can stop early, and each probe is a primary-key lookup on draft_hashtags.
+        for hashtag in dict.fromkeys(hashtags or []):
+            stmt = stmt.where(
+                exists().where(
+                    DraftHashtagDB.draft_id == DraftDB.id,
+                    DraftHashtagDB.hashtag_text == hashtag,
+                )
             )
         return stmt
 
+    @staticmethod
+    def _entity_load_options():
+        # The mapper never reads the owner; its default selectin would load the user with all notes and drafts.
+        return noload(DraftDB.user), selectinload(DraftDB.hashtags), selectinload(DraftDB.file)
+
+    @staticmethod
+    def _stored_hashtags():
+        return (
+            select(func.array_agg(aggregate_order_by(DraftHashtagDB.hashtag_text, DraftHashtagDB.hashtag_text)))
+            .where(DraftHashtagDB.draft_id == DraftDB.id)
+            .correlate(DraftDB)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _map_row_to_dm(row) -> Draft:
+        return Draft(
+            id=row.id,
+            user_id=row.user_id,
+            text=row.text,
+            file_id=row.file_id,
+            created_at=normalize_datetime(row.created_at),
+            updated_at=normalize_datetime(row.updated_at),
+        )
+
     async def create(self, entity: Draft) -> None:
         db_model = map_draft_to_db(entity)
         self._session.add(db_model)
         await self._session.flush()
+        await change_creation_counts(
+            self._session,
+            CreationCountKind.DRAFT,
+            [(db_model.user_id, db_model.created_at)],
+            delta=1,
+        )
+        record_user_write(self._session, entity.user_id)
 
     async def get_by_id(self, draft_id: UUID) -> Draft | None:
         stmt = (
             select(DraftDB)
-            .options(selectinload(DraftDB.hashtags), selectinload(DraftDB.file))
+            .options(*self._entity_load_options())
             .where(DraftDB.id == draft_id)
         )
         result = await self._session.execute(stmt)
@@ -59,6 +112,23 @@ class DraftsRepository(IDraftsRepository):
             return None
         return map_draft_to_dm(db_model)
 
+    async def get_plain_by_id(self, draft_id: UUID, for_update: bool = False) -> Draft | None:
+        stmt = select(
+            DraftDB.id,
+            DraftDB.user_id,
+            DraftDB.text,
+            DraftDB.file_id,
+            DraftDB.created_at,
+            DraftDB.updated_at,
+        ).where(DraftDB.id == draft_id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return self._map_row_to_dm(row)
+
     async def get_by_user(
         self,
         user_id: UUID,
@@ -66,7 +136,7 @@ class DraftsRepository(IDraftsRepository):
         to_date: datetime | None = None,
         hashtags: list[str] | None = None,
     ) -> list[Draft]:
-        stmt = select(DraftDB).options(selectinload(DraftDB.hashtags), selectinload(DraftDB.file))
+        stmt = select(DraftDB).options(*self._entity_load_options())
         stmt = self._apply_common_filters(
             stmt=stmt,
             user_id=user_id,
@@ -79,6 +149,44 @@ class DraftsRepository(IDraftsRepository):
         db_models = result.unique().scalars().all()
         return [map_draft_to_dm(db_model) for db_model in db_models]
 
+    async def get_page_by_user(
+        self,
+        user_id: UUID,
+        limit: int | None,
+        after: DraftCursor | None = None,
+        summary: bool = False,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        hashtags: list[str] | None = None,
+    ) -> list[Draft]:
+        if summary:
+            stmt = select(
+                DraftDB.id,
+                DraftDB.user_id,
+                func.left(DraftDB.text, SUMMARY_TEXT_LENGTH).label("text"),
+                DraftDB.file_id,
+                DraftDB.created_at,
+                DraftDB.updated_at,
+            )
+        else:
+            stmt = select(DraftDB).options(*self._entity_load_options())
+        stmt = self._apply_common_filters(
+            stmt=stmt,
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+            hashtags=hashtags,
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(DraftDB.created_at, DraftDB.id) < tuple_(ensure_utc_datetime(after.created_at), after.id),
+            )
+        stmt = stmt.order_by(DraftDB.created_at.desc(), DraftDB.id.desc()).limit(limit)
+        result = await self._session.execute(stmt)
+        if summary:
+            return [self._map_row_to_dm(row) for row in result.all()]
+        return [map_draft_to_dm(db_model) for db_model in result.unique().scalars().all()]
+
     async def search_by_text(
         self,
         user_id: UUID,
@@ -93,7 +201,7 @@ class DraftsRepository(IDraftsRepository):
 
         stmt = (
             select(DraftDB)
-            .options(selectinload(DraftDB.hashtags), selectinload(DraftDB.file))
+            .options(*self._entity_load_options())
             .where(func.lower(func.coalesce(DraftDB.text, "")).like(f"%{normalized_query}%"))
         )
         stmt = self._apply_common_filters(
@@ -108,28 +216,104 @@ class DraftsRepository(IDraftsRepository):
         db_models = result.unique().scalars().all()
         return [map_draft_to_dm(db_model) for db_model in db_models]
 
-    async def update(self, entity: Draft) -> None:
-        stmt = select(DraftDB).where(DraftDB.id == entity.id)
+    async def count_hashtags_by_user(
+        self,
+        user_id: UUID,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> list[HashtagCount]:
+        draft_count = func.count(DraftHashtagDB.draft_id).label("draft_count")
+        stmt = select(DraftHashtagDB.hashtag_text, draft_count).join(DraftDB, DraftDB.id == DraftHashtagDB.draft_id)
+        stmt = self._apply_common_filters(
+            stmt=stmt,
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+        )
+        stmt = stmt.group_by(DraftHashtagDB.hashtag_text).order_by(
+            draft_count.desc(),
+            DraftHashtagDB.hashtag_text.asc(),
+        )
         result = await self._session.execute(stmt)
-        db_model = result.scalar_one_or_none()
-        if db_model is None:
-            return
-        db_model.text = entity.text
-        db_model.file_id = entity.file_id
-        db_model.updated_at = ensure_utc_datetime(entity.updated_at) or utc_now()
-        await self._session.flush()
+        return [HashtagCount(hashtag=hashtag, count=int(count)) for hashtag, count in result.all()]
 
-    async def delete_by_id(self, draft_id: UUID) -> None:
-        stmt = select(DraftDB).where(DraftDB.id == draft_id)
+    async def update_for_user(
+        self,
+        draft_id: UUID,
+        user_id: UUID,
+        updated_at: datetime,
+        text: str | None | UnsetType = Unset,
+        file_id: UUID | None | UnsetType = Unset,
+    ) -> Draft | None:
+        values = {"updated_at": ensure_utc_datetime(updated_at) or utc_now()}
+        if text is not Unset:
+            values["text"] = text
+        if file_id is not Unset:
+            values["file_id"] = file_id
+        # RETURNING reads the stored hashtags in the same round trip, so callers can skip an unchanged sync.
+        stmt = (
+            update(DraftDB)
+            .where(DraftDB.id == draft_id, DraftDB.user_id == user_id)
+            .values(**values)
+            .returning(
+                DraftDB.id,
+                DraftDB.user_id,
+                DraftDB.text,
+                DraftDB.file_id,
+                DraftDB.created_at,
+                DraftDB.updated_at,
+                self._stored_hashtags().label("hashtags"),
+            )
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(stmt)
-        db_model = result.scalar_one_or_none()
-        if db_model is None:
-            return
-        await self._session.delete(db_model)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        record_user_write(self._session, user_id)
+        draft = self._map_row_to_dm(row)
+        draft.hashtags = list(row.hashtags or [])
+        if draft.file_id is not None:
+            file_db = await self._session.get(S3FileDB, draft.file_id)
+            draft.file = map_s3_file_to_dm(file_db) if file_db else None
+        return draft
+
+    async def delete_by_id(self, draft_id: UUID) -> Draft | None:
+        # Only the statement that actually removed the row gets it back, so concurrent deletions
+        # of the same draft cannot both release its hashtags.
+        stmt = (
+            delete(DraftDB)
+            .where(DraftDB.id == draft_id)
+            .returning(
+                DraftDB.id,
+                DraftDB.user_id,
+                DraftDB.text,
+                DraftDB.file_id,
+                DraftDB.created_at,
+                DraftDB.updated_at,
+                self._stored_hashtags().label("hashtags"),
+            )
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        await change_creation_counts(
+            self._session,
+            CreationCountKind.DRAFT,
+            [(row.user_id, row.created_at)],
+            delta=-1,
+        )
         await self._session.flush()
+        record_user_write(self._session, row.user_id)
+        draft = self._map_row_to_dm(row)
+        draft.hashtags = list(row.hashtags or [])
+        return draft
 
     async def delete_all(self) -> None:
         await self._session.execute(delete(DraftHashtagDB))
+        await self._session.execute(delete(UserHashtagCountDB))
+        await clear_creation_counts(self._session, CreationCountKind.DRAFT)
         await self._session.execute(text("DELETE FROM drafts"))
         await self._session.flush()
 
@@ -138,28 +322,12 @@ class DraftsRepository(IDraftsRepository):
         user_id: UUID,
         timezone_name: str = "UTC",
     ) -> list[DraftCreationStat]:
-        created_date = func.date(func.timezone(timezone_name, DraftDB.created_at)).label(
-            "created_date",
-        )
-        stmt = (
-            select(created_date, func.count(DraftDB.id))
-            .where(DraftDB.user_id == user_id)
-            .group_by(created_date)
-            .order_by(created_date.asc())
+        stmt = select_daily_creation_counts(CreationCountKind.DRAFT, timezone_name).where(
+            UserCreationCountDB.user_id == user_id,
         )
         result = await self._session.execute(stmt)
-
-        stats: list[DraftCreationStat] = []
-        for created_at, count in result.all():
-            if isinstance(created_at, str):
-                created_at = date.fromisoformat(created_at)
-            elif isinstance(created_at, datetime):
-                created_at = created_at.date()
-            stats.append(
-                DraftCreationStat(
-                    date=created_at,
-                    count=int(count or 0),
-                ),
-            )
-        return stats
+        return [
+            DraftCreationStat(date=normalize_created_date(created_at), count=int(count or 0))
+            for created_at, count in result.all()
+        ]
 
@@ -5,10 +5,13 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.hashtags import IHashtagsRepository
+from brain.application.abstractions.repositories.models import HashtagCount
 from brain.domain.entities.hashtag import Hashtag
-from brain.infrastructure.db.models.hashtag import DraftHashtagDB, HashtagDB
+from brain.infrastructure.db.models.hashtag import DraftHashtagDB, HashtagDB, UserHashtagCountDB
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class HashtagsRepository(IHashtagsRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -23,13 +26,16 @@ class HashtagsRepository(IHashtagsRepository):
         await self._session.execute(stmt)
         await self._session.flush()
 
-    async def replace_draft_hashtags(self, draft_id: UUID, texts: list[str]) -> None:
-        await self._session.execute(
-            delete(DraftHashtagDB).where(DraftHashtagDB.draft_id == draft_id),
+    async def replace_draft_hashtags(self, draft_id: UUID, texts: list[str]) -> list[str]:
+        result = await self._session.execute(
+            delete(DraftHashtagDB)
+            .where(DraftHashtagDB.draft_id == draft_id)
+            .returning(DraftHashtagDB.hashtag_text),
         )
+        previous = sorted(row[0] for row in result.all())
         await self._session.flush()
         if not texts:
-            return
+            return previous
 
         await self.ensure_hashtags(texts=texts)
 
@@ -39,6 +45,38 @@ class HashtagsRepository(IHashtagsRepository):
         insert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["draft_id", "hashtag_text"])
         await self._session.execute(insert_stmt)
         await self._session.flush()
+        return previous
+
+    async def change_user_hashtag_counts(self, user_id: UUID, texts: list[str], delta: int) -> None:
+        texts = list(dict.fromkeys(texts))
+        if not texts or delta == 0:
+            return
+        stmt = insert(UserHashtagCountDB).values(
+            [{"user_id": user_id, "hashtag_text": text, "count": delta} for text in texts],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "hashtag_text"],
+            set_={"count": UserHashtagCountDB.count + stmt.excluded.count},
+        )
+        await self._session.execute(stmt)
+        if delta < 0:
+            await self._session.execute(
+                delete(UserHashtagCountDB).where(
+                    UserHashtagCountDB.user_id == user_id,
+                    UserHashtagCountDB.hashtag_text.in_(texts),
+                    UserHashtagCountDB.count <= 0,
+                ),
+            )
+        await self._session.flush()
+
+    async def get_user_hashtag_counts(self, user_id: UUID) -> list[HashtagCount]:
+        stmt = (
+            select(UserHashtagCountDB.hashtag_text, UserHashtagCountDB.count)
+            .where(UserHashtagCountDB.user_id == user_id)
+            .order_by(UserHashtagCountDB.count.desc(), UserHashtagCountDB.hashtag_text.asc())
+        )
+        result = await self._session.execute(stmt)
+        return [HashtagCount(hashtag=hashtag, count=count) for hashtag, count in result.all()]
 
     async def get_draft_hashtags(self, draft_id: UUID) -> list[str]:
         stmt = (
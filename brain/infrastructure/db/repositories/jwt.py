@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.jwt import (
@@ -8,12 +9,15 @@ from brain.application.abstractions.repositories.jwt import (
 )
 from brain.domain.entities.jwt import JwtRefreshToken
 from brain.infrastructure.db.mappers.jwt import (
+    hash_refresh_token,
     map_jwt_refresh_token_to_db,
     map_jwt_refresh_token_to_dm,
 )
 from brain.infrastructure.db.models.jwt import JwtRefreshTokenDB
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class JwtRefreshTokensRepository(IJwtRefreshTokensRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -31,10 +35,10 @@ class JwtRefreshTokensRepository(IJwtRefreshTokensRepository):
             return map_jwt_refresh_token_to_dm(db_model)
 
     async def get_by_token(self, token: str) -> JwtRefreshToken | None:
-        query = select(JwtRefreshTokenDB).where(JwtRefreshTokenDB.token == token)
+        query = select(JwtRefreshTokenDB).where(JwtRefreshTokenDB.token_hash == hash_refresh_token(token))
         result = await self._session.execute(query)
         db_model = result.scalar()
-        if db_model:
+        if db_model and db_model.token == token:
             return map_jwt_refresh_token_to_dm(db_model)
 
     async def delete_by_id(self, token_id: UUID) -> None:
@@ -42,3 +46,19 @@ class JwtRefreshTokensRepository(IJwtRefreshTokensRepository):
         await self._session.execute(stmt)
         await self._session.flush()
 
+    async def delete_expired(self, expired_before: datetime, limit: int) -> int:
+        expired_ids = (
+            select(JwtRefreshTokenDB.id)
+            .where(JwtRefreshTokenDB.expires_at < expired_before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(JwtRefreshTokenDB).where(JwtRefreshTokenDB.id.in_(expired_ids))
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return result.rowcount
+
+    async def count(self) -> int:
+        query = select(func.count()).select_from(JwtRefreshTokenDB)
+        result = await self._session.execute(query)
+        return result.scalar_one()
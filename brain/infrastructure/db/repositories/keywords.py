@@ -9,8 +9,10 @@ from brain.domain.entities.keyword import Keyword
 from brain.infrastructure.db.models.keyword import KeywordDB
 from brain.infrastructure.db.models.note import NoteDB
 from brain.infrastructure.db.models.keyword import NoteKeywordDB
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class KeywordsRepository(IKeywordsRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -118,6 +120,18 @@ class KeywordsRepository(IKeywordsRepository):
         names = [row[0] for row in result.all() if row[0]]
         return names
 
+    async def get_notes_keyword_names(self, note_ids: list[UUID]) -> list[str]:
+        if not note_ids:
+            return []
+        stmt = (
+            select(KeywordDB.name)
+            .join(NoteKeywordDB, NoteKeywordDB.keyword_id == KeywordDB.id)
+            .where(NoteKeywordDB.note_id.in_(note_ids))
+            .distinct()
+        )
+        result = await self._session.execute(stmt)
+        return [row[0] for row in result.all() if row[0]]
+
     async def delete_note_keywords(self, note_id: UUID) -> None:
         await self._session.execute(
             delete(NoteKeywordDB).where(NoteKeywordDB.note_id == note_id),
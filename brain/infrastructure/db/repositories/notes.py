@@ -1,7 +1,7 @@
-from datetime import date, datetime
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, text, func, exists
+from sqlalchemy import Select, delete, select, text, func, exists, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.notes import INotesRepository
@@ -11,12 +11,22 @@ from brain.application.abstractions.repositories.models import (
 )
 from brain.domain.entities.note import Note
 from brain.infrastructure.db.mappers.notes import map_note_to_db, map_note_to_dm
+from brain.infrastructure.db.models.creation_count import CreationCountKind, UserCreationCountDB
 from brain.infrastructure.db.models.keyword import KeywordDB
 from brain.infrastructure.db.models.note import NoteDB
 from brain.infrastructure.db.models.user import UserDB
+from brain.infrastructure.db.repositories.creation_counts import (
+    change_creation_counts,
+    clear_creation_counts,
+    normalize_created_date,
+    select_daily_creation_counts,
+)
+from brain.infrastructure.db.write_tracking import record_user_write
 from brain.domain.time import ensure_utc_datetime, utc_now
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class NotesRepository(INotesRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -25,6 +35,13 @@ class NotesRepository(INotesRepository):
         db_model = map_note_to_db(entity)
         self._session.add(db_model)
         await self._session.flush()
+        await change_creation_counts(
+            self._session,
+            CreationCountKind.NOTE,
+            [(db_model.user_id, db_model.created_at)],
+            delta=1,
+        )
+        record_user_write(self._session, entity.user_id)
 
     async def get_by_user_telegram_id(
         self,
@@ -39,6 +56,27 @@ class NotesRepository(INotesRepository):
             .join(UserDB)
             .where(UserDB.telegram_id == telegram_id)
         )  # fmt: skip
+        return await self._get_filtered(query, from_date, to_date, pinned_first, include_archived)
+
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        pinned_first: bool = True,
+        include_archived: bool = False,
+    ) -> list[Note]:
+        query = select(NoteDB).where(NoteDB.user_id == user_id)
+        return await self._get_filtered(query, from_date, to_date, pinned_first, include_archived)
+
+    async def _get_filtered(
+        self,
+        query: Select,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        pinned_first: bool,
+        include_archived: bool,
+    ) -> list[Note]:
         from_date = ensure_utc_datetime(from_date)
         to_date = ensure_utc_datetime(to_date)
         if from_date:
@@ -57,16 +95,25 @@ class NotesRepository(INotesRepository):
         notes = [map_note_to_dm(db_model) for db_model in db_models]
         return notes
 
-    async def get_by_id(self, note_id: UUID) -> Note | None:
+    async def get_by_id(self, note_id: UUID, user_id: UUID | None = None) -> Note | None:
         query = (
             select(NoteDB)
             .where(NoteDB.id == note_id)
         )  # fmt: skip
+        if user_id is not None:
+            query = query.where(NoteDB.user_id == user_id)
         result = await self._session.execute(query)
         db_model = result.scalar()
         if db_model:
             return map_note_to_dm(db_model)
 
+    async def get_by_ids(self, note_ids: list[UUID]) -> list[Note]:
+        if not note_ids:
+            return []
+        query = select(NoteDB).where(NoteDB.id.in_(note_ids))
+        result = await self._session.execute(query)
+        return [map_note_to_dm(db_model) for db_model in result.scalars().all()]
+
     async def get_by_title(self, user_id: UUID, title: str, exact_match: bool = False) -> Note | None:
         query = (
             select(NoteDB)
@@ -118,34 +165,70 @@ class NotesRepository(INotesRepository):
 
     async def update(self, entity: Note):
         query = (
-            select(NoteDB)
-            .where(NoteDB.id == entity.id)
-        )  # fmt: skip
-        result = await self._session.execute(query)
-        db_model = result.scalar()
-        if not db_model:
-            return
-        db_model.title = entity.title
-        db_model.text = entity.text
-        db_model.represents_keyword_id = entity.represents_keyword_id
-        db_model.is_pinned = entity.is_pinned
-        db_model.is_archived = entity.is_archived
-        db_model.updated_at = ensure_utc_datetime(entity.updated_at) or utc_now()
+            update(NoteDB)
+            .where(NoteDB.id == entity.id, NoteDB.user_id == entity.user_id)
+            .values(
+                title=entity.title,
+                text=entity.text,
+                represents_keyword_id=entity.represents_keyword_id,
+                is_pinned=entity.is_pinned,
+                is_archived=entity.is_archived,
+                updated_at=ensure_utc_datetime(entity.updated_at) or utc_now(),
+            )
+        )
+        await self._session.execute(query)
         await self._session.flush()
+        record_user_write(self._session, entity.user_id)
 
     async def delete_all(self):
         await self._session.execute(text("DELETE FROM notes"))
+        await clear_creation_counts(self._session, CreationCountKind.NOTE)
         await self._session.flush()
 
-    async def delete_by_id(self, entity_id: UUID):
+    async def _delete_returning(self, *criteria) -> list[Note]:
         query = (
-            select(NoteDB)
-            .where(NoteDB.id == entity_id)
-        )  # fmt: skip
+            delete(NoteDB)
+            .where(*criteria)
+            .returning(
+                NoteDB.id,
+                NoteDB.user_id,
+                NoteDB.title,
+                NoteDB.text,
+                NoteDB.represents_keyword_id,
+                NoteDB.is_pinned,
+                NoteDB.is_archived,
+                NoteDB.created_at,
+                NoteDB.updated_at,
+                NoteDB.link_intervals,
+            )
+        )
         result = await self._session.execute(query)
-        db_model = result.scalar()
-        await self._session.delete(db_model)
+        rows = result.all()
+        await change_creation_counts(
+            self._session,
+            CreationCountKind.NOTE,
+            [(row.user_id, row.created_at) for row in rows],
+            delta=-1,
+        )
         await self._session.flush()
+        for row in rows:
+            record_user_write(self._session, row.user_id)
+        return [map_note_to_dm(row) for row in rows]
+
+    async def delete_by_id(self, entity_id: UUID, user_id: UUID | None = None) -> Note | None:
+        criteria = [NoteDB.id == entity_id]
+        if user_id is not None:
+            criteria.append(NoteDB.user_id == user_id)
+        deleted = await self._delete_returning(*criteria)
+        return deleted[0] if deleted else None
+
+    async def delete_by_ids(self, entity_ids: list[UUID], user_id: UUID | None = None) -> list[Note]:
+        if not entity_ids:
+            return []
+        criteria = [NoteDB.id.in_(entity_ids)]
+        if user_id is not None:
+            criteria.append(NoteDB.user_id == user_id)
+        return await self._delete_returning(*criteria)
 
     async def count_notes_by_user_and_title(
         self,
@@ -269,34 +352,17 @@ class NotesRepository(INotesRepository):
             )
         return suggestions
 
-    async def get_note_creation_stats_by_user_telegram_id(
+    async def get_note_creation_stats_by_user_id(
         self,
-        telegram_id: int,
+        user_id: UUID,
         timezone_name: str = "UTC",
     ) -> list[NoteCreationStat]:
-        created_date = func.date(func.timezone(timezone_name, NoteDB.created_at)).label(
-            "created_date",
-        )
-        stmt = (
-            select(created_date, func.count(NoteDB.id))
-            .join(UserDB)
-            .where(UserDB.telegram_id == telegram_id)
-            .group_by(created_date)
-            .order_by(created_date.asc())
+        stmt = select_daily_creation_counts(CreationCountKind.NOTE, timezone_name).where(
+            UserCreationCountDB.user_id == user_id
         )
         result = await self._session.execute(stmt)
-
-        stats: list[NoteCreationStat] = []
-        for created_at, count in result.all():
-            if isinstance(created_at, str):
-                created_at = date.fromisoformat(created_at)
-            elif isinstance(created_at, datetime):
-                created_at = created_at.date()
-            stats.append(
-                NoteCreationStat(
-                    date=created_at,
-                    count=int(count or 0),
-                ),
-            )
-        return stats
+        return [
+            NoteCreationStat(date=normalize_created_date(created_at), count=int(count or 0))
+            for created_at, count in result.all()
+        ]
 
@@ -1,17 +1,22 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, bindparam, text
+from sqlalchemy import delete, func, select, bindparam, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
-from brain.domain.entities.s3_file import S3File
+from brain.domain.entities.s3_file import S3File, S3FileStatus
 from brain.infrastructure.db.mappers.s3_files import (
     map_s3_file_to_dm,
     map_s3_file_to_db,
 )
-from brain.infrastructure.db.models.s3 import S3FileDB
+from brain.infrastructure.db.models.s3 import S3FileDB, S3OrphanedObjectDB
 from brain.infrastructure.db.models.user import UserDB
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
+
+@instrumented_repository
 class S3FilesRepository(IS3FilesRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -39,6 +44,9 @@ class S3FilesRepository(IS3FilesRepository):
         old_db_model.name = entity.name
         old_db_model.path = entity.path
         old_db_model.content_type = entity.content_type
+        old_db_model.size = entity.size
+        old_db_model.sha256 = entity.sha256
+        old_db_model.status = entity.status.value
         await self._session.flush()
 
     async def get_by_user_id(self, user_id: UUID) -> S3File | None:
@@ -52,7 +60,48 @@ class S3FilesRepository(IS3FilesRepository):
         if db_model:
             return map_s3_file_to_dm(db_model)
 
+    async def get_by_sha256(self, sha256: str) -> S3File | None:
+        query = (
+            select(S3FileDB)
+            .where(
+                S3FileDB.sha256 == sha256,
+                S3FileDB.status == S3FileStatus.READY.value,
+                S3FileDB.parent_id.is_(None),
+            )
+            .order_by(S3FileDB.created_at)
+            .limit(1)
+            .with_for_update(read=True)
+        )
+        result = await self._session.execute(query)
+        db_model = result.scalar()
+        if db_model:
+            return map_s3_file_to_dm(db_model)
+
+    async def count_by_path(self, path: str) -> int:
+        query = select(func.count()).select_from(S3FileDB).where(S3FileDB.path == path)
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    async def add_orphaned_object(self, path: str) -> None:
+        stmt = insert(S3OrphanedObjectDB).values(path=path).on_conflict_do_nothing()
+        await self._session.execute(stmt)
+
+    async def get_orphaned_objects(self, created_before: datetime, limit: int) -> list[str]:
+        query = (
+            select(S3OrphanedObjectDB.path)
+            .where(S3OrphanedObjectDB.created_at < created_before)
+            .order_by(S3OrphanedObjectDB.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_orphaned_object(self, path: str) -> None:
+        await self._session.execute(delete(S3OrphanedObjectDB).where(S3OrphanedObjectDB.path == path))
+
     async def delete_all(self) -> None:
         await self._session.execute(text("DELETE FROM s3_files"))
+        await self._session.execute(text("DELETE FROM s3_orphaned_objects"))
         await self._session.flush()
 
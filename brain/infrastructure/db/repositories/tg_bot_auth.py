@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.tg_bot_auth import (
@@ -14,8 +15,10 @@ from brain.infrastructure.db.mappers.tg_bot_auth import (
 from brain.infrastructure.db.models.tg_bot_auth import (
     TelegramBotAuthSessionDB,
 )
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class TelegramBotAuthSessionsRepository(ITelegramBotAuthSessionsRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -52,3 +55,19 @@ class TelegramBotAuthSessionsRepository(ITelegramBotAuthSessionsRepository):
         await self._session.flush()
         return bool(result.rowcount)
 
+    async def delete_created_before(self, created_before: datetime, limit: int) -> int:
+        stale_ids = (
+            select(TelegramBotAuthSessionDB.id)
+            .where(TelegramBotAuthSessionDB.created_at < created_before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(TelegramBotAuthSessionDB).where(TelegramBotAuthSessionDB.id.in_(stale_ids))
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return result.rowcount
+
+    async def count(self) -> int:
+        query = select(func.count()).select_from(TelegramBotAuthSessionDB)
+        result = await self._session.execute(query)
+        return result.scalar_one()
@@ -2,14 +2,17 @@ from uuid import UUID
 
 from sqlalchemy import select, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.domain.entities.user import User
 from brain.infrastructure.db.mappers.users import map_user_to_dm, map_user_to_db
 from brain.infrastructure.db.models.user import UserDB
 from brain.domain.time import utc_now
+from brain.infrastructure.monitoring.repositories import instrumented_repository
 
 
+@instrumented_repository
 class UsersRepository(IUsersRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -34,6 +37,7 @@ class UsersRepository(IUsersRepository):
         old_db_model.last_name = entity.last_name
         old_db_model.pin_hash = entity.pin_hash
         old_db_model.profile_picture_file_id = entity.profile_picture_file_id
+        old_db_model.profile_picture_file_unique_id = entity.profile_picture_file_unique_id
         old_db_model.updated_at = utc_now()
         await self._session.flush()
 
@@ -59,3 +63,15 @@ class UsersRepository(IUsersRepository):
         db_models = result.scalars().all()
         return [map_user_to_dm(db_model) for db_model in db_models]
 
+    async def get_page(self, after_id: UUID | None, limit: int) -> list[User]:
+        query = (
+            select(UserDB)
+            # Only the avatar is needed here; the default selectin loads would pull every note and draft.
+            .options(noload(UserDB.notes), noload(UserDB.drafts), noload(UserDB.keywords))
+            .order_by(UserDB.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(UserDB.id > after_id)
+        result = await self._session.execute(query)
+        return [map_user_to_dm(db_model) for db_model in result.scalars().all()]
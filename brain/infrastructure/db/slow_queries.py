@@ -0,0 +1,89 @@
+import json
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+from brain.infrastructure.db.tracing import statement_operation
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT_KEY = "brain_slow_query_started_at"
+_PLAN_SAVEPOINT = "brain_slow_query_plan"
+_EXPLAINABLE = {"SELECT", "WITH", "INSERT", "UPDATE", "DELETE"}
+
+
+def instrument_slow_queries(engine: Engine, slow_query_log: SlowQueryLog) -> None:
+    if not slow_query_log.enabled:
+        return
+
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            setattr(context, _STARTED_AT_KEY, time.perf_counter())
+
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started_at = getattr(context, _STARTED_AT_KEY, None)
+        if started_at is None:
+            return
+        duration = time.perf_counter() - started_at
+        if not slow_query_log.is_slow(duration):
+            return
+        slow_query_log.report("sql", statement, parameters, duration)
+        if not executemany and slow_query_log.should_capture_plan():
+            plan = capture_postgres_plan(conn, statement, parameters)
+            if plan is not None:
+                slow_query_log.write_plan("sql", statement, duration, plan)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def capture_postgres_plan(conn: Connection, statement: str, parameters: Any) -> Any:
+    """
+    Explain a statement that just ran, on its own connection and transaction. Only SELECTs
+    are executed again under ANALYZE; writes get the estimated plan. A savepoint keeps a
+    failing EXPLAIN from aborting the caller's transaction.
+    """
+    operation = statement_operation(statement)
+    if conn.dialect.name != "postgresql" or operation not in _EXPLAINABLE:
+        return None
+    if operation == "SELECT":
+        explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+    else:
+        explain = "EXPLAIN (FORMAT JSON) "
+    # A fresh cursor leaves the rows of the original statement untouched.
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_PLAN_SAVEPOINT}")
+        try:
+            cursor.execute(explain + statement, parameters)
+            plan = cursor.fetchone()[0]
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_PLAN_SAVEPOINT}")
+            raise
+        finally:
+            cursor.execute(f"RELEASE SAVEPOINT {_PLAN_SAVEPOINT}")
+    except Exception:
+        logger.warning("Failed to capture the plan of a slow statement", exc_info=True)
+        return None
+    finally:
+        cursor.close()
+    # asyncpg hands json columns back undecoded
+    return json.loads(plan) if isinstance(plan, str) else plan
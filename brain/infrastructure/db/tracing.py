@@ -0,0 +1,70 @@
+from typing import Any
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext, ExecutionContext
+
+from brain.infrastructure.monitoring.tracing import tracer
+
+_SPAN_KEY = "brain_tracing_span"
+
+
+def statement_operation(statement: str) -> str:
+    words = statement.split(None, 1)
+    return words[0].upper() if words else "SQL"
+
+
+def instrument_engine_tracing(engine: Engine) -> None:
+    """Record a client span around every statement the engine sends to the database."""
+    event.listen(engine, "before_cursor_execute", _start_statement_span)
+    event.listen(engine, "after_cursor_execute", _end_statement_span)
+    event.listen(engine, "handle_error", _fail_statement_span)
+
+
+def _start_statement_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    if context is None:
+        return
+    operation = statement_operation(statement)
+    # Parameters are left out on purpose, they carry user content.
+    span = tracer.start_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.name": conn.engine.url.database or "",
+            "db.operation": operation,
+            "db.statement": statement,
+        },
+    )
+    setattr(context, _SPAN_KEY, span)
+
+
+def _end_statement_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    span = getattr(context, _SPAN_KEY, None)
+    if span is not None:
+        span.end()
+        setattr(context, _SPAN_KEY, None)
+
+
+def _fail_statement_span(exception_context: ExceptionContext) -> None:
+    span = getattr(exception_context.execution_context, _SPAN_KEY, None)
+    if span is None:
+        return
+    span.record_exception(exception_context.original_exception)
+    span.set_status(Status(StatusCode.ERROR))
+    span.end()
+    setattr(exception_context.execution_context, _SPAN_KEY, None)
@@ -0,0 +1,35 @@
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_WRITTEN_USER_IDS_KEY = "written_user_ids"
+
+
+def record_user_write(session: AsyncSession, user_id: UUID) -> None:
+    """Remember that the session changed notes or drafts of the user, see IRecentUserWrites."""
+    session.info.setdefault(_WRITTEN_USER_IDS_KEY, set()).add(user_id)
+
+
+def pop_written_user_ids(session: AsyncSession) -> set[UUID]:
+    return session.info.pop(_WRITTEN_USER_IDS_KEY, set())
+
+
+class IRecentUserWrites(Protocol):
+    """
+    Users who committed writes within the replica sticky period; their reads go to the primary.
+    """
+
+    async def mark(self, user_ids: set[UUID]) -> None:
+        raise NotImplementedError
+
+    async def is_recent(self, user_id: UUID) -> bool:
+        raise NotImplementedError
+
+
+class NullRecentUserWrites(IRecentUserWrites):
+    async def mark(self, user_ids: set[UUID]) -> None:
+        return None
+
+    async def is_recent(self, user_id: UUID) -> bool:
+        return False
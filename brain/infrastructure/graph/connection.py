@@ -7,4 +7,8 @@ def create_driver(config: INeo4jConfig) -> AsyncDriver:
     return AsyncGraphDatabase.driver(
         config.uri,
         auth=(config.user, config.password),
+        max_connection_pool_size=config.max_connection_pool_size,
+        connection_acquisition_timeout=config.connection_acquisition_timeout,
+        max_connection_lifetime=config.max_connection_lifetime,
+        fetch_size=config.fetch_size,
     )
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from neo4j import AsyncDriver
+
+
+@dataclass(frozen=True, kw_only=True)
+class Neo4jPoolStats:
+    in_use: int
+    idle: int
+    # The driver caps connections per server, so utilisation is reported for the busiest one
+    max_size: int
+    utilisation: float
+
+
+def collect_neo4j_pool_stats(driver: AsyncDriver) -> Neo4jPoolStats:
+    # The driver has no public pool API; read its bookkeeping without touching connections.
+    pool = driver._pool
+    max_size = pool.pool_config.max_connection_pool_size
+    in_use = 0
+    idle = 0
+    busiest = 0
+    for connections in list(pool.connections.values()):
+        server_in_use = sum(1 for connection in list(connections) if connection.in_use)
+        in_use += server_in_use
+        idle += len(connections) - server_in_use
+        busiest = max(busiest, server_in_use)
+    return Neo4jPoolStats(
+        in_use=in_use,
+        idle=idle,
+        max_size=max_size,
+        utilisation=round(busiest / max_size, 3) if max_size > 0 else 0.0,
+    )
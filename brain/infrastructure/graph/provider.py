@@ -6,8 +6,11 @@ from neo4j import AsyncDriver
 from brain.application.abstractions.config.models import INeo4jConfig
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
 from brain.infrastructure.graph.connection import create_driver
+from brain.infrastructure.graph.pool_stats import collect_neo4j_pool_stats
 from brain.infrastructure.graph.repositories.notes import NotesGraphRepository
 from brain.infrastructure.graph.tx_accessor import Neo4jTxAccessor
+from brain.infrastructure.monitoring.metrics import NEO4J_POOLS
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
 from brain.infrastructure.uow.backends import Neo4jTransactionController
 from brain.infrastructure.uow.context import UnitOfWorkContext
 
@@ -18,7 +21,9 @@ class Neo4jProvider(Provider):
     @provide
     async def get_driver(self, config: INeo4jConfig) -> AsyncIterable[AsyncDriver]:
         driver = create_driver(config)
+        NEO4J_POOLS.add_pool("default", lambda: collect_neo4j_pool_stats(driver))
         yield driver
+        NEO4J_POOLS.remove_pool("default")
         await driver.close()
 
     @provide(scope=Scope.REQUEST, provides=INotesGraphRepository)
@@ -27,11 +32,13 @@ class Neo4jProvider(Provider):
         driver: AsyncDriver,
         config: INeo4jConfig,
         tx_accessor: Neo4jTxAccessor,
+        slow_query_log: SlowQueryLog,
     ) -> NotesGraphRepository:
         return NotesGraphRepository(
             driver=driver,
             database=config.database,
             tx_accessor=tx_accessor,
+            slow_query_log=slow_query_log,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -1,22 +1,87 @@
+import logging
+import time
 from uuid import UUID
 
-from neo4j import AsyncDriver
+from neo4j import READ_ACCESS, AsyncDriver, AsyncSession, AsyncTransaction, EagerResult
+from opentelemetry.trace import SpanKind
 
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
 from brain.domain.entities.graph import GraphData, GraphNode, GraphConnection
 from brain.domain.entities.note import Note
 from brain.infrastructure.graph.tx_accessor import Neo4jTxAccessor
+from brain.infrastructure.monitoring.repositories import instrumented_repository
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
+from brain.infrastructure.monitoring.tracing import tracer
 
+logger = logging.getLogger(__name__)
 
+
+@instrumented_repository
 class NotesGraphRepository(INotesGraphRepository):
-    def __init__(self, driver: AsyncDriver, database: str, tx_accessor: Neo4jTxAccessor):
+    def __init__(
+        self,
+        driver: AsyncDriver,
+        database: str,
+        tx_accessor: Neo4jTxAccessor,
+        slow_query_log: SlowQueryLog | None = None,
+    ):
         self._driver = driver
         self._database = database
         self._tx_accessor = tx_accessor
+        self._slow_query_log = slow_query_log
+
+    def _read_session(self) -> AsyncSession:
+        # Read access lets a cluster route these queries to followers and read replicas.
+        return self._driver.session(database=self._database, default_access_mode=READ_ACCESS)
+
+    async def _run(
+        self,
+        runner: AsyncSession | AsyncTransaction,
+        query: str,
+        params: dict[str, object],
+        read_only: bool,
+    ) -> EagerResult:
+        # Results are consumed inside the span so it covers streaming the records too.
+        with tracer.start_as_current_span(
+            "neo4j.run",
+            kind=SpanKind.CLIENT,
+            attributes={"db.system": "neo4j", "db.name": self._database, "db.statement": query},
+        ):
+            started_at = time.perf_counter()
+            result = await runner.run(query, **params)
+            eager_result = await result.to_eager_result()
+            duration = time.perf_counter() - started_at
+        if self._slow_query_log is not None and self._slow_query_log.is_slow(duration):
+            await self._report_slow_query(runner, query, params, read_only, duration)
+        return eager_result
 
-    async def _run_write(self, query: str, **params: str | bool | list[str] | None) -> None:
+    async def _report_slow_query(
+        self,
+        runner: AsyncSession | AsyncTransaction,
+        query: str,
+        params: dict[str, object],
+        read_only: bool,
+        duration: float,
+    ) -> None:
+        self._slow_query_log.report("cypher", query, params, duration)
+        if not self._slow_query_log.should_capture_plan():
+            return
+        # PROFILE executes the query again, so writes only get the planner's EXPLAIN.
+        prefix = "PROFILE " if read_only else "EXPLAIN "
+        try:
+            result = await runner.run(prefix + query, **params)
+            summary = await result.consume()
+        except Exception:
+            logger.warning("Failed to capture the plan of a slow Cypher query", exc_info=True)
+            return
+        self._slow_query_log.write_plan("cypher", query, duration, summary.profile or summary.plan)
+
+    async def _run_read(self, session: AsyncSession, query: str, **params: object) -> EagerResult:
+        return await self._run(session, query, params, read_only=True)
+
+    async def _run_write(self, query: str, **params: object) -> EagerResult:
         tx = await self._tx_accessor.get_tx()
-        await tx.run(query, **params)
+        return await self._run(tx, query, params, read_only=False)
 
     async def upsert_note(self, note: Note):
         query = """
@@ -116,28 +181,59 @@ class NotesGraphRepository(INotesGraphRepository):
         )
 
     async def delete_note(self, note_id: UUID):
+        await self.delete_notes([note_id])
+
+    async def delete_notes(self, note_ids: list[UUID]):
+        if not note_ids:
+            return
         await self._run_write(
             """
-            MATCH (n:Note {id: $id})
-            WITH n, n.user_id AS user_id
+            UNWIND $ids AS id
+            MATCH (n:Note {id: id})
+            OPTIONAL MATCH (n)-[:HAS_KEYWORD]->(linked:Keyword)
+            WITH n, collect(linked) AS linked_keywords
+            OPTIONAL MATCH (own:Keyword {user_id: n.user_id, name: n.title})
+            WITH n, linked_keywords + collect(own) AS candidates
             DETACH DELETE n
-            WITH user_id
-            MATCH (k:Keyword {user_id: user_id})
+            WITH candidates
+            UNWIND candidates AS k
+            WITH DISTINCT k
+            WHERE NOT EXISTS {
+                MATCH (:Note)-[:HAS_KEYWORD]->(k)
+            }
+            AND NOT EXISTS {
+                MATCH (m:Note {user_id: k.user_id, title: k.name})
+                WHERE m.represents_keyword_id IS NOT NULL
+            }
+            DETACH DELETE k
+            """,
+            ids=[str(note_id) for note_id in note_ids],
+        )
+
+    async def delete_orphan_keywords(self, limit: int) -> int:
+        result = await self._run_write(
+            """
+            MATCH (k:Keyword)
             WHERE NOT EXISTS {
                 MATCH (:Note)-[:HAS_KEYWORD]->(k)
             }
             AND NOT EXISTS {
-                MATCH (m:Note {user_id: user_id, title: k.name})
+                MATCH (m:Note {user_id: k.user_id, title: k.name})
                 WHERE m.represents_keyword_id IS NOT NULL
             }
+            WITH k
+            LIMIT $limit
             DETACH DELETE k
+            RETURN count(*) AS deleted
             """,
-            id=str(note_id),
+            limit=limit,
         )
+        return result.records[0]["deleted"] if result.records else 0
 
     async def count_notes_by_user_and_title(self, user_id: UUID, title: str) -> int:
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
+        async with self._read_session() as session:
+            result = await self._run_read(
+                session,
                 """
                 RETURN CASE WHEN
                     EXISTS {
@@ -151,12 +247,12 @@ class NotesGraphRepository(INotesGraphRepository):
                 user_id=str(user_id),
                 title=title,
             )
-            record = await result.single()
-            return record["c"] if record else 0
+            return result.records[0]["c"] if result.records else 0
 
     async def count_links_between_notes(self, user_id: UUID, from_title: str, to_title: str) -> int:
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
+        async with self._read_session() as session:
+            result = await self._run_read(
+                session,
                 """
                 MATCH (from:Note {user_id: $user_id, title: $from_title})
                 OPTIONAL MATCH (from)-[:HAS_KEYWORD]->(direct:Keyword {
@@ -174,8 +270,7 @@ class NotesGraphRepository(INotesGraphRepository):
                 from_title=from_title,
                 to_title=to_title,
             )
-            record = await result.single()
-            return record["c"] if record else 0
+            return result.records[0]["c"] if result.records else 0
 
     async def get_graph(
         self,
@@ -266,15 +361,17 @@ class NotesGraphRepository(INotesGraphRepository):
             "    CASE WHEN node:Note THEN toString(node.id) ELSE NULL END AS note_id"
         )
 
-        async with self._driver.session(database=self._database) as session:
+        async with self._read_session() as session:
             if query:
-                result = await session.run(
+                result = await self._run_read(
+                    session,
                     nodes_filtered_query,
                     user_id=str(user_id),
                     search_query=query,
                 )
             else:
-                result = await session.run(
+                result = await self._run_read(
+                    session,
                     nodes_query,
                     user_id=str(user_id),
                 )
@@ -283,7 +380,7 @@ class NotesGraphRepository(INotesGraphRepository):
             keyword_names: list[str] = []
             note_ids: list[str] = []
 
-            async for record in result:
+            for record in result.records:
                 if record["kind"] == "keyword" and record["has_keyword_note"]:
                     # Hide keyword nodes when a note represents that keyword.
                     continue
@@ -334,7 +431,8 @@ class NotesGraphRepository(INotesGraphRepository):
                     toString(b.id) AS to_note_id
             """
 
-            result = await session.run(
+            result = await self._run_read(
+                session,
                 connections_query,
                 user_id=str(user_id),
                 note_ids=note_ids,
@@ -342,7 +440,7 @@ class NotesGraphRepository(INotesGraphRepository):
             )
 
             connections: list[GraphConnection] = []
-            async for record in result:
+            for record in result.records:
                 if record["kind"] == "has_keyword":
                     to_id = f"keyword:{record['to_keyword']}"
                 else:
@@ -0,0 +1,13 @@
+from dishka import Provider, Scope, provide
+
+from brain.application.abstractions.services.image_thumbnailer import IImageThumbnailer
+from brain.config.models import S3Config
+from brain.infrastructure.images.thumbnailer import PillowImageThumbnailer
+
+
+class ImageProvider(Provider):
+    scope = Scope.APP
+
+    @provide(provides=IImageThumbnailer)
+    def get_image_thumbnailer(self, config: S3Config) -> PillowImageThumbnailer:
+        return PillowImageThumbnailer(quality=config.thumbnail_quality)
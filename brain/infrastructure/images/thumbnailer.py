@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from io import BytesIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from brain.application.abstractions.services.image_thumbnailer import IImageThumbnailer, Thumbnail
+
+logger = logging.getLogger(__name__)
+
+
+class PillowImageThumbnailer(IImageThumbnailer):
+    def __init__(self, quality: int = 80):
+        self._quality = quality
+
+    async def make_thumbnails(self, content: bytes, sizes: Sequence[int]) -> list[Thumbnail]:
+        # Decoding and resampling are CPU-bound and release the GIL, so they run off the event loop.
+        return await asyncio.to_thread(self._make_thumbnails, content, sorted(set(sizes), reverse=True))
+
+    def _make_thumbnails(self, content: bytes, sizes: list[int]) -> list[Thumbnail]:
+        try:
+            with Image.open(BytesIO(content)) as image:
+                # JPEG can decode straight at a reduced scale, which is far cheaper than a full decode.
+                if sizes:
+                    image.draft("RGB", (sizes[0], sizes[0]))
+                image = ImageOps.exif_transpose(image)
+                image.load()
+        except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+            logger.warning("Cannot decode image for thumbnails", exc_info=True)
+            return []
+
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in {"LA", "PA"} else "RGB")
+
+        thumbnails = []
+        # Largest first, each one resampled from the previous, so the big image is only scaled once.
+        for size in sizes:
+            if max(image.size) <= size:
+                continue
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            image.save(buffer, format="WEBP", quality=self._quality, method=4)
+            thumbnails.append(Thumbnail(size=size, content=buffer.getvalue(), content_type="image/webp"))
+        thumbnails.reverse()
+        return thumbnails
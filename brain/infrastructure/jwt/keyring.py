@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from jwt.algorithms import get_default_algorithms
+
+logger = logging.getLogger(__name__)
+
+_ALGORITHMS = get_default_algorithms()
+
+
+class JwtKeyringError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class JwtKey:
+    kid: str | None
+    algorithm: str
+    # Keys are parsed once when the keyring is loaded, so encode/decode never re-parse PEM data.
+    signing_key: Any | None
+    verification_key: Any
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing_key is not None
+
+
+@dataclass(frozen=True)
+class JwtKeyring:
+    active_kid: str | None
+    keys: dict[str | None, JwtKey]
+
+    @property
+    def active_key(self) -> JwtKey:
+        return self.keys[self.active_kid]
+
+    def get(self, kid: str | None) -> JwtKey | None:
+        return self.keys.get(kid)
+
+
+def _prepare_key(algorithm: str, key: str) -> Any:
+    try:
+        return _ALGORITHMS[algorithm].prepare_key(key)
+    except KeyError as exc:
+        raise JwtKeyringError(f"Unsupported JWT algorithm: {algorithm}") from exc
+
+
+def build_jwt_key(
+    kid: str | None,
+    algorithm: str,
+    key: str | None = None,
+    public_key: str | None = None,
+) -> JwtKey:
+    if algorithm.startswith("HS"):
+        if not key:
+            raise JwtKeyringError(f"HMAC key {kid!r} requires a secret")
+        prepared = _prepare_key(algorithm, key)
+        return JwtKey(kid=kid, algorithm=algorithm, signing_key=prepared, verification_key=prepared)
+
+    signing_key = _prepare_key(algorithm, key) if key else None
+    if public_key:
+        verification_key = _prepare_key(algorithm, public_key)
+    elif signing_key is not None:
+        verification_key = signing_key.public_key()
+    else:
+        raise JwtKeyringError(f"Asymmetric key {kid!r} requires a private or public key")
+    return JwtKey(
+        kid=kid,
+        algorithm=algorithm,
+        signing_key=signing_key,
+        verification_key=verification_key,
+    )
+
+
+def parse_jwt_keyring(data: dict) -> JwtKeyring:
+    keys: dict[str | None, JwtKey] = {}
+    for item in data.get("keys", []):
+        jwt_key = build_jwt_key(
+            kid=item["kid"],
+            algorithm=item["algorithm"],
+            key=item.get("key"),
+            public_key=item.get("public_key"),
+        )
+        keys[jwt_key.kid] = jwt_key
+
+    active_kid = data.get("active_kid")
+    if active_kid not in keys:
+        raise JwtKeyringError(f"Active key {active_kid!r} is missing from the keyring")
+    if not keys[active_kid].can_sign:
+        raise JwtKeyringError(f"Active key {active_kid!r} has no signing key")
+    return JwtKeyring(active_kid=active_kid, keys=keys)
+
+
+def public_jwk(jwt_key: JwtKey) -> dict | None:
+    if jwt_key.algorithm.startswith("HS"):
+        return None
+    jwk = _ALGORITHMS[jwt_key.algorithm].to_jwk(jwt_key.verification_key, as_dict=True)
+    jwk.update({"kid": jwt_key.kid, "alg": jwt_key.algorithm, "use": "sig"})
+    return jwk
+
+
+class IJwtKeyringSource(Protocol):
+    def get_keyring(self) -> JwtKeyring: ...
+
+
+class StaticJwtKeyringSource(IJwtKeyringSource):
+    def __init__(self, keyring: JwtKeyring):
+        self._keyring = keyring
+
+    @classmethod
+    def from_secret(cls, secret_key: str, algorithm: str) -> "StaticJwtKeyringSource":
+        jwt_key = build_jwt_key(kid=None, algorithm=algorithm, key=secret_key)
+        return cls(JwtKeyring(active_kid=None, keys={None: jwt_key}))
+
+    def get_keyring(self) -> JwtKeyring:
+        return self._keyring
+
+
+class FileJwtKeyringSource(IJwtKeyringSource):
+    """
+    Keyring stored as a JSON file, re-read when its mtime changes so keys can be
+    rotated without restarting workers. A broken file keeps the last good keyring.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        reload_interval: float = 30,
+        fallback: JwtKey | None = None,
+    ):
+        self._path = Path(path)
+        self._reload_interval = reload_interval
+        self._fallback = fallback
+        self._keyring: JwtKeyring | None = None
+        self._mtime: float | None = None
+        self._checked_at = 0.0
+
+    def _load(self) -> JwtKeyring:
+        with self._path.open("r", encoding="utf-8") as file:
+            keyring = parse_jwt_keyring(json.load(file))
+        if self._fallback is None or self._fallback.kid in keyring.keys:
+            return keyring
+        return JwtKeyring(
+            active_kid=keyring.active_kid,
+            keys={**keyring.keys, self._fallback.kid: self._fallback},
+        )
+
+    def get_keyring(self) -> JwtKeyring:
+        now = time.monotonic()
+        if self._keyring is not None and now - self._checked_at < self._reload_interval:
+            return self._keyring
+
+        self._checked_at = now
+        try:
+            mtime = os.stat(self._path).st_mtime
+            if self._keyring is not None and mtime == self._mtime:
+                return self._keyring
+            self._keyring = self._load()
+        except (OSError, ValueError, KeyError, JwtKeyringError):
+            if self._keyring is None:
+                raise
+            logger.exception("Failed to reload JWT keyring from %s, keeping previous keys", self._path)
+            return self._keyring
+
+        self._mtime = mtime
+        logger.info("Loaded JWT keyring from %s: active_kid=%s", self._path, self._keyring.active_kid)
+        return self._keyring
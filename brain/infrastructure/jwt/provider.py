@@ -2,6 +2,12 @@ from dishka import Provider, Scope, provide
 
 from brain.application.abstractions.token_verifier import TokenVerifier
 from brain.config.models import AuthenticationConfig
+from brain.infrastructure.jwt.keyring import (
+    FileJwtKeyringSource,
+    IJwtKeyringSource,
+    StaticJwtKeyringSource,
+    build_jwt_key,
+)
 from brain.infrastructure.jwt.service import JwtService
 
 
@@ -9,9 +15,29 @@ class JwtProvider(Provider):
     scope = Scope.APP
 
     @provide
-    def get_token_verifier(self, config: AuthenticationConfig) -> TokenVerifier:
+    def get_keyring_source(self, config: AuthenticationConfig) -> IJwtKeyringSource:
+        if not config.keyring_path:
+            return StaticJwtKeyringSource.from_secret(
+                secret_key=config.secret_key,
+                algorithm=config.algorithm,
+            )
+        return FileJwtKeyringSource(
+            path=config.keyring_path,
+            reload_interval=config.keyring_reload_interval,
+            fallback=(
+                build_jwt_key(kid=None, algorithm=config.algorithm, key=config.secret_key)
+                if config.secret_key
+                else None
+            ),
+        )
+
+    @provide
+    def get_token_verifier(
+        self,
+        config: AuthenticationConfig,
+        keyring_source: IJwtKeyringSource,
+    ) -> TokenVerifier:
         return JwtService(
-            secret_key=config.secret_key,
             access_token_lifetime=config.access_token_lifetime,
-            algorithm=config.algorithm,
+            keyring_source=keyring_source,
         )
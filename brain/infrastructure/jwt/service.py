@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
-from json import JSONEncoder
 from uuid import UUID
 
 import jwt
-from jwt import ExpiredSignatureError, DecodeError
+from jwt import ExpiredSignatureError, InvalidTokenError
 
 from brain.application.abstractions.token_verifier import (
     TokenVerifier,
@@ -12,25 +11,29 @@ from brain.application.abstractions.token_verifier import (
 )
 from brain.domain.entities.jwt import JwtAccessToken
 from brain.domain.time import ensure_utc_datetime, utc_now
+from brain.infrastructure.jwt.keyring import IJwtKeyringSource, StaticJwtKeyringSource, public_jwk
 
 
-class UUIDEncoder(JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, UUID):
-            return obj.hex
-        return JSONEncoder.default(self, obj)
+def _normalize_payload_value(value):
+    if isinstance(value, UUID):
+        return value.hex
+    return value
 
 
 class JwtService(TokenVerifier):
     def __init__(
         self,
-        secret_key: str,
         access_token_lifetime: int,
-        algorithm: str,
+        secret_key: str | None = None,
+        algorithm: str = "HS256",
+        keyring_source: IJwtKeyringSource | None = None,
     ):
-        self._secret_key = secret_key
+        if keyring_source is None:
+            if secret_key is None:
+                raise ValueError("Either secret_key or keyring_source is required")
+            keyring_source = StaticJwtKeyringSource.from_secret(secret_key=secret_key, algorithm=algorithm)
+        self._keyring_source = keyring_source
         self._access_token_lifetime = access_token_lifetime
-        self._algorithm = algorithm
 
     def create_token(self, payload: dict) -> JwtAccessToken:
         expires_at = payload.get("exp")
@@ -43,11 +46,12 @@ class JwtService(TokenVerifier):
             expires_at = ensure_utc_datetime(expires_at)
             payload["exp"] = expires_at
 
+        key = self._keyring_source.get_keyring().active_key
         encoded_jwt = jwt.encode(
-            payload=payload,
-            key=self._secret_key,
-            algorithm=self._algorithm,
-            json_encoder=UUIDEncoder,
+            payload={name: _normalize_payload_value(value) for name, value in payload.items()},
+            key=key.signing_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid} if key.kid is not None else None,
         )
         return JwtAccessToken(
             access_token=encoded_jwt,
@@ -56,12 +60,20 @@ class JwtService(TokenVerifier):
 
     def decode_token(self, token: str) -> dict:
         try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = self._keyring_source.get_keyring().get(kid)
+            if key is None:
+                raise TokenInvalidError()
             return jwt.decode(
                 jwt=token,
-                key=self._secret_key,
-                algorithms=[self._algorithm],
+                key=key.verification_key,
+                algorithms=[key.algorithm],
             )
         except ExpiredSignatureError as exc:
             raise TokenExpiredError() from exc
-        except DecodeError as exc:
+        except InvalidTokenError as exc:
             raise TokenInvalidError() from exc
+
+    def get_public_jwks(self) -> list[dict]:
+        keyring = self._keyring_source.get_keyring()
+        return [jwk for jwk in map(public_jwk, keyring.keys.values()) if jwk is not None]
@@ -0,0 +1,43 @@
+"""Add sha256/path indexes to s3_files and s3_orphaned_objects
+
+Revision ID: a1b2c3d4e5f7
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1b2c3d4e5f7"
+down_revision: Union[str, None] = "f0a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_s3_files_sha256", "s3_files", ["sha256"], unique=False)
+    op.create_index("ix_s3_files_path", "s3_files", ["path"], unique=False)
+    op.create_table(
+        "s3_orphaned_objects",
+        sa.Column("path", sa.String(length=256), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("path"),
+    )
+    op.create_index(
+        "ix_s3_orphaned_objects_created_at",
+        "s3_orphaned_objects",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_s3_orphaned_objects_created_at", table_name="s3_orphaned_objects")
+    op.drop_table("s3_orphaned_objects")
+    op.drop_index("ix_s3_files_path", table_name="s3_files")
+    op.drop_index("ix_s3_files_sha256", table_name="s3_files")
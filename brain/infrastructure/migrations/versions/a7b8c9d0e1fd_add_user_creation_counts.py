@@ -0,0 +1,50 @@
+"""Add user_creation_counts
+
+Revision ID: a7b8c9d0e1fd
+Revises: f6a7b8c9d0ec
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1fd"
+down_revision: Union[str, None] = "f6a7b8c9d0ec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_creation_counts",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "kind", "bucket_start"),
+    )
+    # Same buckets as creation_bucket_start: 2000-01-01 is a whole number of 15 minute steps
+    # past the Unix epoch. Spelled without date_bin, which needs PostgreSQL 14.
+    for kind, table in (("note", "notes"), ("draft", "drafts")):
+        op.execute(
+            f"""
+            INSERT INTO user_creation_counts (user_id, kind, bucket_start, count)
+            SELECT
+                user_id,
+                '{kind}',
+                to_timestamp(floor(extract(epoch FROM created_at) / 900) * 900),
+                count(*)
+            FROM {table}
+            GROUP BY 1, 2, 3
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("user_creation_counts")
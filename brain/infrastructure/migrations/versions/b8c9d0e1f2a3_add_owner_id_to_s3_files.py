@@ -0,0 +1,39 @@
+"""Add owner_id to s3_files for presigned uploads
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1fd
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1fd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("s3_files", sa.Column("owner_id", sa.Uuid(), nullable=True))
+    op.create_foreign_key(
+        "s3_files_owner_id_fkey",
+        "s3_files",
+        "users",
+        ["owner_id"],
+        ["id"],
+        ondelete="SET NULL",
+        onupdate="CASCADE",
+    )
+    op.create_index(op.f("ix_s3_files_owner_id"), "s3_files", ["owner_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_s3_files_owner_id"), table_name="s3_files")
+    op.drop_constraint("s3_files_owner_id_fkey", "s3_files", type_="foreignkey")
+    op.drop_column("s3_files", "owner_id")
@@ -0,0 +1,47 @@
+"""Add thumbnail parent reference to s3_files
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f6a8
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b9"
+down_revision: Union[str, None] = "b2c3d4e5f6a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("s3_files", sa.Column("parent_id", sa.Uuid(), nullable=True))
+    op.add_column("s3_files", sa.Column("thumbnail_size", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "s3_files_parent_id_fkey",
+        "s3_files",
+        "s3_files",
+        ["parent_id"],
+        ["id"],
+        ondelete="CASCADE",
+        onupdate="CASCADE",
+    )
+    op.create_index(op.f("ix_s3_files_parent_id"), "s3_files", ["parent_id"], unique=False)
+    op.create_unique_constraint(
+        "uq_s3_files_parent_id_thumbnail_size",
+        "s3_files",
+        ["parent_id", "thumbnail_size"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_s3_files_parent_id_thumbnail_size", "s3_files", type_="unique")
+    op.drop_index(op.f("ix_s3_files_parent_id"), table_name="s3_files")
+    op.drop_constraint("s3_files_parent_id_fkey", "s3_files", type_="foreignkey")
+    op.drop_column("s3_files", "thumbnail_size")
+    op.drop_column("s3_files", "parent_id")
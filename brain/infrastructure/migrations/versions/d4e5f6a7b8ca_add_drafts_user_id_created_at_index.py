@@ -0,0 +1,31 @@
+"""Add (user_id, created_at, id) index to drafts
+
+Revision ID: d4e5f6a7b8ca
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8ca"
+down_revision: Union[str, None] = "c3d4e5f6a7b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_drafts_user_id_created_at",
+        "drafts",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_drafts_user_id_created_at", table_name="drafts")
@@ -0,0 +1,40 @@
+"""Add token_hash to jwt_refresh_tokens and cleanup indexes
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jwt_refresh_tokens", sa.Column("token_hash", sa.String(length=64), nullable=True))
+    op.execute("UPDATE jwt_refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column("jwt_refresh_tokens", "token_hash", nullable=False)
+    op.create_unique_constraint("jwt_refresh_tokens_token_hash_key", "jwt_refresh_tokens", ["token_hash"])
+    op.create_index(
+        "ix_jwt_refresh_tokens_expires_at",
+        "jwt_refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+    op.create_index("ix_tg_bot_auth_created_at", "tg_bot_auth", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tg_bot_auth_created_at", table_name="tg_bot_auth")
+    op.drop_index("ix_jwt_refresh_tokens_expires_at", table_name="jwt_refresh_tokens")
+    op.drop_constraint("jwt_refresh_tokens_token_hash_key", "jwt_refresh_tokens", type_="unique")
+    op.drop_column("jwt_refresh_tokens", "token_hash")
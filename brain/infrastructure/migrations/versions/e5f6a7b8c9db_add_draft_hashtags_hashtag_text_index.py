@@ -0,0 +1,31 @@
+"""Add (hashtag_text, draft_id) index to draft_hashtags
+
+Revision ID: e5f6a7b8c9db
+Revises: d4e5f6a7b8ca
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9db"
+down_revision: Union[str, None] = "d4e5f6a7b8ca"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_draft_hashtags_hashtag_text_draft_id",
+        "draft_hashtags",
+        ["hashtag_text", "draft_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_draft_hashtags_hashtag_text_draft_id", table_name="draft_hashtags")
@@ -0,0 +1,30 @@
+"""Add status to s3_files for presigned uploads
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f0a1b2c3d4e5"
+down_revision: Union[str, None] = "e9f0a1b2c3d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "s3_files",
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="ready"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("s3_files", "status")
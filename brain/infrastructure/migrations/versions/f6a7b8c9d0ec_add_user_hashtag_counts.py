@@ -0,0 +1,44 @@
+"""Add user_hashtag_counts
+
+Revision ID: f6a7b8c9d0ec
+Revises: e5f6a7b8c9db
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0ec"
+down_revision: Union[str, None] = "e5f6a7b8c9db"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_hashtag_counts",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("hashtag_text", sa.String(length=255), nullable=False),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["hashtag_text"], ["hashtags.text"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "hashtag_text"),
+    )
+    op.execute(
+        """
+        INSERT INTO user_hashtag_counts (user_id, hashtag_text, count)
+        SELECT drafts.user_id, draft_hashtags.hashtag_text, count(*)
+        FROM draft_hashtags
+        JOIN drafts ON drafts.id = draft_hashtags.draft_id
+        GROUP BY drafts.user_id, draft_hashtags.hashtag_text
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_hashtag_counts")
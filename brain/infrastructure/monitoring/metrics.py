@@ -0,0 +1,75 @@
+import logging
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, Gauge, Histogram, multiprocess, start_http_server
+
+from brain.infrastructure.monitoring.pool_stats import PoolStatsCollector
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REPOSITORY_CALL_DURATION = Histogram(
+    "repository_call_duration_seconds",
+    "Repository method latency",
+    ["repository", "method"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+TASKIQ_QUEUE_DEPTH = Gauge(
+    "taskiq_queue_depth",
+    "Messages in a taskiq stream not yet delivered to a worker",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+TASKIQ_QUEUE_PENDING = Gauge(
+    "taskiq_queue_pending",
+    "Messages delivered to a taskiq worker but not acknowledged yet",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+AUTH_TABLE_ROWS = Gauge(
+    "auth_table_rows",
+    "Rows left in an auth table after the last expired-data cleanup",
+    ["table"],
+    multiprocess_mode="mostrecent",
+)
+
+DATABASE_POOLS = PoolStatsCollector("db_pool")
+NEO4J_POOLS = PoolStatsCollector("neo4j_pool")
+REGISTRY.register(DATABASE_POOLS)
+REGISTRY.register(NEO4J_POOLS)
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """
+    Registry to serve metrics from. With PROMETHEUS_MULTIPROC_DIR set, metric samples of every
+    process are read from that directory. Pool collectors read live pool objects, so they only
+    report the pools of the serving process, told apart by their pid label.
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(DATABASE_POOLS)
+    registry.register(NEO4J_POOLS)
+    return registry
+
+
+def start_worker_metrics_server(port: int) -> None:
+    """
+    Serve metrics from a taskiq worker. With PROMETHEUS_MULTIPROC_DIR set, every worker process
+    writes its samples there and whichever process binds the port first serves all of them.
+    """
+    try:
+        start_http_server(port, registry=get_metrics_registry())
+    except OSError:
+        logger.debug("Metrics port %d is already served by another worker process", port)
@@ -0,0 +1,55 @@
+import logging
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+
+from prometheus_client.metrics_core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStatsCollector(Collector):
+    """
+    Exposes connection pool snapshots on scrape. Every registered pool returns a dataclass
+    of numbers; each field becomes a `<namespace>_<field>{pool="...", pid="..."}` gauge, or a
+    counter when the field name ends in `_total`. The pid label keeps the pools of different
+    API or worker processes apart when they are scraped through one multiprocess registry.
+    """
+
+    def __init__(self, namespace: str):
+        self._namespace = namespace
+        self._pools: dict[str, Callable[[], object]] = {}
+
+    def add_pool(self, name: str, collect_stats: Callable[[], object]) -> None:
+        self._pools[name] = collect_stats
+
+    def remove_pool(self, name: str) -> None:
+        self._pools.pop(name, None)
+
+    def describe(self) -> list[Metric]:
+        # Fields are only known once a pool is registered, so skip the registry's name check.
+        return []
+
+    def collect(self) -> Iterator[Metric]:
+        families: dict[str, Metric] = {}
+        pid = str(os.getpid())
+        for pool, collect_stats in list(self._pools.items()):
+            try:
+                stats = asdict(collect_stats())
+            except Exception:
+                logger.exception("Failed to collect %s stats for the %s pool", self._namespace, pool)
+                continue
+            for field, value in stats.items():
+                family = families.get(field)
+                if family is None:
+                    family = families[field] = self._family(field)
+                family.add_metric([pool, pid], value)
+        yield from families.values()
+
+    def _family(self, field: str) -> Metric:
+        name = f"{self._namespace}_{field}"
+        documentation = f"Connection pool {field.replace('_', ' ')}"
+        if field.endswith("_total"):
+            return CounterMetricFamily(name, documentation, labels=["pool", "pid"])
+        return GaugeMetricFamily(name, documentation, labels=["pool", "pid"])
@@ -0,0 +1,41 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from brain.application.interactors.factory import InteractorProvider
+from brain.infrastructure.monitoring.taskiq_queue import TaskiqQueueMonitor
+from brain.infrastructure.monitoring.tracing import trace_methods
+
+
+class MonitoringProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self, taskiq_queues: Sequence[tuple[str, str]] = ()):
+        super().__init__()
+        self._taskiq_queues = tuple(taskiq_queues)
+
+    @provide
+    def get_taskiq_queue_monitor(self, redis: Redis) -> TaskiqQueueMonitor:
+        return TaskiqQueueMonitor(redis=redis, queues=self._taskiq_queues)
+
+
+class TracingProvider(Provider):
+    """Wraps every interactor in spans, keeping the application layer free of tracing code."""
+
+    scope = Scope.REQUEST
+
+    def __init__(self):
+        super().__init__()
+        for factory in InteractorProvider().factories:
+            self.decorate(_trace_decorator(factory.provides.type_hint))
+
+
+def _trace_decorator(interactor: type) -> Callable[[Any], Any]:
+    def decorator(instance: Any) -> Any:
+        return trace_methods(instance)
+
+    # dishka matches decorators to the type they wrap by annotation
+    decorator.__annotations__ = {"instance": interactor, "return": interactor}
+    return decorator
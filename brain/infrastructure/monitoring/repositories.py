@@ -0,0 +1,48 @@
+import functools
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from brain.infrastructure.monitoring.metrics import REPOSITORY_CALL_DURATION
+from brain.infrastructure.monitoring.tracing import tracer
+
+T = TypeVar("T")
+
+# "<Repository>.<method>" of the innermost repository call, for attributing database statements
+current_repository_method: ContextVar[str | None] = ContextVar("current_repository_method", default=None)
+
+
+def instrumented_repository(cls: type[T]) -> type[T]:
+    """
+    Record a latency histogram sample and a tracing span for every public coroutine method
+    defined on a repository class.
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            continue
+        setattr(cls, name, _instrumented(attr, repository=cls.__name__, method=name))
+    return cls
+
+
+def _instrumented(
+    func: Callable[..., Awaitable[Any]],
+    repository: str,
+    method: str,
+) -> Callable[..., Awaitable[Any]]:
+    duration = REPOSITORY_CALL_DURATION.labels(repository=repository, method=method)
+    span_name = f"{repository}.{method}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started_at = time.perf_counter()
+        token = current_repository_method.set(span_name)
+        try:
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+            duration.observe(time.perf_counter() - started_at)
+
+    return wrapper
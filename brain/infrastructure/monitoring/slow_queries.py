@@ -0,0 +1,105 @@
+import json
+import logging
+import random
+import re
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+from brain.config.models import SlowQueryConfig
+from brain.infrastructure.monitoring.repositories import current_repository_method
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# Numbers that are not part of an identifier or a $1-style placeholder
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace and replace inline literals, so equal statements log identically."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _redact_value(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes, list, tuple, set, dict)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Keep the shape and types of bound parameters but none of their values."""
+    if isinstance(parameters, Mapping):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (Mapping, list, tuple)):
+            # executemany: one set of parameters per row
+            return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+class SlowQueryLog:
+    """
+    Logs database statements slower than the configured threshold and appends sampled
+    query plans to a size-rotated JSON lines file.
+    """
+
+    def __init__(self, config: SlowQueryConfig):
+        self._threshold = config.threshold_ms / 1000
+        self._plan_sample_rate = config.plan_sample_rate
+        self._plan_handler: RotatingFileHandler | None = None
+        if self.enabled and self._plan_sample_rate > 0:
+            path = Path(config.plan_log_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._plan_handler = RotatingFileHandler(
+                path,
+                maxBytes=config.plan_log_max_bytes,
+                backupCount=config.plan_log_backup_count,
+                encoding="utf-8",
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self._threshold > 0
+
+    def is_slow(self, duration: float) -> bool:
+        return self.enabled and duration >= self._threshold
+
+    def should_capture_plan(self) -> bool:
+        return self._plan_handler is not None and random.random() < self._plan_sample_rate
+
+    def report(self, backend: str, statement: str, parameters: Any, duration: float) -> None:
+        logger.warning(
+            "Slow %s statement took %.1f ms in %s: %s params=%s",
+            backend,
+            duration * 1000,
+            current_repository_method.get() or "<no repository>",
+            normalize_statement(statement),
+            redact_parameters(parameters),
+        )
+
+    def write_plan(self, backend: str, statement: str, duration: float, plan: Any) -> None:
+        if self._plan_handler is None:
+            return
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "backend": backend,
+            "duration_ms": round(duration * 1000, 1),
+            "repository_method": current_repository_method.get(),
+            "statement": normalize_statement(statement),
+            "plan": plan,
+        }
+        record = logging.makeLogRecord({"msg": json.dumps(entry, default=str), "levelno": logging.INFO})
+        self._plan_handler.handle(record)
+
+    def close(self) -> None:
+        if self._plan_handler is not None:
+            self._plan_handler.close()
@@ -0,0 +1,42 @@
+import logging
+from collections.abc import Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from brain.infrastructure.monitoring.metrics import TASKIQ_QUEUE_DEPTH, TASKIQ_QUEUE_PENDING
+
+logger = logging.getLogger(__name__)
+
+
+class TaskiqQueueMonitor:
+    """Samples the depth of taskiq Redis streams into gauges, given (stream, consumer group) pairs."""
+
+    def __init__(self, redis: Redis, queues: Sequence[tuple[str, str]]):
+        self._redis = redis
+        self._queues = tuple(queues)
+
+    async def refresh(self) -> None:
+        for stream, group in self._queues:
+            try:
+                depth, pending = await self._sample(stream, group)
+            except RedisError:
+                logger.warning("Failed to sample taskiq queue %s", stream, exc_info=True)
+                continue
+            TASKIQ_QUEUE_DEPTH.labels(queue=stream).set(depth)
+            TASKIQ_QUEUE_PENDING.labels(queue=stream).set(pending)
+
+    async def _sample(self, stream: str, group: str) -> tuple[int, int]:
+        try:
+            groups = await self._redis.xinfo_groups(stream)
+        except ResponseError:
+            # The stream is created lazily by the first producer or consumer.
+            return 0, 0
+        info = next((item for item in groups if item["name"] == group), None)
+        if info is None:
+            return await self._redis.xlen(stream), 0
+        lag = info.get("lag")
+        if lag is None:
+            # Redis cannot compute the lag after entries were deleted; fall back to the stream length.
+            lag = await self._redis.xlen(stream)
+        return lag, info["pending"]
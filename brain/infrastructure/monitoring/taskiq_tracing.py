@@ -0,0 +1,54 @@
+from typing import Any
+
+from opentelemetry import context, propagate, trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from brain.infrastructure.monitoring.tracing import tracer
+
+
+class TaskiqTracingMiddleware(TaskiqMiddleware):
+    """
+    Carries the sender's trace context in message labels and runs each task inside a
+    consumer span that continues it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._active: dict[str, tuple[Span, object]] = {}
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        propagate.inject(message.labels)
+        return message
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        parent = propagate.extract(message.labels)
+        span = tracer.start_span(
+            f"taskiq {message.task_name}",
+            context=parent,
+            kind=SpanKind.CONSUMER,
+            attributes={
+                "messaging.system": "taskiq",
+                "messaging.operation": "process",
+                "messaging.message.id": message.task_id,
+            },
+        )
+        token = context.attach(trace.set_span_in_context(span, parent))
+        self._active[message.task_id] = (span, token)
+        return message
+
+    def on_error(self, message: TaskiqMessage, result: TaskiqResult[Any], exception: BaseException) -> None:
+        active = self._active.get(message.task_id)
+        if active is None:
+            return
+        span, _ = active
+        span.record_exception(exception)
+        span.set_status(Status(StatusCode.ERROR))
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        active = self._active.pop(message.task_id, None)
+        if active is None:
+            return
+        span, token = active
+        context.detach(token)
+        span.end()
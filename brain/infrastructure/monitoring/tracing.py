@@ -0,0 +1,88 @@
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from brain.config.models import TracingConfig, TracingExporter
+
+T = TypeVar("T")
+
+tracer = trace.get_tracer("brain")
+
+_span_exporter: SpanExporter | None = None
+
+
+def build_span_exporter(config: TracingConfig) -> SpanExporter | None:
+    if config.exporter == TracingExporter.NONE:
+        return None
+    if config.exporter == TracingExporter.CONSOLE:
+        return ConsoleSpanExporter()
+    if config.exporter == TracingExporter.MEMORY:
+        return InMemorySpanExporter()
+    # Optional dependency, only needed when spans leave the process
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=config.otlp_endpoint or None)
+
+
+def setup_tracing(config: TracingConfig) -> SpanExporter | None:
+    """
+    Install the process-wide tracer provider and return its exporter. The global provider
+    can only be set once, so later calls return the exporter chosen by the first one.
+    """
+    global _span_exporter
+    if _span_exporter is not None:
+        return _span_exporter
+    exporter = build_span_exporter(config)
+    if exporter is None:
+        return None
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: config.service_name}),
+        sampler=ParentBased(TraceIdRatioBased(config.sample_ratio)),
+    )
+    if isinstance(exporter, InMemorySpanExporter):
+        # Export synchronously so tests can assert on spans right after the call
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    _span_exporter = exporter
+    return exporter
+
+
+@functools.cache
+def _public_coroutine_methods(cls: type) -> tuple[str, ...]:
+    return tuple(
+        name
+        for name, member in inspect.getmembers(cls, inspect.iscoroutinefunction)
+        if not name.startswith("_")
+    )
+
+
+def trace_methods(instance: T) -> T:
+    """Wrap the public coroutine methods of an object in spans named `<Class>.<method>`."""
+    cls = type(instance)
+    for name in _public_coroutine_methods(cls):
+        setattr(instance, name, traced(getattr(instance, name), f"{cls.__name__}.{name}"))
+    return instance
+
+
+def traced(func: Callable[..., Awaitable[Any]], span_name: str) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.start_as_current_span(span_name):
+            return await func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1 @@
+from brain.infrastructure.redis.provider import RedisProvider as RedisProvider
@@ -0,0 +1,39 @@
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from brain.config.models import BotConfig, DatabaseReplicaConfig, RedisConfig
+from brain.infrastructure.db.write_tracking import IRecentUserWrites, NullRecentUserWrites
+from brain.infrastructure.redis.recent_writes import RedisRecentUserWrites
+from brain.infrastructure.redis.update_queue import TelegramUpdateQueue
+from brain.infrastructure.redis.user_info_cache import TelegramUserInfoCache
+
+
+class RedisProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_redis(self, config: RedisConfig) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(config.uri, decode_responses=True)
+        yield redis
+        await redis.aclose()
+
+    @provide
+    def get_user_info_cache(self, redis: Redis, bot_config: BotConfig) -> TelegramUserInfoCache:
+        return TelegramUserInfoCache(redis=redis, ttl=bot_config.user_info_cache_ttl)
+
+    @provide
+    def get_telegram_update_queue(self, redis: Redis, bot_config: BotConfig) -> TelegramUpdateQueue:
+        return TelegramUpdateQueue(
+            redis=redis,
+            dedupe_ttl=bot_config.update_dedupe_ttl,
+            lock_timeout=bot_config.update_lock_timeout,
+            max_attempts=bot_config.update_max_attempts,
+        )
+
+    @provide
+    def get_recent_user_writes(self, redis: Redis, replica_config: DatabaseReplicaConfig) -> IRecentUserWrites:
+        if not replica_config.enabled:
+            return NullRecentUserWrites()
+        return RedisRecentUserWrites(redis=redis, ttl=max(1, replica_config.sticky_period))
@@ -0,0 +1,27 @@
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from brain.infrastructure.db.write_tracking import IRecentUserWrites
+
+
+class RedisRecentUserWrites(IRecentUserWrites):
+    _key_prefix = "recent_write:user"
+
+    def __init__(self, redis: Redis, ttl: int):
+        self._redis = redis
+        self._ttl = ttl
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self._key_prefix}:{user_id}"
+
+    async def mark(self, user_ids: set[UUID]) -> None:
+        if not user_ids:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.set(self._key(user_id), 1, ex=self._ttl)
+            await pipe.execute()
+
+    async def is_recent(self, user_id: UUID) -> bool:
+        return bool(await self._redis.exists(self._key(user_id)))
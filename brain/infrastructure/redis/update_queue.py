@@ -0,0 +1,95 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError
+
+logger = logging.getLogger(__name__)
+
+
+class TelegramUpdateQueue:
+    """
+    Per-chat FIFO of raw Telegram updates. Any worker may drain a chat, but a
+    per-chat lock guarantees updates of one chat are processed one at a time, in order.
+    An update is removed from its queue only after it was handled, so a crashed worker
+    never loses it; one that keeps failing is moved to a dead-letter list.
+    """
+
+    _seen_key_prefix = "tg_updates:seen"
+    _queue_key_prefix = "tg_updates:queue"
+    _attempts_key_prefix = "tg_updates:attempts"
+    _dead_letter_key_prefix = "tg_updates:dead"
+    _lock_key_prefix = "tg_updates:lock"
+
+    def __init__(self, redis: Redis, dedupe_ttl: int, lock_timeout: int, max_attempts: int = 3):
+        self._redis = redis
+        self._dedupe_ttl = dedupe_ttl
+        self._lock_timeout = lock_timeout
+        self._max_attempts = max_attempts
+
+    async def enqueue(self, update_id: int, ordering_key: str, payload: str) -> bool:
+        is_new = await self._redis.set(
+            f"{self._seen_key_prefix}:{update_id}",
+            "1",
+            nx=True,
+            ex=self._dedupe_ttl,
+        )
+        if not is_new:
+            return False
+        await self._redis.rpush(f"{self._queue_key_prefix}:{ordering_key}", payload)
+        return True
+
+    async def drain(self, ordering_key: str, handler: Callable[[str], Awaitable[None]]) -> int:
+        queue_key = f"{self._queue_key_prefix}:{ordering_key}"
+        processed = 0
+        while True:
+            lock = self._redis.lock(f"{self._lock_key_prefix}:{ordering_key}", timeout=self._lock_timeout)
+            if not await lock.acquire(blocking=False):
+                # Another worker owns this chat and will pick up our update
+                return processed
+            try:
+                processed += await self._drain_locked(ordering_key, lock, handler)
+            finally:
+                try:
+                    await lock.release()
+                except LockError:
+                    logger.warning("Telegram update lock for %s expired before release", ordering_key)
+            # An update may have been pushed after the last pop but before the release
+            if not await self._redis.llen(queue_key):
+                return processed
+
+    async def _drain_locked(self, ordering_key: str, lock: Lock, handler: Callable[[str], Awaitable[None]]) -> int:
+        queue_key = f"{self._queue_key_prefix}:{ordering_key}"
+        attempts_key = f"{self._attempts_key_prefix}:{ordering_key}"
+        processed = 0
+        while (payload := await self._redis.lindex(queue_key, 0)) is not None:
+            try:
+                # Restart the lock timeout for every update, however long the backlog is
+                await lock.reacquire()
+            except LockError:
+                logger.warning("Lost the Telegram update lock for %s, leaving its queue to the new owner", ordering_key)
+                return processed
+            attempts = await self._redis.incr(attempts_key)
+            if attempts > self._max_attempts:
+                logger.error(
+                    "Moving a Telegram update for %s to the dead-letter list after %d failed attempts",
+                    ordering_key,
+                    self._max_attempts,
+                )
+                await self._redis.lmove(queue_key, f"{self._dead_letter_key_prefix}:{ordering_key}", "LEFT", "RIGHT")
+                await self._redis.delete(attempts_key)
+                continue
+            try:
+                await handler(payload)
+            except Exception:
+                logger.exception("Failed to process queued Telegram update for %s (attempt %d)", ordering_key, attempts)
+                continue
+            if not await lock.owned():
+                # The update outlived the lock; popping now could drop the new owner's head
+                logger.warning("Telegram update lock for %s expired while handling an update", ordering_key)
+                return processed
+            await self._redis.lpop(queue_key)
+            await self._redis.delete(attempts_key)
+            processed += 1
+        return processed
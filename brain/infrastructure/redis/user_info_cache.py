@@ -0,0 +1,98 @@
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from enum import Enum
+
+from redis.asyncio import Redis
+
+from brain.application.interactors.users.dto import CreateOrUpdateUser
+
+
+class UserInfoState(Enum):
+    UNKNOWN = "unknown"
+    UNCHANGED = "unchanged"
+    CHANGED = "changed"
+
+
+def build_user_info_fingerprint(user_data: CreateOrUpdateUser) -> str:
+    raw = json.dumps([user_data.username, user_data.first_name, user_data.last_name])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class TelegramUserInfoCache:
+    _fingerprint_key_prefix = "tg_user_info:fingerprint"
+    _pending_key = "tg_user_info:pending"
+    _flush_scheduled_key = "tg_user_info:flush_scheduled"
+    _flush_scheduled_ttl = 60
+
+    def __init__(self, redis: Redis, ttl: int):
+        self._redis = redis
+        self._ttl = ttl
+
+    def _fingerprint_key(self, telegram_id: int) -> str:
+        return f"{self._fingerprint_key_prefix}:{telegram_id}"
+
+    async def get_state(self, user_data: CreateOrUpdateUser) -> UserInfoState:
+        cached = await self._redis.get(self._fingerprint_key(user_data.telegram_id))
+        if cached is None:
+            return UserInfoState.UNKNOWN
+        if cached == build_user_info_fingerprint(user_data):
+            return UserInfoState.UNCHANGED
+        return UserInfoState.CHANGED
+
+    async def remember(self, user_data: CreateOrUpdateUser) -> None:
+        await self.remember_many([user_data])
+
+    async def remember_many(self, users: list[CreateOrUpdateUser]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_data in users:
+                pipe.set(
+                    self._fingerprint_key(user_data.telegram_id),
+                    build_user_info_fingerprint(user_data),
+                    ex=self._ttl,
+                )
+            await pipe.execute()
+
+    async def add_pending(self, user_data: CreateOrUpdateUser) -> bool:
+        """
+        Queues the user info for the next batched write.
+        Returns True when the caller should schedule a flush.
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._pending_key, str(user_data.telegram_id), json.dumps(asdict(user_data)))
+            pipe.set(self._flush_scheduled_key, "1", nx=True, ex=self._flush_scheduled_ttl)
+            _, flush_scheduled = await pipe.execute()
+        return bool(flush_scheduled)
+
+    async def pop_pending(self) -> list[CreateOrUpdateUser]:
+        await self._redis.delete(self._flush_scheduled_key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self._pending_key)
+            pipe.delete(self._pending_key)
+            pending, _ = await pipe.execute()
+        return [CreateOrUpdateUser(**json.loads(value)) for value in pending.values()]
+
+    async def restore_pending(self, users: list[CreateOrUpdateUser]) -> None:
+        # HSETNX keeps info queued while the failed write was running, it is newer
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for user_data in users:
+                pipe.hsetnx(self._pending_key, str(user_data.telegram_id), json.dumps(asdict(user_data)))
+            await pipe.execute()
+
+    async def flush_pending(self, write: Callable[[list[CreateOrUpdateUser]], Awaitable[None]]) -> int:
+        """
+        Hands the queued user info to `write` and stores the fingerprints only after it succeeds.
+        A failed write puts the entries back for the next flush and leaves the fingerprints stale,
+        so the users' next updates are queued again instead of being skipped.
+        """
+        pending = await self.pop_pending()
+        if not pending:
+            return 0
+        try:
+            await write(pending)
+        except Exception:
+            await self.restore_pending(pending)
+            raise
+        await self.remember_many(pending)
+        return len(pending)
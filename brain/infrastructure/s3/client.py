@@ -1,5 +1,6 @@
 import boto3
 from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
 
 from brain.config.models import S3Config
 
@@ -7,15 +8,28 @@ from brain.config.models import S3Config
 class S3Client:
     def __init__(self, config: S3Config):
         self.config = config
-        self.client = boto3.client(
+        self.client = self._build_client(self.config.endpoint_url)
+        # Presigned URLs embed the host in the signature, so they are signed for the client-facing endpoint.
+        if self.config.presign_endpoint_url:
+            self.presign_client = self._build_client(self.config.presign_endpoint_url)
+        else:
+            self.presign_client = self.client
+        self.bucket = self.config.bucket_name
+
+    def _build_client(self, endpoint_url: str):
+        return boto3.client(
             "s3",
-            endpoint_url=self.config.endpoint_url,
+            endpoint_url=endpoint_url,
             aws_access_key_id=self.config.access_key_id,
             aws_secret_access_key=self.config.secret_access_key,
             region_name=self.config.region_name,
-            config=BotoConfig(signature_version="s3v4"),
+            config=BotoConfig(
+                signature_version="s3v4",
+                max_pool_connections=self.config.max_pool_connections,
+                connect_timeout=self.config.connect_timeout,
+                read_timeout=self.config.read_timeout,
+            ),
         )
-        self.bucket = self.config.bucket_name
 
     def upload_file(self, file_content: bytes, object_name: str, content_type: str = None) -> str:
         extra_args = {}
@@ -30,3 +44,85 @@ class S3Client:
         )
 
         return f"{self.config.endpoint_url}/{self.bucket}/{object_name}"
+
+    def download_file(self, object_name: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=object_name)
+        with response["Body"] as body:
+            return body.read()
+
+    def delete_object(self, object_name: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=object_name)
+
+    def create_multipart_upload(self, object_name: str, content_type: str | None = None) -> str:
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=object_name,
+            **extra_args,
+        )
+        return response["UploadId"]
+
+    def upload_part(self, object_name: str, upload_id: str, part_number: int, body: bytes) -> str:
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(self, object_name: str, upload_id: str, parts: list[dict]) -> None:
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+        )
+
+    def generate_presigned_put(
+        self,
+        object_name: str,
+        content_type: str,
+        content_length: int,
+        checksum_sha256: str | None,
+        expires_in: int,
+    ) -> str:
+        params = {
+            "Bucket": self.bucket,
+            "Key": object_name,
+            "ContentType": content_type,
+            "ContentLength": content_length,
+        }
+        if checksum_sha256:
+            params["ChecksumSHA256"] = checksum_sha256
+        return self.presign_client.generate_presigned_url(
+            "put_object",
+            Params=params,
+            ExpiresIn=expires_in,
+        )
+
+    def generate_presigned_get(self, object_name: str, expires_in: int) -> str:
+        return self.presign_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": object_name},
+            ExpiresIn=expires_in,
+        )
+
+    def head_object(self, object_name: str) -> dict | None:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=object_name, ChecksumMode="ENABLED")
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise
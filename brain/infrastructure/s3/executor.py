@@ -0,0 +1,48 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from opentelemetry.trace import SpanKind
+
+from brain.infrastructure.monitoring.tracing import tracer
+
+T = TypeVar("T")
+
+
+class S3Executor:
+    """
+    Runs blocking boto3 calls. The base implementation calls them inline.
+    """
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with tracer.start_as_current_span(
+            f"s3.{getattr(func, '__name__', 'call')}",
+            kind=SpanKind.CLIENT,
+            attributes={"rpc.system": "aws-api", "rpc.service": "S3"},
+        ):
+            return await self._call(func, *args, **kwargs)
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return func(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class ThreadPoolS3Executor(S3Executor):
+    """
+    Offloads boto3 calls to a dedicated bounded pool, so S3 traffic neither blocks the
+    event loop nor competes with other users of the default executor.
+    """
+
+    def __init__(self, max_workers: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3")
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -1,22 +1,103 @@
-from brain.application.abstractions.storage.files import IFileStorage
+import base64
+from collections.abc import AsyncIterable
+
+from brain.application.abstractions.storage.files import (
+    IFileStorage,
+    PresignedUpload,
+    StoredFile,
+    StoredObjectInfo,
+)
 from brain.config.models import S3Config
 from brain.infrastructure.s3.client import S3Client
+from brain.infrastructure.s3.executor import S3Executor
+from brain.infrastructure.s3.multipart import S3MultipartStreamUploader
 
 
 class S3FileStorage(IFileStorage):
-    def __init__(self, s3_client: S3Client, s3_config: S3Config):
+    def __init__(self, s3_client: S3Client, s3_config: S3Config, executor: S3Executor):
         self._s3_client = s3_client
         self._s3_config = s3_config
+        self._executor = executor
+        self._stream_uploader = S3MultipartStreamUploader(
+            s3_client=s3_client,
+            executor=executor,
+            part_size=s3_config.multipart_part_size,
+        )
 
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
         content_type: str | None = None,
     ) -> str:
-        url = self._s3_client.upload_file(
+        url = await self._executor.run(
+            self._s3_client.upload_file,
             file_content=content,
             object_name=object_name,
             content_type=content_type,
         )
         return url.replace(self._s3_config.endpoint_url, self._s3_config.external_host)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        object_name: str,
+        content_type: str | None = None,
+    ) -> StoredFile:
+        return await self._stream_uploader.upload(
+            chunks=chunks,
+            object_name=object_name,
+            content_type=content_type,
+        )
+
+    async def download(self, object_name: str) -> bytes:
+        return await self._executor.run(self._s3_client.download_file, object_name)
+
+    async def delete(self, object_name: str) -> None:
+        await self._executor.run(self._s3_client.delete_object, object_name)
+
+    async def create_upload_url(
+        self,
+        object_name: str,
+        content_type: str,
+        size: int,
+        sha256: str | None,
+        expires_in: int,
+    ) -> PresignedUpload:
+        # S3 expects the checksum base64-encoded and rejects a PUT whose body does not match it.
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode() if sha256 else None
+        url = await self._executor.run(
+            self._s3_client.generate_presigned_put,
+            object_name=object_name,
+            content_type=content_type,
+            content_length=size,
+            checksum_sha256=checksum,
+            expires_in=expires_in,
+        )
+        headers = {"Content-Type": content_type}
+        if checksum:
+            headers["x-amz-checksum-sha256"] = checksum
+        return PresignedUpload(url=url, method="PUT", headers=headers)
+
+    async def create_download_url(self, object_name: str, expires_in: int) -> str:
+        return await self._executor.run(
+            self._s3_client.generate_presigned_get,
+            object_name=object_name,
+            expires_in=expires_in,
+        )
+
+    async def get_object_info(self, object_name: str) -> StoredObjectInfo | None:
+        response = await self._executor.run(self._s3_client.head_object, object_name)
+        if response is None:
+            return None
+        checksum = response.get("ChecksumSHA256")
+        # Multipart objects carry a composite "<hash>-<parts>" checksum that is not the content hash.
+        if checksum and "-" not in checksum:
+            sha256 = base64.b64decode(checksum).hex()
+        else:
+            sha256 = None
+        return StoredObjectInfo(
+            size=response["ContentLength"],
+            content_type=response.get("ContentType"),
+            sha256=sha256,
+        )
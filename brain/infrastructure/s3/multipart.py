@@ -0,0 +1,92 @@
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterable
+
+from brain.application.abstractions.storage.files import StoredFile
+from brain.infrastructure.s3.client import S3Client
+from brain.infrastructure.s3.executor import S3Executor
+
+logger = logging.getLogger(__name__)
+
+
+class S3MultipartStreamUploader:
+    """
+    Pipes an async byte stream into S3 without holding the whole object in memory.
+
+    At most one part (plus the incoming chunk) is buffered at a time; size and SHA-256
+    are computed while the bytes pass through. Streams shorter than one part fall back
+    to a single PUT, empty streams are not written at all.
+    """
+
+    def __init__(self, s3_client: S3Client, executor: S3Executor, part_size: int):
+        self._s3_client = s3_client
+        self._executor = executor
+        self._part_size = part_size
+
+    async def upload(
+        self,
+        chunks: AsyncIterable[bytes],
+        object_name: str,
+        content_type: str | None = None,
+    ) -> StoredFile:
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict] = []
+
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+                if len(buffer) < self._part_size:
+                    continue
+
+                if upload_id is None:
+                    upload_id = await self._executor.run(
+                        self._s3_client.create_multipart_upload,
+                        object_name,
+                        content_type,
+                    )
+                parts.append(await self._upload_part(object_name, upload_id, len(parts) + 1, buffer))
+                buffer = bytearray()
+
+            if upload_id is None:
+                if size:
+                    await self._executor.run(self._s3_client.upload_file, bytes(buffer), object_name, content_type)
+                return StoredFile(size=size, sha256=digest.hexdigest())
+
+            if buffer:
+                parts.append(await self._upload_part(object_name, upload_id, len(parts) + 1, buffer))
+            await self._executor.run(
+                self._s3_client.complete_multipart_upload,
+                object_name,
+                upload_id,
+                parts,
+            )
+        except BaseException:
+            if upload_id is not None:
+                await self._abort(object_name, upload_id)
+            raise
+
+        return StoredFile(size=size, sha256=digest.hexdigest())
+
+    async def _upload_part(self, object_name: str, upload_id: str, part_number: int, body: bytearray) -> dict:
+        etag = await self._executor.run(
+            self._s3_client.upload_part,
+            object_name,
+            upload_id,
+            part_number,
+            body,
+        )
+        return {"PartNumber": part_number, "ETag": etag}
+
+    async def _abort(self, object_name: str, upload_id: str) -> None:
+        try:
+            await asyncio.shield(
+                self._executor.run(self._s3_client.abort_multipart_upload, object_name, upload_id)
+            )
+        except Exception:
+            logger.exception("Failed to abort multipart upload %s for %s", upload_id, object_name)
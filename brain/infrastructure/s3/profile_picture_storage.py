@@ -1,20 +1,23 @@
 from brain.application.abstractions.storage.user_profile_pictures import IProfilePictureStorage
 from brain.config.models import S3Config
 from brain.infrastructure.s3.client import S3Client
+from brain.infrastructure.s3.executor import S3Executor
 
 
 class S3ProfilePictureStorage(IProfilePictureStorage):
-    def __init__(self, s3_client: S3Client, s3_config: S3Config):
+    def __init__(self, s3_client: S3Client, s3_config: S3Config, executor: S3Executor):
         self._s3_client = s3_client
         self._s3_config = s3_config
+        self._executor = executor
 
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
         content_type: str | None = None,
     ) -> str:
-        url = self._s3_client.upload_file(
+        url = await self._executor.run(
+            self._s3_client.upload_file,
             content,
             object_name,
             content_type=content_type,
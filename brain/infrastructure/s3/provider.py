@@ -1,9 +1,12 @@
+from collections.abc import Iterable
+
 from dishka import Provider, Scope, provide
 
-from brain.config.models import S3Config
+from brain.config.models import S3Config, S3StorageBackend
 from brain.application.abstractions.storage.files import IFileStorage
 from brain.application.abstractions.storage.user_profile_pictures import IProfilePictureStorage
 from brain.infrastructure.s3.client import S3Client
+from brain.infrastructure.s3.executor import S3Executor, ThreadPoolS3Executor
 from brain.infrastructure.s3.file_storage import S3FileStorage
 from brain.infrastructure.s3.profile_picture_storage import S3ProfilePictureStorage
 
@@ -15,10 +18,24 @@ class S3Provider(Provider):
     def get_s3_client(self, config: S3Config) -> S3Client:
         return S3Client(config)
 
+    @provide
+    def get_s3_executor(self, config: S3Config) -> Iterable[S3Executor]:
+        if config.backend == S3StorageBackend.EXECUTOR:
+            executor = ThreadPoolS3Executor(max_workers=config.executor_max_workers)
+        else:
+            executor = S3Executor()
+        yield executor
+        executor.shutdown()
+
     @provide(provides=IProfilePictureStorage)
-    def get_profile_picture_storage(self, s3_client: S3Client, config: S3Config) -> S3ProfilePictureStorage:
-        return S3ProfilePictureStorage(s3_client=s3_client, s3_config=config)
+    def get_profile_picture_storage(
+        self,
+        s3_client: S3Client,
+        config: S3Config,
+        executor: S3Executor,
+    ) -> S3ProfilePictureStorage:
+        return S3ProfilePictureStorage(s3_client=s3_client, s3_config=config, executor=executor)
 
     @provide(provides=IFileStorage)
-    def get_file_storage(self, s3_client: S3Client, config: S3Config) -> S3FileStorage:
-        return S3FileStorage(s3_client=s3_client, s3_config=config)
+    def get_file_storage(self, s3_client: S3Client, config: S3Config, executor: S3Executor) -> S3FileStorage:
+        return S3FileStorage(s3_client=s3_client, s3_config=config, executor=executor)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from io import BytesIO
 from mimetypes import guess_type
 from typing import Sequence
 from uuid import UUID
@@ -11,6 +10,7 @@ from aiogram.types import Message
 from brain.application.interactors import UploadFileInteractor
 from brain.domain.services.message_attachment_uploader import IMessageAttachmentUploader
 from brain.domain.services.media import guess_image_content_type
+from brain.infrastructure.telegram.file_stream import iter_telegram_file
 
 
 class BaseMessageAttachmentUploader(IMessageAttachmentUploader, ABC):
@@ -46,17 +46,13 @@ class BaseMessageAttachmentUploader(IMessageAttachmentUploader, ABC):
         if not file.file_path:
             return None
 
-        buffer = BytesIO()
-        await message.bot.download_file(file.file_path, destination=buffer)
-        content = buffer.getvalue()
-        if not content:
-            return None
-
-        uploaded_file = await upload_file_interactor.upload_file(
+        uploaded_file = await upload_file_interactor.upload_file_stream(
             filename=self._resolve_filename(message, file.file_path),
-            content=content,
+            chunks=iter_telegram_file(message.bot, file.file_path),
             content_type=self._resolve_content_type(message, file.file_path),
         )
+        if uploaded_file is None:
+            return None
         return uploaded_file.id
 
 
@@ -0,0 +1,32 @@
+from collections.abc import AsyncIterator
+
+import aiofiles
+from aiogram import Bot
+
+TELEGRAM_FILE_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_telegram_file(
+    bot: Bot,
+    file_path: str,
+    chunk_size: int = TELEGRAM_FILE_CHUNK_SIZE,
+    timeout: int = 30,
+) -> AsyncIterator[bytes]:
+    """
+    Yields a Telegram file chunk by chunk, the same way `Bot.download_file` reads it,
+    but without writing into an intermediate buffer.
+    """
+    api = bot.session.api
+    if api.is_local:
+        async with aiofiles.open(str(api.wrap_local_file.to_local(file_path)), "rb") as file:
+            while chunk := await file.read(chunk_size):
+                yield chunk
+        return
+
+    async for chunk in bot.session.stream_content(
+        url=api.file_url(bot.token, file_path),
+        timeout=timeout,
+        chunk_size=chunk_size,
+        raise_for_status=True,
+    ):
+        yield chunk
@@ -5,21 +5,35 @@ from aiogram import Bot
 from brain.application.abstractions.services.profile_picture_provider import (
     IProfilePictureProvider,
     ProfilePictureData,
+    ProfilePictureRef,
 )
 from brain.domain.services.media import guess_image_content_type
+from brain.infrastructure.telegram.rate_limiter import TelegramApiRateLimiter
 
 
 class TelegramProfilePictureProvider(IProfilePictureProvider):
-    def __init__(self, bot: Bot):
+    def __init__(self, bot: Bot, rate_limiter: TelegramApiRateLimiter):
         self._bot = bot
+        self._rate_limiter = rate_limiter
 
-    async def get_profile_picture_content(self, telegram_id: int) -> tuple[bytes, str] | None:
-        photos = await self._bot.get_user_profile_photos(user_id=telegram_id, limit=1)
+    async def get_profile_picture_content(self, telegram_id: int) -> ProfilePictureData | None:
+        ref = await self.get_profile_picture_ref(telegram_id)
+        if ref is None:
+            return None
+        return await self.download_profile_picture(ref)
+
+    async def get_profile_picture_ref(self, telegram_id: int) -> ProfilePictureRef | None:
+        photos = await self._rate_limiter.call(
+            lambda: self._bot.get_user_profile_photos(user_id=telegram_id, limit=1),
+        )
         if not photos.photos:
             return None
 
         photo = photos.photos[0][-1]
-        file = await self._bot.get_file(photo.file_id)
+        return ProfilePictureRef(file_id=photo.file_id, file_unique_id=photo.file_unique_id)
+
+    async def download_profile_picture(self, ref: ProfilePictureRef) -> ProfilePictureData | None:
+        file = await self._rate_limiter.call(lambda: self._bot.get_file(ref.file_id))
         if not file.file_path:
             return None
 
@@ -30,4 +44,8 @@ class TelegramProfilePictureProvider(IProfilePictureProvider):
             return None
 
         content_type = guess_image_content_type(file.file_path) or "image/jpeg"
-        return ProfilePictureData(content=content, content_type=content_type)
+        return ProfilePictureData(
+            content=content,
+            content_type=content_type,
+            file_unique_id=ref.file_unique_id,
+        )
@@ -5,10 +5,12 @@ from brain.application.abstractions.services.profile_picture_provider import (
     IProfilePictureProvider,
 )
 from brain.application.interactors import UploadFileInteractor
+from brain.config.models import BotConfig
 from brain.infrastructure.telegram.attachment_upload import MessageAttachmentUploadController
 from brain.infrastructure.telegram.profile_picture_provider import (
     TelegramProfilePictureProvider,
 )
+from brain.infrastructure.telegram.rate_limiter import TelegramApiRateLimiter
 
 
 class TelegramInfrastructureProvider(Provider):
@@ -19,6 +21,14 @@ class TelegramInfrastructureProvider(Provider):
     ) -> MessageAttachmentUploadController:
         return MessageAttachmentUploadController(upload_file_interactor=upload_file_interactor)
 
+    @provide(scope=Scope.APP)
+    async def get_telegram_api_rate_limiter(self, config: BotConfig) -> TelegramApiRateLimiter:
+        return TelegramApiRateLimiter(rate=config.api_rate_limit)
+
     @provide(scope=Scope.REQUEST, provides=IProfilePictureProvider)
-    async def get_telegram_profile_picture_provider(self, bot: Bot) -> TelegramProfilePictureProvider:
-        return TelegramProfilePictureProvider(bot=bot)
+    async def get_telegram_profile_picture_provider(
+        self,
+        bot: Bot,
+        rate_limiter: TelegramApiRateLimiter,
+    ) -> TelegramProfilePictureProvider:
+        return TelegramProfilePictureProvider(bot=bot, rate_limiter=rate_limiter)
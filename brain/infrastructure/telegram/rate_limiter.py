@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from aiogram.exceptions import TelegramRetryAfter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TelegramApiRateLimiter:
+    """
+    Spaces out Bot API calls to at most `rate` per second and waits out
+    flood-control (429) responses instead of failing the call.
+    """
+
+    def __init__(self, rate: float, max_retries: int = 3):
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._max_retries = max_retries
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = max(self._next_slot, loop.time()) + self._interval
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            await self.acquire()
+            try:
+                return await func()
+            except TelegramRetryAfter as exc:
+                attempt += 1
+                if attempt > self._max_retries:
+                    raise
+                logger.warning("Telegram flood control, retrying in %s seconds", exc.retry_after)
+                await asyncio.sleep(exc.retry_after)
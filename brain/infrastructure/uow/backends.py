@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import logging
 from typing import Protocol, runtime_checkable
 
 from neo4j import AsyncDriver, AsyncSession as Neo4jAsyncSession, AsyncTransaction
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from brain.infrastructure.db.write_tracking import IRecentUserWrites, pop_written_user_ids
 from brain.infrastructure.uow.context import UnitOfWorkContext
 
+logger = logging.getLogger(__name__)
+
 
 @runtime_checkable
 class ITransactionController(Protocol):
@@ -37,8 +41,9 @@ class IFlushableTransactionController(Protocol):
 class SqlAlchemyTransactionController(ITransactionController, IFlushableTransactionController):
     backend_key = "sql"
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, recent_writes: IRecentUserWrites | None = None):
         self._session = session
+        self._recent_writes = recent_writes
 
     async def begin(self, context: UnitOfWorkContext) -> None:
         context.set_handle(self.backend_key, self._session)
@@ -52,11 +57,13 @@ class SqlAlchemyTransactionController(ITransactionController, IFlushableTransact
     async def commit(self, context: UnitOfWorkContext) -> None:
         if not context.is_started(self.backend_key):
             return
+        await self._mark_recent_writes()
         await self._session.commit()
 
     async def rollback(self, context: UnitOfWorkContext) -> None:
         if not context.is_started(self.backend_key):
             return
+        pop_written_user_ids(self._session)
         await self._session.rollback()
 
     async def close(self, context: UnitOfWorkContext) -> None:
@@ -66,6 +73,16 @@ class SqlAlchemyTransactionController(ITransactionController, IFlushableTransact
         await self.ensure_started(context)
         await self._session.flush()
 
+    async def _mark_recent_writes(self) -> None:
+        # Mark before committing, so the user is pinned to the primary by the time the write is visible.
+        user_ids = pop_written_user_ids(self._session)
+        if not user_ids or self._recent_writes is None:
+            return
+        try:
+            await self._recent_writes.mark(user_ids)
+        except Exception:
+            logger.exception("Failed to mark recent writes for %d users", len(user_ids))
+
 
 class Neo4jTransactionController(ITransactionController):
     backend_key = "neo4j"
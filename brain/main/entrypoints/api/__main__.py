@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import uvicorn
 
 from brain.config.models import Config
@@ -8,7 +11,8 @@ config = load_config(
     env_file_path=".env",
 )
 
-if __name__ == "__main__":
+
+def main() -> None:
     uvicorn.run(
         app="brain.main.entrypoints.api.factory:create_app",
         host=config.api.internal_host,
@@ -18,3 +22,13 @@ if __name__ == "__main__":
         access_log=False,
         workers=config.api.workers,
     )
+
+
+if __name__ == "__main__":
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        main()
+    else:
+        # Worker processes share their metrics through this directory, see get_metrics_registry
+        with tempfile.TemporaryDirectory(prefix="brain-api-metrics-") as metrics_dir:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+            main()
@@ -9,13 +9,17 @@ from brain.config.provider import ConfigProvider, DatabaseConfigProvider
 from brain.config.models import APIConfig, Config
 from brain.config.parser import load_config
 from brain.infrastructure.jwt.provider import JwtProvider
+from brain.infrastructure.redis.provider import RedisProvider
 from brain.main.log import setup_logging
 from brain.presentation.api.factory import create_bare_app
 from brain.presentation.tgbot.provider import DispatcherProvider, BotProvider
-from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.db.provider import DatabaseProvider, ReadReplicaProvider
 from brain.infrastructure.graph.provider import Neo4jProvider
+from brain.infrastructure.images.provider import ImageProvider
+from brain.infrastructure.monitoring.provider import MonitoringProvider, TracingProvider
+from brain.infrastructure.monitoring.tracing import setup_tracing
 from brain.infrastructure.s3.provider import S3Provider
-from brain.main.entrypoints.taskiq.broker import broker as taskiq_broker
+from brain.main.entrypoints.taskiq.broker import bot_updates_broker, broker as taskiq_broker
 from brain.application.interactors.factory import InteractorProvider
 from brain.infrastructure.telegram.provider import TelegramInfrastructureProvider
 from brain.infrastructure.api_keys.provider import ApiKeyServiceProvider
@@ -25,25 +29,37 @@ logger = logging.getLogger(__name__)
 
 async def on_startup(container: AsyncContainer, config: APIConfig):
     await taskiq_broker.startup()
+    await bot_updates_broker.startup()
     logger.info("Startup complete")
 
 
 def create_app() -> FastAPI:
     config = load_config(config_class=Config, env_file_path=".env")
     setup_logging(config.logging_level)
+    setup_tracing(config.tracing)
     app = create_bare_app(config=config.api)
     container = make_async_container(
         ConfigProvider(),
         BotProvider(),
         DatabaseConfigProvider(),
         DatabaseProvider(),
+        ReadReplicaProvider(),
+        RedisProvider(),
         Neo4jProvider(),
         S3Provider(),
+        ImageProvider(),
         ApiKeyServiceProvider(),
         InteractorProvider(),
         TelegramInfrastructureProvider(),
         JwtProvider(),
         DispatcherProvider(),
+        MonitoringProvider(
+            taskiq_queues=[
+                (queue_broker.queue_name, queue_broker.consumer_group_name)
+                for queue_broker in (taskiq_broker, bot_updates_broker)
+            ],
+        ),
+        TracingProvider(),
         context={Config: config},
     )
 
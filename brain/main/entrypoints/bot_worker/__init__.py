@@ -0,0 +1 @@
+"""Dedicated taskiq worker entrypoint for queued Telegram updates."""
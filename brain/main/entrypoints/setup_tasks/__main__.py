@@ -11,10 +11,12 @@ from brain.config.provider import ConfigProvider, DatabaseConfigProvider
 from brain.config.models import APIConfig, Config
 from brain.config.parser import load_config
 from brain.infrastructure.jwt.provider import JwtProvider
+from brain.infrastructure.redis.provider import RedisProvider
+from brain.infrastructure.images.provider import ImageProvider
 from brain.infrastructure.s3.provider import S3Provider
 from brain.main.log import setup_logging
 from brain.presentation.tgbot.provider import DispatcherProvider, BotProvider
-from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.db.provider import DatabaseProvider, ReadReplicaProvider
 from brain.infrastructure.graph.provider import Neo4jProvider
 from brain.infrastructure.api_keys.provider import ApiKeyServiceProvider
 from brain.infrastructure.telegram.provider import TelegramInfrastructureProvider
@@ -56,8 +58,11 @@ async def main(config: Config):
         BotProvider(),
         DatabaseConfigProvider(),
         DatabaseProvider(),
+        ReadReplicaProvider(),
+        RedisProvider(),
         Neo4jProvider(),
         S3Provider(),
+        ImageProvider(),
         ApiKeyServiceProvider(),
         InteractorProvider(),
         TelegramInfrastructureProvider(),
@@ -1,15 +1,25 @@
+import os
 import subprocess
+import tempfile
 
 
 def main() -> int:
     command = [
         "taskiq",
         "worker",
-        "brain.main.entrypoints.taskiq.broker:broker",
+        "brain.main.entrypoints.taskiq.worker:broker",
         "brain.presentation.tgbot.tasks",
+        "brain.presentation.tasks.auth",
+        "brain.presentation.tasks.files",
+        "brain.presentation.tasks.graph",
     ]
-    return subprocess.call(command)
-
+    env = dict(os.environ)
+    if env.get("PROMETHEUS_MULTIPROC_DIR"):
+        return subprocess.call(command, env=env)
+    # Worker processes share their metrics through this directory, see start_worker_metrics_server
+    with tempfile.TemporaryDirectory(prefix="brain-taskiq-metrics-") as metrics_dir:
+        env["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+        return subprocess.call(command, env=env)
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,65 @@
+import sys
+
+from dishka import make_async_container
+from dishka.integrations.taskiq import setup_dishka
+from taskiq import TaskiqEvents, TaskiqState
+
+from brain.application.interactors.factory import InteractorProvider
+from brain.config.models import Config
+from brain.config.provider import ConfigProvider, DatabaseConfigProvider
+from brain.infrastructure.api_keys.provider import ApiKeyServiceProvider
+from brain.infrastructure.db.provider import DatabaseProvider, ReadReplicaProvider
+from brain.infrastructure.graph.provider import Neo4jProvider
+from brain.infrastructure.images.provider import ImageProvider
+from brain.infrastructure.jwt.provider import JwtProvider
+from brain.infrastructure.monitoring.metrics import start_worker_metrics_server
+from brain.infrastructure.monitoring.provider import TracingProvider
+from brain.infrastructure.monitoring.tracing import setup_tracing
+from brain.infrastructure.redis.provider import RedisProvider
+from brain.infrastructure.s3.provider import S3Provider
+from brain.infrastructure.telegram.provider import TelegramInfrastructureProvider
+from brain.main.entrypoints.taskiq.broker import bot_updates_broker, broker, config
+from brain.presentation.tgbot.bot_provider import BotProvider
+from brain.presentation.tgbot.provider import DispatcherProvider
+
+# Worker entrypoint: brokers live in broker.py so task modules can import them without pulling in
+# the dependency container, which in turn imports the bot handlers that enqueue those tasks.
+container = None
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def start_metrics_server(state: TaskiqState) -> None:
+    if config.metrics.worker_port:
+        start_worker_metrics_server(config.metrics.worker_port)
+
+
+def setup_worker() -> None:
+    global container
+    if container is not None:
+        return
+
+    setup_tracing(config.tracing)
+    container = make_async_container(
+        ConfigProvider(),
+        BotProvider(),
+        DatabaseConfigProvider(),
+        DatabaseProvider(),
+        ReadReplicaProvider(),
+        RedisProvider(),
+        Neo4jProvider(),
+        S3Provider(),
+        ImageProvider(),
+        ApiKeyServiceProvider(),
+        InteractorProvider(),
+        TelegramInfrastructureProvider(),
+        JwtProvider(),
+        DispatcherProvider(),
+        TracingProvider(),
+        context={Config: config},
+    )
+    setup_dishka(container=container, broker=broker)
+    setup_dishka(container=container, broker=bot_updates_broker)
+
+
+if "pytest" not in sys.modules:
+    setup_worker()
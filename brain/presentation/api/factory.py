@@ -11,12 +11,16 @@ def create_bare_app(config: APIConfig) -> FastAPI:
     app = FastAPI()
 
     app.middleware("http")(middlewares.access_log_middleware)
+    app.middleware("http")(middlewares.metrics_middleware)
+    app.middleware("http")(middlewares.tracing_middleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=config.allowed_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Cursor for the next page of GET /drafts
+        expose_headers=["X-Next-Cursor"],
     )
 
     register_routes(app=app, config=config)
@@ -1,6 +1,12 @@
 import logging
+import time
 
 from fastapi import Request, Response
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind, StatusCode
+
+from brain.infrastructure.monitoring.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+from brain.infrastructure.monitoring.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -16,3 +22,51 @@ async def access_log_middleware(request: Request, call_next):
         raise
     finally:
         logger.info("%s %s %s", req_status, request.method, request.url)
+
+
+def get_matched_route_template(request: Request) -> str:
+    # Read after call_next: the router stores the matched route in the scope while dispatching.
+    route = request.scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+
+async def metrics_middleware(request: Request, call_next):
+    # The route is only known once the router ran, so requests in flight are counted per method.
+    in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=request.method)
+    in_progress.inc()
+    req_status = 500
+    started_at = time.perf_counter()
+    try:
+        response: Response = await call_next(request)
+        req_status = response.status_code
+        return response
+    finally:
+        in_progress.dec()
+        HTTP_REQUEST_DURATION.labels(
+            method=request.method,
+            route=get_matched_route_template(request),
+            status=str(req_status),
+        ).observe(time.perf_counter() - started_at)
+
+
+async def tracing_middleware(request: Request, call_next):
+    # The span is renamed once routing is done, so it is named by template, not by URL.
+    with tracer.start_as_current_span(
+        request.method,
+        context=propagate.extract(request.headers),
+        kind=SpanKind.SERVER,
+        attributes={
+            "http.request.method": request.method,
+            "url.path": request.url.path,
+        },
+    ) as span:
+        try:
+            response: Response = await call_next(request)
+        finally:
+            route = get_matched_route_template(request)
+            span.update_name(f"{request.method} {route}")
+            span.set_attribute("http.route", route)
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(StatusCode.ERROR)
+        return response
@@ -2,6 +2,7 @@ from fastapi import FastAPI, APIRouter
 
 from brain.config.models import APIConfig
 from .healthcheck import get_router as get_healthcheck_router
+from .metrics import get_router as get_metrics_router
 from .tgbot import get_router as get_tgbot_router
 from .auth import get_router as get_auth_router
 from .users import get_router as get_users_router
@@ -25,3 +26,5 @@ def register_routes(app: FastAPI, config: APIConfig):
     root_router.include_router(get_upload_router())
 
     app.include_router(root_router)
+    # Served outside /api, where Prometheus expects it
+    app.include_router(get_metrics_router())
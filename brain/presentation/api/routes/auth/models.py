@@ -42,3 +42,7 @@ class PinVerifyResultSchema(BaseModel):
 
 class PinStatusSchema(BaseModel):
     is_pin_set: bool
+
+
+class JwksSchema(BaseModel):
+    keys: list[dict]
@@ -22,6 +22,7 @@ from brain.domain.entities.tg_bot_auth import TelegramBotAuthSession
 from brain.presentation.api.dependencies.auth import get_user_from_request
 from brain.presentation.api.routes.auth.models import (
     FakeAuthSchema,
+    JwksSchema,
     JwtTokenSchema,
     PinStatusSchema,
     PinVerifyResultSchema,
@@ -92,6 +93,13 @@ async def refresh_token(
     return JwtTokenSchema.model_validate(asdict(token))
 
 
+@inject
+async def get_jwks(
+    auth_interactor: FromDishka[AuthInteractor],
+):
+    return JwksSchema(keys=auth_interactor.get_public_jwks())
+
+
 @inject
 async def create_tg_bot_auth_session(
     interactor: FromDishka[TelegramBotAuthSessionInteractor],
@@ -186,6 +194,13 @@ def get_router() -> APIRouter:
         methods=["POST"],
         response_model=JwtTokenSchema,
     )
+    router.add_api_route(
+        path="/jwks",
+        endpoint=get_jwks,
+        methods=["GET"],
+        response_model=JwksSchema,
+        status_code=status.HTTP_200_OK,
+    )
     router.add_api_route(
         path="/tg-bot/sessions",
         endpoint=create_tg_bot_auth_session,
@@ -1,8 +1,11 @@
+import base64
+import json
 from dataclasses import asdict
+from datetime import datetime
 from uuid import UUID
 
 from brain.application.interactors.drafts.dto import CreateDraft, UpdateDraft
-from brain.application.abstractions.repositories.models import DraftCreationStat
+from brain.application.abstractions.repositories.models import DraftCreationStat, DraftCursor, HashtagCount
 from brain.config.models import S3Config
 from brain.application.types import Unset
 from brain.domain.entities.draft import Draft
@@ -11,10 +14,12 @@ from brain.domain.services.media import build_public_file_url
 from brain.presentation.api.routes.drafts.models import (
     CreateDraftSchema,
     DraftCreationStatSchema,
+    HashtagCountSchema,
     ReadDraftSchema,
+    ReadDraftSummarySchema,
     UpdateDraftSchema,
 )
-from brain.presentation.api.routes.users.models import ReadS3FileSchema
+from brain.presentation.api.routes.users.models import ReadFileThumbnailSchema, ReadS3FileSchema
 
 
 def map_draft_to_read_schema(draft: Draft, s3_config: S3Config) -> ReadDraftSchema:
@@ -30,6 +35,17 @@ def map_draft_to_read_schema(draft: Draft, s3_config: S3Config) -> ReadDraftSche
             ),
             content_type=draft.file.content_type,
             created_at=draft.file.created_at,
+            thumbnails=[
+                ReadFileThumbnailSchema(
+                    size=thumbnail.thumbnail_size,
+                    url=build_public_file_url(
+                        external_host=s3_config.external_host,
+                        file_path=thumbnail.path,
+                    ),
+                    content_type=thumbnail.content_type,
+                )
+                for thumbnail in draft.file.thumbnails
+            ],
         )
 
     return ReadDraftSchema(
@@ -42,6 +58,33 @@ def map_draft_to_read_schema(draft: Draft, s3_config: S3Config) -> ReadDraftSche
     )
 
 
+def map_draft_to_summary_schema(draft: Draft) -> ReadDraftSummarySchema:
+    return ReadDraftSummarySchema(
+        id=draft.id,
+        text=draft.text,
+        file_id=draft.file_id,
+        created_at=draft.created_at,
+        updated_at=draft.updated_at,
+    )
+
+
+def encode_draft_cursor(cursor: DraftCursor) -> str:
+    payload = json.dumps([cursor.created_at.isoformat(), str(cursor.id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_draft_cursor(value: str) -> DraftCursor:
+    """
+    Raises ValueError for anything that is not a cursor produced by encode_draft_cursor.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        created_at, draft_id = json.loads(payload)
+        return DraftCursor(created_at=datetime.fromisoformat(created_at), id=UUID(draft_id))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid draft cursor") from exc
+
+
 def map_create_schema_to_dto(
     schema: CreateDraftSchema,
     user: User,
@@ -56,10 +99,12 @@ def map_create_schema_to_dto(
 def map_update_schema_to_dto(
     draft_id: UUID,
     schema: UpdateDraftSchema,
+    user: User,
 ) -> UpdateDraft:
     payload = schema.model_dump(exclude_unset=True)
     return UpdateDraft(
         draft_id=draft_id,
+        user_id=user.id,
         text=payload.get("text", Unset),
         file_id=payload.get("file_id", Unset),
         patch=payload.get("patch", Unset),
@@ -70,3 +115,9 @@ def map_draft_creation_stat_to_schema(
     stat: DraftCreationStat,
 ) -> DraftCreationStatSchema:
     return DraftCreationStatSchema.model_validate(asdict(stat))
+
+
+def map_hashtag_count_to_schema(
+    hashtag_count: HashtagCount,
+) -> HashtagCountSchema:
+    return HashtagCountSchema.model_validate(asdict(hashtag_count))
@@ -16,6 +16,15 @@ class ReadDraftSchema(BaseModel):
     updated_at: datetime
 
 
+class ReadDraftSummarySchema(BaseModel):
+    id: UUID
+    # The first characters of the draft text only
+    text: str | None
+    file_id: UUID | None
+    created_at: datetime
+    updated_at: datetime
+
+
 class CreateDraftSchema(BaseModel):
     text: str | None = None
     file_id: UUID | None = None
@@ -37,3 +46,8 @@ class SearchDraftsSchema(BaseModel):
 class DraftCreationStatSchema(BaseModel):
     date: date
     count: int
+
+
+class HashtagCountSchema(BaseModel):
+    hashtag: str
+    count: int
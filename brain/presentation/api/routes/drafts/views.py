@@ -1,8 +1,10 @@
+from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pytz import timezone as pytz_timezone, UnknownTimeZoneError
 from starlette import status
 
@@ -12,6 +14,7 @@ from brain.application.interactors import (
     DeleteDraftInteractor,
     GetDraftInteractor,
     GetDraftCreationStatsInteractor,
+    GetDraftHashtagCountsInteractor,
     GetDraftsInteractor,
     SearchDraftsByTextInteractor,
     UpdateDraftInteractor,
@@ -19,32 +22,62 @@ from brain.application.interactors import (
 from brain.application.interactors.drafts.exceptions import (
     DraftNotFoundException,
     DraftPatchApplyException,
+    UpdateDraftForbiddenException,
 )
 from brain.domain.entities.user import User
 from brain.presentation.api.dependencies.auth import get_notes_user_from_request
 from brain.presentation.api.routes.drafts.mappers import (
+    decode_draft_cursor,
+    encode_draft_cursor,
     map_create_schema_to_dto,
     map_draft_creation_stat_to_schema,
     map_draft_to_read_schema,
+    map_draft_to_summary_schema,
+    map_hashtag_count_to_schema,
     map_update_schema_to_dto,
 )
 from brain.presentation.api.routes.drafts.models import (
     CreateDraftSchema,
     DraftCreationStatSchema,
+    HashtagCountSchema,
     ReadDraftSchema,
+    ReadDraftSummarySchema,
     SearchDraftsSchema,
     UpdateDraftSchema,
 )
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
 @inject
 async def get_drafts(
+    response: Response,
     s3_config: FromDishka[S3Config],
     interactor: FromDishka[GetDraftsInteractor],
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+    limit: Annotated[int | None, Query(ge=1, le=500)] = None,
+    cursor: Annotated[str | None, Query()] = None,
+    summary: Annotated[bool, Query()] = False,
 ):
-    drafts = await interactor.get_drafts(user_id=user.id)
-    return [map_draft_to_read_schema(draft, s3_config) for draft in drafts]
+    try:
+        draft_cursor = decode_draft_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    page = await interactor.get_drafts_page(
+        user_id=user.id,
+        limit=limit,
+        cursor=draft_cursor,
+        summary=summary,
+    )
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_draft_cursor(page.next_cursor)
+    if summary:
+        return [map_draft_to_summary_schema(draft) for draft in page.drafts]
+    return [map_draft_to_read_schema(draft, s3_config) for draft in page.drafts]
 
 
 @inject
@@ -53,7 +86,7 @@ async def search_drafts(
     get_interactor: FromDishka[GetDraftsInteractor],
     search_interactor: FromDishka[SearchDraftsByTextInteractor],
     body: SearchDraftsSchema,
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
 ):
     if body.text_query:
         drafts = await search_interactor.search(
@@ -79,7 +112,7 @@ async def create_draft(
     create_interactor: FromDishka[CreateDraftInteractor],
     get_interactor: FromDishka[GetDraftInteractor],
     draft: CreateDraftSchema,
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
 ):
     draft_id = await create_interactor.create_draft(
         map_create_schema_to_dto(schema=draft, user=user),
@@ -98,7 +131,7 @@ async def delete_draft(
     get_interactor: FromDishka[GetDraftInteractor],
     delete_interactor: FromDishka[DeleteDraftInteractor],
     draft_id: UUID,
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
 ):
     draft = await get_interactor.get_draft_by_id(draft_id)
     if not draft:
@@ -123,29 +156,17 @@ async def delete_draft(
 @inject
 async def update_draft(
     s3_config: FromDishka[S3Config],
-    get_interactor: FromDishka[GetDraftInteractor],
     update_interactor: FromDishka[UpdateDraftInteractor],
     draft_id: UUID,
     draft: UpdateDraftSchema,
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
 ):
-    existing_draft = await get_interactor.get_draft_by_id(draft_id)
-    if not existing_draft:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Draft not found",
-        )
-    if existing_draft.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Forbidden",
-        )
-
     try:
         updated_draft = await update_interactor.update_draft(
             map_update_schema_to_dto(
                 draft_id=draft_id,
                 schema=draft,
+                user=user,
             ),
         )
     except DraftNotFoundException:
@@ -153,6 +174,11 @@ async def update_draft(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Draft not found",
         )
+    except UpdateDraftForbiddenException:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden",
+        )
     except DraftPatchApplyException:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -165,8 +191,8 @@ async def update_draft(
 @inject
 async def get_draft_creation_stats(
     interactor: FromDishka[GetDraftCreationStatsInteractor],
-    timezone: str = Query("UTC"),
-    user: User = Depends(get_notes_user_from_request),
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+    timezone: Annotated[str, Query()] = "UTC",
 ):
     try:
         pytz_timezone(timezone)
@@ -182,14 +208,29 @@ async def get_draft_creation_stats(
     return [map_draft_creation_stat_to_schema(stat) for stat in stats]
 
 
+@inject
+async def get_draft_hashtag_counts(
+    interactor: FromDishka[GetDraftHashtagCountsInteractor],
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+    from_date: Annotated[datetime | None, Query()] = None,
+    to_date: Annotated[datetime | None, Query()] = None,
+):
+    counts = await interactor.get_counts(
+        user_id=user.id,
+        from_date=from_date,
+        to_date=to_date,
+    )
+    return [map_hashtag_count_to_schema(hashtag_count) for hashtag_count in counts]
+
+
 def get_router() -> APIRouter:
     router = APIRouter(prefix="/drafts")
     router.add_api_route(
         path="",
         endpoint=get_drafts,
         methods=["GET"],
-        response_model=list[ReadDraftSchema],
-        summary="Get all drafts",
+        response_model=list[ReadDraftSchema] | list[ReadDraftSummarySchema],
+        summary="Get drafts, newest first; pass limit to paginate via the X-Next-Cursor header",
         status_code=status.HTTP_200_OK,
     )
     router.add_api_route(
@@ -208,6 +249,14 @@ def get_router() -> APIRouter:
         summary="Get draft creation stats by date",
         status_code=status.HTTP_200_OK,
     )
+    router.add_api_route(
+        path="/hashtags",
+        endpoint=get_draft_hashtag_counts,
+        methods=["GET"],
+        response_model=list[HashtagCountSchema],
+        summary="Get hashtag usage counts across drafts, most used first",
+        status_code=status.HTTP_200_OK,
+    )
     router.add_api_route(
         path="",
         endpoint=create_draft,
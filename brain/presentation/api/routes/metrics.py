@@ -0,0 +1,42 @@
+import hmac
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Header, HTTPException, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette import status
+
+from brain.config.models import MetricsConfig
+from brain.infrastructure.monitoring.metrics import get_metrics_registry
+from brain.infrastructure.monitoring.taskiq_queue import TaskiqQueueMonitor
+
+
+@inject
+async def get_metrics(
+    taskiq_queues: FromDishka[TaskiqQueueMonitor],
+    metrics_config: FromDishka[MetricsConfig],
+    authorization: Annotated[str | None, Header(alias="Authorization")] = None,
+) -> Response:
+    if not metrics_config.token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    expected = f"Bearer {metrics_config.token}".encode()
+    if not hmac.compare_digest((authorization or "").encode(), expected):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+        )
+
+    await taskiq_queues.refresh()
+    return Response(content=generate_latest(get_metrics_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def get_router() -> APIRouter:
+    router = APIRouter(tags=["Metrics"])
+    router.add_api_route(
+        path="/metrics",
+        endpoint=get_metrics,
+        methods=["GET"],
+        include_in_schema=False,
+    )
+    return router
@@ -48,10 +48,12 @@ def map_create_schema_to_dto(
 def map_update_schema_to_dto(
     note_id: UUID,
     schema: UpdateNoteSchema,
+    user: User,
 ) -> UpdateNote:
     payload = schema.model_dump(exclude_unset=True)
     return UpdateNote(
         note_id=note_id,
+        user_id=user.id,
         title=payload.get("title", Unset),
         text=payload.get("text", Unset),
         patch=payload.get("patch", Unset),
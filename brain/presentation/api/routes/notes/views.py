@@ -25,6 +25,7 @@ from brain.application.interactors import (
 )
 from brain.application.interactors.notes.exceptions import (
     NoteNotFoundException,
+    NoteForbiddenException,
     KeywordNotFoundException,
     NoteTitleAlreadyExistsException,
     NoteTitleRequiredException,
@@ -78,7 +79,7 @@ async def get_notes(
     from_date = ensure_utc_datetime(from_date)
     to_date = ensure_utc_datetime(to_date)
     notes = await interactor.get_notes(
-        user.telegram_id,
+        user.id,
         from_date=from_date,
         to_date=to_date,
         pinned_first=pinned_first,
@@ -125,10 +126,11 @@ async def get_note(
     note_id: UUID,
     user: User = Depends(get_notes_user_from_request),
 ):
-    note = await interactor.get_note_by_id(note_id)
-    if note is None:
+    try:
+        note = await interactor.get_user_note(note_id, user.id)
+    except NoteNotFoundException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-    if note.user_id != user.id:
+    except NoteForbiddenException:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Forbidden",
@@ -139,13 +141,12 @@ async def get_note(
 @inject
 async def create_note(
     create_interactor: FromDishka[CreateNoteInteractor],
-    get_note_interactor: FromDishka[GetNoteInteractor],
     note: CreateNoteSchema,
     user: User = Depends(get_notes_user_from_request),
 ):
     data = map_create_schema_to_dto(note, user)
     try:
-        note_id = await create_interactor.create_note(data)
+        created_note = await create_interactor.create_note(data)
     except NoteTitleRequiredException:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -161,20 +162,18 @@ async def create_note(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Keyword not found",
         )
-    note = await get_note_interactor.get_note_by_id(note_id)
-    return map_note_to_read_schema(note)
+    return map_note_to_read_schema(created_note)
 
 
 @inject
 async def create_note_from_draft(
     create_from_draft_interactor: FromDishka[CreateNoteFromDraftInteractor],
-    get_note_interactor: FromDishka[GetNoteInteractor],
     body: CreateNoteFromDraftSchema,
     user: User = Depends(get_notes_user_from_request),
 ):
     data = map_create_from_draft_schema_to_dto(schema=body, user=user)
     try:
-        note_id = await create_from_draft_interactor.create_note_from_draft(data)
+        note = await create_from_draft_interactor.create_note_from_draft(data)
     except DraftNotFoundException:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -201,57 +200,44 @@ async def create_note_from_draft(
             detail="Keyword not found",
         )
 
-    note = await get_note_interactor.get_note_by_id(note_id)
     return map_note_to_read_schema(note)
 
 
 @inject
 async def delete_note(
-    get_note_interactor: FromDishka[GetNoteInteractor],
     delete_interactor: FromDishka[DeleteNoteInteractor],
     note_id: UUID,
     user: User = Depends(get_notes_user_from_request),
 ):
-    note = await get_note_interactor.get_note_by_id(note_id)
-    if not note:
+    try:
+        await delete_interactor.delete_note(note_id, user_id=user.id)
+    except NoteNotFoundException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-
-    if note.user_id != user.id:
+    except NoteForbiddenException:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Forbidden",
         )
 
-    try:
-        await delete_interactor.delete_note(note_id)
-    except NoteNotFoundException:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-
 
 @inject
 async def update_note(
-    get_note_interactor: FromDishka[GetNoteInteractor],
     update_interactor: FromDishka[UpdateNoteInteractor],
     note_id: UUID,
     note: UpdateNoteSchema,
     user: User = Depends(get_notes_user_from_request),
 ):
-    existing_note = await get_note_interactor.get_note_by_id(note_id)
-    if not existing_note:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-
-    if existing_note.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Forbidden",
-        )
-
-    data = map_update_schema_to_dto(note_id, note)
+    data = map_update_schema_to_dto(note_id, note, user)
 
     try:
         updated_note = await update_interactor.update_note(data)
     except NoteNotFoundException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
+    except NoteForbiddenException:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden",
+        )
     except NoteTitleRequiredException:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -316,7 +302,7 @@ async def get_note_creation_stats(
             detail="Invalid timezone",
         )
     stats = await interactor.get_stats(
-        user.telegram_id,
+        user.id,
         timezone_name=timezone,
     )
     return [map_note_creation_stat_to_schema(stat) for stat in stats]
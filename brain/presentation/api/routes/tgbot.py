@@ -1,11 +1,27 @@
+import json
+
 from aiogram import Dispatcher, Bot
 from aiogram.types import Update
-from dishka import FromDishka
+from dishka import AsyncContainer, FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter
 from starlette.requests import Request
 
-from brain.config.models import APIConfig
+from brain.config.models import APIConfig, BotConfig, WebhookProcessingMode
+from brain.infrastructure.redis.update_queue import TelegramUpdateQueue
+from brain.presentation.tgbot.tasks import process_telegram_updates_task
+from brain.presentation.tgbot.utils.aiogram_helpers import resolve_update_ordering_key
+
+
+async def enqueue_update(update: Update, data: dict, update_queue: TelegramUpdateQueue) -> None:
+    ordering_key = resolve_update_ordering_key(update)
+    queued = await update_queue.enqueue(
+        update_id=update.update_id,
+        ordering_key=ordering_key,
+        payload=json.dumps(data),
+    )
+    if queued:
+        await process_telegram_updates_task.kiq(ordering_key=ordering_key)
 
 
 @inject
@@ -13,9 +29,16 @@ async def handle_webhook(
     request: Request,
     bot: FromDishka[Bot],
     dp: FromDishka[Dispatcher],
+    bot_config: FromDishka[BotConfig],
+    container: FromDishka[AsyncContainer],
 ):
     data = await request.json()
     update = Update(**data)
+    if bot_config.webhook_mode is WebhookProcessingMode.QUEUE:
+        # Resolved only here so inline deployments never touch the queue
+        update_queue = await container.get(TelegramUpdateQueue)
+        await enqueue_update(update, data, update_queue)
+        return
     await dp.feed_webhook_update(bot=bot, update=update)
 
 
@@ -1,33 +1,135 @@
+from typing import Annotated, NoReturn
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette import status
 
+from brain.application.interactors.complete_file_upload import (
+    CompleteFileUploadInteractor,
+    FileUploadNotCompletedException,
+)
 from brain.application.interactors.get_file import GetFileInteractor, FileNotFoundException
-from brain.application.interactors.upload_file import UploadFileInteractor
-from brain.presentation.api.routes.upload_models import ReadUploadedFileSchema
+from brain.application.interactors.file_dto import ReadFileOutput
+from brain.application.interactors.get_file_download_url import GetFileDownloadUrlInteractor
+from brain.application.interactors.request_file_upload import RequestFileUploadInteractor
+from brain.application.interactors.upload_file import FileTooLargeException, UploadFileInteractor
+from brain.config.models import S3Config
+from brain.domain.entities.user import User
+from brain.presentation.api.dependencies.auth import get_notes_user_from_request
+from brain.presentation.api.routes.upload_models import (
+    ReadDownloadUrlSchema,
+    ReadUploadedFileSchema,
+    ReadUploadTicketSchema,
+    RequestUploadSchema,
+)
+from brain.presentation.api.routes.users.models import ReadFileThumbnailSchema
+from brain.presentation.api.streaming_form import (
+    MultipartFileMissingError,
+    MultipartStreamError,
+    RequestBodyTooLargeError,
+    StreamingFilePart,
+)
+from brain.presentation.tasks.files import enqueue_file_thumbnails
+
+# Room for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_ALLOWANCE = 64 * 1024
+
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                },
+            },
+        },
+    },
+}
+
+
+def _map_file_to_schema(file: ReadFileOutput) -> ReadUploadedFileSchema:
+    return ReadUploadedFileSchema(
+        id=file.id,
+        name=file.name,
+        path=file.path,
+        url=file.url,
+        content_type=file.content_type,
+        created_at=file.created_at,
+        thumbnails=[
+            ReadFileThumbnailSchema(size=thumbnail.size, url=thumbnail.url, content_type=thumbnail.content_type)
+            for thumbnail in file.thumbnails
+        ],
+    )
+
+
+def _raise_too_large(max_size: int) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds {max_size} bytes",
+    )
 
 
 @inject
 async def upload_file(
+    request: Request,
     interactor: FromDishka[UploadFileInteractor],
-    file: UploadFile = File(...),
+    s3_config: FromDishka[S3Config],
 ) -> ReadUploadedFileSchema:
-    content = await file.read()
-    uploaded_file = await interactor.upload_file(
-        filename=file.filename,
-        content=content,
-        content_type=file.content_type,
-    )
-    return ReadUploadedFileSchema(
-        id=uploaded_file.id,
-        name=uploaded_file.name,
-        path=uploaded_file.path,
-        url=uploaded_file.url,
-        content_type=uploaded_file.content_type,
-        created_at=uploaded_file.created_at,
-    )
+    # The form is parsed from the request stream so oversized bodies are cut off as they arrive.
+    max_body_size = s3_config.max_upload_size + MULTIPART_OVERHEAD_ALLOWANCE
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared_size = int(content_length)
+        except ValueError:
+            declared_size = -1
+        if declared_size < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid Content-Length header",
+            )
+        if declared_size > max_body_size:
+            _raise_too_large(s3_config.max_upload_size)
+
+    try:
+        file_part = StreamingFilePart(
+            body=request.stream(),
+            content_type=request.headers.get("content-type", ""),
+            field_name="file",
+            max_body_size=max_body_size,
+        )
+        await file_part.open()
+        uploaded_file = await interactor.upload_file_stream(
+            filename=file_part.filename,
+            chunks=file_part.iter_chunks(),
+            content_type=file_part.content_type,
+        )
+    except MultipartFileMissingError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="File is required",
+        )
+    except MultipartStreamError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except FileTooLargeException as exc:
+        _raise_too_large(exc.max_size)
+    except RequestBodyTooLargeError:
+        _raise_too_large(s3_config.max_upload_size)
+
+    if uploaded_file is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="File is empty",
+        )
+    await enqueue_file_thumbnails(uploaded_file.id, uploaded_file.content_type)
+    return _map_file_to_schema(uploaded_file)
 
 
 @inject
@@ -43,16 +145,75 @@ async def get_file(
             detail="File not found",
         )
 
-    return ReadUploadedFileSchema(
-        id=file.id,
-        name=file.name,
-        path=file.path,
-        url=file.url,
-        content_type=file.content_type,
-        created_at=file.created_at,
+    return _map_file_to_schema(file)
+
+
+@inject
+async def request_upload(
+    data: RequestUploadSchema,
+    interactor: FromDishka[RequestFileUploadInteractor],
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+) -> ReadUploadTicketSchema:
+    try:
+        ticket = await interactor.request_upload(
+            owner_id=user.id,
+            filename=data.filename,
+            size=data.size,
+            content_type=data.content_type,
+            sha256=data.sha256,
+        )
+    except FileTooLargeException as exc:
+        _raise_too_large(exc.max_size)
+
+    return ReadUploadTicketSchema(
+        file_id=ticket.file_id,
+        upload_url=ticket.upload_url,
+        method=ticket.method,
+        headers=ticket.headers,
+        expires_at=ticket.expires_at,
     )
 
 
+@inject
+async def complete_upload(
+    file_id: UUID,
+    interactor: FromDishka[CompleteFileUploadInteractor],
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+) -> ReadUploadedFileSchema:
+    try:
+        file = await interactor.complete_upload(file_id=file_id, user_id=user.id)
+    except FileNotFoundException:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found",
+        )
+    except FileUploadNotCompletedException:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="File has not been uploaded",
+        )
+
+    await enqueue_file_thumbnails(file.id, file.content_type)
+    return _map_file_to_schema(file)
+
+
+@inject
+async def get_download_url(
+    file_id: UUID,
+    interactor: FromDishka[GetFileDownloadUrlInteractor],
+    user: Annotated[User, Depends(get_notes_user_from_request)],
+) -> ReadDownloadUrlSchema:
+    try:
+        download = await interactor.get_download_url(file_id=file_id, user_id=user.id)
+    except FileNotFoundException:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found",
+        )
+
+    return ReadDownloadUrlSchema(url=download.url, expires_at=download.expires_at)
+
+
 def get_router() -> APIRouter:
     router = APIRouter(prefix="/file", tags=["Upload"])
     router.add_api_route(
@@ -61,6 +222,28 @@ def get_router() -> APIRouter:
         methods=["POST"],
         response_model=ReadUploadedFileSchema,
         status_code=status.HTTP_200_OK,
+        openapi_extra=UPLOAD_REQUEST_BODY,
+    )
+    router.add_api_route(
+        path="/upload-url",
+        endpoint=request_upload,
+        methods=["POST"],
+        response_model=ReadUploadTicketSchema,
+        status_code=status.HTTP_201_CREATED,
+    )
+    router.add_api_route(
+        path="/{file_id}/complete",
+        endpoint=complete_upload,
+        methods=["POST"],
+        response_model=ReadUploadedFileSchema,
+        status_code=status.HTTP_200_OK,
+    )
+    router.add_api_route(
+        path="/{file_id}/download-url",
+        endpoint=get_download_url,
+        methods=["GET"],
+        response_model=ReadDownloadUrlSchema,
+        status_code=status.HTTP_200_OK,
     )
     router.add_api_route(
         path="/{file_id}",
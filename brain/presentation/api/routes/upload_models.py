@@ -1,7 +1,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from brain.presentation.api.routes.users.models import ReadFileThumbnailSchema
 
 
 class ReadUploadedFileSchema(BaseModel):
@@ -11,3 +13,26 @@ class ReadUploadedFileSchema(BaseModel):
     url: str
     content_type: str
     created_at: datetime | None
+    # Generated in the background, so empty right after an upload
+    thumbnails: list[ReadFileThumbnailSchema] = Field(default_factory=list)
+
+
+class RequestUploadSchema(BaseModel):
+    filename: str | None = None
+    content_type: str | None = None
+    size: int = Field(gt=0)
+    # Hex SHA-256 of the content; when set, S3 rejects a body that does not match it
+    sha256: str | None = Field(default=None, pattern=r"^[0-9a-f]{64}$")
+
+
+class ReadUploadTicketSchema(BaseModel):
+    file_id: UUID
+    upload_url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+class ReadDownloadUrlSchema(BaseModel):
+    url: str
+    expires_at: datetime
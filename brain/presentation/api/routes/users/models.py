@@ -1,7 +1,14 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class ReadFileThumbnailSchema(BaseModel):
+    # Longest edge in pixels
+    size: int
+    url: str
+    content_type: str
 
 
 class ReadS3FileSchema(BaseModel):
@@ -11,6 +18,7 @@ class ReadS3FileSchema(BaseModel):
     url: str
     content_type: str
     created_at: datetime | None
+    thumbnails: list[ReadFileThumbnailSchema] = Field(default_factory=list)
 
 
 class ReadUserSchema(BaseModel):
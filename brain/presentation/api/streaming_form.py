@@ -0,0 +1,117 @@
+from collections import deque
+from collections.abc import AsyncIterator
+
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+
+class MultipartStreamError(Exception):
+    pass
+
+
+class MultipartFileMissingError(MultipartStreamError):
+    pass
+
+
+class RequestBodyTooLargeError(Exception):
+    pass
+
+
+class StreamingFilePart:
+    """
+    Reads one file field of a multipart/form-data body straight from the request stream,
+    without spooling it to disk. Every byte received counts towards max_body_size, so
+    chunked bodies without a Content-Length are capped as well.
+    """
+
+    def __init__(self, body: AsyncIterator[bytes], content_type: str, field_name: str, max_body_size: int):
+        media_type, options = parse_options_header(content_type)
+        boundary = options.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise MultipartStreamError("Expected a multipart/form-data body")
+        self._body = body
+        self._field_name = field_name.encode()
+        self._max_body_size = max_body_size
+        self._received = 0
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._in_file = False
+        self._file_started = False
+        self._file_ended = False
+        self._chunks: deque[bytes] = deque()
+        self.filename: str | None = None
+        self.content_type: str | None = None
+
+    async def open(self) -> None:
+        """Reads up to the headers of the file part, filling in filename and content_type."""
+        while not self._file_started:
+            if not await self._feed():
+                raise MultipartFileMissingError("File is required")
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        while True:
+            while self._chunks:
+                yield self._chunks.popleft()
+            if self._file_ended:
+                return
+            if not await self._feed():
+                raise MultipartStreamError("Multipart body ended inside the file part")
+
+    async def _feed(self) -> bool:
+        chunk = await anext(self._body, None)
+        if chunk is None:
+            return False
+        self._received += len(chunk)
+        if self._received > self._max_body_size:
+            raise RequestBodyTooLargeError
+        try:
+            self._parser.write(chunk)
+        except FormParserError as exc:
+            raise MultipartStreamError("Malformed multipart body") from exc
+        return True
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if self._file_started or options.get(b"name") != self._field_name or b"filename" not in options:
+            return
+        self._in_file = True
+        self._file_started = True
+        self.filename = options[b"filename"].decode("utf-8", errors="replace") or None
+        content_type = self._headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1") if content_type else None
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file and end > start:
+            self._chunks.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._file_ended = True
@@ -0,0 +1,27 @@
+import logging
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from brain.application.interactors.auth.cleanup_expired_auth_data import CleanupExpiredAuthDataInteractor
+from brain.infrastructure.monitoring.metrics import AUTH_TABLE_ROWS
+from brain.main.entrypoints.taskiq.broker import broker
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(schedule=[{"cron": "*/30 * * * *"}])
+@inject(patch_module=True)
+async def cleanup_expired_auth_data_task(
+    interactor: FromDishka[CleanupExpiredAuthDataInteractor],
+) -> None:
+    result = await interactor.execute()
+    AUTH_TABLE_ROWS.labels(table="jwt_refresh_tokens").set(result.refresh_tokens_total)
+    AUTH_TABLE_ROWS.labels(table="tg_bot_auth").set(result.bot_auth_sessions_total)
+    logger.info(
+        "Auth data cleanup: deleted_refresh_tokens=%d deleted_bot_auth_sessions=%d "
+        "jwt_refresh_tokens_total=%d tg_bot_auth_total=%d",
+        result.deleted_refresh_tokens,
+        result.deleted_bot_auth_sessions,
+        result.refresh_tokens_total,
+        result.bot_auth_sessions_total,
+    )
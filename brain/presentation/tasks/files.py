@@ -0,0 +1,42 @@
+import logging
+from uuid import UUID
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from brain.application.interactors.cleanup_orphaned_files import CleanupOrphanedFilesInteractor
+from brain.application.interactors.generate_file_thumbnails import GenerateFileThumbnailsInteractor
+from brain.domain.services.media import is_thumbnail_source
+from brain.main.entrypoints.taskiq.broker import broker
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(schedule=[{"cron": "15 * * * *"}])
+@inject(patch_module=True)
+async def cleanup_orphaned_files_task(
+    interactor: FromDishka[CleanupOrphanedFilesInteractor],
+) -> None:
+    deleted_objects = await interactor.execute()
+    logger.info("Orphaned files cleanup: deleted_objects=%d", deleted_objects)
+
+
+@broker.task
+@inject(patch_module=True)
+async def generate_file_thumbnails_task(
+    file_id: str,
+    interactor: FromDishka[GenerateFileThumbnailsInteractor],
+) -> None:
+    await interactor.generate_thumbnails(file_id=UUID(file_id))
+
+
+async def enqueue_file_thumbnails(file_id: UUID, content_type: str | None = None) -> None:
+    """
+    Schedule thumbnails for a freshly uploaded file. Pass content_type when it is known
+    to skip enqueueing for non-images; a failure to enqueue never fails the upload.
+    """
+    if content_type is not None and not is_thumbnail_source(content_type):
+        return
+    try:
+        await generate_file_thumbnails_task.kiq(file_id=str(file_id))
+    except Exception:
+        logger.exception("Failed to enqueue thumbnails for file %s", file_id)
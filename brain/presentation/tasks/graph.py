@@ -0,0 +1,17 @@
+import logging
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from brain.application.interactors import SweepOrphanKeywordsInteractor
+from brain.main.entrypoints.taskiq.broker import broker
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(schedule=[{"cron": "45 3 * * *"}])
+@inject(patch_module=True)
+async def sweep_orphan_keywords_task(
+    interactor: FromDishka[SweepOrphanKeywordsInteractor],
+) -> None:
+    deleted_keywords = await interactor.execute()
+    logger.info("Orphan keywords sweep: deleted_keywords=%d", deleted_keywords)
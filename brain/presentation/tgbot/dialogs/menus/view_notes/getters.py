@@ -3,15 +3,20 @@ from uuid import UUID
 from aiogram_dialog import DialogManager
 from dishka import AsyncContainer
 
-from brain.application.interactors import GetNoteInteractor, GetNotesInteractor
+from brain.application.interactors import GetNoteInteractor, GetNotesInteractor, GetUserInteractor
+from brain.application.interactors.users.exceptions import UserNotFoundException
 
 
 async def get_notes_list(dialog_manager: DialogManager, **kwargs):
     container: AsyncContainer = dialog_manager.middleware_data.get("dishka_container")
     notes_interactor: GetNotesInteractor = await container.get(GetNotesInteractor)
+    user_interactor: GetUserInteractor = await container.get(GetUserInteractor)
 
-    user = dialog_manager.event.from_user
-    notes = await notes_interactor.get_notes(user_telegram_id=user.id)
+    try:
+        user = await user_interactor.get_user_by_telegram_id(dialog_manager.event.from_user.id)
+    except UserNotFoundException:
+        return {"notes": []}
+    notes = await notes_interactor.get_notes(user_id=user.id)
 
     return {"notes": notes}
 
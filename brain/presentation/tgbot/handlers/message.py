@@ -8,6 +8,7 @@ from brain.application.interactors import (
 from brain.application.interactors.drafts.dto import CreateDraft
 from brain.application.interactors.users.exceptions import UserNotFoundException
 from brain.infrastructure.telegram.attachment_upload import MessageAttachmentUploadController
+from brain.presentation.tasks.files import enqueue_file_thumbnails
 
 
 async def handle_message(m: Message, dishka_container: AsyncContainer):
@@ -18,6 +19,8 @@ async def handle_message(m: Message, dishka_container: AsyncContainer):
         file_id = None
         if attachment_upload_controller.has_supported_attachment(m):
             file_id = await attachment_upload_controller.upload_attachment(m)
+            if file_id is not None:
+                await enqueue_file_thumbnails(file_id)
 
         user = await get_user_interactor.get_user_by_telegram_id(m.from_user.id)
         await create_draft_interactor.create_draft(
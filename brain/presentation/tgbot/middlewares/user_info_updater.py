@@ -7,6 +7,8 @@ from dishka import AsyncContainer
 
 from brain.application.interactors import UserInteractor
 from brain.application.interactors.users.dto import CreateOrUpdateUser
+from brain.infrastructure.redis.user_info_cache import TelegramUserInfoCache, UserInfoState
+from brain.presentation.tgbot.tasks import flush_user_info_updates_task
 from brain.presentation.tgbot.utils.aiogram_helpers import extract_user_from_event
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,25 @@ class UserInfoUpdaterMiddleware(BaseMiddleware):
     def __init__(self):
         super().__init__()
 
+    async def _sync_user_info(self, container: AsyncContainer, user_data: CreateOrUpdateUser) -> None:
+        user_info_cache = await container.get(TelegramUserInfoCache)
+        state = await user_info_cache.get_state(user_data)
+        if state is UserInfoState.UNCHANGED:
+            return
+
+        if state is UserInfoState.CHANGED:
+            # Known user with changed names: write asynchronously in a batch
+            if await user_info_cache.add_pending(user_data):
+                await flush_user_info_updates_task.kiq()
+            logger.debug(f"Queued user info update: {user_data}")
+            return
+
+        # Unknown user: write synchronously so handlers can rely on the user row
+        user_interactor = await container.get(UserInteractor)
+        await user_interactor.create_or_update_user(user_data)
+        await user_info_cache.remember(user_data)
+        logger.debug(f"Updated user info: {user_data}")
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
@@ -23,7 +44,6 @@ class UserInfoUpdaterMiddleware(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
         container: AsyncContainer = data["dishka_container"]
-        user_interactor = await container.get(UserInteractor)
 
         user = extract_user_from_event(event)
         if user is not None and not user.is_bot:
@@ -33,7 +53,6 @@ class UserInfoUpdaterMiddleware(BaseMiddleware):
                 first_name=user.first_name,
                 last_name=user.last_name,
             )
-            await user_interactor.create_or_update_user(interactor_data)
-            logger.debug(f"Updated user info: {interactor_data}")
+            await self._sync_user_info(container, interactor_data)
 
         return await handler(event, data)
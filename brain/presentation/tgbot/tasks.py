@@ -1,15 +1,18 @@
 import logging
 from io import BytesIO
 
-from aiogram import Bot
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
 from dishka.integrations.taskiq import FromDishka, inject
 
-from brain.application.interactors import UploadUserProfilePictureInteractor
+from brain.application.interactors import UploadUserProfilePictureInteractor, UserInteractor
 from brain.application.interactors.users.update_all_profile_pictures import (
     UpdateAllUsersProfilePicturesInteractor,
 )
 from brain.domain.services.media import guess_image_content_type
-from brain.main.entrypoints.taskiq.broker import broker
+from brain.infrastructure.redis.update_queue import TelegramUpdateQueue
+from brain.infrastructure.redis.user_info_cache import TelegramUserInfoCache
+from brain.main.entrypoints.taskiq.broker import bot_updates_broker, broker
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ async def upload_user_profile_picture_task(
         telegram_id=telegram_id,
         image_content=content,
         content_type=guess_image_content_type(file.file_path),
+        file_unique_id=photo.file_unique_id,
     )
 
 
@@ -45,4 +49,36 @@ async def upload_user_profile_picture_task(
 async def update_all_users_profile_pictures_task(
     interactor: FromDishka[UpdateAllUsersProfilePicturesInteractor],
 ) -> None:
-    await interactor.execute()
+    result = await interactor.execute()
+    logger.info(
+        "Profile picture refresh: checked=%d updated=%d unchanged=%d failed=%d",
+        result.checked,
+        result.updated,
+        result.unchanged,
+        result.failed,
+    )
+
+
+@broker.task
+@inject(patch_module=True)
+async def flush_user_info_updates_task(
+    user_info_cache: FromDishka[TelegramUserInfoCache],
+    interactor: FromDishka[UserInteractor],
+) -> None:
+    flushed = await user_info_cache.flush_pending(interactor.create_or_update_users)
+    logger.debug("Flushed %d user info updates", flushed)
+
+
+@bot_updates_broker.task
+@inject(patch_module=True)
+async def process_telegram_updates_task(
+    ordering_key: str,
+    bot: FromDishka[Bot],
+    dp: FromDishka[Dispatcher],
+    update_queue: FromDishka[TelegramUpdateQueue],
+) -> None:
+    async def feed(payload: str) -> None:
+        update = Update.model_validate_json(payload, context={"bot": bot})
+        await dp.feed_update(bot=bot, update=update)
+
+    await update_queue.drain(ordering_key=ordering_key, handler=feed)
@@ -1,4 +1,5 @@
-from aiogram.types import TelegramObject, User
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.types import TelegramObject, Update, User
 
 
 def extract_user_from_event(event: TelegramObject) -> User | None:
@@ -9,3 +10,13 @@ def extract_user_from_event(event: TelegramObject) -> User | None:
             return event.callback_query.from_user
     except Exception:
         return None
+
+
+def resolve_update_ordering_key(update: Update) -> str:
+    """Key that serializes processing of updates belonging to the same chat (or user)."""
+    event_context = UserContextMiddleware.resolve_event_context(event=update)
+    if event_context.chat is not None:
+        return f"chat:{event_context.chat.id}"
+    if event_context.user is not None:
+        return f"user:{event_context.user.id}"
+    return f"update:{update.update_id}"
@@ -3,13 +3,17 @@ import asyncio
 import pytest
 import pytest_asyncio
 from dishka import make_async_container
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from brain.config.provider import ConfigProvider
-from brain.config.models import Config
+from brain.config.models import Config, TracingConfig, TracingExporter
 from brain.config.parser import load_config
-from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.db.provider import DatabaseProvider, ReadReplicaProvider
 from brain.infrastructure.api_keys.provider import ApiKeyServiceProvider
+from brain.infrastructure.monitoring.provider import TracingProvider
+from brain.infrastructure.monitoring.tracing import setup_tracing
 from tests.fixtures.db_provider import TestDbProvider
+from tests.fixtures.read_replica_provider import TestReadReplicaProvider
 from tests.fixtures.graph_provider import TestGraphProvider
 from tests.log import setup_logging
 
@@ -34,6 +38,18 @@ def configure_logging() -> None:
     setup_logging(config.logging_level)
 
 
+@pytest.fixture(scope="session")
+def memory_span_exporter() -> InMemorySpanExporter:
+    return setup_tracing(TracingConfig(exporter=TracingExporter.MEMORY))
+
+
+@pytest.fixture
+def span_exporter(memory_span_exporter: InMemorySpanExporter) -> InMemorySpanExporter:
+    memory_span_exporter.clear()
+    yield memory_span_exporter
+    memory_span_exporter.clear()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def dishka():
     from brain.application.interactors.factory import InteractorProvider
@@ -47,10 +63,13 @@ async def dishka():
         ConfigProvider(),
         TestDbProvider(),
         DatabaseProvider(),
+        ReadReplicaProvider(),
+        TestReadReplicaProvider(),
         ApiKeyServiceProvider(),
         TestGraphProvider(),
         InteractorProvider(),
         JwtProvider(),
+        TracingProvider(),
         context={Config: config},
     )
     yield container
@@ -14,6 +14,7 @@ from brain.config.models import Config
 from brain.infrastructure.graph.connection import create_driver
 from brain.infrastructure.graph.repositories.notes import NotesGraphRepository
 from brain.infrastructure.graph.tx_accessor import Neo4jTxAccessor
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
 from brain.infrastructure.uow.backends import Neo4jTransactionController
 from brain.infrastructure.uow.context import UnitOfWorkContext
 from tests.mocks.config import Neo4jConfig
@@ -34,11 +35,13 @@ class TestGraphProvider(Provider):
         driver: AsyncDriver,
         config: INeo4jConfig,
         tx_accessor: Neo4jTxAccessor,
+        slow_query_log: SlowQueryLog,
     ) -> NotesGraphRepository:
         return NotesGraphRepository(
             driver=driver,
             database=config.database,
             tx_accessor=tx_accessor,
+            slow_query_log=slow_query_log,
         )
 
     @provide(scope=Scope.REQUEST)
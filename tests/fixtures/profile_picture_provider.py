@@ -3,6 +3,7 @@ from dishka import Provider, Scope, provide
 from brain.application.abstractions.services.profile_picture_provider import (
     IProfilePictureProvider,
     ProfilePictureData,
+    ProfilePictureRef,
 )
 
 
@@ -13,6 +14,12 @@ class MockProfilePictureProvider(IProfilePictureProvider):
     ) -> ProfilePictureData | None:
         return None  # Return None by default for tests
 
+    async def get_profile_picture_ref(self, telegram_id: int) -> ProfilePictureRef | None:
+        return None
+
+    async def download_profile_picture(self, ref: ProfilePictureRef) -> ProfilePictureData | None:
+        return None
+
 
 class TestProfilePictureProvider(Provider):
     @provide(scope=Scope.REQUEST)
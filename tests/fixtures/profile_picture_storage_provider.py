@@ -1,6 +1,14 @@
+import hashlib
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, provide
 
-from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.storage.files import (
+    IFileStorage,
+    PresignedUpload,
+    StoredFile,
+    StoredObjectInfo,
+)
 from brain.application.abstractions.storage.user_profile_pictures import IProfilePictureStorage
 
 
@@ -8,7 +16,7 @@ class FakeProfilePictureStorage(IProfilePictureStorage):
     def __init__(self, base_url: str = "https://avatars.test"):
         self._base_url = base_url
 
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
@@ -21,7 +29,7 @@ class FakeFileStorage(IFileStorage):
     def __init__(self, base_url: str = "https://files.test"):
         self._base_url = base_url
 
-    def upload(
+    async def upload(
         self,
         content: bytes,
         object_name: str,
@@ -29,6 +37,45 @@ class FakeFileStorage(IFileStorage):
     ) -> str:
         return f"{self._base_url}/{object_name}"
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        object_name: str,
+        content_type: str | None = None,
+    ) -> StoredFile:
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+        return StoredFile(size=size, sha256=digest.hexdigest())
+
+    async def download(self, object_name: str) -> bytes:
+        return b""
+
+    async def delete(self, object_name: str) -> None:
+        return None
+
+    async def create_upload_url(
+        self,
+        object_name: str,
+        content_type: str,
+        size: int,
+        sha256: str | None,
+        expires_in: int,
+    ) -> PresignedUpload:
+        return PresignedUpload(
+            url=f"{self._base_url}/{object_name}?signed",
+            method="PUT",
+            headers={"Content-Type": content_type},
+        )
+
+    async def create_download_url(self, object_name: str, expires_in: int) -> str:
+        return f"{self._base_url}/{object_name}?signed"
+
+    async def get_object_info(self, object_name: str) -> StoredObjectInfo | None:
+        return None
+
 
 class TestProfilePictureStorageProvider(Provider):
     scope = Scope.APP
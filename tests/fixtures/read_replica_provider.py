@@ -0,0 +1,18 @@
+from dishka import Provider, Scope, provide
+
+from brain.config.models import DatabaseReplicaConfig
+from brain.infrastructure.db.write_tracking import IRecentUserWrites, NullRecentUserWrites
+
+
+class TestReadReplicaProvider(Provider):
+    """Tests run against a single database, so reads always stay on the primary."""
+
+    scope = Scope.APP
+
+    @provide
+    def get_db_replica_config(self) -> DatabaseReplicaConfig:
+        return DatabaseReplicaConfig()
+
+    @provide
+    def get_recent_user_writes(self) -> IRecentUserWrites:
+        return NullRecentUserWrites()
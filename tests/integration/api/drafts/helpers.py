@@ -26,9 +26,15 @@ async def create_draft(
         updated_at=updated_at,
     )
     await repo_hub.drafts.create(entity=draft)
+    hashtag_texts = normalize_hashtag_texts(hashtags or [])
     await repo_hub.hashtags.replace_draft_hashtags(
         draft_id=draft.id,
-        texts=normalize_hashtag_texts(hashtags or []),
+        texts=hashtag_texts,
+    )
+    await repo_hub.hashtags.change_user_hashtag_counts(
+        user_id=user.id,
+        texts=hashtag_texts,
+        delta=1,
     )
     await commit_repo_hub(repo_hub)
     return draft
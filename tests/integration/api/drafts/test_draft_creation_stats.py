@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from tests.integration.api.drafts.helpers import create_draft
+from tests.integration.utils.uow import commit_repo_hub
 
 
 async def test_get_draft_creation_stats(notes_app, api_client, repo_hub, user):
@@ -62,6 +63,58 @@ async def test_get_draft_creation_stats_with_timezone(notes_app, api_client, rep
     ]
 
 
+async def test_get_draft_creation_stats_with_non_whole_hour_timezone(notes_app, api_client, repo_hub, user):
+    # Asia/Kathmandu is UTC+05:45, so local midnight falls at 18:15 UTC
+    await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="Before midnight",
+        created_at=datetime(2024, 1, 1, 18, 14, 0),
+        updated_at=datetime(2024, 1, 1, 18, 14, 0),
+    )
+    await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="After midnight",
+        created_at=datetime(2024, 1, 1, 18, 15, 0),
+        updated_at=datetime(2024, 1, 1, 18, 15, 0),
+    )
+
+    async with api_client(notes_app) as client:
+        response = await client.get("/api/drafts/creation-stats?timezone=Asia/Kathmandu")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"date": "2024-01-01", "count": 1},
+        {"date": "2024-01-02", "count": 1},
+    ]
+
+
+async def test_get_draft_creation_stats_after_delete(notes_app, api_client, repo_hub, user):
+    await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="Kept",
+        created_at=datetime(2024, 1, 1, 10, 0, 0),
+        updated_at=datetime(2024, 1, 1, 10, 0, 0),
+    )
+    deleted = await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="Deleted",
+        created_at=datetime(2024, 1, 1, 10, 5, 0),
+        updated_at=datetime(2024, 1, 1, 10, 5, 0),
+    )
+    await repo_hub.drafts.delete_by_id(deleted.id)
+    await commit_repo_hub(repo_hub)
+
+    async with api_client(notes_app) as client:
+        response = await client.get("/api/drafts/creation-stats")
+
+    assert response.status_code == 200
+    assert response.json() == [{"date": "2024-01-01", "count": 1}]
+
+
 async def test_get_draft_creation_stats_invalid_timezone_returns_bad_request(
     notes_app,
     api_client,
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from starlette import status
+
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.api.conftest import ApiClientFactory
+from tests.integration.api.drafts.helpers import create_draft
+
+
+@pytest.mark.asyncio
+async def test_draft_hashtag_counts_follow_create_update_and_delete(
+    notes_app: FastAPI,
+    api_client: ApiClientFactory,
+) -> None:
+    async with api_client(notes_app) as client:
+        # setup: two drafts sharing #work
+        first = await client.request(method="POST", url="/api/drafts", json={"text": "Plan #work #ai"})
+        second = await client.request(method="POST", url="/api/drafts", json={"text": "Call #work"})
+
+        # action: retag the first draft, delete the second one
+        await client.request(
+            method="PATCH",
+            url=f"/api/drafts/{first.json()['id']}",
+            json={"text": "Plan #work #ideas"},
+        )
+        await client.request(method="DELETE", url=f"/api/drafts/{second.json()['id']}")
+        response = await client.request(method="GET", url="/api/drafts/hashtags")
+
+    # check: counters reflect the remaining draft only
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"hashtag": "ideas", "count": 1},
+        {"hashtag": "work", "count": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_draft_hashtag_counts_filter_by_date(
+    notes_app: FastAPI,
+    api_client: ApiClientFactory,
+    repo_hub: RepositoryHub,
+    user: User,
+) -> None:
+    # setup: drafts created on different days
+    await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="Old #work",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        hashtags=["work"],
+    )
+    await create_draft(
+        repo_hub=repo_hub,
+        user=user,
+        text="New #work #ai",
+        created_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+        hashtags=["work", "ai"],
+    )
+
+    # action: count totals and counts since mid-January
+    async with api_client(notes_app) as client:
+        totals = await client.request(method="GET", url="/api/drafts/hashtags")
+        recent = await client.request(
+            method="GET",
+            url="/api/drafts/hashtags",
+            params={"from_date": "2024-01-15T00:00:00Z"},
+        )
+
+    # check: most used first, date range narrows the counts
+    assert totals.json() == [
+        {"hashtag": "work", "count": 2},
+        {"hashtag": "ai", "count": 1},
+    ]
+    assert recent.json() == [
+        {"hashtag": "ai", "count": 1},
+        {"hashtag": "work", "count": 1},
+    ]
@@ -80,3 +80,74 @@ async def test_search_drafts_post_filters_by_date_range(
     assert response.status_code == status.HTTP_200_OK
     ids = [item["id"] for item in response.json()]
     assert ids == [str(in_range.id)]
+
+
+@pytest.mark.asyncio
+async def test_get_drafts_paginates_with_cursor(
+    notes_app: FastAPI,
+    api_client: ApiClientFactory,
+    repo_hub: RepositoryHub,
+    user: User,
+) -> None:
+    # setup: three drafts, two sharing the same creation time
+    same_time = datetime(2024, 1, 2, 3, 4, 5)
+    drafts = [
+        await create_draft(repo_hub=repo_hub, user=user, text="Oldest", created_at=datetime(2024, 1, 1)),
+        await create_draft(repo_hub=repo_hub, user=user, text="Tie A", created_at=same_time),
+        await create_draft(repo_hub=repo_hub, user=user, text="Tie B", created_at=same_time),
+    ]
+
+    # action: walk pages of two
+    async with api_client(notes_app) as client:
+        first = await client.request(method="GET", url="/api/drafts", params={"limit": 2})
+        second = await client.request(
+            method="GET",
+            url="/api/drafts",
+            params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        )
+
+    # check: every draft is returned exactly once, newest first
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_200_OK
+    assert "X-Next-Cursor" not in second.headers
+    first_ids = [item["id"] for item in first.json()]
+    second_ids = [item["id"] for item in second.json()]
+    assert len(first_ids) == 2
+    assert set(first_ids) == {str(drafts[1].id), str(drafts[2].id)}
+    assert second_ids == [str(drafts[0].id)]
+
+
+@pytest.mark.asyncio
+async def test_get_drafts_summary_skips_relations(
+    notes_app: FastAPI,
+    api_client: ApiClientFactory,
+    repo_hub: RepositoryHub,
+    user: User,
+) -> None:
+    # setup: draft with hashtags and long text
+    draft = await create_draft(repo_hub=repo_hub, user=user, text="x" * 1000, hashtags=["idea"])
+
+    # action: request summaries
+    async with api_client(notes_app) as client:
+        response = await client.request(method="GET", url="/api/drafts", params={"summary": "true"})
+
+    # check: preview only, without file and hashtags
+    assert response.status_code == status.HTTP_200_OK
+    [item] = response.json()
+    assert item["id"] == str(draft.id)
+    assert item["text"] == "x" * 280
+    assert item["file_id"] is None
+    assert "hashtags" not in item
+
+
+@pytest.mark.asyncio
+async def test_get_drafts_rejects_invalid_cursor(
+    notes_app: FastAPI,
+    api_client: ApiClientFactory,
+) -> None:
+    # action: request with malformed cursor
+    async with api_client(notes_app) as client:
+        response = await client.request(method="GET", url="/api/drafts", params={"cursor": "garbage"})
+
+    # check
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
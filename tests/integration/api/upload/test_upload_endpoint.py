@@ -8,9 +8,10 @@ from dishka import make_async_container, Provider, Scope, provide
 from dishka.integrations.fastapi import setup_dishka
 
 from brain.application.abstractions.repositories.s3_files import IS3FilesRepository
-from brain.application.abstractions.storage.files import IFileStorage
+from brain.application.abstractions.storage.files import IFileStorage, StoredFile
 from brain.application.abstractions.uow import IUnitOfWork, UnitOfWorkFactory
 from brain.application.interactors.upload_file import UploadFileInteractor
+from brain.application.services.file_deduplication import FileDeduplicationService
 from brain.presentation.api.factory import create_bare_app
 from brain.config.models import APIConfig, S3Config
 
@@ -32,6 +33,13 @@ class FakeUnitOfWork(IUnitOfWork):
         return None
 
 
+@pytest.fixture(autouse=True)
+def enqueue_thumbnails(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    kiq = AsyncMock()
+    monkeypatch.setattr("brain.presentation.tasks.files.generate_file_thumbnails_task.kiq", kiq)
+    return kiq
+
+
 @pytest.fixture
 def client(event_loop):
     # setup: api and s3 config used by app and URL builder
@@ -46,11 +54,21 @@ def client(event_loop):
         access_key_id="key",
         secret_access_key="secret",
         bucket_name="test-bucket",
+        max_upload_size=1024,
     )
 
     # setup: mocked storage and repository dependencies
     mock_file_storage = MagicMock(spec=IFileStorage)
+
+    async def _consume_stream(chunks, object_name, content_type=None) -> StoredFile:
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+        return StoredFile(size=size, sha256="")
+
+    mock_file_storage.upload_stream.side_effect = _consume_stream
     mock_s3_files_repo = AsyncMock(spec=IS3FilesRepository)
+    mock_s3_files_repo.get_by_sha256.return_value = None
 
     # Provider
     class MockProvider(Provider):
@@ -69,6 +87,7 @@ def client(event_loop):
                 s3_files_repo=s3_files_repo,
                 s3_config=s3_config,
                 uow_factory=uow_factory,
+                file_deduplication_service=FileDeduplicationService(s3_files_repo=s3_files_repo),
             )
 
         @provide(provides=IFileStorage)
@@ -100,7 +119,7 @@ def client(event_loop):
     event_loop.run_until_complete(container.close())
 
 
-def test_upload_image(client):
+def test_upload_image(client, enqueue_thumbnails: AsyncMock):
     # action: upload image file
     files = {"file": ("test.jpg", b"content", "image/jpeg")}
     response = client.request(method="POST", url="/api/file/upload", files=files)
@@ -114,6 +133,8 @@ def test_upload_image(client):
     assert UUID(payload["id"])
     assert payload["content_type"] == "image/jpeg"
     assert payload["created_at"] is not None
+    assert payload["thumbnails"] == []
+    enqueue_thumbnails.assert_awaited_once_with(file_id=payload["id"])
 
 
 def test_upload_file_supports_non_image_content(client):
@@ -146,3 +167,81 @@ def test_upload_file_without_extension(client):
     assert UUID(payload["id"])
     assert payload["content_type"] == "text/plain"
     assert payload["created_at"] is not None
+
+
+def test_upload_file_rejects_oversized_body(client):
+    # action: upload file larger than the configured limit
+    files = {"file": ("big.bin", b"x" * 200 * 1024, "application/octet-stream")}
+    response = client.request(method="POST", url="/api/file/upload", files=files)
+
+    # check: request is rejected before the body is parsed
+    assert response.status_code == 413
+
+
+def test_upload_file_rejects_file_over_limit_within_overhead_allowance(client):
+    # action: upload file slightly larger than the limit
+    files = {"file": ("big.bin", b"x" * 2048, "application/octet-stream")}
+    response = client.request(method="POST", url="/api/file/upload", files=files)
+
+    # check: streamed size check rejects the file
+    assert response.status_code == 413
+
+
+def test_upload_file_rejects_empty_file(client):
+    # action: upload empty file
+    files = {"file": ("empty.txt", b"", "text/plain")}
+    response = client.request(method="POST", url="/api/file/upload", files=files)
+
+    # check: empty upload is rejected
+    assert response.status_code == 422
+
+
+def test_upload_file_rejects_chunked_body_over_limit(client):
+    # setup: multipart body streamed without a Content-Length
+    boundary = "upload-boundary"
+
+    def body():
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="big.bin"\r\n\r\n'.encode()
+        for _ in range(100):
+            yield b"x" * 1024
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    # action
+    response = client.request(
+        method="POST",
+        url="/api/file/upload",
+        content=body(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    # check: running byte count rejects the body
+    assert response.status_code == 413
+
+
+def test_upload_file_rejects_malformed_content_length(client):
+    # action: Content-Length header that is not a number
+    response = client.request(
+        method="POST",
+        url="/api/file/upload",
+        content=b"",
+        headers={"Content-Type": "multipart/form-data; boundary=x", "Content-Length": "abc"},
+    )
+
+    # check
+    assert response.status_code == 400
+
+
+def test_upload_file_rejects_non_multipart_body(client):
+    # action: body that is not multipart/form-data
+    response = client.request(method="POST", url="/api/file/upload", json={"file": "content"})
+
+    # check
+    assert response.status_code == 400
+
+
+def test_upload_file_requires_file_field(client):
+    # action: multipart form without the file field
+    response = client.request(method="POST", url="/api/file/upload", files={"other": ("a.txt", b"a", "text/plain")})
+
+    # check
+    assert response.status_code == 422
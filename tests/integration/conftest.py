@@ -13,11 +13,14 @@ from brain.config.models import Config
 from brain.config.parser import load_config
 from brain.config.provider import ConfigProvider
 from brain.domain.entities.user import User
-from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.db.provider import DatabaseProvider, ReadReplicaProvider
 from brain.infrastructure.db.repositories.hub import RepositoryHub
+from brain.infrastructure.images.provider import ImageProvider
 from brain.infrastructure.jwt.provider import JwtProvider
 from brain.infrastructure.api_keys.provider import ApiKeyServiceProvider
+from brain.infrastructure.monitoring.provider import TracingProvider
 from tests.fixtures.db_provider import TestDbProvider
+from tests.fixtures.read_replica_provider import TestReadReplicaProvider
 from tests.fixtures.profile_picture_storage_provider import TestProfilePictureStorageProvider
 from tests.fixtures.graph_provider import TestGraphProvider, TestNeo4jConfigProvider
 from tests.fixtures.profile_picture_provider import TestProfilePictureProvider
@@ -47,14 +50,18 @@ async def dishka():
         ConfigProvider(),
         TestDbProvider(),
         DatabaseProvider(),
+        ReadReplicaProvider(),
+        TestReadReplicaProvider(),
         TestNeo4jConfigProvider(),
         TestGraphProvider(),
         ApiKeyServiceProvider(),
         TestProfilePictureStorageProvider(),
         TestProfilePictureProvider(),
         MockBotProvider(),
+        ImageProvider(),
         InteractorProvider(),
         JwtProvider(),
+        TracingProvider(),
         context={Config: config},
     )
     yield container
@@ -13,27 +13,27 @@ async def seed_graph_data(
 ):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
 
-    alpha_id = await create_interactor.create_note(
+    alpha_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Alpha",
             text="links [[Beta]] and [[Orphan]]",
         )
-    )
-    beta_id = await create_interactor.create_note(
+    )).id
+    beta_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Beta",
             text="see [[Gamma]]",
         )
-    )
-    gamma_id = await create_interactor.create_note(
+    )).id
+    gamma_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Gamma",
             text="",
         )
-    )
+    )).id
     return alpha_id, beta_id, gamma_id
 
 
@@ -147,20 +147,20 @@ async def test_get_graph_excludes_archived_notes(
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
     graph_interactor = await dishka_request.get(GetGraphInteractor)
 
-    archived_note_id = await create_interactor.create_note(
+    archived_note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="ArchivedNode",
             text="Ref [[VisibleNode]]",
         ),
-    )
-    visible_note_id = await create_interactor.create_note(
+    )).id
+    visible_note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="VisibleNode",
             text="Visible text",
         ),
-    )
+    )).id
 
     await update_interactor.update_note(
         UpdateNote(
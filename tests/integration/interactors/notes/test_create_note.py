@@ -18,7 +18,7 @@ async def test_note_creation(dishka_request: AsyncContainer, user: User, repo_hu
         title="Note title",
         text="Some note text",
     )
-    note_id = await create_interactor.create_note(data)
+    note_id = (await create_interactor.create_note(data)).id
 
     note = await repo_hub.notes.get_by_id(note_id)
     assert note is not None
@@ -41,7 +41,7 @@ async def test_note_autogenerates_title_when_missing(
         title=None,
         text="Some note text",
     )
-    note_id = await create_interactor.create_note(data)
+    note_id = (await create_interactor.create_note(data)).id
     note = await repo_hub.notes.get_by_id(note_id)
     assert note is not None
     assert note.title.startswith("Untitled ")
@@ -104,7 +104,7 @@ async def test_note_creation_with_wikilinks(
         title="Source",
         text="Links to [[Target]].",
     )
-    note_id = await create_interactor.create_note(data)
+    note_id = (await create_interactor.create_note(data)).id
 
     # Verify PG State
     note = await repo_hub.notes.get_by_id(note_id)
@@ -139,7 +139,7 @@ async def test_note_creation_auto_title_with_links(
         title=None,
         text="Content with [[Linked]].",
     )
-    note_id = await create_interactor.create_note(data)
+    note_id = (await create_interactor.create_note(data)).id
     note = await repo_hub.notes.get_by_id(note_id)
 
     # Verify link established using generated title
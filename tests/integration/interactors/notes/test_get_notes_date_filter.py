@@ -46,7 +46,7 @@ async def test_get_notes_filters_from_date(
     await _create_note_with_created_at(repo_hub, user, "New", base + timedelta(days=10))
 
     notes = await interactor.get_notes(
-        user.telegram_id,
+        user.id,
         from_date=base + timedelta(days=5),
     )
 
@@ -65,7 +65,7 @@ async def test_get_notes_filters_to_date(
     await _create_note_with_created_at(repo_hub, user, "New", base + timedelta(days=10))
 
     notes = await interactor.get_notes(
-        user.telegram_id,
+        user.id,
         to_date=base + timedelta(days=5),
     )
 
@@ -85,7 +85,7 @@ async def test_get_notes_filters_between_dates(
     await _create_note_with_created_at(repo_hub, user, "Late", base + timedelta(days=10))
 
     notes = await interactor.get_notes(
-        user.telegram_id,
+        user.id,
         from_date=base + timedelta(days=3),
         to_date=base + timedelta(days=7),
     )
@@ -18,20 +18,20 @@ async def test_keywords_deleted_when_last_link_removed(
     delete_interactor = await dishka_request.get(DeleteNoteInteractor)
     session = await dishka_request.get(AsyncSession)
 
-    first_note_id = await create_interactor.create_note(
+    first_note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="First",
             text="See [[Omega]]",
         ),
-    )
-    second_note_id = await create_interactor.create_note(
+    )).id
+    second_note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Second",
             text="Linking [[Omega]] too",
         ),
-    )
+    )).id
 
     result = await session.execute(
         select(KeywordDB).where(KeywordDB.user_id == user.id, KeywordDB.name == "Omega"),
@@ -60,13 +60,13 @@ async def test_keyword_note_creates_keyword_without_link(
     delete_interactor = await dishka_request.get(DeleteNoteInteractor)
     session = await dishka_request.get(AsyncSession)
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Atlas",
             text="No links here",
         ),
-    )
+    )).id
 
     keyword_db = (
         await session.execute(
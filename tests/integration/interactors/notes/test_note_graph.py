@@ -13,13 +13,13 @@ async def test_note_graph_links_to_notes_by_title(dishka_request, user: User):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     notes_graph_repo = await dishka_request.get(INotesGraphRepository)
 
-    child_id = await create_interactor.create_note(
+    child_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Child",
             text="leaf",
         ),
-    )
+    )).id
     await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
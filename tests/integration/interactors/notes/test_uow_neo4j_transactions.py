@@ -61,13 +61,13 @@ async def test_commit_persists_sql_then_neo4j(
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="CommitBothStores",
             text="content",
         ),
-    )
+    )).id
 
     note = await repo_hub.notes.get_by_id(note_id)
     assert note is not None
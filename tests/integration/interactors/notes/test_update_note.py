@@ -23,13 +23,13 @@ async def test_note_update_requires_title(
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Alpha",
             text="Note",
         ),
-    )
+    )).id
     with pytest.raises(NoteTitleRequiredException):
         await update_interactor.update_note(
             UpdateNote(
@@ -57,13 +57,13 @@ async def test_note_duplicate_title_conflict(
         ),
     )
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Sigma",
             text="Regular note",
         ),
-    )
+    )).id
 
     with pytest.raises(NoteTitleAlreadyExistsException):
         await update_interactor.update_note(
@@ -86,13 +86,13 @@ async def test_note_update_renaming(
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
     # Create original
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="OldName",
             text="Text",
         )
-    )
+    )).id
 
     # Rename
     await update_interactor.update_note(
@@ -128,13 +128,13 @@ async def test_note_update_content_links(
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Linker",
             text="Refers [[A]]",
         )
-    )
+    )).id
 
     # Update: remove A, add B
     await update_interactor.update_note(
@@ -162,13 +162,13 @@ async def test_note_update_patch(
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Patcher",
             text="Hello world",
         )
-    )
+    )).id
 
     patch_str = get_patches_str("Hello world", "Hello patched")
 
@@ -197,13 +197,13 @@ async def test_note_update_keyword_gc(
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
     # 1. Create note linking to "Temporary"
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Holder",
             text="Links [[Temporary]]",
         )
-    )
+    )).id
 
     # Verify keyword exists
     kw = await repo_hub.keywords.get_by_user_and_name(user.id, "Temporary")
@@ -250,13 +250,13 @@ async def test_note_update_removes_wikilink_connection(
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
     # 1. Create a note with a wikilink
-    note_id = await create_interactor.create_note(
+    note_id = (await create_interactor.create_note(
         CreateNote(
             by_user_telegram_id=user.telegram_id,
             title="Source",
             text="This refers to [[Target]]",
         )
-    )
+    )).id
 
     # Verify link exists initially
     initial_count = await graph_repo.count_links_between_notes(user.id, "Source", "Target")
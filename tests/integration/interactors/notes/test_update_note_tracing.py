@@ -0,0 +1,43 @@
+import pytest
+from dishka import AsyncContainer
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from brain.application.interactors import CreateNoteInteractor, UpdateNoteInteractor
+from brain.application.interactors.notes.dto import CreateNote, UpdateNote
+from brain.domain.entities.user import User
+
+
+@pytest.mark.asyncio
+async def test_note_update_spans_cover_sql_and_cypher(
+    dishka_request: AsyncContainer,
+    user: User,
+    span_exporter: InMemorySpanExporter,
+):
+    create_interactor = await dishka_request.get(CreateNoteInteractor)
+    update_interactor = await dishka_request.get(UpdateNoteInteractor)
+    note_id = (await create_interactor.create_note(
+        CreateNote(
+            by_user_telegram_id=user.telegram_id,
+            title="Traced",
+            text="Links to [[First]]",
+        ),
+    )).id
+    span_exporter.clear()
+
+    await update_interactor.update_note(
+        UpdateNote(
+            note_id=note_id,
+            title="Traced",
+            text="Links to [[Second]]",
+        ),
+    )
+
+    spans = span_exporter.get_finished_spans()
+    names = [span.name for span in spans]
+    (root,) = [span for span in spans if span.name == "UpdateNoteInteractor.update_note"]
+    assert "NotesRepository.update" in names
+    assert "NotesGraphRepository.sync_connections" in names
+    assert "neo4j.run" in names
+    assert "UPDATE" in names
+    # Everything the update did is recorded inside the interactor's trace.
+    assert {span.context.trace_id for span in spans} == {root.context.trace_id}
@@ -10,7 +10,7 @@ from brain.infrastructure.db.repositories.users import UsersRepository
 from brain.application.abstractions.repositories.users import IUsersRepository
 from tests.fixtures.profile_picture_provider import MockProfilePictureProvider
 
-from brain.application.abstractions.services.profile_picture_provider import ProfilePictureData
+from brain.application.abstractions.services.profile_picture_provider import ProfilePictureData, ProfilePictureRef
 
 from dishka import AsyncContainer
 
@@ -25,12 +25,24 @@ async def test_update_all_profile_pictures(
 
     # Setup mock provider to return some dummy content
 
-    with patch.object(
-        MockProfilePictureProvider,
-        "get_profile_picture_content",
-        new_callable=AsyncMock,
-    ) as mock_get:
-        mock_get.return_value = ProfilePictureData(content=b"fake_image_content", content_type="image/png")
+    with (
+        patch.object(
+            MockProfilePictureProvider,
+            "get_profile_picture_ref",
+            new_callable=AsyncMock,
+        ) as mock_get,
+        patch.object(
+            MockProfilePictureProvider,
+            "download_profile_picture",
+            new_callable=AsyncMock,
+        ) as mock_download,
+    ):
+        mock_get.return_value = ProfilePictureRef(file_id="file-id", file_unique_id="unique-id")
+        mock_download.return_value = ProfilePictureData(
+            content=b"fake_image_content",
+            content_type="image/png",
+            file_unique_id="unique-id",
+        )
 
         # Execute the interactor
         await update_all_users_profile_pictures_interactor.execute()
@@ -41,5 +53,11 @@ async def test_update_all_profile_pictures(
         # Verify user was updated
         updated_user = await users_repository.get_by_id(user.id)
         assert updated_user.profile_picture_file_id is not None
+        assert updated_user.profile_picture_file_unique_id == "unique-id"
+
+        # A second run sees the same file_unique_id and skips the download
+        mock_download.reset_mock()
+        await update_all_users_profile_pictures_interactor.execute()
+        mock_download.assert_not_awaited()
 
         # We could also verify S3 but checking the user entity update is a strong enough signal for this integration level
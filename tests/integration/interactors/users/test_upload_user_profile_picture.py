@@ -64,3 +64,31 @@ async def test_upload_user_profile_picture_updates_existing_record(
     assert stored.content_type == "image/png"
     updated_user = await repo_hub.users.get_by_id(user.id)
     assert updated_user.profile_picture_file_id == first_profile_picture.id
+
+
+@pytest.mark.asyncio
+async def test_upload_user_profile_picture_keeps_record_for_same_content(
+    dishka_request: AsyncContainer,
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup: prepare interactor and initial profile picture
+    interactor = await dishka_request.get(UploadUserProfilePictureInteractor)
+    first_profile_picture = await interactor.upload_profile_picture(
+        telegram_id=user.telegram_id,
+        image_content=b"avatar-bytes",
+        content_type="image/jpeg",
+    )
+
+    # action: upload identical bytes again
+    second_profile_picture = await interactor.upload_profile_picture(
+        telegram_id=user.telegram_id,
+        image_content=b"avatar-bytes",
+        content_type="image/jpeg",
+    )
+
+    # check: stored object and hash are reused
+    stored = await repo_hub.s3_files.get_by_user_id(user.id)
+    assert second_profile_picture.path == first_profile_picture.path
+    assert stored.sha256 == first_profile_picture.sha256
+    assert await repo_hub.s3_files.count_by_path(stored.path) == 1
@@ -26,3 +26,27 @@ async def test_user_creation(dishka_request: AsyncContainer, repo_hub: Repositor
     assert user.last_name == data.last_name
     assert user.created_at is not None
     assert user.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_batch_user_update_keeps_pin_and_creates_missing(dishka_request: AsyncContainer, repo_hub: RepositoryHub):
+    interactor = await dishka_request.get(UserInteractor)
+    await interactor.create_or_update_user(
+        CreateOrUpdateUser(telegram_id=5, username="old", first_name="Old", last_name=None),
+    )
+    existing = await repo_hub.users.get_by_telegram_id(5)
+    existing.pin_hash = "hash"
+    await repo_hub.users.update(existing)
+
+    await interactor.create_or_update_users(
+        [
+            CreateOrUpdateUser(telegram_id=5, username="new", first_name="New", last_name=None),
+            CreateOrUpdateUser(telegram_id=6, username="other", first_name="Other", last_name=None),
+        ]
+    )
+
+    updated = await repo_hub.users.get_by_telegram_id(5)
+    created = await repo_hub.users.get_by_telegram_id(6)
+    assert updated.username == "new"
+    assert updated.pin_hash == "hash"
+    assert created is not None
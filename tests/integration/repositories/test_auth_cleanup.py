@@ -0,0 +1,64 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from dishka import AsyncContainer
+
+from brain.application.abstractions.repositories.jwt import IJwtRefreshTokensRepository
+from brain.application.abstractions.repositories.tg_bot_auth import ITelegramBotAuthSessionsRepository
+from brain.domain.entities.jwt import JwtRefreshToken
+from brain.domain.entities.tg_bot_auth import TelegramBotAuthSession
+from brain.domain.entities.user import User
+from brain.domain.time import utc_now
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_refresh_tokens_respects_limit(
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup: store two expired tokens and one active token
+    jwt_repo = await dishka_request.get(IJwtRefreshTokensRepository)
+    now = utc_now()
+    expired = [
+        JwtRefreshToken(id=uuid4(), user_id=user.id, token=f"expired-{i}", expires_at=now - timedelta(hours=1))
+        for i in range(2)
+    ]
+    active = JwtRefreshToken(id=uuid4(), user_id=user.id, token="active", expires_at=now + timedelta(hours=1))
+    for token in [*expired, active]:
+        await jwt_repo.create(token)
+
+    # action: delete expired tokens one at a time
+    first_batch = await jwt_repo.delete_expired(expired_before=now, limit=1)
+    second_batch = await jwt_repo.delete_expired(expired_before=now, limit=1)
+    third_batch = await jwt_repo.delete_expired(expired_before=now, limit=1)
+
+    # check: only expired tokens are removed and lookup by token still works
+    assert (first_batch, second_batch, third_batch) == (1, 1, 0)
+    assert await jwt_repo.get_by_id(expired[0].id) is None
+    stored = await jwt_repo.get_by_token("active")
+    assert stored is not None
+    assert stored.id == active.id
+
+    await jwt_repo.delete_by_id(active.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_stale_bot_auth_sessions(
+    dishka_request: AsyncContainer,
+):
+    # setup: store a stale and a fresh session
+    sessions_repo = await dishka_request.get(ITelegramBotAuthSessionsRepository)
+    now = utc_now()
+    stale = TelegramBotAuthSession(id=uuid4().hex[:16], created_at=now - timedelta(days=2))
+    fresh = TelegramBotAuthSession(id=uuid4().hex[:16], created_at=now)
+    await sessions_repo.create(stale)
+    await sessions_repo.create(fresh)
+
+    # action: delete sessions older than a day
+    deleted = await sessions_repo.delete_created_before(created_before=now - timedelta(days=1), limit=100)
+
+    # check: only the stale session is gone
+    assert deleted >= 1
+    assert await sessions_repo.get_by_id(stale.id) is None
+    assert await sessions_repo.get_by_id(fresh.id) is not None
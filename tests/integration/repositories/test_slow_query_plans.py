@@ -0,0 +1,36 @@
+import json
+
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import text
+
+from brain.application.abstractions.config.models import IDatabaseConfig
+from brain.config.models import SlowQueryConfig
+from brain.infrastructure.db.connection import create_engine
+from brain.infrastructure.db.slow_queries import instrument_slow_queries
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog
+
+
+@pytest.mark.asyncio
+async def test_slow_statement_plan_is_captured_without_breaking_the_transaction(dishka: AsyncContainer, tmp_path):
+    plan_log_path = tmp_path / "query_plans.jsonl"
+    slow_query_log = SlowQueryLog(
+        SlowQueryConfig(threshold_ms=10, plan_sample_rate=1.0, plan_log_path=str(plan_log_path)),
+    )
+    engine = create_engine(await dishka.get(IDatabaseConfig))
+    instrument_slow_queries(engine.sync_engine, slow_query_log)
+
+    try:
+        async with engine.begin() as conn:
+            slept = await conn.scalar(text("SELECT pg_sleep(0.02) IS NULL"))
+            # A failing EXPLAIN would have aborted the transaction
+            after = await conn.scalar(text("SELECT 1"))
+    finally:
+        await engine.dispose()
+        slow_query_log.close()
+
+    assert slept is True
+    assert after == 1
+    (entry,) = [json.loads(line) for line in plan_log_path.read_text().splitlines()]
+    assert entry["backend"] == "sql"
+    assert entry["plan"][0]["Plan"]["Actual Loops"] == 1
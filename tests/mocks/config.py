@@ -6,6 +6,14 @@ from brain.application.abstractions.config.models import IDatabaseConfig, INeo4j
 @dataclass
 class DatabaseConfig(IDatabaseConfig):
     uri_: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    prepared_statement_cache_size: int = 100
+    statement_timeout: int = 0
+    server_settings: str = ""
 
     @property
     def uri(self) -> str:
@@ -18,3 +26,9 @@ class Neo4jConfig(INeo4jConfig):
     user: str
     password: str
     database: str
+    orphan_keyword_sweep_enabled: bool = False
+    orphan_keyword_sweep_batch_size: int = 1000
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
+    max_connection_lifetime: int = 3600
+    fetch_size: int = 1000
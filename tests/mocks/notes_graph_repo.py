@@ -84,6 +84,14 @@ class DummyNotesGraphRepository(INotesGraphRepository):
                     del self._links[uid][deleted.title]
                 break
 
+    async def delete_notes(self, note_ids: list[UUID]):
+        for note_id in note_ids:
+            await self.delete_note(note_id)
+
+    async def delete_orphan_keywords(self, limit: int) -> int:
+        # Keywords are derived from links here, so they never outlive their notes.
+        return 0
+
     async def count_notes_by_user_and_title(self, user_id: UUID, title: str) -> int:
         user_notes = self._get_user_notes(user_id)
         if any(n.title == title for n in user_notes.values()):
@@ -0,0 +1,67 @@
+import logging
+import os
+import time
+from uuid import uuid4
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from brain.infrastructure.jwt.keyring import JwtKeyring, StaticJwtKeyringSource, build_jwt_key
+from brain.infrastructure.jwt.service import JwtService
+
+logger = logging.getLogger()
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def _build_service(algorithm: str) -> JwtService:
+    if algorithm == "HS256":
+        key = "benchmark-secret"
+    elif algorithm == "EdDSA":
+        key = _private_pem(ed25519.Ed25519PrivateKey.generate())
+    elif algorithm == "ES256":
+        key = _private_pem(ec.generate_private_key(ec.SECP256R1()))
+    else:
+        key = _private_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    jwt_key = build_jwt_key(kid="bench", algorithm=algorithm, key=key)
+    return JwtService(
+        access_token_lifetime=3600,
+        keyring_source=StaticJwtKeyringSource(JwtKeyring(active_kid="bench", keys={"bench": jwt_key})),
+    )
+
+
+@pytest.mark.parametrize("algorithm", ["HS256", "EdDSA", "ES256", "RS256"])
+def test_jwt_issue_and_verify_throughput(algorithm: str) -> None:
+    # setup: build a single-key service for the algorithm
+    iterations = int(os.getenv(key="PERF_JWT_ITERATIONS", default="2000"))
+    min_verify_ops = int(os.getenv(key="PERF_MIN_JWT_VERIFY_OPS", default="200"))
+    service = _build_service(algorithm)
+    user_id = uuid4()
+
+    # action: issue and verify tokens in a tight loop
+    start = time.perf_counter()
+    tokens = [service.create_token(payload={"user_id": user_id}).access_token for _ in range(iterations)]
+    issue_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for token in tokens:
+        service.decode_token(token)
+    verify_elapsed = time.perf_counter() - start
+
+    # check: verification throughput stays above the threshold
+    issue_ops = iterations / issue_elapsed
+    verify_ops = iterations / verify_elapsed
+    logger.info(
+        "JWT throughput: algorithm=%s issue_ops=%.0f verify_ops=%.0f",
+        algorithm,
+        issue_ops,
+        verify_ops,
+    )
+    assert verify_ops >= min_verify_ops
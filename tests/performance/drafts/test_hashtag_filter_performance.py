@@ -0,0 +1,120 @@
+import hashlib
+import logging
+import math
+import os
+import time
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select, text
+
+from brain.domain.entities.user import User
+from brain.infrastructure.db.models.draft import DraftDB
+from brain.infrastructure.db.models.hashtag import DraftHashtagDB
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.utils.uow import commit_repo_hub
+
+logger = logging.getLogger()
+
+# Draft number i carries hashtag "m<k>" when i is divisible by k, so every extra filter is more selective.
+HASHTAG_MODULI = [2, 3, 5, 7]
+PAGE_SIZE = 50
+
+
+def load_perf_threshold_ms(*, env_key: str, default_ms: int) -> int:
+    return int(os.getenv(key=env_key, default=str(default_ms)))
+
+
+async def seed_drafts(repo_hub: RepositoryHub, user: User, total: int) -> None:
+    session = repo_hub.drafts._session  # type: ignore[attr-defined]
+    await session.execute(
+        text(
+            """
+            INSERT INTO drafts (id, user_id, text, created_at, updated_at)
+            SELECT md5(i::text)::uuid, :user_id, 'draft ' || i,
+                   timestamptz '2024-01-01' - i * interval '1 second',
+                   timestamptz '2024-01-01' - i * interval '1 second'
+            FROM generate_series(1, :total) AS i
+            """
+        ),
+        {"user_id": user.id, "total": total},
+    )
+    for modulus in HASHTAG_MODULI:
+        await session.execute(
+            text("INSERT INTO hashtags (text) VALUES (:tag) ON CONFLICT DO NOTHING"),
+            {"tag": f"m{modulus}"},
+        )
+        await session.execute(
+            text(
+                """
+                INSERT INTO draft_hashtags (draft_id, hashtag_text)
+                SELECT md5(i::text)::uuid, :tag
+                FROM generate_series(:modulus, :total, :modulus) AS i
+                """
+            ),
+            {"tag": f"m{modulus}", "modulus": modulus, "total": total},
+        )
+    await commit_repo_hub(repo_hub)
+    await session.execute(text("ANALYZE drafts"))
+    await session.execute(text("ANALYZE draft_hashtags"))
+
+
+def expected_first_page(filters: int) -> list[UUID]:
+    step = math.lcm(*HASHTAG_MODULI[:filters])
+    return [UUID(hashlib.md5(str(step * n).encode()).hexdigest()) for n in range(1, PAGE_SIZE + 1)]
+
+
+def build_group_by_query(user_id: UUID, hashtags: list[str]):
+    # The filter this benchmark replaced, kept here as the baseline.
+    return (
+        select(DraftDB.id)
+        .join(DraftHashtagDB, DraftHashtagDB.draft_id == DraftDB.id)
+        .where(DraftDB.user_id == user_id, DraftHashtagDB.hashtag_text.in_(hashtags))
+        .group_by(DraftDB.id)
+        .having(func.count(func.distinct(DraftHashtagDB.hashtag_text)) == len(hashtags))
+        .order_by(DraftDB.created_at.desc(), DraftDB.id.desc())
+        .limit(PAGE_SIZE)
+    )
+
+
+@pytest.mark.asyncio
+async def test_hashtag_filter_on_large_draft_set(
+    repo_hub: RepositoryHub,
+    user: User,
+) -> None:
+    # setup: many drafts for one user
+    total = int(os.getenv(key="PERF_DRAFTS_TOTAL", default="100000"))
+    max_ms = load_perf_threshold_ms(env_key="PERF_MAX_DRAFT_HASHTAG_FILTER_MS", default_ms=500)
+    await seed_drafts(repo_hub=repo_hub, user=user, total=total)
+    session = repo_hub.drafts._session  # type: ignore[attr-defined]
+
+    for filters in range(1, len(HASHTAG_MODULI) + 1):
+        hashtags = [f"m{modulus}" for modulus in HASHTAG_MODULI[:filters]]
+
+        # action: newest page through the repository, then the old GROUP BY query
+        start = time.perf_counter()
+        drafts = await repo_hub.drafts.get_page_by_user(
+            user_id=user.id,
+            limit=PAGE_SIZE,
+            summary=True,
+            hashtags=hashtags,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        baseline_ids = list((await session.execute(build_group_by_query(user.id, hashtags))).scalars())
+        baseline_ms = (time.perf_counter() - start) * 1000
+
+        # check: same drafts as the baseline and under threshold
+        ids = [draft.id for draft in drafts]
+        assert ids == expected_first_page(filters)
+        assert set(ids) == set(baseline_ids)
+        assert elapsed_ms <= max_ms
+        logger.info(
+            "Draft hashtag filter metrics: drafts=%d filters=%d elapsed_ms=%.2f group_by_ms=%.2f threshold_ms=%d",
+            total,
+            filters,
+            elapsed_ms,
+            baseline_ms,
+            max_ms,
+        )
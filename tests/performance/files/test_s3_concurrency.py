@@ -0,0 +1,100 @@
+import logging
+import os
+import time
+from collections.abc import Generator
+from uuid import uuid4
+
+import pytest
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+
+from brain.config.models import S3Config, S3StorageBackend
+from brain.infrastructure.s3.client import S3Client
+from brain.infrastructure.s3.executor import S3Executor, ThreadPoolS3Executor
+from brain.infrastructure.s3.file_storage import S3FileStorage
+from tests.performance.load_helpers import run_concurrent_tasks
+
+logger = logging.getLogger()
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint_url() -> Generator[str, None, None]:
+    # PERF_S3_ENDPOINT_URL points at an already running MinIO, e.g. the docker-compose one
+    endpoint_url = os.getenv(key="PERF_S3_ENDPOINT_URL")
+    if endpoint_url:
+        yield endpoint_url
+        return
+
+    minio = (
+        DockerContainer("minio/minio")
+        .with_command("server /data")
+        .with_env("MINIO_ROOT_USER", "minioadmin")
+        .with_env("MINIO_ROOT_PASSWORD", "minioadmin")
+        .with_exposed_ports(9000)
+    )
+    minio.start()
+    try:
+        wait_for_logs(minio, "API:")
+        yield f"http://{minio.get_container_host_ip()}:{minio.get_exposed_port(9000)}"
+    finally:
+        minio.stop()
+
+
+def _build_storage(endpoint_url: str, backend: S3StorageBackend) -> tuple[S3FileStorage, S3Executor]:
+    config = S3Config(
+        external_host=endpoint_url,
+        endpoint_url=endpoint_url,
+        access_key_id=os.getenv(key="PERF_S3_ACCESS_KEY_ID", default="minioadmin"),
+        secret_access_key=os.getenv(key="PERF_S3_SECRET_ACCESS_KEY", default="minioadmin"),
+        bucket_name=f"perf-{uuid4().hex[:12]}",
+        backend=backend,
+    )
+    client = S3Client(config)
+    client.client.create_bucket(Bucket=config.bucket_name)
+    if backend == S3StorageBackend.EXECUTOR:
+        executor = ThreadPoolS3Executor(max_workers=config.executor_max_workers)
+    else:
+        executor = S3Executor()
+    return S3FileStorage(s3_client=client, s3_config=config, executor=executor), executor
+
+
+@pytest.mark.asyncio
+async def test_s3_upload_concurrency_by_backend(s3_endpoint_url: str) -> None:
+    # setup: the same payloads for both backends
+    total = int(os.getenv(key="PERF_S3_UPLOADS_TOTAL", default="64"))
+    concurrency = int(os.getenv(key="PERF_S3_UPLOADS_CONCURRENCY", default="16"))
+    payload_size = int(os.getenv(key="PERF_S3_PAYLOAD_BYTES", default=str(256 * 1024)))
+    min_speedup = float(os.getenv(key="PERF_MIN_S3_EXECUTOR_SPEEDUP", default="1.5"))
+    payload = os.urandom(payload_size)
+
+    throughput: dict[S3StorageBackend, float] = {}
+    for backend in (S3StorageBackend.BLOCKING, S3StorageBackend.EXECUTOR):
+        storage, executor = _build_storage(s3_endpoint_url, backend)
+
+        async def _upload(index: int, storage: S3FileStorage = storage) -> str:
+            return await storage.upload(
+                content=payload,
+                object_name=f"bench/{index}.bin",
+                content_type="application/octet-stream",
+            )
+
+        # action: upload concurrently from a single event loop
+        start = time.perf_counter()
+        await run_concurrent_tasks(total=total, concurrency=concurrency, worker=_upload)
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+
+        throughput[backend] = total / elapsed
+        logger.info(
+            "S3 upload throughput: backend=%s uploads=%s concurrency=%s payload_bytes=%s ops=%.1f",
+            backend.value,
+            total,
+            concurrency,
+            payload_size,
+            throughput[backend],
+        )
+
+    # check: the executor backend actually overlaps requests
+    speedup = throughput[S3StorageBackend.EXECUTOR] / throughput[S3StorageBackend.BLOCKING]
+    logger.info("S3 executor speedup: %.2fx", speedup)
+    assert speedup >= min_speedup
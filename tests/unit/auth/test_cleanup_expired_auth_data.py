@@ -0,0 +1,39 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from brain.application.interactors.auth.cleanup_expired_auth_data import CleanupExpiredAuthDataInteractor
+from brain.config.models import AuthenticationConfig
+
+
+def _make_uow_factory() -> MagicMock:
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return MagicMock(return_value=uow)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_in_batches_until_batch_is_not_full():
+    jwt_repo = AsyncMock()
+    jwt_repo.delete_expired.side_effect = [2, 2, 1]
+    jwt_repo.count.return_value = 10
+    sessions_repo = AsyncMock()
+    sessions_repo.delete_created_before.side_effect = [0]
+    sessions_repo.count.return_value = 3
+    uow_factory = _make_uow_factory()
+    interactor = CleanupExpiredAuthDataInteractor(
+        jwt_repo=jwt_repo,
+        sessions_repo=sessions_repo,
+        auth_config=AuthenticationConfig(admin_token="a", secret_key="b", cleanup_batch_size=2),
+        uow_factory=uow_factory,
+    )
+
+    result = await interactor.execute()
+
+    assert result.deleted_refresh_tokens == 5
+    assert result.deleted_bot_auth_sessions == 0
+    assert result.refresh_tokens_total == 10
+    assert result.bot_auth_sessions_total == 3
+    assert jwt_repo.delete_expired.await_count == 3
+    assert all(call.kwargs["limit"] == 2 for call in jwt_repo.delete_expired.await_args_list)
+    assert uow_factory.return_value.commit.await_count == 4
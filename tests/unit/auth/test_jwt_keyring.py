@@ -0,0 +1,118 @@
+import json
+import os
+from uuid import uuid4
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from brain.application.abstractions.token_verifier import TokenInvalidError
+from brain.infrastructure.jwt.keyring import (
+    FileJwtKeyringSource,
+    JwtKeyring,
+    StaticJwtKeyringSource,
+    build_jwt_key,
+    parse_jwt_keyring,
+)
+from brain.infrastructure.jwt.service import JwtService
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def _public_pem(private_key) -> str:
+    return (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "private_key"),
+    [
+        ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+        ("ES256", ec.generate_private_key(ec.SECP256R1())),
+    ],
+)
+def test_asymmetric_token_verifies_with_public_key_only(algorithm, private_key):
+    user_id = uuid4()
+    signer = JwtService(
+        access_token_lifetime=60,
+        keyring_source=StaticJwtKeyringSource(
+            JwtKeyring(
+                active_kid="k1",
+                keys={"k1": build_jwt_key(kid="k1", algorithm=algorithm, key=_private_pem(private_key))},
+            )
+        ),
+    )
+    verifier_keyring = parse_jwt_keyring(
+        {
+            "active_kid": "local",
+            "keys": [
+                {"kid": "local", "algorithm": "HS256", "key": "local-secret"},
+                {"kid": "k1", "algorithm": algorithm, "public_key": _public_pem(private_key)},
+            ],
+        }
+    )
+    verifier = JwtService(access_token_lifetime=60, keyring_source=StaticJwtKeyringSource(verifier_keyring))
+
+    token = signer.create_token(payload={"user_id": user_id})
+
+    assert verifier.decode_token(token.access_token)["user_id"] == user_id.hex
+    assert [jwk["kid"] for jwk in verifier.get_public_jwks()] == ["k1"]
+
+
+def test_rotated_keyring_keeps_verifying_tokens_of_previous_kid(tmp_path):
+    keyring_path = tmp_path / "keyring.json"
+    keyring_path.write_text(
+        json.dumps({"active_kid": "old", "keys": [{"kid": "old", "algorithm": "HS256", "key": "old-secret"}]})
+    )
+    source = FileJwtKeyringSource(path=str(keyring_path), reload_interval=0)
+    service = JwtService(access_token_lifetime=60, keyring_source=source)
+    old_token = service.create_token(payload={"user_id": 1})
+
+    keyring_path.write_text(
+        json.dumps(
+            {
+                "active_kid": "new",
+                "keys": [
+                    {"kid": "new", "algorithm": "HS256", "key": "new-secret"},
+                    {"kid": "old", "algorithm": "HS256", "key": "old-secret"},
+                ],
+            }
+        )
+    )
+    stat = keyring_path.stat()
+    os.utime(keyring_path, (stat.st_atime, stat.st_mtime + 1))
+    new_token = service.create_token(payload={"user_id": 2})
+
+    assert source.get_keyring().active_kid == "new"
+    assert service.decode_token(old_token.access_token)["user_id"] == 1
+    assert service.decode_token(new_token.access_token)["user_id"] == 2
+
+
+def test_unknown_kid_is_rejected():
+    signer = JwtService(
+        access_token_lifetime=60,
+        keyring_source=StaticJwtKeyringSource(
+            JwtKeyring(
+                active_kid="other",
+                keys={"other": build_jwt_key(kid="other", algorithm="HS256", key="secret")},
+            )
+        ),
+    )
+    verifier = JwtService(secret_key="secret", access_token_lifetime=60, algorithm="HS256")
+
+    token = signer.create_token(payload={"user_id": 1})
+
+    with pytest.raises(TokenInvalidError):
+        verifier.decode_token(token.access_token)
@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import HashtagCount
+from brain.application.interactors.drafts.get_draft_hashtag_counts import GetDraftHashtagCountsInteractor
+
+
+@pytest.mark.asyncio
+async def test_get_counts_reads_counter_table_without_dates():
+    # setup: counters hold the totals
+    hashtags_repo = AsyncMock()
+    drafts_repo = AsyncMock()
+    counts = [HashtagCount(hashtag="idea", count=2)]
+    hashtags_repo.get_user_hashtag_counts.return_value = counts
+    interactor = GetDraftHashtagCountsInteractor(hashtags_repo=hashtags_repo, drafts_repo=drafts_repo)
+    user_id = uuid4()
+
+    # action: request totals
+    result = await interactor.get_counts(user_id=user_id)
+
+    # check: drafts are not aggregated
+    assert result == counts
+    hashtags_repo.get_user_hashtag_counts.assert_awaited_once_with(user_id)
+    drafts_repo.count_hashtags_by_user.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_counts_counts_drafts_for_date_range():
+    # setup: a date range cannot be answered from totals
+    hashtags_repo = AsyncMock()
+    drafts_repo = AsyncMock()
+    drafts_repo.count_hashtags_by_user.return_value = []
+    interactor = GetDraftHashtagCountsInteractor(hashtags_repo=hashtags_repo, drafts_repo=drafts_repo)
+    user_id = uuid4()
+    from_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    # action: request counts since a date
+    await interactor.get_counts(user_id=user_id, from_date=from_date)
+
+    # check: the ranged aggregate is used
+    drafts_repo.count_hashtags_by_user.assert_awaited_once_with(user_id=user_id, from_date=from_date, to_date=None)
+    hashtags_repo.get_user_hashtag_counts.assert_not_called()
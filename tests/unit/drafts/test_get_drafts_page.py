@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import DraftCursor
+from brain.application.interactors.drafts.get_drafts import GetDraftsInteractor
+from brain.domain.entities.draft import Draft
+from brain.presentation.api.routes.drafts.mappers import decode_draft_cursor, encode_draft_cursor
+
+
+def _drafts(count: int) -> list[Draft]:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [Draft(id=uuid4(), user_id=uuid4(), created_at=now - timedelta(minutes=index)) for index in range(count)]
+
+
+def _read_repositories(drafts_repo: AsyncMock) -> AsyncMock:
+    read_repositories = AsyncMock()
+    read_repositories.get_drafts_repo.return_value = drafts_repo
+    return read_repositories
+
+
+@pytest.mark.asyncio
+async def test_get_drafts_page_returns_cursor_when_more_rows_exist():
+    # setup: repository returns one row more than requested
+    drafts = _drafts(3)
+    drafts_repo = AsyncMock()
+    drafts_repo.get_page_by_user.return_value = drafts
+    interactor = GetDraftsInteractor(read_repositories=_read_repositories(drafts_repo))
+    user_id = uuid4()
+
+    # action: request a page of two summaries
+    page = await interactor.get_drafts_page(user_id=user_id, limit=2, summary=True, hashtags=["#Idea"])
+
+    # check: extra row is dropped and the cursor points at the last returned draft
+    assert page.drafts == drafts[:2]
+    assert page.next_cursor == DraftCursor(created_at=drafts[1].created_at, id=drafts[1].id)
+    drafts_repo.get_page_by_user.assert_awaited_once_with(
+        user_id=user_id,
+        limit=3,
+        after=None,
+        summary=True,
+        from_date=None,
+        to_date=None,
+        hashtags=["idea"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_drafts_page_without_limit_has_no_cursor():
+    # setup: repository returns every draft
+    drafts = _drafts(2)
+    drafts_repo = AsyncMock()
+    drafts_repo.get_page_by_user.return_value = drafts
+    interactor = GetDraftsInteractor(read_repositories=_read_repositories(drafts_repo))
+
+    # action: request without limit
+    page = await interactor.get_drafts_page(user_id=uuid4())
+
+    # check: all drafts, no next page
+    assert page.drafts == drafts
+    assert page.next_cursor is None
+    assert drafts_repo.get_page_by_user.await_args.kwargs["limit"] is None
+
+
+def test_draft_cursor_round_trip():
+    # setup: cursor with timezone-aware timestamp
+    cursor = DraftCursor(created_at=datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc), id=uuid4())
+
+    # action: encode and decode
+    decoded = decode_draft_cursor(encode_draft_cursor(cursor))
+
+    # check: same position
+    assert decoded == cursor
+
+
+@pytest.mark.parametrize("value", ["", "not-base64!", "W10", "WyJ4IiwgInkiXQ"])
+def test_decode_draft_cursor_rejects_garbage(value: str):
+    # action + check: malformed cursors raise ValueError
+    with pytest.raises(ValueError):
+        decode_draft_cursor(value)
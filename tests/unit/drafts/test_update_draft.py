@@ -0,0 +1,118 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors.drafts.dto import UpdateDraft
+from brain.application.interactors.drafts.exceptions import DraftNotFoundException, UpdateDraftForbiddenException
+from brain.application.interactors.drafts.update_draft import UpdateDraftInteractor
+from brain.application.types import Unset
+from brain.domain.entities.draft import Draft
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+@pytest.fixture
+def drafts_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def hashtag_sync_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def interactor(drafts_repo, hashtag_sync_service):
+    uow = FakeUnitOfWork()
+    return UpdateDraftInteractor(
+        drafts_repo=drafts_repo,
+        hashtag_sync_service=hashtag_sync_service,
+        uow_factory=lambda: uow,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_draft_skips_hashtag_sync_when_set_is_unchanged(interactor, drafts_repo, hashtag_sync_service):
+    # setup: stored draft already carries the same hashtags
+    user_id = uuid4()
+    stored = Draft(id=uuid4(), user_id=user_id, text="Plan #work edited", hashtags=["work"])
+    drafts_repo.update_for_user.return_value = stored
+
+    # action: replace the text
+    result = await interactor.update_draft(UpdateDraft(draft_id=stored.id, user_id=user_id, text="Plan #work edited"))
+
+    # check: one owner-scoped update, no lookups and no hashtag rewrite
+    assert result is stored
+    assert result.hashtags == ["work"]
+    drafts_repo.update_for_user.assert_awaited_once()
+    assert drafts_repo.update_for_user.await_args.kwargs["user_id"] == user_id
+    drafts_repo.get_plain_by_id.assert_not_called()
+    drafts_repo.get_by_id.assert_not_called()
+    hashtag_sync_service.sync.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_draft_syncs_changed_hashtags(interactor, drafts_repo, hashtag_sync_service):
+    # setup: stored hashtags differ from the new text
+    user_id = uuid4()
+    stored = Draft(id=uuid4(), user_id=user_id, text="Plan #ideas", hashtags=["work"])
+    drafts_repo.update_for_user.return_value = stored
+
+    # action: replace the text
+    result = await interactor.update_draft(UpdateDraft(draft_id=stored.id, user_id=user_id, text="Plan #ideas"))
+
+    # check: hashtags are synced and returned from memory
+    hashtag_sync_service.sync.assert_awaited_once_with(draft_id=stored.id, user_id=user_id, text="Plan #ideas")
+    assert result.hashtags == ["ideas"]
+
+
+@pytest.mark.asyncio
+async def test_update_draft_applies_patch_to_locked_row(interactor, drafts_repo):
+    # setup: stored draft text
+    user_id = uuid4()
+    draft_id = uuid4()
+    drafts_repo.get_plain_by_id.return_value = Draft(id=draft_id, user_id=user_id, text="hello")
+    drafts_repo.update_for_user.return_value = Draft(id=draft_id, user_id=user_id, text="hello world")
+    patch = "@@ -1,5 +1,11 @@\n hello\n+ world\n"
+
+    # action: patch the draft
+    await interactor.update_draft(UpdateDraft(draft_id=draft_id, user_id=user_id, patch=patch))
+
+    # check: patched text is written with the owner check
+    drafts_repo.get_plain_by_id.assert_awaited_once_with(draft_id, for_update=True)
+    kwargs = drafts_repo.update_for_user.await_args.kwargs
+    assert kwargs["text"] == "hello world"
+    assert kwargs["file_id"] is Unset
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("existing_owner", "expected_exception"),
+    [(None, DraftNotFoundException), ("other", UpdateDraftForbiddenException)],
+)
+async def test_update_draft_distinguishes_missing_and_foreign_drafts(
+    interactor, drafts_repo, existing_owner, expected_exception
+):
+    # setup: owner-scoped update matches no row
+    draft_id = uuid4()
+    drafts_repo.update_for_user.return_value = None
+    drafts_repo.get_plain_by_id.return_value = (
+        Draft(id=draft_id, user_id=uuid4()) if existing_owner else None
+    )
+
+    # action / check
+    with pytest.raises(expected_exception):
+        await interactor.update_draft(UpdateDraft(draft_id=draft_id, user_id=uuid4(), text="x"))
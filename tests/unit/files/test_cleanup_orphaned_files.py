@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors.cleanup_orphaned_files import CleanupOrphanedFilesInteractor
+from brain.config.models import S3Config
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_only_unreferenced_objects():
+    # setup: two released paths, one referenced again
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_orphaned_objects.side_effect = [["free.jpg", "shared.jpg"]]
+    s3_files_repo.count_by_path.side_effect = lambda path: 1 if path == "shared.jpg" else 0
+    file_storage = AsyncMock()
+    interactor = CleanupOrphanedFilesInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=S3Config(
+            external_host="http://files.example.com",
+            endpoint_url="http://localhost:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="test-bucket",
+            orphan_cleanup_batch_size=10,
+        ),
+        uow_factory=FakeUnitOfWork,
+    )
+
+    # action: run the sweeper
+    deleted = await interactor.execute()
+
+    # check: referenced object kept, both queue entries consumed
+    assert deleted == 1
+    file_storage.delete.assert_awaited_once_with("free.jpg")
+    assert [call.args[0] for call in s3_files_repo.delete_orphaned_object.await_args_list] == [
+        "free.jpg",
+        "shared.jpg",
+    ]
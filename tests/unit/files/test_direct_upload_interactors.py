@@ -0,0 +1,224 @@
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from brain.application.abstractions.storage.files import PresignedUpload, StoredObjectInfo
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors.complete_file_upload import (
+    CompleteFileUploadInteractor,
+    FileUploadNotCompletedException,
+)
+from brain.application.interactors.get_file import FileNotFoundException
+from brain.application.interactors.get_file_download_url import GetFileDownloadUrlInteractor
+from brain.application.interactors.request_file_upload import RequestFileUploadInteractor
+from brain.application.interactors.upload_file import FileTooLargeException
+from brain.application.services.file_deduplication import FileDeduplicationService
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3File, S3FileStatus
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+def _s3_config() -> S3Config:
+    return S3Config(
+        external_host="http://files.example.com",
+        endpoint_url="http://localhost:9000",
+        access_key_id="key",
+        secret_access_key="secret",
+        bucket_name="test-bucket",
+        max_upload_size=100,
+        presigned_url_ttl=60,
+    )
+
+
+OWNER_ID = uuid4()
+
+
+def _pending_file(size: int = 10, owner_id: UUID = OWNER_ID) -> S3File:
+    return S3File(
+        id=uuid4(),
+        name="file.png",
+        path="file.png",
+        content_type="image/png",
+        size=size,
+        status=S3FileStatus.PENDING,
+        owner_id=owner_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_upload_creates_pending_file():
+    # setup: storage returns presigned PUT
+    file_storage = AsyncMock()
+    file_storage.create_upload_url.return_value = PresignedUpload(
+        url="https://s3/signed",
+        method="PUT",
+        headers={"Content-Type": "image/png"},
+    )
+    s3_files_repo = AsyncMock()
+    uow = FakeUnitOfWork()
+    interactor = RequestFileUploadInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+        uow_factory=lambda: uow,
+    )
+
+    # action: request upload ticket
+    ticket = await interactor.request_upload(
+        owner_id=OWNER_ID,
+        filename="photo.png",
+        size=10,
+        content_type="image/png",
+    )
+
+    # check: pending row stored with declared size and ticket returned
+    created = s3_files_repo.create.await_args.kwargs["entity"]
+    assert created.status == S3FileStatus.PENDING
+    assert created.size == 10
+    assert created.owner_id == OWNER_ID
+    assert created.path.endswith(".png")
+    assert ticket.file_id == created.id
+    assert ticket.upload_url == "https://s3/signed"
+    assert file_storage.create_upload_url.await_args.kwargs["expires_in"] == 60
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_request_upload_rejects_oversized_file():
+    # setup: interactor with small upload limit
+    interactor = RequestFileUploadInteractor(
+        file_storage=AsyncMock(),
+        s3_files_repo=AsyncMock(),
+        s3_config=_s3_config(),
+        uow_factory=FakeUnitOfWork,
+    )
+
+    # action / check: declared size above limit is rejected
+    with pytest.raises(FileTooLargeException):
+        await interactor.request_upload(owner_id=OWNER_ID, filename="big.bin", size=101)
+
+
+@pytest.mark.asyncio
+async def test_complete_upload_marks_file_ready_after_head():
+    # setup: object exists with the declared size
+    file = _pending_file()
+    file_storage = AsyncMock()
+    file_storage.get_object_info.return_value = StoredObjectInfo(size=10, content_type="image/png", sha256="abc")
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = file
+    s3_files_repo.get_by_sha256.return_value = None
+    uow = FakeUnitOfWork()
+    interactor = CompleteFileUploadInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+        uow_factory=lambda: uow,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=s3_files_repo),
+    )
+
+    # action: complete upload
+    output = await interactor.complete_upload(file.id, user_id=OWNER_ID)
+
+    # check: file is finalised with checksum reported by S3
+    assert file.status == S3FileStatus.READY
+    assert file.sha256 == "abc"
+    s3_files_repo.update.assert_awaited_once_with(file)
+    uow.commit.assert_awaited_once()
+    assert output.url == "http://files.example.com/file.png"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("info", [None, StoredObjectInfo(size=11, content_type="image/png", sha256=None)])
+async def test_complete_upload_rejects_missing_or_mismatched_object(info):
+    # setup: object missing or with a different size
+    file = _pending_file()
+    file_storage = AsyncMock()
+    file_storage.get_object_info.return_value = info
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = file
+    interactor = CompleteFileUploadInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+        uow_factory=FakeUnitOfWork,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=s3_files_repo),
+    )
+
+    # action / check: completion fails and file stays pending
+    with pytest.raises(FileUploadNotCompletedException):
+        await interactor.complete_upload(file.id, user_id=OWNER_ID)
+    assert file.status == S3FileStatus.PENDING
+    s3_files_repo.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_download_url_is_not_issued_for_pending_file():
+    # setup: pending file
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = _pending_file()
+    file_storage = AsyncMock()
+    interactor = GetFileDownloadUrlInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+    )
+
+    # action / check: pending files are hidden
+    with pytest.raises(FileNotFoundException):
+        await interactor.get_download_url(uuid4(), user_id=OWNER_ID)
+    file_storage.create_download_url.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_upload_hides_file_of_another_user():
+    # setup: pending file requested by someone else
+    file = _pending_file(owner_id=uuid4())
+    file_storage = AsyncMock()
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = file
+    interactor = CompleteFileUploadInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+        uow_factory=FakeUnitOfWork,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=s3_files_repo),
+    )
+
+    # action / check: file is reported as missing and left untouched
+    with pytest.raises(FileNotFoundException):
+        await interactor.complete_upload(file.id, user_id=OWNER_ID)
+    file_storage.get_object_info.assert_not_awaited()
+    s3_files_repo.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_download_url_is_not_issued_for_file_of_another_user():
+    # setup: ready file owned by someone else
+    file = _pending_file(owner_id=uuid4())
+    file.status = S3FileStatus.READY
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = file
+    file_storage = AsyncMock()
+    interactor = GetFileDownloadUrlInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        s3_config=_s3_config(),
+    )
+
+    # action / check
+    with pytest.raises(FileNotFoundException):
+        await interactor.get_download_url(file.id, user_id=OWNER_ID)
+    file_storage.create_download_url.assert_not_awaited()
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.services.image_thumbnailer import Thumbnail
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors.generate_file_thumbnails import GenerateFileThumbnailsInteractor
+from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3File, S3FileStatus
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+def _build_interactor(file: S3File | None, thumbnails: list[Thumbnail]):
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_id.return_value = file
+    file_storage = AsyncMock()
+    file_storage.download.return_value = b"original"
+    image_thumbnailer = AsyncMock()
+    image_thumbnailer.make_thumbnails.return_value = thumbnails
+    interactor = GenerateFileThumbnailsInteractor(
+        file_storage=file_storage,
+        s3_files_repo=s3_files_repo,
+        image_thumbnailer=image_thumbnailer,
+        s3_config=S3Config(
+            external_host="http://files.example.com",
+            endpoint_url="http://localhost:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="test-bucket",
+            thumbnail_sizes="160,480",
+        ),
+        uow_factory=FakeUnitOfWork,
+    )
+    return interactor, s3_files_repo, file_storage, image_thumbnailer
+
+
+@pytest.mark.asyncio
+async def test_generate_thumbnails_stores_webp_rows_linked_to_original():
+    # setup: ready jpeg with two resulting thumbnails
+    file = S3File(id=uuid4(), name="a.jpg", path="a.jpg", content_type="image/jpeg", sha256="abc")
+    thumbnails = [
+        Thumbnail(size=160, content=b"small", content_type="image/webp"),
+        Thumbnail(size=480, content=b"large", content_type="image/webp"),
+    ]
+    interactor, s3_files_repo, file_storage, image_thumbnailer = _build_interactor(file, thumbnails)
+
+    # action: generate thumbnails
+    result = await interactor.generate_thumbnails(file.id)
+
+    # check: original downloaded once, thumbnails uploaded and stored as children
+    file_storage.download.assert_awaited_once_with("a.jpg")
+    image_thumbnailer.make_thumbnails.assert_awaited_once_with(b"original", [160, 480])
+    assert [call.kwargs["object_name"] for call in file_storage.upload.await_args_list] == [
+        "thumbnails/abc/160.webp",
+        "thumbnails/abc/480.webp",
+    ]
+    created = [call.kwargs["entity"] for call in s3_files_repo.create.await_args_list]
+    assert created == result
+    assert [(item.parent_id, item.thumbnail_size, item.size) for item in created] == [
+        (file.id, 160, 5),
+        (file.id, 480, 5),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "file",
+    [
+        None,
+        S3File(id=uuid4(), name="a.pdf", path="a.pdf", content_type="application/pdf"),
+        S3File(id=uuid4(), name="a.jpg", path="a.jpg", content_type="image/jpeg", status=S3FileStatus.PENDING),
+        S3File(
+            id=uuid4(),
+            name="a.jpg",
+            path="a.jpg",
+            content_type="image/jpeg",
+            thumbnails=[S3File(id=uuid4(), name="t", path="t", content_type="image/webp", thumbnail_size=160)],
+        ),
+    ],
+    ids=["missing", "not-image", "pending", "already-done"],
+)
+async def test_generate_thumbnails_skips_files_without_work(file: S3File | None):
+    # setup: file that must not be processed
+    interactor, s3_files_repo, file_storage, _ = _build_interactor(file, [])
+
+    # action: generate thumbnails
+    result = await interactor.generate_thumbnails(uuid4())
+
+    # check: nothing is downloaded or stored
+    assert result == []
+    file_storage.download.assert_not_awaited()
+    s3_files_repo.create.assert_not_awaited()
@@ -3,9 +3,12 @@ from unittest.mock import Mock, AsyncMock
 
 import pytest
 
+from brain.application.abstractions.storage.files import StoredFile
 from brain.application.abstractions.uow import IUnitOfWork
-from brain.application.interactors.upload_file import UploadFileInteractor
+from brain.application.services.file_deduplication import FileDeduplicationService
+from brain.application.interactors.upload_file import FileTooLargeException, UploadFileInteractor
 from brain.config.models import S3Config
+from brain.domain.entities.s3_file import S3File
 
 
 class FakeUnitOfWork(IUnitOfWork):
@@ -24,8 +27,9 @@ class FakeUnitOfWork(IUnitOfWork):
 @pytest.mark.asyncio
 async def test_upload_file_uses_filename_extension():
     # setup: create interactor with mocked dependencies
-    mock_file_storage = Mock()
+    mock_file_storage = AsyncMock()
     mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = None
     s3_config = S3Config(
         external_host="http://files.example.com",
         endpoint_url="http://localhost:9000",
@@ -39,6 +43,7 @@ async def test_upload_file_uses_filename_extension():
         s3_files_repo=mock_s3_files_repo,
         s3_config=s3_config,
         uow_factory=lambda: uow,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
     )
 
     # action: upload file with extension in filename
@@ -70,8 +75,9 @@ async def test_upload_file_uses_filename_extension():
 @pytest.mark.asyncio
 async def test_upload_file_uses_bin_when_filename_has_no_extension():
     # setup: create interactor with mocked dependencies
-    mock_file_storage = Mock()
+    mock_file_storage = AsyncMock()
     mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = None
     s3_config = S3Config(
         external_host="http://files.example.com",
         endpoint_url="http://localhost:9000",
@@ -85,6 +91,7 @@ async def test_upload_file_uses_bin_when_filename_has_no_extension():
         s3_files_repo=mock_s3_files_repo,
         s3_config=s3_config,
         uow_factory=lambda: uow,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
     )
 
     # action: upload file with no extension in filename
@@ -101,3 +108,159 @@ async def test_upload_file_uses_bin_when_filename_has_no_extension():
     assert file.content_type == "application/octet-stream"
     assert file.url == f"http://files.example.com/{upload_call['object_name']}"
     uow.commit.assert_awaited_once()
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_upload_file_stream_records_size_and_checksum():
+    # setup: storage reports streamed size and checksum
+    mock_file_storage = AsyncMock()
+    mock_file_storage.upload_stream = AsyncMock(return_value=StoredFile(size=7, sha256="abc"))
+    mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = None
+    uow = FakeUnitOfWork()
+    interactor = UploadFileInteractor(
+        file_storage=mock_file_storage,
+        s3_files_repo=mock_s3_files_repo,
+        s3_config=S3Config(
+            external_host="http://files.example.com",
+            endpoint_url="http://localhost:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="test-bucket",
+        ),
+        uow_factory=lambda: uow,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
+    )
+
+    # action: upload chunked content
+    file = await interactor.upload_file_stream(
+        filename="clip.mp4",
+        chunks=_chunks(b"con", b"tent"),
+        content_type="video/mp4",
+    )
+
+    # check: file row carries streamed metadata
+    upload_call = mock_file_storage.upload_stream.await_args.kwargs
+    assert re.fullmatch(r"[0-9a-f-]+\.mp4", upload_call["object_name"])
+    created = mock_s3_files_repo.create.await_args.kwargs["entity"]
+    assert created.size == 7
+    assert created.sha256 == "abc"
+    assert file.path == upload_call["object_name"]
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_stream_skips_empty_file():
+    # setup: storage reports an empty stream
+    mock_file_storage = AsyncMock()
+    mock_file_storage.upload_stream = AsyncMock(return_value=StoredFile(size=0, sha256=""))
+    mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = None
+    interactor = UploadFileInteractor(
+        file_storage=mock_file_storage,
+        s3_files_repo=mock_s3_files_repo,
+        s3_config=Mock(),
+        uow_factory=FakeUnitOfWork,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
+    )
+
+    # action: upload empty stream
+    file = await interactor.upload_file_stream(filename="empty.txt", chunks=_chunks())
+
+    # check: no file row is created
+    assert file is None
+    mock_s3_files_repo.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_stream_rejects_file_over_limit():
+    # setup: storage consumes the stream like a real upload
+    async def _consume(chunks, object_name, content_type=None):
+        async for _ in chunks:
+            pass
+        return StoredFile(size=0, sha256="")
+
+    mock_file_storage = Mock()
+    mock_file_storage.upload_stream = AsyncMock(side_effect=_consume)
+    mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = None
+    interactor = UploadFileInteractor(
+        file_storage=mock_file_storage,
+        s3_files_repo=mock_s3_files_repo,
+        s3_config=S3Config(
+            external_host="http://files.example.com",
+            endpoint_url="http://localhost:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="test-bucket",
+            max_upload_size=5,
+        ),
+        uow_factory=FakeUnitOfWork,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
+    )
+
+    # action / check: the stream is cut off once the limit is passed
+    with pytest.raises(FileTooLargeException):
+        await interactor.upload_file_stream(filename="big.bin", chunks=_chunks(b"abc", b"def"))
+    mock_s3_files_repo.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_reuses_object_with_same_content():
+    # setup: identical bytes are already stored
+    mock_file_storage = AsyncMock()
+    mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = S3File(
+        name="existing.pdf",
+        path="existing.pdf",
+        content_type="application/pdf",
+    )
+    uow = FakeUnitOfWork()
+    interactor = UploadFileInteractor(
+        file_storage=mock_file_storage,
+        s3_files_repo=mock_s3_files_repo,
+        s3_config=Mock(external_host="http://files.example.com"),
+        uow_factory=lambda: uow,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
+    )
+
+    # action: upload the same content again
+    file = await interactor.upload_file(filename="copy.pdf", content=b"content")
+
+    # check: no PUT, new row references the existing object
+    mock_file_storage.upload.assert_not_awaited()
+    assert file.path == "existing.pdf"
+    assert mock_s3_files_repo.create.await_args.kwargs["entity"].sha256 == mock_s3_files_repo.get_by_sha256.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_upload_file_stream_drops_duplicate_object():
+    # setup: streamed bytes match an existing object
+    mock_file_storage = AsyncMock()
+    mock_file_storage.upload_stream.return_value = StoredFile(size=7, sha256="abc")
+    mock_s3_files_repo = AsyncMock()
+    mock_s3_files_repo.get_by_sha256.return_value = S3File(
+        name="existing.mp4",
+        path="existing.mp4",
+        content_type="video/mp4",
+    )
+    interactor = UploadFileInteractor(
+        file_storage=mock_file_storage,
+        s3_files_repo=mock_s3_files_repo,
+        s3_config=Mock(external_host="http://files.example.com", max_upload_size=100),
+        uow_factory=FakeUnitOfWork,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=mock_s3_files_repo),
+    )
+
+    # action: stream a duplicate
+    file = await interactor.upload_file_stream(filename="clip.mp4", chunks=_chunks(b"content"))
+
+    # check: new copy is queued for cleanup and the row points at the old one
+    uploaded_name = mock_file_storage.upload_stream.await_args.kwargs["object_name"]
+    mock_s3_files_repo.add_orphaned_object.assert_awaited_once_with(uploaded_name)
+    assert file.path == "existing.mp4"
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from neo4j._async.io import AsyncBolt
+
+from brain.config.models import Neo4jConfig
+from brain.infrastructure.graph.connection import create_driver
+from brain.infrastructure.graph.pool_stats import collect_neo4j_pool_stats
+
+
+def _config() -> Neo4jConfig:
+    return Neo4jConfig(
+        host="localhost",
+        port=7687,
+        user="neo4j",
+        password="neo4j",
+        max_connection_pool_size=7,
+        connection_acquisition_timeout=2.5,
+        max_connection_lifetime=600,
+        fetch_size=250,
+    )
+
+
+def test_create_driver_applies_pool_settings():
+    # setup: config with non-default pool settings
+    config = _config()
+
+    # action: build the driver without connecting
+    driver = create_driver(config)
+
+    # check: settings reach the pool and session defaults
+    pool_config = driver._pool.pool_config
+    workspace_config = driver._default_workspace_config
+    assert pool_config.max_connection_pool_size == 7
+    assert pool_config.max_connection_lifetime == 600
+    assert workspace_config.connection_acquisition_timeout == 2.5
+    assert workspace_config.fetch_size == 250
+
+
+def test_collect_neo4j_pool_stats_reports_busiest_server():
+    # setup: two servers with mixed busy and idle connections
+    busy = SimpleNamespace(in_use=True)
+    free = SimpleNamespace(in_use=False)
+    driver = SimpleNamespace(
+        _pool=SimpleNamespace(
+            pool_config=SimpleNamespace(max_connection_pool_size=4),
+            connections={"a": [busy, busy, busy, free], "b": [busy, free]},
+        ),
+    )
+
+    # action: collect stats
+    stats = collect_neo4j_pool_stats(driver)
+
+    # check: totals summed, utilisation taken from server "a"
+    assert stats.in_use == 4
+    assert stats.idle == 2
+    assert stats.max_size == 4
+    assert stats.utilisation == 0.75
+
+
+def test_collect_neo4j_pool_stats_reads_a_real_driver():
+    # setup: real driver, built without connecting. pool_stats reads private driver
+    # internals, so this fails as soon as a driver upgrade renames them.
+    driver = create_driver(_config())
+
+    # action: collect stats from the untouched pool
+    stats = collect_neo4j_pool_stats(driver)
+
+    # check: the pool exposes what pool_stats reads, connections still flag their use
+    assert stats.in_use == 0
+    assert stats.idle == 0
+    assert stats.max_size == 7
+    assert hasattr(driver._pool, "connections")
+    assert isinstance(AsyncBolt.in_use, bool)
@@ -0,0 +1,68 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors import SweepOrphanKeywordsInteractor
+from brain.config.models import Neo4jConfig
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+def _config(enabled: bool) -> Neo4jConfig:
+    return Neo4jConfig(
+        host="localhost",
+        port=7687,
+        user="neo4j",
+        password="neo4j",
+        orphan_keyword_sweep_enabled=enabled,
+        orphan_keyword_sweep_batch_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_orphans_in_batches():
+    # setup: two full batches followed by a partial one
+    notes_graph_repo = AsyncMock()
+    notes_graph_repo.delete_orphan_keywords.side_effect = [2, 2, 1]
+    interactor = SweepOrphanKeywordsInteractor(
+        notes_graph_repo=notes_graph_repo,
+        neo4j_config=_config(enabled=True),
+        uow_factory=FakeUnitOfWork,
+    )
+
+    # action: run the sweeper
+    deleted = await interactor.execute()
+
+    # check: batches run until one comes back short
+    assert deleted == 5
+    assert [call.kwargs["limit"] for call in notes_graph_repo.delete_orphan_keywords.await_args_list] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_sweep_is_noop_when_disabled():
+    # setup: sweeper switched off
+    notes_graph_repo = AsyncMock()
+    interactor = SweepOrphanKeywordsInteractor(
+        notes_graph_repo=notes_graph_repo,
+        neo4j_config=_config(enabled=False),
+        uow_factory=FakeUnitOfWork,
+    )
+
+    # action: run the sweeper
+    deleted = await interactor.execute()
+
+    # check: graph is not touched
+    assert deleted == 0
+    notes_graph_repo.delete_orphan_keywords.assert_not_awaited()
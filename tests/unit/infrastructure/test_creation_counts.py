@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from brain.infrastructure.db.models.creation_count import CreationCountKind
+from brain.infrastructure.db.repositories.creation_counts import change_creation_counts, creation_bucket_start
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def test_creation_bucket_start_truncates_to_quarter_hour():
+    # setup/action: aware and naive timestamps
+    aware = creation_bucket_start(datetime(2024, 1, 1, 23, 44, 59, tzinfo=ZoneInfo("Asia/Kathmandu")))
+    naive = creation_bucket_start(datetime(2024, 1, 1, 18, 29, 0))
+
+    # check: both land on the UTC quarter hour
+    assert aware == datetime(2024, 1, 1, 17, 45, tzinfo=timezone.utc)
+    assert naive == datetime(2024, 1, 1, 18, 15, tzinfo=timezone.utc)
+
+
+def test_quarter_hour_buckets_fall_into_one_local_day():
+    # setup: zones with whole, half and three-quarter hour offsets
+    zones = ["America/Los_Angeles", "Asia/Kolkata", "Asia/Kathmandu", "Australia/Eucla"]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    for zone in zones:
+        tz = ZoneInfo(zone)
+        for step in range(96):
+            # action: bucket a range of minutes
+            bucket = start + timedelta(minutes=15 * step)
+
+            # check: the first and last minute of a bucket share a local date
+            assert bucket.astimezone(tz).date() == (bucket + timedelta(minutes=14, seconds=59)).astimezone(tz).date()
+
+
+@pytest.mark.asyncio
+async def test_change_creation_counts_groups_rows_per_bucket():
+    # setup: three rows, two in one bucket
+    session = RecordingSession()
+    user_id = uuid4()
+    created = [
+        (user_id, datetime(2024, 1, 1, 10, 1, tzinfo=timezone.utc)),
+        (user_id, datetime(2024, 1, 1, 10, 14, tzinfo=timezone.utc)),
+        (user_id, datetime(2024, 1, 1, 10, 15, tzinfo=timezone.utc)),
+    ]
+
+    # action: decrement
+    await change_creation_counts(session, CreationCountKind.DRAFT, created, delta=-1)
+
+    # check: one upsert with per-bucket deltas, then empty buckets are dropped
+    upsert, cleanup = session.statements
+    params = upsert.compile(dialect=postgresql.dialect()).params
+    assert sorted(value for key, value in params.items() if key.startswith("count")) == [-2, -1]
+    assert "ON CONFLICT" in str(upsert.compile(dialect=postgresql.dialect()))
+    assert "count <= " in str(cleanup.compile(dialect=postgresql.dialect()))
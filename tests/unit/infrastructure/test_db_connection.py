@@ -0,0 +1,81 @@
+import pytest
+
+from brain.config.models import DatabaseConfig
+from brain.infrastructure.db.connection import build_connect_args, create_engine, parse_server_settings
+from brain.infrastructure.db.pool_stats import (
+    CheckoutLatencyTracker,
+    TimedAsyncAdaptedQueuePool,
+    collect_database_pool_stats,
+)
+
+
+def _config(**kwargs) -> DatabaseConfig:
+    return DatabaseConfig(
+        host="localhost",
+        port=5432,
+        database="brain",
+        user="brain",
+        password="secret",
+        **kwargs,
+    )
+
+
+def test_create_engine_applies_pool_and_asyncpg_settings():
+    # setup: config with non-default pool and connection settings
+    config = _config(
+        pool_size=3,
+        max_overflow=2,
+        pool_timeout=1.5,
+        pool_pre_ping=False,
+        prepared_statement_cache_size=0,
+        statement_timeout=5000,
+        server_settings="application_name=brain, lock_timeout=1000",
+    )
+
+    # action: build the engine without connecting
+    engine = create_engine(config)
+
+    # check: pool sizing and per-connection settings are applied
+    pool = engine.pool
+    assert isinstance(pool, TimedAsyncAdaptedQueuePool)
+    assert pool.size() == 3
+    assert pool._max_overflow == 2
+    assert pool._timeout == 1.5
+    assert pool._pre_ping is False
+    assert engine.url.query["prepared_statement_cache_size"] == "0"
+    assert build_connect_args(config) == {
+        "statement_cache_size": 0,
+        "server_settings": {
+            "application_name": "brain",
+            "lock_timeout": "1000",
+            "statement_timeout": "5000",
+        },
+    }
+
+
+def test_parse_server_settings_rejects_malformed_items():
+    # setup/action/check: valid pairs parsed, missing separator rejected
+    assert parse_server_settings("a=1,,b = x") == {"a": "1", "b": "x"}
+    with pytest.raises(ValueError):
+        parse_server_settings("statement_timeout")
+
+
+def test_collect_database_pool_stats_reports_cumulative_checkouts():
+    # setup: idle engine with recorded checkouts
+    engine = create_engine(_config(pool_size=4, max_overflow=4))
+    tracker: CheckoutLatencyTracker = engine.pool.checkout_latency
+    tracker.record(0.010)
+    tracker.record(0.030)
+    tracker.record_timeout()
+
+    # action: collect twice
+    first = collect_database_pool_stats(engine)
+    second = collect_database_pool_stats(engine)
+
+    # check: saturation from checked out connections, counters keep growing between scrapes
+    assert first.max_size == 8
+    assert first.checked_out == 0
+    assert first.saturation == 0.0
+    assert (first.checkouts_total, first.checkout_timeouts_total) == (2, 1)
+    assert first.checkout_seconds_total == pytest.approx(0.040)
+    assert second == first
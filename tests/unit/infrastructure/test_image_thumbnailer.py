@@ -0,0 +1,53 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from brain.infrastructure.images.thumbnailer import PillowImageThumbnailer
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color=(200, 10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_make_thumbnails_downscales_to_webp():
+    # setup: landscape jpeg larger than both sizes
+    thumbnailer = PillowImageThumbnailer(quality=70)
+
+    # action: build two thumbnails
+    thumbnails = await thumbnailer.make_thumbnails(_jpeg(1200, 600), [480, 160])
+
+    # check: smallest first, longest edge fits each size
+    assert [thumbnail.size for thumbnail in thumbnails] == [160, 480]
+    for thumbnail in thumbnails:
+        assert thumbnail.content_type == "image/webp"
+        with Image.open(BytesIO(thumbnail.content)) as image:
+            assert image.format == "WEBP"
+            assert image.size == (thumbnail.size, thumbnail.size // 2)
+
+
+@pytest.mark.asyncio
+async def test_make_thumbnails_skips_sizes_not_smaller_than_original():
+    # setup: small image
+    thumbnailer = PillowImageThumbnailer()
+
+    # action: request a larger and a smaller size
+    thumbnails = await thumbnailer.make_thumbnails(_jpeg(300, 200), [480, 160])
+
+    # check: no upscaled copy is produced
+    assert [thumbnail.size for thumbnail in thumbnails] == [160]
+
+
+@pytest.mark.asyncio
+async def test_make_thumbnails_ignores_undecodable_content():
+    # setup: bytes that are not an image
+    thumbnailer = PillowImageThumbnailer()
+
+    # action: build thumbnails
+    thumbnails = await thumbnailer.make_thumbnails(b"not an image", [160])
+
+    # check: nothing is produced
+    assert thumbnails == []
@@ -0,0 +1,271 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY, CollectorRegistry
+from redis.exceptions import ResponseError
+
+from brain.config.models import MetricsConfig
+from brain.infrastructure.monitoring.metrics import DATABASE_POOLS, start_worker_metrics_server
+from brain.infrastructure.monitoring.pool_stats import PoolStatsCollector
+from brain.infrastructure.monitoring.repositories import instrumented_repository
+from brain.infrastructure.monitoring.taskiq_queue import TaskiqQueueMonitor
+from brain.main.entrypoints.taskiq.__main__ import main as taskiq_main
+from brain.presentation.api.middlewares import metrics_middleware
+from brain.presentation.api.routes.metrics import get_router as get_metrics_router
+
+PID = str(os.getpid())
+
+
+@dataclass(frozen=True, kw_only=True)
+class FakePoolStats:
+    in_use: int
+    checkouts_total: int
+
+
+class FakeStreamsRedis:
+    def __init__(self, groups: dict[str, list[dict]], lengths: dict[str, int]):
+        self._groups = groups
+        self._lengths = lengths
+
+    async def xinfo_groups(self, stream: str) -> list[dict]:
+        if stream not in self._groups:
+            raise ResponseError("no such key")
+        return self._groups[stream]
+
+    async def xlen(self, stream: str) -> int:
+        return self._lengths.get(stream, 0)
+
+
+def test_pool_stats_collector_merges_pools_into_labelled_families():
+    # setup: collector with two pools and a broken one
+    collector = PoolStatsCollector("test_pool")
+    collector.add_pool("primary", lambda: FakePoolStats(in_use=2, checkouts_total=10))
+    collector.add_pool("replica", lambda: FakePoolStats(in_use=1, checkouts_total=4))
+    collector.add_pool("broken", lambda: 1 / 0)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    # action: scrape
+    in_use = registry.get_sample_value("test_pool_in_use", {"pool": "replica", "pid": PID})
+    checkouts = registry.get_sample_value("test_pool_checkouts_total", {"pool": "primary", "pid": PID})
+    collector.remove_pool("primary")
+
+    # check: fields become gauges and counters labelled by process, removed pools disappear
+    assert in_use == 1
+    assert checkouts == 10
+    assert registry.get_sample_value("test_pool_in_use", {"pool": "primary", "pid": PID}) is None
+
+
+@pytest.mark.asyncio
+async def test_instrumented_repository_records_public_coroutines():
+    # setup: repository with a public and a private coroutine
+    @instrumented_repository
+    class TimedFakeRepository:
+        async def get(self, value: int) -> int:
+            return await self._load(value)
+
+        async def _load(self, value: int) -> int:
+            return value * 2
+
+    labels = {"repository": "TimedFakeRepository", "method": "get"}
+
+    # action: call the public method
+    result = await TimedFakeRepository().get(21)
+
+    # check: result passes through, only the public method is timed
+    assert result == 42
+    assert REGISTRY.get_sample_value("repository_call_duration_seconds_count", labels) == 1
+    assert (
+        REGISTRY.get_sample_value(
+            "repository_call_duration_seconds_count",
+            {"repository": "TimedFakeRepository", "method": "_load"},
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_taskiq_queue_monitor_reports_lag_and_pending():
+    # setup: one consumed stream, one without the group and one not created yet
+    redis = FakeStreamsRedis(
+        groups={
+            "test_tasks": [{"name": "other", "lag": 9, "pending": 9}, {"name": "workers", "lag": 3, "pending": 2}],
+            "test_updates": [],
+        },
+        lengths={"test_updates": 5},
+    )
+    monitor = TaskiqQueueMonitor(
+        redis=redis,
+        queues=[("test_tasks", "workers"), ("test_updates", "bots"), ("test_missing", "workers")],
+    )
+
+    # action: refresh gauges
+    await monitor.refresh()
+
+    # check: lag of our group, stream length without a group, zero for missing streams
+    depth = {
+        queue: REGISTRY.get_sample_value("taskiq_queue_depth", {"queue": queue})
+        for queue in ("test_tasks", "test_updates", "test_missing")
+    }
+    assert depth == {"test_tasks": 3, "test_updates": 5, "test_missing": 0}
+    assert REGISTRY.get_sample_value("taskiq_queue_pending", {"queue": "test_tasks"}) == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_labels_requests_by_route_template():
+    # setup: app with a parametrised route
+    app = FastAPI()
+    app.middleware("http")(metrics_middleware)
+
+    @app.get("/test-items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/test-items/{item_id}", "status": "200"}
+    before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    # action: request two different items and an unknown path
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/test-items/1")
+        await client.get("/test-items/2")
+        await client.get("/test-unknown")
+
+    # check: both items share the template label, nothing left in flight
+    assert REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 2
+    assert (
+        REGISTRY.get_sample_value(
+            "http_request_duration_seconds_count",
+            {"method": "GET", "route": "unmatched", "status": "404"},
+        )
+        >= 1
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "http_requests_in_progress",
+            {"method": "GET"},
+        )
+        == 0
+    )
+
+
+def test_worker_metrics_server_serves_all_processes_and_tolerates_a_taken_port(monkeypatch, tmp_path):
+    # setup: shared multiprocess directory, port already bound by a sibling worker process
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    start_http_server = MagicMock(side_effect=OSError("Address already in use"))
+    monkeypatch.setattr("brain.infrastructure.monitoring.metrics.start_http_server", start_http_server)
+    DATABASE_POOLS.add_pool("test_worker", lambda: FakePoolStats(in_use=2, checkouts_total=10))
+
+    # action
+    try:
+        start_worker_metrics_server(9100)
+        registry = start_http_server.call_args.kwargs["registry"]
+        in_use = registry.get_sample_value("db_pool_in_use", {"pool": "test_worker", "pid": PID})
+    finally:
+        DATABASE_POOLS.remove_pool("test_worker")
+
+    # check: multiprocess registry that still carries the pool collectors
+    start_http_server.assert_called_once()
+    assert start_http_server.call_args.args == (9100,)
+    assert registry is not REGISTRY
+    assert in_use == 2
+
+
+def test_taskiq_entrypoint_removes_its_metrics_directory(monkeypatch):
+    # setup: no multiprocess directory configured, worker command that records its environment
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    seen_dirs = []
+
+    def call(command: list[str], env: dict[str, str]) -> int:
+        seen_dirs.append(Path(env["PROMETHEUS_MULTIPROC_DIR"]))
+        assert seen_dirs[0].is_dir()
+        return 3
+
+    monkeypatch.setattr("brain.main.entrypoints.taskiq.__main__.subprocess.call", call)
+
+    # action
+    exit_code = taskiq_main()
+
+    # check: the directory existed for the workers and is gone once they exit
+    assert exit_code == 3
+    assert len(seen_dirs) == 1
+    assert not seen_dirs[0].exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("token", "authorization", "expected_status"),
+    [
+        ("", "Bearer ", 404),
+        ("secret", None, 401),
+        ("secret", "Bearer wrong", 401),
+        ("secret", "Bearer secret", 200),
+    ],
+)
+async def test_metrics_endpoint_requires_configured_token(token, authorization, expected_status):
+    # setup: metrics route with the given token
+    class MetricsTestProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def get_metrics_config(self) -> MetricsConfig:
+            return MetricsConfig(token=token)
+
+        @provide
+        def get_queue_monitor(self) -> TaskiqQueueMonitor:
+            return AsyncMock(spec=TaskiqQueueMonitor)
+
+    app = FastAPI()
+    app.include_router(get_metrics_router())
+    container = make_async_container(MetricsTestProvider())
+    setup_dishka(container=container, app=app)
+    headers = {"Authorization": authorization} if authorization is not None else {}
+
+    # action
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/metrics", headers=headers)
+    await container.close()
+
+    # check
+    assert response.status_code == expected_status
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_multiprocess_registry(monkeypatch, tmp_path):
+    # setup: API workers sharing a multiprocess directory, one pool in this process
+    class MetricsTestProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def get_metrics_config(self) -> MetricsConfig:
+            return MetricsConfig(token="secret")
+
+        @provide
+        def get_queue_monitor(self) -> TaskiqQueueMonitor:
+            return AsyncMock(spec=TaskiqQueueMonitor)
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    app = FastAPI()
+    app.include_router(get_metrics_router())
+    container = make_async_container(MetricsTestProvider())
+    setup_dishka(container=container, app=app)
+    DATABASE_POOLS.add_pool("test_api", lambda: FakePoolStats(in_use=1, checkouts_total=3))
+
+    # action
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+    finally:
+        DATABASE_POOLS.remove_pool("test_api")
+        await container.close()
+
+    # check: per-process collectors of the default registry are gone, pools are labelled by pid
+    assert response.status_code == 200
+    assert "python_gc_objects_collected_total" not in response.text
+    assert f'db_pool_in_use{{pid="{PID}",pool="test_api"}} 1.0' in response.text
@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from brain.infrastructure.db.replica import ReadRepositoryRouter
+from brain.infrastructure.db.repositories.notes import NotesRepository
+from brain.infrastructure.db.write_tracking import NullRecentUserWrites, record_user_write
+from brain.infrastructure.uow.backends import SqlAlchemyTransactionController
+from brain.infrastructure.uow.context import UnitOfWorkContext
+
+
+def _replica_session_maker() -> MagicMock:
+    replica_session = MagicMock()
+    replica_session.close = AsyncMock()
+    return MagicMock(return_value=replica_session)
+
+
+@pytest.mark.asyncio
+async def test_router_uses_replica_for_users_without_recent_writes():
+    # setup: replica configured, no recent writes
+    session_maker = _replica_session_maker()
+    primary_notes_repo = AsyncMock()
+    router = ReadRepositoryRouter(
+        notes_repo=primary_notes_repo,
+        drafts_repo=AsyncMock(),
+        replica_session_maker=session_maker,
+        recent_writes=NullRecentUserWrites(),
+    )
+
+    # action: ask for notes repositories twice and close
+    first = await router.get_notes_repo(uuid4())
+    second = await router.get_notes_repo(uuid4())
+    await router.close()
+
+    # check: both are bound to one replica session, closed with the request
+    assert isinstance(first, NotesRepository)
+    assert isinstance(second, NotesRepository)
+    session_maker.assert_called_once_with()
+    session_maker.return_value.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_router_sticks_to_primary_after_recent_write():
+    # setup: user wrote recently
+    session_maker = _replica_session_maker()
+    recent_writes = AsyncMock()
+    recent_writes.is_recent.return_value = True
+    primary_drafts_repo = AsyncMock()
+    router = ReadRepositoryRouter(
+        notes_repo=AsyncMock(),
+        drafts_repo=primary_drafts_repo,
+        replica_session_maker=session_maker,
+        recent_writes=recent_writes,
+    )
+
+    # action: ask for the drafts repository
+    drafts_repo = await router.get_drafts_repo(uuid4())
+
+    # check: primary repository returned, no replica session opened
+    assert drafts_repo is primary_drafts_repo
+    session_maker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_router_falls_back_to_primary_when_tracker_fails():
+    # setup: stickiness lookup is unavailable
+    recent_writes = AsyncMock()
+    recent_writes.is_recent.side_effect = ConnectionError("redis down")
+    primary_notes_repo = AsyncMock()
+    router = ReadRepositoryRouter(
+        notes_repo=primary_notes_repo,
+        drafts_repo=AsyncMock(),
+        replica_session_maker=_replica_session_maker(),
+        recent_writes=recent_writes,
+    )
+
+    # action/check: reads go to the primary
+    assert await router.get_notes_repo(uuid4()) is primary_notes_repo
+
+
+@pytest.mark.asyncio
+async def test_sql_controller_marks_written_users_before_commit():
+    # setup: session with writes of two users
+    session = MagicMock()
+    session.info = {}
+    session.commit = AsyncMock()
+    recent_writes = AsyncMock()
+    first_user, second_user = uuid4(), uuid4()
+    record_user_write(session, first_user)
+    record_user_write(session, second_user)
+    controller = SqlAlchemyTransactionController(session=session, recent_writes=recent_writes)
+    context = UnitOfWorkContext()
+    await controller.begin(context)
+
+    # action: commit twice
+    await controller.commit(context)
+    await controller.commit(context)
+
+    # check: users marked once, recorded writes consumed
+    recent_writes.mark.assert_awaited_once_with({first_user, second_user})
+    assert session.commit.await_count == 2
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from brain.infrastructure.s3.executor import ThreadPoolS3Executor
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_executor_keeps_event_loop_free():
+    # setup: executor with a bounded pool and a blocking call
+    executor = ThreadPoolS3Executor(max_workers=2)
+    loop_thread = threading.get_ident()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def blocking_call() -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return threading.get_ident()
+
+    # action: run more calls than workers while the loop keeps ticking
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker_task = asyncio.create_task(ticker())
+    thread_ids = await asyncio.gather(*(executor.run(blocking_call) for _ in range(6)))
+    ticker_task.cancel()
+    executor.shutdown()
+
+    # check: calls ran off the loop thread, the pool bound held and the loop was not blocked
+    assert loop_thread not in thread_ids
+    assert peak == 2
+    assert ticks > 5
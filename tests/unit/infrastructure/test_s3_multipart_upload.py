@@ -0,0 +1,101 @@
+import hashlib
+
+import pytest
+
+from brain.infrastructure.s3.executor import S3Executor
+from brain.infrastructure.s3.multipart import S3MultipartStreamUploader
+
+
+class FakeS3Client:
+    def __init__(self, fail_on_part: int | None = None):
+        self.fail_on_part = fail_on_part
+        self.put_calls: list[tuple[str, bytes]] = []
+        self.parts: list[tuple[int, bytes]] = []
+        self.completed: list[dict] | None = None
+        self.aborted: list[str] = []
+
+    def upload_file(self, file_content: bytes, object_name: str, content_type: str | None = None) -> str:
+        self.put_calls.append((object_name, file_content))
+        return object_name
+
+    def create_multipart_upload(self, object_name: str, content_type: str | None = None) -> str:
+        return "upload-1"
+
+    def upload_part(self, object_name: str, upload_id: str, part_number: int, body: bytes) -> str:
+        if part_number == self.fail_on_part:
+            raise RuntimeError("part failed")
+        self.parts.append((part_number, bytes(body)))
+        return f"etag-{part_number}"
+
+    def complete_multipart_upload(self, object_name: str, upload_id: str, parts: list[dict]) -> None:
+        self.completed = parts
+
+    def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        self.aborted.append(upload_id)
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_splits_into_parts_and_hashes():
+    # setup: stream larger than two parts
+    client = FakeS3Client()
+    uploader = S3MultipartStreamUploader(s3_client=client, executor=S3Executor(), part_size=10)
+    data = bytes(range(25))
+
+    # action: upload stream in small chunks
+    stored = await uploader.upload(_chunks(data, 3), "file.bin", "application/octet-stream")
+
+    # check: bounded parts uploaded in order, size and checksum recorded
+    assert [number for number, _ in client.parts] == [1, 2, 3]
+    assert all(len(body) <= 10 + 2 for body in [body for _, body in client.parts])
+    assert b"".join(body for _, body in client.parts) == data
+    assert client.completed == [{"PartNumber": n, "ETag": f"etag-{n}"} for n in (1, 2, 3)]
+    assert client.put_calls == []
+    assert stored.size == 25
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_uses_single_put_for_small_files():
+    # setup: stream smaller than one part
+    client = FakeS3Client()
+    uploader = S3MultipartStreamUploader(s3_client=client, executor=S3Executor(), part_size=10)
+
+    # action: upload short stream
+    stored = await uploader.upload(_chunks(b"hello", 2), "file.txt")
+
+    # check: plain put without multipart
+    assert client.put_calls == [("file.txt", b"hello")]
+    assert client.parts == []
+    assert stored.size == 5
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_skips_empty_stream():
+    # setup: empty stream
+    client = FakeS3Client()
+    uploader = S3MultipartStreamUploader(s3_client=client, executor=S3Executor(), part_size=10)
+
+    # action: upload nothing
+    stored = await uploader.upload(_chunks(b"", 2), "file.txt")
+
+    # check: nothing written
+    assert client.put_calls == []
+    assert stored.size == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_aborts_on_failure():
+    # setup: second part fails
+    client = FakeS3Client(fail_on_part=2)
+    uploader = S3MultipartStreamUploader(s3_client=client, executor=S3Executor(), part_size=10)
+
+    # action / check: error propagates and multipart upload is aborted
+    with pytest.raises(RuntimeError):
+        await uploader.upload(_chunks(bytes(30), 5), "file.bin")
+    assert client.aborted == ["upload-1"]
+    assert client.completed is None
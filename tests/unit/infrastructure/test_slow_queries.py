@@ -0,0 +1,121 @@
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from typing_extensions import Self
+
+from brain.config.models import SlowQueryConfig
+from brain.infrastructure.db.slow_queries import instrument_slow_queries
+from brain.infrastructure.graph.repositories.notes import NotesGraphRepository
+from brain.infrastructure.monitoring.repositories import current_repository_method
+from brain.infrastructure.monitoring.slow_queries import SlowQueryLog, normalize_statement, redact_parameters
+
+SLOW_SQLITE_QUERY = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 300000) SELECT count(*) FROM c"
+)
+
+
+class SlowCypherResult:
+    def __init__(self, records: list[dict]):
+        self._records = records
+
+    async def to_eager_result(self) -> SimpleNamespace:
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(records=self._records)
+
+    async def consume(self) -> SimpleNamespace:
+        return SimpleNamespace(profile={"operatorType": "ProduceResults", "dbHits": 7}, plan=None)
+
+
+class SlowCypherSession:
+    def __init__(self):
+        self.queries: list[str] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def run(self, query: str, **params: object) -> SlowCypherResult:
+        self.queries.append(query)
+        return SlowCypherResult([{"c": 1}])
+
+
+class FakeDriver:
+    def __init__(self, session: SlowCypherSession):
+        self._session = session
+
+    def session(self, **kwargs: object) -> SlowCypherSession:
+        return self._session
+
+
+def test_normalize_statement_hides_literals_but_keeps_placeholders():
+    # setup/action
+    statement = normalize_statement("SELECT *\n  FROM notes\n WHERE title = 'it''s' AND n2 > 10 AND id = $1")
+
+    # check
+    assert statement == "SELECT * FROM notes WHERE title = ? AND n2 > ? AND id = $1"
+
+
+def test_redact_parameters_keeps_shape_only():
+    # setup/action/check: values never leave, types and sizes do
+    assert redact_parameters(("secret", 5, None)) == ["<str len=6>", "<int>", None]
+    assert redact_parameters({"ids": ["a", "b"]}) == {"ids": "<list len=2>"}
+    assert redact_parameters([("a",), ("b",)]) == {"rows": 2, "first": ["<str len=1>"]}
+
+
+def test_slow_sql_statement_is_logged_with_repository_method(caplog: pytest.LogCaptureFixture):
+    # setup: engine with a 1 ms threshold, called from inside a repository method
+    engine = create_engine("sqlite://")
+    instrument_slow_queries(engine, SlowQueryLog(SlowQueryConfig(threshold_ms=1)))
+    token = current_repository_method.set("NotesRepository.get_many")
+
+    # action
+    try:
+        with caplog.at_level(logging.WARNING), engine.connect() as conn:
+            conn.execute(text(SLOW_SQLITE_QUERY))
+            conn.execute(text("SELECT 1"))
+    finally:
+        current_repository_method.reset(token)
+
+    # check: only the slow statement is reported, normalised and attributed
+    messages = [record.getMessage() for record in caplog.records if record.name.endswith("slow_queries")]
+    assert len(messages) == 1
+    assert "Slow sql statement" in messages[0]
+    assert "in NotesRepository.get_many" in messages[0]
+    assert "x < ?" in messages[0]
+
+
+@pytest.mark.asyncio
+async def test_slow_cypher_query_writes_sampled_profile(tmp_path, caplog: pytest.LogCaptureFixture):
+    # setup: repository whose read session is slow, every slow query sampled
+    plan_log_path = tmp_path / "plans" / "query_plans.jsonl"
+    slow_query_log = SlowQueryLog(
+        SlowQueryConfig(threshold_ms=1, plan_sample_rate=1.0, plan_log_path=str(plan_log_path)),
+    )
+    session = SlowCypherSession()
+    repo = NotesGraphRepository(
+        driver=FakeDriver(session),
+        database="neo4j",
+        tx_accessor=None,
+        slow_query_log=slow_query_log,
+    )
+
+    # action
+    with caplog.at_level(logging.WARNING):
+        count = await repo.count_notes_by_user_and_title(uuid4(), "Title")
+    slow_query_log.close()
+
+    # check: the read is re-run under PROFILE and the plan lands in the rotating file
+    assert count == 1
+    assert session.queries[1].startswith("PROFILE ")
+    (entry,) = [json.loads(line) for line in plan_log_path.read_text().splitlines()]
+    assert entry["backend"] == "cypher"
+    assert entry["repository_method"] == "NotesGraphRepository.count_notes_by_user_and_title"
+    assert entry["plan"] == {"operatorType": "ProduceResults", "dbHits": 7}
+    assert any("Slow cypher statement" in record.getMessage() for record in caplog.records)
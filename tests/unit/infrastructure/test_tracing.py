@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from taskiq import TaskiqMessage, TaskiqResult
+
+from brain.application.interactors.factory import InteractorProvider
+from brain.infrastructure.db.tracing import instrument_engine_tracing
+from brain.infrastructure.graph.repositories.notes import NotesGraphRepository
+from brain.infrastructure.monitoring.provider import TracingProvider
+from brain.infrastructure.monitoring.taskiq_tracing import TaskiqTracingMiddleware
+from brain.infrastructure.monitoring.tracing import trace_methods, tracer
+from brain.infrastructure.s3.executor import S3Executor
+from brain.presentation.api.middlewares import tracing_middleware
+
+
+class FakeInteractor:
+    async def execute(self, value: int) -> int:
+        return await self._double(value)
+
+    async def _double(self, value: int) -> int:
+        return value * 2
+
+
+class FakeNeo4jResult:
+    async def to_eager_result(self) -> SimpleNamespace:
+        return SimpleNamespace(records=[{"c": 1}])
+
+
+class FakeNeo4jSession:
+    def __init__(self):
+        self.queries: list[str] = []
+
+    async def run(self, query: str, **params: object) -> FakeNeo4jResult:
+        self.queries.append(query)
+        return FakeNeo4jResult()
+
+
+def _message(task_id: str = "task-1") -> TaskiqMessage:
+    return TaskiqMessage(task_id=task_id, task_name="brain:test_task", labels={}, args=[], kwargs={})
+
+
+@pytest.mark.asyncio
+async def test_trace_methods_wraps_public_coroutines(span_exporter: InMemorySpanExporter):
+    # setup: interactor instance wrapped the way TracingProvider does it
+    interactor = trace_methods(FakeInteractor())
+
+    # action
+    result = await interactor.execute(21)
+
+    # check: one span for the public method, none for private helpers
+    assert result == 42
+    assert [span.name for span in span_exporter.get_finished_spans()] == ["FakeInteractor.execute"]
+
+
+def test_tracing_provider_decorates_every_interactor():
+    # setup/action
+    provider = TracingProvider()
+
+    # check
+    assert len(provider.decorators) == len(InteractorProvider().factories)
+
+
+def test_engine_statements_become_child_spans(span_exporter: InMemorySpanExporter):
+    # setup: instrumented in-memory engine
+    engine = create_engine("sqlite://")
+    instrument_engine_tracing(engine)
+
+    # action: run statements under a parent span, one of them failing
+    with tracer.start_as_current_span("parent"), engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+
+    # check: statement spans are parented and failures are marked
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    statements = [span for span in span_exporter.get_finished_spans() if span.name == "SELECT"]
+    assert len(statements) == 2
+    assert all(span.parent.span_id == spans["parent"].context.span_id for span in statements)
+    assert statements[0].attributes["db.statement"] == "SELECT 1"
+    assert statements[1].status.status_code == StatusCode.ERROR
+
+
+@pytest.mark.asyncio
+async def test_neo4j_runs_are_traced_with_statement(span_exporter: InMemorySpanExporter):
+    # setup: repository with a fake session
+    repo = NotesGraphRepository(driver=None, database="neo4j", tx_accessor=None)
+    session = FakeNeo4jSession()
+
+    # action
+    result = await repo._run_read(session, "RETURN 1 AS c")
+
+    # check: records are returned and the run is a client span
+    assert result.records == [{"c": 1}]
+    (span,) = span_exporter.get_finished_spans()
+    assert span.name == "neo4j.run"
+    assert span.attributes["db.statement"] == "RETURN 1 AS c"
+
+
+@pytest.mark.asyncio
+async def test_s3_executor_traces_calls(span_exporter: InMemorySpanExporter):
+    # setup
+    def put_object(key: str) -> str:
+        return key
+
+    # action
+    result = await S3Executor().run(put_object, "key")
+
+    # check
+    assert result == "key"
+    assert [span.name for span in span_exporter.get_finished_spans()] == ["s3.put_object"]
+
+
+def test_taskiq_middleware_continues_sender_trace(span_exporter: InMemorySpanExporter):
+    # setup: a message sent from inside a traced request
+    middleware = TaskiqTracingMiddleware()
+    message = _message()
+    with tracer.start_as_current_span("request") as request_span:
+        middleware.pre_send(message)
+
+    # action: execute it with an error
+    middleware.pre_execute(message)
+    with tracer.start_as_current_span("interactor"):
+        pass
+    error = RuntimeError("boom")
+    middleware.on_error(message, TaskiqResult(is_err=True, return_value=None, execution_time=0.0, error=error), error)
+    middleware.post_execute(message, TaskiqResult(is_err=True, return_value=None, execution_time=0.0, error=error))
+
+    # check: task span continues the request trace and parents spans opened by the task
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    task_span = spans["taskiq brain:test_task"]
+    assert "traceparent" in message.labels
+    assert task_span.context.trace_id == request_span.get_span_context().trace_id
+    assert task_span.parent.span_id == request_span.get_span_context().span_id
+    assert spans["interactor"].parent.span_id == task_span.context.span_id
+    assert task_span.status.status_code == StatusCode.ERROR
+
+
+@pytest.mark.asyncio
+async def test_tracing_middleware_names_spans_by_route_template(span_exporter: InMemorySpanExporter):
+    # setup: app with a parametrised route
+    app = FastAPI()
+    app.middleware("http")(tracing_middleware)
+
+    @app.get("/test-items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    # action: request an item and an unknown path
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/test-items/1")
+        await client.get("/test-unknown")
+
+    # check: spans are named after the matched template
+    spans = span_exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["GET /test-items/{item_id}", "GET unmatched"]
+    assert spans[0].attributes["http.route"] == "/test-items/{item_id}"
+    assert spans[0].attributes["http.response.status_code"] == 200
@@ -0,0 +1,155 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from brain.infrastructure.redis.update_queue import TelegramUpdateQueue
+
+
+class FakeLock:
+    def __init__(self, redis: "FakeRedis", name: str):
+        self._redis = redis
+        self._name = name
+
+    async def acquire(self, blocking: bool = True) -> bool:
+        if self._name in self._redis.locks:
+            return False
+        self._redis.locks.add(self._name)
+        return True
+
+    async def reacquire(self) -> bool:
+        self._redis.reacquired.append(self._name)
+        return True
+
+    async def owned(self) -> bool:
+        return self._name in self._redis.locks
+
+    async def release(self) -> None:
+        self._redis.locks.discard(self._name)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = defaultdict(list)
+        self.locks: set[str] = set()
+        self.reacquired: list[str] = []
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def rpush(self, key: str, value: str) -> None:
+        self.lists[key].append(value)
+
+    async def lpop(self, key: str) -> str | None:
+        if not self.lists[key]:
+            return None
+        return self.lists[key].pop(0)
+
+    async def lindex(self, key: str, index: int) -> str | None:
+        return self.lists[key][index] if self.lists[key] else None
+
+    async def lmove(self, source: str, destination: str, src: str, dest: str) -> str | None:
+        value = await self.lpop(source)
+        if value is not None:
+            self.lists[destination].append(value)
+        return value
+
+    async def llen(self, key: str) -> int:
+        return len(self.lists[key])
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+    async def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+    def lock(self, name: str, timeout: int) -> FakeLock:
+        return FakeLock(self, name)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_deduplicates_by_update_id():
+    queue = TelegramUpdateQueue(redis=FakeRedis(), dedupe_ttl=60, lock_timeout=60)
+
+    first = await queue.enqueue(update_id=1, ordering_key="chat:1", payload="a")
+    retry = await queue.enqueue(update_id=1, ordering_key="chat:1", payload="a")
+
+    assert (first, retry) == (True, False)
+
+
+@pytest.mark.asyncio
+async def test_drain_processes_chat_updates_in_order_and_extends_lock_per_update():
+    redis = FakeRedis()
+    queue = TelegramUpdateQueue(redis=redis, dedupe_ttl=60, lock_timeout=60)
+    for update_id, payload in enumerate(["a", "b", "c"]):
+        await queue.enqueue(update_id=update_id, ordering_key="chat:1", payload=payload)
+    handled: list[str] = []
+
+    async def handler(payload: str) -> None:
+        handled.append(payload)
+
+    processed = await queue.drain(ordering_key="chat:1", handler=handler)
+
+    assert processed == 3
+    assert handled == ["a", "b", "c"]
+    assert redis.reacquired == ["tg_updates:lock:chat:1"] * 3
+    assert redis.lists["tg_updates:queue:chat:1"] == []
+
+
+@pytest.mark.asyncio
+async def test_drain_retries_failed_update_then_moves_it_to_dead_letters():
+    redis = FakeRedis()
+    queue = TelegramUpdateQueue(redis=redis, dedupe_ttl=60, lock_timeout=60, max_attempts=2)
+    for update_id, payload in enumerate(["a", "b", "c"]):
+        await queue.enqueue(update_id=update_id, ordering_key="chat:1", payload=payload)
+    handled: list[str] = []
+
+    async def handler(payload: str) -> None:
+        handled.append(payload)
+        if payload == "b":
+            raise RuntimeError("boom")
+
+    processed = await queue.drain(ordering_key="chat:1", handler=handler)
+
+    assert processed == 2
+    assert handled == ["a", "b", "b", "c"]
+    assert redis.lists["tg_updates:dead:chat:1"] == ["b"]
+    assert "tg_updates:attempts:chat:1" not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_drain_keeps_update_queued_when_handler_crashes_the_worker():
+    redis = FakeRedis()
+    queue = TelegramUpdateQueue(redis=redis, dedupe_ttl=60, lock_timeout=60)
+    await queue.enqueue(update_id=1, ordering_key="chat:1", payload="a")
+
+    async def handler(payload: str) -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await queue.drain(ordering_key="chat:1", handler=handler)
+
+    assert redis.lists["tg_updates:queue:chat:1"] == ["a"]
+    assert redis.locks == set()
+
+
+@pytest.mark.asyncio
+async def test_drain_skips_when_chat_is_locked_by_another_worker():
+    redis = FakeRedis()
+    queue = TelegramUpdateQueue(redis=redis, dedupe_ttl=60, lock_timeout=60)
+    await queue.enqueue(update_id=1, ordering_key="chat:1", payload="a")
+    redis.locks.add("tg_updates:lock:chat:1")
+    handled: list[str] = []
+
+    async def handler(payload: str) -> None:
+        handled.append(payload)
+
+    processed = await queue.drain(ordering_key="chat:1", handler=handler)
+
+    assert processed == 0
+    assert handled == []
@@ -0,0 +1,105 @@
+import pytest
+from typing_extensions import Self
+
+from brain.application.interactors.users.dto import CreateOrUpdateUser
+from brain.infrastructure.redis.user_info_cache import TelegramUserInfoCache, UserInfoState
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> None:
+            self._commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list:
+        return [await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None or self.hashes.pop(key, None) is not None)
+
+    async def hset(self, key: str, field: str, value: str) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    async def hsetnx(self, key: str, field: str, value: str) -> int:
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = value
+        return 1
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+
+def _user(username: str) -> CreateOrUpdateUser:
+    return CreateOrUpdateUser(telegram_id=1, username=username, first_name="Test", last_name=None)
+
+
+@pytest.mark.asyncio
+async def test_flush_stores_fingerprints_only_after_write_succeeds():
+    # setup: known user with changed info queued for the batch
+    cache = TelegramUserInfoCache(redis=FakeRedis(), ttl=60)
+    await cache.remember(_user("old"))
+    await cache.add_pending(_user("renamed"))
+    states_during_write = []
+
+    async def write(users: list[CreateOrUpdateUser]) -> None:
+        states_during_write.append(await cache.get_state(users[0]))
+
+    # action
+    flushed = await cache.flush_pending(write)
+
+    # check: still CHANGED until committed, UNCHANGED afterwards
+    assert flushed == 1
+    assert states_during_write == [UserInfoState.CHANGED]
+    assert await cache.get_state(_user("renamed")) is UserInfoState.UNCHANGED
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_puts_pending_back_without_overwriting_newer_info():
+    # setup: write fails while a newer rename is queued
+    cache = TelegramUserInfoCache(redis=FakeRedis(), ttl=60)
+    await cache.remember(_user("old"))
+    await cache.add_pending(_user("renamed"))
+
+    async def write(users: list[CreateOrUpdateUser]) -> None:
+        await cache.add_pending(_user("renamed-again"))
+        raise RuntimeError("db is down")
+
+    # action
+    with pytest.raises(RuntimeError):
+        await cache.flush_pending(write)
+
+    # check: fingerprint untouched, newest info kept for the next flush
+    assert await cache.get_state(_user("renamed")) is UserInfoState.CHANGED
+    assert [user.username for user in await cache.pop_pending()] == ["renamed-again"]
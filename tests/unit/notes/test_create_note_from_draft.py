@@ -0,0 +1,79 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.interactors.drafts.exceptions import DraftNotFoundException
+from brain.application.interactors.notes.create_note_from_draft import CreateNoteFromDraftInteractor
+from brain.application.interactors.notes.dto import CreateNoteFromDraft
+from brain.config.models import S3Config
+from brain.domain.entities.draft import Draft
+from brain.domain.entities.user import User
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _build_interactor(draft: Draft, deleted: Draft | None):
+    user = User(id=draft.user_id, telegram_id=1, username=None, first_name="Test", last_name=None)
+    user_lookup_service = AsyncMock()
+    user_lookup_service.get_user_by_telegram_id.return_value = user
+    drafts_repo = AsyncMock()
+    drafts_repo.get_by_id.return_value = draft
+    drafts_repo.delete_by_id.return_value = deleted
+    note_creation_service = AsyncMock()
+    hashtag_sync_service = AsyncMock()
+    uow = FakeUnitOfWork()
+    interactor = CreateNoteFromDraftInteractor(
+        user_lookup_service=user_lookup_service,
+        drafts_repo=drafts_repo,
+        note_creation_service=note_creation_service,
+        hashtag_sync_service=hashtag_sync_service,
+        s3_config=S3Config(
+            external_host="http://files.example.com",
+            endpoint_url="http://localhost:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            bucket_name="test-bucket",
+        ),
+        uow_factory=lambda: uow,
+    )
+    return interactor, note_creation_service, hashtag_sync_service, uow
+
+
+@pytest.mark.asyncio
+async def test_create_note_from_draft_releases_hashtags_of_deleted_row():
+    # setup: the row removed by the delete carries a newer hashtag than the one read before
+    draft = Draft(id=uuid4(), user_id=uuid4(), text="#old", hashtags=["old"])
+    deleted = Draft(id=draft.id, user_id=draft.user_id, text="#new", hashtags=["new"])
+    interactor, note_creation_service, hashtag_sync_service, uow = _build_interactor(draft, deleted)
+
+    # action
+    await interactor.create_note_from_draft(CreateNoteFromDraft(by_user_telegram_id=1, draft_id=draft.id, title="Title"))
+
+    # check: counters follow the deleted row
+    hashtag_sync_service.release.assert_awaited_once_with(user_id=draft.user_id, hashtags=["new"])
+    note_creation_service.create_note.assert_awaited_once()
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_note_from_draft_fails_when_draft_was_deleted_concurrently():
+    # setup: another request deleted the draft between the read and the delete
+    draft = Draft(id=uuid4(), user_id=uuid4(), text="#idea", hashtags=["idea"])
+    interactor, note_creation_service, hashtag_sync_service, uow = _build_interactor(draft, deleted=None)
+
+    # action / check: no note is created and nothing is released twice
+    with pytest.raises(DraftNotFoundException):
+        await interactor.create_note_from_draft(CreateNoteFromDraft(by_user_telegram_id=1, draft_id=draft.id, title="Title"))
+    hashtag_sync_service.release.assert_not_awaited()
+    note_creation_service.create_note.assert_not_awaited()
+    uow.commit.assert_not_awaited()
@@ -14,8 +14,10 @@ async def test_export_notes():
     user_id = 123
     mock_user_interactor = AsyncMock()
     mock_notes_repo = AsyncMock()
+    mock_read_repositories = AsyncMock()
+    mock_read_repositories.get_notes_repo.return_value = mock_notes_repo
 
-    interactor = ExportNotesInteractor(mock_user_interactor, mock_notes_repo)
+    interactor = ExportNotesInteractor(mock_user_interactor, mock_read_repositories)
 
     # Mock data
     mock_user = Mock(id=uuid4(), telegram_id=user_id)
@@ -49,3 +51,4 @@ async def test_export_notes():
             assert data["text"] == "Content"
             assert data["id"] == str(note_id)
             assert data["is_archived"] is True
+    mock_read_repositories.get_notes_repo.assert_awaited_once_with(mock_user.id)
@@ -0,0 +1,141 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.uow import IUnitOfWork
+from brain.application.interactors.notes.dto import MergeNotes
+from brain.application.interactors.notes.exceptions import NoteNotFoundException
+from brain.application.interactors.notes.merge_notes import MergeNotesInteractor
+from brain.application.services.note_crud import NoteDeletionService
+from brain.application.services.note_lookup import NoteLookupService
+from brain.domain.entities.note import Note
+from brain.domain.services.note_text import NoteTextService
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+def _note(user_id, title: str) -> Note:
+    return Note(id=uuid4(), user_id=user_id, title=title, text=title, represents_keyword_id=uuid4())
+
+
+@pytest.fixture
+def user():
+    return type("UserStub", (), {"id": uuid4(), "telegram_id": 1})()
+
+
+@pytest.fixture
+def repos():
+    return AsyncMock(), AsyncMock(), AsyncMock()
+
+
+@pytest.fixture
+def note_update_service():
+    service = AsyncMock()
+    service.update_note.side_effect = lambda data, note: note
+    return service
+
+
+@pytest.fixture
+def interactor(user, repos, note_update_service):
+    notes_repo, keywords_repo, notes_graph_repo = repos
+    user_lookup_service = AsyncMock()
+    user_lookup_service.get_user_by_telegram_id.return_value = user
+    uow = FakeUnitOfWork()
+    return MergeNotesInteractor(
+        user_lookup_service=user_lookup_service,
+        note_lookup_service=NoteLookupService(notes_repo),
+        note_update_service=note_update_service,
+        note_deletion_service=NoteDeletionService(
+            notes_repo=notes_repo,
+            keywords_repo=keywords_repo,
+            notes_graph_repo=notes_graph_repo,
+        ),
+        note_text_service=NoteTextService(),
+        uow_factory=lambda: uow,
+    )
+
+
+@pytest.mark.asyncio
+async def test_merge_notes_runs_constant_statements_for_many_sources(user, repos, interactor):
+    # setup: fifty source notes and a target
+    notes_repo, keywords_repo, notes_graph_repo = repos
+    sources = [_note(user.id, f"Source {index}") for index in range(50)]
+    target = _note(user.id, "Target")
+    notes_repo.get_by_ids.return_value = [target, *sources]
+    notes_repo.delete_by_ids.return_value = sources
+    keywords_repo.get_notes_keyword_names.return_value = ["Linked"]
+
+    # action: merge all sources into the target
+    await interactor.merge_notes(
+        MergeNotes(
+            by_user_telegram_id=user.telegram_id,
+            source_note_ids=[note.id for note in sources],
+            target_note_id=target.id,
+        )
+    )
+
+    # check: every repository is hit once, no per-note round trips
+    source_ids = [note.id for note in sources]
+    notes_repo.get_by_ids.assert_awaited_once_with([*source_ids, target.id])
+    notes_repo.get_by_id.assert_not_called()
+    notes_repo.delete_by_id.assert_not_called()
+    notes_repo.delete_by_ids.assert_awaited_once_with(source_ids, user_id=user.id)
+    keywords_repo.get_notes_keyword_names.assert_awaited_once_with(source_ids)
+    keywords_repo.delete_unused_keywords.assert_awaited_once()
+    cleanup_names = keywords_repo.delete_unused_keywords.await_args.kwargs["names"]
+    assert "Linked" in cleanup_names and "Source 49" in cleanup_names
+    notes_graph_repo.delete_notes.assert_awaited_once_with(source_ids)
+    notes_graph_repo.delete_note.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_merge_notes_raises_when_a_note_is_missing(user, repos, interactor):
+    # setup: one source note does not exist
+    notes_repo, _, _ = repos
+    target = _note(user.id, "Target")
+    notes_repo.get_by_ids.return_value = [target]
+
+    # action / check
+    with pytest.raises(NoteNotFoundException):
+        await interactor.merge_notes(
+            MergeNotes(by_user_telegram_id=user.telegram_id, source_note_ids=[uuid4()], target_note_id=target.id)
+        )
+    notes_repo.delete_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_merge_notes_merges_a_repeated_source_once(user, repos, interactor, note_update_service):
+    # setup: the same source note listed twice
+    notes_repo, keywords_repo, _ = repos
+    source = _note(user.id, "Source")
+    target = _note(user.id, "Target")
+    notes_repo.get_by_ids.return_value = [target, source]
+    notes_repo.delete_by_ids.return_value = [source]
+    keywords_repo.get_notes_keyword_names.return_value = []
+
+    # action
+    await interactor.merge_notes(
+        MergeNotes(
+            by_user_telegram_id=user.telegram_id,
+            source_note_ids=[source.id, source.id],
+            target_note_id=target.id,
+        )
+    )
+
+    # check: looked up, appended and deleted once
+    notes_repo.get_by_ids.assert_awaited_once_with([source.id, target.id])
+    update = note_update_service.update_note.await_args.args[0]
+    assert update.text == "Target\nSource"
+    notes_repo.delete_by_ids.assert_awaited_once_with([source.id], user_id=user.id)
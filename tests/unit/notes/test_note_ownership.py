@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.interactors.notes.dto import UpdateNote
+from brain.application.interactors.notes.exceptions import NoteForbiddenException, NoteNotFoundException
+from brain.application.services.note_crud import NoteDeletionService, NoteUpdateService
+from brain.domain.entities.note import Note
+
+
+def _note(user_id=None) -> Note:
+    return Note(id=uuid4(), user_id=user_id or uuid4(), title="Title", text="text", represents_keyword_id=uuid4())
+
+
+@pytest.fixture
+def notes_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def keywords_repo():
+    repo = AsyncMock()
+    repo.get_note_keyword_names.return_value = ["Linked"]
+    return repo
+
+
+@pytest.fixture
+def deletion_service(notes_repo, keywords_repo):
+    return NoteDeletionService(notes_repo=notes_repo, keywords_repo=keywords_repo, notes_graph_repo=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_delete_note_uses_owner_scoped_delete(deletion_service, notes_repo, keywords_repo):
+    # setup: delete returns the removed note
+    note = _note()
+    notes_repo.delete_by_id.return_value = note
+
+    # action: delete as the owner
+    await deletion_service.delete_note(note.id, user_id=note.user_id)
+
+    # check: no separate note lookup, cleanup uses the returned note
+    notes_repo.delete_by_id.assert_awaited_once_with(note.id, user_id=note.user_id)
+    notes_repo.get_by_id.assert_not_called()
+    keywords_repo.delete_unused_keywords.assert_awaited_once_with(user_id=note.user_id, names=["Linked", "Title"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("existing", "expected_exception"),
+    [(None, NoteNotFoundException), (_note(), NoteForbiddenException)],
+)
+async def test_delete_note_distinguishes_missing_and_foreign_notes(
+    deletion_service, notes_repo, keywords_repo, existing, expected_exception
+):
+    # setup: scoped delete matched nothing
+    notes_repo.delete_by_id.return_value = None
+    notes_repo.get_by_id.return_value = existing
+
+    # action / check
+    with pytest.raises(expected_exception):
+        await deletion_service.delete_note(uuid4(), user_id=uuid4())
+    keywords_repo.delete_unused_keywords.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_note_skips_read_for_loaded_note(notes_repo):
+    # setup: caller already holds the note
+    note = _note()
+    service = NoteUpdateService(
+        notes_repo=notes_repo,
+        notes_graph_repo=AsyncMock(),
+        keywords_repo=AsyncMock(),
+        keyword_note_service=AsyncMock(),
+        note_title_service=AsyncMock(),
+        keyword_sync_service=AsyncMock(),
+    )
+
+    # action: update with the loaded note
+    result = await service.update_note(UpdateNote(note_id=note.id, text="new"), note=note)
+
+    # check: note is written without a lookup
+    assert result.text == "new"
+    notes_repo.get_by_id.assert_not_called()
+    notes_repo.update.assert_awaited_once_with(note)
@@ -1,30 +1,30 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any
 from uuid import uuid4
 
 
 @dataclass
 class FakeUser:
     id: int
-    username: Optional[str] = None
+    username: str | None = None
     first_name: str = ""
-    last_name: Optional[str] = None
+    last_name: str | None = None
     is_bot: bool = False
 
 
 @dataclass
 class FakeMessage:
     from_user: FakeUser
-    text: Optional[str] = None
-    caption: Optional[str] = None
-    photo: Optional[List[Any]] = None
-    document: Optional[Any] = None
-    video: Optional[Any] = None
-    audio: Optional[Any] = None
-    video_note: Optional[Any] = None
-    voice: Optional[Any] = None
-    bot: Optional[Any] = None
-    replies: List[str] = field(default_factory=list)
+    text: str | None = None
+    caption: str | None = None
+    photo: list[Any] | None = None
+    document: Any | None = None
+    video: Any | None = None
+    audio: Any | None = None
+    video_note: Any | None = None
+    voice: Any | None = None
+    bot: Any | None = None
+    replies: list[str] = field(default_factory=list)
 
     async def reply(self, text: str) -> None:
         self.replies.append(text)
@@ -32,7 +32,7 @@ class FakeMessage:
 
 @dataclass
 class FakeCommand:
-    args: Optional[str] = None
+    args: str | None = None
 
 
 @dataclass
@@ -47,8 +47,8 @@ class FakeCallbackQueryEvent:
 
 @dataclass
 class FakeEvent:
-    message: Optional[Any] = None
-    callback_query: Optional[Any] = None
+    message: Any | None = None
+    callback_query: Any | None = None
 
 
 @dataclass
@@ -57,9 +57,9 @@ class FakeFromUserEvent:
 
 
 class FakeContainer:
-    def __init__(self, mapping: Dict[Any, Any]):
+    def __init__(self, mapping: dict[Any, Any]):
         self._mapping = mapping
-        self.get_calls: List[Any] = []
+        self.get_calls: list[Any] = []
 
     async def get(self, key: Any) -> Any:
         self.get_calls.append(key)
@@ -68,7 +68,7 @@ class FakeContainer:
 
 class FakeDialogManager:
     def __init__(self):
-        self.start_calls: List[Dict[str, Any]] = []
+        self.start_calls: list[dict[str, Any]] = []
 
     async def start(self, **kwargs: Any) -> None:
         self.start_calls.append(kwargs)
@@ -76,10 +76,10 @@ class FakeDialogManager:
 
 class HandlerRecorder:
     def __init__(self, result: Any = None):
-        self.calls: List[tuple[Any, Any]] = []
+        self.calls: list[tuple[Any, Any]] = []
         self.result = result
 
-    async def __call__(self, event: Any, data: Dict[str, Any]) -> Any:
+    async def __call__(self, event: Any, data: dict[str, Any]) -> Any:
         self.calls.append((event, data))
         return self.result
 
@@ -87,7 +87,7 @@ class HandlerRecorder:
 class FakeCreateNoteInteractor:
     def __init__(self, error: Exception | None = None):
         self.error = error
-        self.calls: List[Any] = []
+        self.calls: list[Any] = []
 
     async def create_note(self, payload: Any) -> None:
         self.calls.append(payload)
@@ -98,7 +98,7 @@ class FakeCreateNoteInteractor:
 class FakeCreateDraftInteractor:
     def __init__(self, error: Exception | None = None):
         self.error = error
-        self.calls: List[Any] = []
+        self.calls: list[Any] = []
 
     async def create_draft(self, payload: Any) -> None:
         self.calls.append(payload)
@@ -109,7 +109,7 @@ class FakeCreateDraftInteractor:
 class FakeGetUserInteractor:
     def __init__(self, user_id: Any | None = None, error: Exception | None = None):
         self.error = error
-        self.calls: List[int] = []
+        self.calls: list[int] = []
         self.user = type("UserStub", (), {"id": user_id or uuid4()})()
 
     async def get_user_by_telegram_id(self, telegram_id: int) -> Any:
@@ -122,7 +122,7 @@ class FakeGetUserInteractor:
 class FakeUploadFileInteractor:
     def __init__(self, error: Exception | None = None):
         self.error = error
-        self.calls: List[Dict[str, Any]] = []
+        self.calls: list[dict[str, Any]] = []
         self.file_id = uuid4()
 
     async def upload_file(self, filename: str | None, content: bytes, content_type: str | None = None) -> Any:
@@ -137,10 +137,14 @@ class FakeUploadFileInteractor:
             raise self.error
         return type("UploadedFileStub", (), {"id": self.file_id})()
 
+    async def upload_file_stream(self, filename: str | None, chunks: Any, content_type: str | None = None) -> Any:
+        content = b"".join([chunk async for chunk in chunks])
+        return await self.upload_file(filename=filename, content=content, content_type=content_type)
+
 
 class FakeAuthSessionInteractor:
     def __init__(self):
-        self.calls: List[Dict[str, Any]] = []
+        self.calls: list[dict[str, Any]] = []
 
     async def attach_user_to_session(self, **kwargs: Any) -> None:
         self.calls.append(kwargs)
@@ -148,16 +152,36 @@ class FakeAuthSessionInteractor:
 
 class FakeUserInteractor:
     def __init__(self):
-        self.calls: List[Any] = []
+        self.calls: list[Any] = []
 
     async def create_or_update_user(self, payload: Any) -> None:
         self.calls.append(payload)
 
 
+class FakeUserInfoCache:
+    def __init__(self, state: Any = None, flush_scheduled: bool = True):
+        from brain.infrastructure.redis.user_info_cache import UserInfoState
+
+        self.state = state or UserInfoState.UNKNOWN
+        self.flush_scheduled = flush_scheduled
+        self.remembered: list[Any] = []
+        self.pending: list[Any] = []
+
+    async def get_state(self, payload: Any) -> Any:
+        return self.state
+
+    async def remember(self, payload: Any) -> None:
+        self.remembered.append(payload)
+
+    async def add_pending(self, payload: Any) -> bool:
+        self.pending.append(payload)
+        return self.flush_scheduled
+
+
 class FakeGetNotesInteractor:
     def __init__(self, notes: list[Any]):
         self.notes = notes
-        self.calls: List[Dict[str, Any]] = []
+        self.calls: list[dict[str, Any]] = []
 
     async def get_notes(self, **kwargs: Any) -> list[Any]:
         self.calls.append(kwargs)
@@ -167,7 +191,7 @@ class FakeGetNotesInteractor:
 class FakeGetNoteInteractor:
     def __init__(self, note: Any):
         self.note = note
-        self.calls: List[Any] = []
+        self.calls: list[Any] = []
 
     async def get_note_by_id(self, note_id: Any) -> Any:
         self.calls.append(note_id)
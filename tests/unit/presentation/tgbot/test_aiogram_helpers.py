@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 
 from aiogram.types import CallbackQuery, Chat, Message, Update, User
 
-from brain.presentation.tgbot.utils.aiogram_helpers import extract_user_from_event
+from brain.presentation.tgbot.utils.aiogram_helpers import extract_user_from_event, resolve_update_ordering_key
 
 
 def _user(user_id: int) -> User:
@@ -68,3 +68,36 @@ def test_extract_user_from_event_handles_errors():
 
     # check: errors are swallowed and None returned
     assert result is None
+
+
+def test_resolve_update_ordering_key_uses_chat():
+    # setup: message and callback query updates in the same chat
+    user = _user(3)
+    message_update = Update(update_id=3, message=_message(user))
+    callback_update = Update(
+        update_id=4,
+        callback_query=CallbackQuery(
+            id="cbq",
+            from_user=user,
+            chat_instance="inst",
+            data="x",
+            message=_message(user),
+        ),
+    )
+
+    # action: resolve ordering keys
+    keys = [resolve_update_ordering_key(message_update), resolve_update_ordering_key(callback_update)]
+
+    # check: both updates share the chat key
+    assert keys == ["chat:3", "chat:3"]
+
+
+def test_resolve_update_ordering_key_falls_back_to_update_id():
+    # setup: update without chat or user
+    event = Update(update_id=5)
+
+    # action: resolve ordering key
+    result = resolve_update_ordering_key(event)
+
+    # check: update id is used
+    assert result == "update:5"
@@ -3,7 +3,8 @@ from uuid import uuid4
 
 import pytest
 
-from brain.application.interactors import GetNoteInteractor, GetNotesInteractor
+from brain.application.interactors import GetNoteInteractor, GetNotesInteractor, GetUserInteractor
+from brain.application.interactors.users.exceptions import UserNotFoundException
 from brain.presentation.tgbot.dialogs.menus.view_notes.getters import (
     get_notes_list,
     get_note_details,
@@ -13,6 +14,7 @@ from tests.unit.presentation.tgbot.fakes import (
     FakeFromUserEvent,
     FakeGetNoteInteractor,
     FakeGetNotesInteractor,
+    FakeGetUserInteractor,
     FakeUser,
 )
 
@@ -38,7 +40,8 @@ async def test_get_notes_list_fetches_for_user():
     user = FakeUser(id=99)
     event = FakeFromUserEvent(from_user=user)
     interactor = FakeGetNotesInteractor(notes=["note-1"])
-    container = FakeContainer({GetNotesInteractor: interactor})
+    get_user = FakeGetUserInteractor()
+    container = FakeContainer({GetNotesInteractor: interactor, GetUserInteractor: get_user})
     dialog_manager = FakeDialogManager(
         middleware_data={"dishka_container": container},
         event=event,
@@ -47,11 +50,31 @@ async def test_get_notes_list_fetches_for_user():
     # action: fetch notes list data
     result = await get_notes_list(dialog_manager)
 
-    # check: interactor called with user id and notes returned
-    assert interactor.calls == [{"user_telegram_id": 99}]
+    # check: user resolved by telegram id, notes fetched by user id
+    assert get_user.calls == [99]
+    assert interactor.calls == [{"user_id": get_user.user.id}]
     assert result == {"notes": ["note-1"]}
 
 
+@pytest.mark.asyncio
+async def test_get_notes_list_is_empty_for_unknown_user():
+    # setup: telegram user without an account
+    interactor = FakeGetNotesInteractor(notes=["note-1"])
+    get_user = FakeGetUserInteractor(error=UserNotFoundException())
+    container = FakeContainer({GetNotesInteractor: interactor, GetUserInteractor: get_user})
+    dialog_manager = FakeDialogManager(
+        middleware_data={"dishka_container": container},
+        event=FakeFromUserEvent(from_user=FakeUser(id=99)),
+    )
+
+    # action
+    result = await get_notes_list(dialog_manager)
+
+    # check
+    assert result == {"notes": []}
+    assert interactor.calls == []
+
+
 @pytest.mark.asyncio
 async def test_get_note_details_uses_selected_id():
     # setup: dialog manager with chosen note id
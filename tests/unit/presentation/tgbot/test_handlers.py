@@ -38,21 +38,29 @@ class EnqueueRecorder:
         self.calls.append(telegram_id)
 
 
+class FakeBotSession:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.api = SimpleNamespace(is_local=False, file_url=lambda token, path: f"https://files/{token}/{path}")
+        self.stream_calls: list[str] = []
+
+    async def stream_content(self, url: str, timeout: int, chunk_size: int, raise_for_status: bool):
+        self.stream_calls.append(url)
+        for start in range(0, len(self.content), 4):
+            yield self.content[start : start + 4]
+
+
 class FakeBot:
     def __init__(self, file_path: str, content: bytes):
         self.file_path = file_path
-        self.content = content
+        self.token = "token"
+        self.session = FakeBotSession(content)
         self.get_file_calls: list[str] = []
-        self.download_file_calls: list[str] = []
 
     async def get_file(self, file_id: str) -> SimpleNamespace:
         self.get_file_calls.append(file_id)
         return SimpleNamespace(file_path=self.file_path)
 
-    async def download_file(self, file_path: str, destination) -> None:
-        self.download_file_calls.append(file_path)
-        destination.write(self.content)
-
 
 @pytest.mark.asyncio
 async def test_handle_start_cmd_attaches_user_when_session(monkeypatch: pytest.MonkeyPatch):
@@ -206,8 +214,15 @@ async def test_handle_message_uploads_supported_attachments_and_attaches_file_to
     telegram_file_path,
     expected_filename,
     expected_content_type,
+    monkeypatch: pytest.MonkeyPatch,
 ):
     # setup: message with supported attachment
+    enqueued: list[str] = []
+
+    async def kiq(file_id: str) -> None:
+        enqueued.append(file_id)
+
+    monkeypatch.setattr("brain.presentation.tasks.files.generate_file_thumbnails_task.kiq", kiq)
     bot = FakeBot(file_path=telegram_file_path, content=b"file-bytes")
     message = FakeMessage(
         from_user=FakeUser(id=55),
@@ -242,7 +257,8 @@ async def test_handle_message_uploads_supported_attachments_and_attaches_file_to
         CreateDraft(user_id=get_user.user.id, text="with attachment", file_id=upload_file.file_id),
     ]
     assert bot.get_file_calls == [telegram_file_id]
-    assert bot.download_file_calls == [telegram_file_path]
+    assert bot.session.stream_calls == [f"https://files/token/{telegram_file_path}"]
+    assert enqueued == [str(upload_file.file_id)]
 
 
 @pytest.mark.asyncio
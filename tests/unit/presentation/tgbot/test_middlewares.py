@@ -2,12 +2,14 @@ import pytest
 
 from brain.application.interactors import UserInteractor
 from brain.application.interactors.users.dto import CreateOrUpdateUser
+from brain.infrastructure.redis.user_info_cache import TelegramUserInfoCache, UserInfoState
 from brain.presentation.tgbot.middlewares.user_info_updater import UserInfoUpdaterMiddleware
 from tests.unit.presentation.tgbot.fakes import (
     FakeContainer,
     FakeEvent,
     FakeMessageEvent,
     FakeUser,
+    FakeUserInfoCache,
     FakeUserInteractor,
     HandlerRecorder,
 )
@@ -25,7 +27,7 @@ async def test_user_info_updater_updates_user():
     )
     event = FakeEvent(message=FakeMessageEvent(from_user=user))
     interactor = FakeUserInteractor()
-    container = FakeContainer({UserInteractor: interactor})
+    container = FakeContainer({UserInteractor: interactor, TelegramUserInfoCache: FakeUserInfoCache()})
     handler = HandlerRecorder(result="ok")
     middleware = UserInfoUpdaterMiddleware()
 
@@ -40,6 +42,7 @@ async def test_user_info_updater_updates_user():
         last_name="User",
     )
     assert interactor.calls == [expected]
+    assert container._mapping[TelegramUserInfoCache].remembered == [expected]
     assert handler.calls == [(event, {"dishka_container": container})]
     assert result == "ok"
 
@@ -56,7 +59,7 @@ async def test_user_info_updater_skips_bot_user():
     )
     event = FakeEvent(message=FakeMessageEvent(from_user=user))
     interactor = FakeUserInteractor()
-    container = FakeContainer({UserInteractor: interactor})
+    container = FakeContainer({UserInteractor: interactor, TelegramUserInfoCache: FakeUserInfoCache()})
     handler = HandlerRecorder(result="ok")
     middleware = UserInfoUpdaterMiddleware()
 
@@ -73,7 +76,7 @@ async def test_user_info_updater_skips_when_no_user():
     # setup: event without user info
     event = FakeEvent(message=None, callback_query=None)
     interactor = FakeUserInteractor()
-    container = FakeContainer({UserInteractor: interactor})
+    container = FakeContainer({UserInteractor: interactor, TelegramUserInfoCache: FakeUserInfoCache()})
     handler = HandlerRecorder(result="ok")
     middleware = UserInfoUpdaterMiddleware()
 
@@ -83,3 +86,53 @@ async def test_user_info_updater_skips_when_no_user():
     # check: user save skipped
     assert interactor.calls == []
     assert result == "ok"
+
+
+@pytest.mark.asyncio
+async def test_user_info_updater_skips_write_when_fingerprint_unchanged():
+    # setup: cached fingerprint matches the event user
+    user = FakeUser(id=123, username="tester", first_name="Test", is_bot=False)
+    event = FakeEvent(message=FakeMessageEvent(from_user=user))
+    interactor = FakeUserInteractor()
+    cache = FakeUserInfoCache(state=UserInfoState.UNCHANGED)
+    container = FakeContainer({UserInteractor: interactor, TelegramUserInfoCache: cache})
+    handler = HandlerRecorder(result="ok")
+    middleware = UserInfoUpdaterMiddleware()
+
+    # action: call middleware
+    result = await middleware(handler, event, {"dishka_container": container})
+
+    # check: no DB write and no queued update
+    assert interactor.calls == []
+    assert cache.pending == []
+    assert UserInteractor not in container.get_calls
+    assert result == "ok"
+
+
+@pytest.mark.asyncio
+async def test_user_info_updater_queues_changed_user_info(monkeypatch: pytest.MonkeyPatch):
+    # setup: cached fingerprint differs from the event user
+    user = FakeUser(id=123, username="renamed", first_name="Test", is_bot=False)
+    event = FakeEvent(message=FakeMessageEvent(from_user=user))
+    interactor = FakeUserInteractor()
+    cache = FakeUserInfoCache(state=UserInfoState.CHANGED)
+    container = FakeContainer({UserInteractor: interactor, TelegramUserInfoCache: cache})
+    handler = HandlerRecorder(result="ok")
+    middleware = UserInfoUpdaterMiddleware()
+    flush_calls = []
+
+    async def fake_kiq() -> None:
+        flush_calls.append(True)
+
+    monkeypatch.setattr(
+        "brain.presentation.tgbot.tasks.flush_user_info_updates_task.kiq",
+        fake_kiq,
+    )
+
+    # action: call middleware
+    await middleware(handler, event, {"dishka_container": container})
+
+    # check: update queued for the batch task instead of written inline
+    assert interactor.calls == []
+    assert [payload.username for payload in cache.pending] == ["renamed"]
+    assert flush_calls == [True]
@@ -5,25 +5,30 @@ import pytest
 
 from brain.application.interactors.drafts.exceptions import DraftNotFoundException
 from brain.application.services.draft_access import DraftDeletionService
+from brain.domain.entities.draft import Draft
 
 
 @pytest.mark.asyncio
 async def test_delete_draft_removes_existing_entity():
     repo = AsyncMock()
-    repo.get_by_id.return_value = object()
-    service = DraftDeletionService(repo)
-    draft_id = uuid4()
+    draft = Draft(id=uuid4(), user_id=uuid4(), text="#idea", hashtags=["idea"])
+    repo.delete_by_id.return_value = draft
+    hashtag_sync_service = AsyncMock()
+    service = DraftDeletionService(repo, hashtag_sync_service)
 
-    await service.delete_draft(draft_id)
+    await service.delete_draft(draft.id)
 
-    repo.delete_by_id.assert_called_once_with(draft_id)
+    repo.delete_by_id.assert_called_once_with(draft.id)
+    hashtag_sync_service.release.assert_called_once_with(user_id=draft.user_id, hashtags=["idea"])
 
 
 @pytest.mark.asyncio
-async def test_delete_draft_raises_if_missing():
+async def test_delete_draft_raises_if_no_row_was_deleted():
     repo = AsyncMock()
-    repo.get_by_id.return_value = None
-    service = DraftDeletionService(repo)
+    repo.delete_by_id.return_value = None
+    hashtag_sync_service = AsyncMock()
+    service = DraftDeletionService(repo, hashtag_sync_service)
 
     with pytest.raises(DraftNotFoundException):
         await service.delete_draft(uuid4())
+    hashtag_sync_service.release.assert_not_called()
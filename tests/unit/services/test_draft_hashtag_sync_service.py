@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, call
+from uuid import uuid4
+
+import pytest
+
+from brain.application.services.draft_hashtag_sync import DraftHashtagSyncService
+
+
+@pytest.mark.asyncio
+async def test_sync_changes_counters_only_for_changed_hashtags():
+    # setup: draft previously tagged #idea and #todo
+    repo = AsyncMock()
+    repo.replace_draft_hashtags.return_value = ["idea", "todo"]
+    service = DraftHashtagSyncService(repo)
+    draft_id = uuid4()
+    user_id = uuid4()
+
+    # action: keep #idea, drop #todo, add #done
+    result = await service.sync(draft_id=draft_id, user_id=user_id, text="#idea #done")
+
+    # check: only the difference reaches the counters
+    assert result == ["idea", "done"]
+    repo.replace_draft_hashtags.assert_awaited_once_with(draft_id=draft_id, texts=["idea", "done"])
+    assert repo.change_user_hashtag_counts.await_args_list == [
+        call(user_id=user_id, texts=["done"], delta=1),
+        call(user_id=user_id, texts=["todo"], delta=-1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_release_decrements_counters():
+    repo = AsyncMock()
+    service = DraftHashtagSyncService(repo)
+    user_id = uuid4()
+
+    await service.release(user_id=user_id, hashtags=["idea"])
+
+    repo.change_user_hashtag_counts.assert_awaited_once_with(user_id=user_id, texts=["idea"], delta=-1)
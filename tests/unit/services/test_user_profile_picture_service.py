@@ -0,0 +1,108 @@
+import hashlib
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.services.file_deduplication import FileDeduplicationService
+from brain.application.services.user_profile_picture import UserProfilePictureService
+from brain.domain.entities.s3_file import S3File
+
+
+def _build_service(existing: S3File | None, duplicate: S3File | None = None):
+    user = type(
+        "UserStub",
+        (),
+        {"id": uuid4(), "profile_picture_file_id": None, "profile_picture_file_unique_id": None},
+    )()
+    users_repo = AsyncMock()
+    users_repo.get_by_telegram_id.return_value = user
+    s3_files_repo = AsyncMock()
+    s3_files_repo.get_by_user_id.return_value = existing
+    s3_files_repo.get_by_sha256.return_value = duplicate
+    storage = AsyncMock()
+    service = UserProfilePictureService(
+        users_repo=users_repo,
+        s3_files_repo=s3_files_repo,
+        profile_picture_storage=storage,
+        file_deduplication_service=FileDeduplicationService(s3_files_repo=s3_files_repo),
+    )
+    return service, user, users_repo, s3_files_repo, storage
+
+
+@pytest.mark.asyncio
+async def test_upload_profile_picture_skips_unchanged_avatar():
+    # setup: stored avatar has the same content hash
+    content = b"avatar"
+    existing = S3File(
+        id=uuid4(),
+        name="a.jpg",
+        path="avatars/u/a.jpg",
+        content_type="image/jpeg",
+        sha256=hashlib.sha256(content).hexdigest(),
+    )
+    service, _, users_repo, s3_files_repo, storage = _build_service(existing)
+
+    # action: upload identical avatar
+    result = await service.upload_profile_picture(telegram_id=1, image_content=content, content_type="image/jpeg")
+
+    # check: nothing is written
+    assert result is existing
+    storage.upload.assert_not_awaited()
+    s3_files_repo.update.assert_not_awaited()
+    users_repo.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upload_profile_picture_reuses_existing_object_and_releases_old():
+    # setup: user has an old avatar and the new bytes are already stored elsewhere
+    existing = S3File(id=uuid4(), name="old.jpg", path="avatars/u/old.jpg", content_type="image/jpeg", sha256="old")
+    duplicate = S3File(id=uuid4(), name="same.png", path="avatars/other/same.png", content_type="image/png")
+    service, user, _, s3_files_repo, storage = _build_service(existing, duplicate)
+
+    # action: upload avatar with known content
+    result = await service.upload_profile_picture(telegram_id=1, image_content=b"new", content_type="image/png")
+
+    # check: no PUT, row points at the shared object and old object is queued for cleanup
+    storage.upload.assert_not_awaited()
+    assert result.path == "avatars/other/same.png"
+    assert result.id == existing.id
+    s3_files_repo.update.assert_awaited_once()
+    s3_files_repo.add_orphaned_object.assert_awaited_once_with("avatars/u/old.jpg")
+    assert user.profile_picture_file_id == existing.id
+
+
+@pytest.mark.asyncio
+async def test_upload_profile_picture_uploads_new_content():
+    # setup: first avatar with unseen content
+    service, user, _, s3_files_repo, storage = _build_service(existing=None)
+
+    # action: upload avatar
+    result = await service.upload_profile_picture(telegram_id=1, image_content=b"new", content_type="image/png")
+
+    # check: object is written under the user's prefix with its hash
+    storage.upload.assert_awaited_once()
+    assert result.path.startswith(f"avatars/{user.id}/")
+    assert result.sha256 == hashlib.sha256(b"new").hexdigest()
+    s3_files_repo.create.assert_awaited_once()
+    s3_files_repo.add_orphaned_object.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_attach_profile_picture_keeps_existing_row_for_same_content():
+    # setup: picture stored outside the transaction has the same hash as the current avatar
+    content = b"avatar"
+    sha256 = hashlib.sha256(content).hexdigest()
+    existing = S3File(id=uuid4(), name="a.jpg", path="avatars/u/a.jpg", content_type="image/jpeg", sha256=sha256)
+    service, _, _, s3_files_repo, storage = _build_service(existing, duplicate=existing)
+    stored = await service.store_profile_picture(user_id=uuid4(), image_content=content, content_type="image/jpeg")
+    stored_path = stored.path
+
+    # action: attach the stored picture
+    result = await service.attach_profile_picture(telegram_id=1, profile_picture=stored, file_unique_id="u1")
+
+    # check: the new object is queued for cleanup and the row is left as is
+    storage.upload.assert_awaited_once()
+    assert result is existing
+    s3_files_repo.add_orphaned_object.assert_awaited_once_with(stored_path)
+    s3_files_repo.update.assert_not_awaited()
@@ -0,0 +1,197 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from brain.application.abstractions.services.profile_picture_provider import (
+    ProfilePictureData,
+    ProfilePictureRef,
+)
+from brain.application.interactors.users.update_all_profile_pictures import (
+    UpdateAllUsersProfilePicturesInteractor,
+)
+from brain.config.models import BotConfig
+from brain.domain.entities.user import User
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+        self.active = False
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        self.active = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.active = False
+        return False
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class FakeUsersRepository:
+    def __init__(self, users: list[User]):
+        self.users = sorted(users, key=lambda user: user.id)
+        self.page_calls: list[tuple[UUID | None, int]] = []
+
+    async def get_page(self, after_id: UUID | None, limit: int) -> list[User]:
+        self.page_calls.append((after_id, limit))
+        remaining = [user for user in self.users if after_id is None or user.id > after_id]
+        return remaining[:limit]
+
+
+class FakeProfilePictureProvider:
+    def __init__(self, refs: dict[int, ProfilePictureRef | None]):
+        self.refs = refs
+        self.downloads: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_profile_picture_ref(self, telegram_id: int) -> ProfilePictureRef | None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.refs.get(telegram_id)
+
+    async def download_profile_picture(self, ref: ProfilePictureRef) -> ProfilePictureData | None:
+        self.downloads.append(ref.file_unique_id)
+        return ProfilePictureData(content=b"img", content_type="image/jpeg", file_unique_id=ref.file_unique_id)
+
+
+def _user(telegram_id: int, file_unique_id: str | None = None) -> User:
+    return User(
+        id=uuid4(),
+        telegram_id=telegram_id,
+        username=None,
+        first_name="Test",
+        last_name=None,
+        profile_picture_file_unique_id=file_unique_id,
+    )
+
+
+def _build_interactor(users: list[User], provider: FakeProfilePictureProvider, batch_size: int = 2):
+    users_repo = FakeUsersRepository(users)
+    service = AsyncMock()
+    uow = FakeUnitOfWork()
+    interactor = UpdateAllUsersProfilePicturesInteractor(
+        users_repo=users_repo,
+        profile_picture_provider=provider,
+        user_profile_picture_service=service,
+        bot_config=BotConfig(
+            token="token",
+            profile_picture_refresh_batch_size=batch_size,
+            profile_picture_refresh_concurrency=2,
+        ),
+        uow_factory=uow,
+    )
+    return interactor, users_repo, service, uow
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_avatars_with_same_file_unique_id():
+    # setup: one unchanged avatar, one changed avatar and one user without avatar
+    users = [_user(1, "same"), _user(2, "old"), _user(3)]
+    provider = FakeProfilePictureProvider(
+        {
+            1: ProfilePictureRef(file_id="f1", file_unique_id="same"),
+            2: ProfilePictureRef(file_id="f2", file_unique_id="new"),
+            3: None,
+        }
+    )
+    interactor, _, service, _ = _build_interactor(users, provider, batch_size=10)
+
+    # action: refresh all avatars
+    result = await interactor.execute()
+
+    # check: only the changed avatar is downloaded and stored
+    assert provider.downloads == ["new"]
+    service.store_profile_picture.assert_awaited_once_with(
+        user_id=users[1].id,
+        image_content=b"img",
+        content_type="image/jpeg",
+    )
+    service.attach_profile_picture.assert_awaited_once_with(
+        telegram_id=2,
+        profile_picture=service.store_profile_picture.return_value,
+        file_unique_id="new",
+    )
+    assert (result.checked, result.updated, result.unchanged, result.failed) == (3, 1, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_paginates_by_id_and_commits_per_user():
+    # setup: five users with changed avatars and batches of two
+    users = [_user(telegram_id) for telegram_id in range(1, 6)]
+    provider = FakeProfilePictureProvider(
+        {user.telegram_id: ProfilePictureRef(file_id="f", file_unique_id=f"u{user.telegram_id}") for user in users}
+    )
+    interactor, users_repo, service, uow = _build_interactor(users, provider, batch_size=2)
+
+    # action: refresh all avatars
+    result = await interactor.execute()
+
+    # check: keyset pages continue from the last id and each user is committed separately
+    ordered = users_repo.users
+    assert users_repo.page_calls == [(None, 2), (ordered[1].id, 2), (ordered[3].id, 2)]
+    assert uow.commits == 5
+    assert service.attach_profile_picture.await_count == 5
+    assert result.updated == 5
+    assert provider.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_counts_failures_and_continues():
+    # setup: provider fails for the first user
+    users = [_user(1), _user(2)]
+    provider = FakeProfilePictureProvider({2: ProfilePictureRef(file_id="f2", file_unique_id="u2")})
+    provider.get_profile_picture_ref = AsyncMock(
+        side_effect=[RuntimeError("boom"), ProfilePictureRef(file_id="f2", file_unique_id="u2")]
+    )
+    interactor, _, service, _ = _build_interactor(users, provider, batch_size=10)
+
+    # action: refresh all avatars
+    result = await interactor.execute()
+
+    # check: failure is counted and the other user is still updated
+    assert result.failed == 1
+    assert result.updated == 1
+    service.attach_profile_picture.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_uploads_outside_transaction_and_isolates_failed_users():
+    # setup: attaching the first user's avatar fails
+    users = [_user(1), _user(2)]
+    provider = FakeProfilePictureProvider(
+        {user.telegram_id: ProfilePictureRef(file_id="f", file_unique_id=f"u{user.telegram_id}") for user in users}
+    )
+    interactor, users_repo, service, uow = _build_interactor(users, provider, batch_size=10)
+    first_user = users_repo.users[0]
+    puts_in_transaction = []
+
+    async def store(**kwargs):
+        puts_in_transaction.append(uow.active)
+        return kwargs["user_id"]
+
+    async def attach(telegram_id: int, **kwargs):
+        if telegram_id == first_user.telegram_id:
+            raise RuntimeError("constraint violation")
+
+    service.store_profile_picture.side_effect = store
+    service.attach_profile_picture.side_effect = attach
+
+    # action: refresh all avatars
+    result = await interactor.execute()
+
+    # check: PUTs ran outside transactions, the failed user's object is released, the other is committed
+    assert puts_in_transaction == [False, False]
+    assert (result.updated, result.failed) == (1, 1)
+    service.release_profile_picture.assert_awaited_once_with(first_user.id)
+    assert uow.commits == 2